@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from datetime import datetime
 import hashlib
@@ -9,6 +10,7 @@ from typing import Any, Dict, List, Optional
 from mcp.server.fastmcp import FastMCP
 
 from fateforger.adapters.notion.timeboxing_preferences import (
+    AsyncNotionConstraintStore,
     NotionPreferenceDBs,
     ConstraintQueryFilters,
     NotionConstraintStore,
@@ -24,6 +26,8 @@ mcp = FastMCP(
 )
 
 _STORE: Optional[NotionConstraintStore] = None
+_ASYNC_STORE: Optional[AsyncNotionConstraintStore] = None
+_ASYNC_STORE_LOCK = asyncio.Lock()
 
 
 def _get_store() -> NotionConstraintStore:
@@ -62,6 +66,20 @@ def _get_store() -> NotionConstraintStore:
     return _STORE
 
 
+async def _get_async_store() -> AsyncNotionConstraintStore:
+    """Return the shared store whose Notion calls run off the event loop."""
+    global _ASYNC_STORE
+    if _ASYNC_STORE:
+        return _ASYNC_STORE
+    async with _ASYNC_STORE_LOCK:
+        if _ASYNC_STORE is None:
+            store = await asyncio.to_thread(_get_store)
+            _ASYNC_STORE = AsyncNotionConstraintStore(
+                store, max_workers=settings.notion_constraint_store_max_workers
+            )
+    return _ASYNC_STORE
+
+
 def _discover_existing_store(session) -> NotionConstraintStore | None:
     """Try constructing a store by discovering pre-existing DBs by title."""
     titles = {
@@ -185,10 +203,14 @@ def _serialize_constraint(page) -> Dict[str, Any]:
 
 
 @mcp.tool(name="constraint_get_store_info")
-def get_store_info() -> Dict[str, Any]:
+async def get_store_info() -> Dict[str, Any]:
     """Return parent page + DB ids/URLs for the constraint memory store."""
 
-    store = _get_store()
+    store = await _get_async_store()
+    return await store.run(_store_info, store.store)
+
+
+def _store_info(store: NotionConstraintStore) -> Dict[str, Any]:
     parent_page_id = os.getenv("NOTION_TIMEBOXING_PARENT_PAGE_ID", "").strip()
     info: Dict[str, Any] = {
         "parent_page_id": parent_page_id,
@@ -228,33 +250,33 @@ def get_store_info() -> Dict[str, Any]:
 
 
 @mcp.tool(name="constraint_get_constraint")
-def get_constraint(uid: str) -> Dict[str, Any] | None:
+async def get_constraint(uid: str) -> Dict[str, Any] | None:
     """Get a single constraint by UID (includes page_id + url)."""
 
-    store = _get_store()
-    page = store._get_constraint_by_uid(uid)
+    store = await _get_async_store()
+    page = await store.get_constraint_by_uid(uid)
     if not page:
         return None
     return _serialize_constraint(page)
 
 
 @mcp.tool(name="constraint_query_types")
-def query_types(
+async def query_types(
     stage: Optional[str] = None, event_types: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
-    store = _get_store()
-    return store.query_types(stage=stage, event_types=event_types)
+    store = await _get_async_store()
+    return await store.query_types(stage=stage, event_types=event_types)
 
 
 @mcp.tool(name="constraint_query_constraints")
-def query_constraints(
+async def query_constraints(
     filters: Dict[str, Any],
     type_ids: Optional[List[str]] = None,
     tags: Optional[List[str]] = None,
     sort: Optional[List[List[str]]] = None,
     limit: int = 50,
 ) -> List[Dict[str, Any]]:
-    store = _get_store()
+    store = await _get_async_store()
     as_of = filters.get("as_of")
     if not as_of:
         as_of = datetime.utcnow().date().isoformat()
@@ -273,7 +295,7 @@ def query_constraints(
         require_active=filters.get("require_active", True),
     )
     sort_spec = [(item[0], item[1]) for item in (sort or [])]
-    pages = store.query_constraints(
+    pages = await store.query_constraints(
         query_filters,
         type_ids=type_ids,
         tags=tags,
@@ -284,11 +306,19 @@ def query_constraints(
 
 
 @mcp.tool(name="constraint_upsert_constraint")
-def upsert_constraint(
+async def upsert_constraint(
     record: Dict[str, Any], event: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
-    store = _get_store()
+    store = await _get_async_store()
     _ensure_uid(record)
+    return await store.run_write(_upsert_constraint, store.store, record, event)
+
+
+def _upsert_constraint(
+    store: NotionConstraintStore,
+    record: Dict[str, Any],
+    event: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
     page = store.upsert_constraint(record)
     if event:
         if not event.get("extracted_uid"):
@@ -311,11 +341,17 @@ def upsert_constraint(
 
 
 @mcp.tool(name="constraint_log_event")
-def log_event(event: Dict[str, Any]) -> Dict[str, Any]:
-    store = _get_store()
+async def log_event(event: Dict[str, Any]) -> Dict[str, Any]:
     uid = event.get("constraint_uid")
     if not uid:
         raise ValueError("constraint_uid is required")
+    store = await _get_async_store()
+    return await store.run_write(_log_event, store.store, uid, event)
+
+
+def _log_event(
+    store: NotionConstraintStore, uid: str, event: Dict[str, Any]
+) -> Dict[str, Any]:
     constraint_page = store._get_constraint_by_uid(uid)
     if not constraint_page:
         raise ValueError(f"constraint not found for uid={uid}")
@@ -337,9 +373,9 @@ def log_event(event: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @mcp.tool(name="constraint_seed_types")
-def seed_types() -> Dict[str, Any]:
-    store = _get_store()
-    pages = seed_default_constraint_types(store)
+async def seed_types() -> Dict[str, Any]:
+    store = await _get_async_store()
+    pages = await store.run_write(seed_default_constraint_types, store.store)
     return {"count": len(pages)}
 
 
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Time the local Graphiti memory log at scale: load, appends and queries.
+
+Writes a synthetic JSONL log of ``--rows`` rows to a temp dir, then reports
+the streamed load, ``--adds`` appends and the mean indexed query time.
+
+    poetry run python scripts/dev/bench_graphiti_local_memory.py --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from autogen_core.memory import MemoryContent
+
+from fateforger.agents.timeboxing.graphiti_constraint_memory import (
+    _GraphitiLocalMemoryBackend,
+)
+
+WORDS = ["sleep", "gym", "lunch", "deep", "work", "commute", "Focus", "walk"]
+
+
+def _row(index: int, rng: random.Random) -> dict:
+    return {
+        "content": " ".join(rng.sample(WORDS, 3)),
+        "mime_type": "text/plain",
+        "metadata": {
+            "memory_id": f"m{index}",
+            "uid": f"tb:{rng.choice(WORDS).lower()}",
+            "updated_at": f"2026-01-{rng.randint(1, 9):02d}",
+            "user_id": rng.choice(["u1", "u1", "u2", ""]),
+        },
+        "created_at": "2026-01-01",
+    }
+
+
+async def _run(rows: int, adds: int, queries: int) -> None:
+    rng = random.Random(rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "graphiti_memory.json"
+        with path.open("w", encoding="utf-8") as handle:
+            for index in range(rows):
+                handle.write(json.dumps(_row(index, rng)) + "\n")
+
+        started = time.perf_counter()
+        backend = _GraphitiLocalMemoryBackend(path=str(path), user_id="u1", limit=200)
+        load_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for index in range(adds):
+            await backend.add(MemoryContent(content=f"note {index}", mime_type="text/plain"))
+        add_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for _ in range(queries):
+            await backend.query("tb:walk", limit=200)
+        query_s = (time.perf_counter() - started) / max(1, queries)
+
+    print(
+        f"{rows} rows: load={load_s:.2f}s add({adds})={add_s:.2f}s "
+        f"query={query_s * 1000:.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--adds", type=int, default=1_000)
+    parser.add_argument("--queries", type=int, default=20)
+    args = parser.parse_args()
+    for rows in args.rows:
+        asyncio.run(_run(rows, args.adds, args.queries))
+
+
+if __name__ == "__main__":
+    main()
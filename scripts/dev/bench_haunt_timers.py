@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Time scheduling and reply-cancelling many in-memory haunt follow-ups.
+
+Schedules ``--followups`` follow-ups spread over ``--topics`` topics on a
+``HauntingService`` without a durable store (one ``TimerQueue`` heap), then
+cancels them topic by topic through ``record_user_activity``.
+
+    poetry run python scripts/dev/bench_haunt_timers.py --followups 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+from fateforger.haunt.messages import FollowUpSpec
+from fateforger.haunt.service import HauntingService
+
+
+async def _run(followups: int, topics: int) -> None:
+    base_now = datetime(2025, 1, 1, 9, 0)
+    service = HauntingService(scheduler=None, now=lambda: base_now)
+    spec = FollowUpSpec(
+        should_schedule=True,
+        after=timedelta(hours=1),
+        max_attempts=2,
+        cancel_on_user_reply=True,
+    )
+
+    started = time.perf_counter()
+    for index in range(followups):
+        await service.schedule_followup(
+            message_id=f"m{index}",
+            topic_id=f"topic-{index % topics}",
+            task_id=None,
+            content="ping",
+            spec=spec,
+        )
+    scheduled_s = time.perf_counter() - started
+    armed = len(service._timers)
+
+    started = time.perf_counter()
+    cancelled = 0
+    for topic in range(topics):
+        cancelled += await service.record_user_activity(
+            topic_id=f"topic-{topic}", task_id=None
+        )
+    cancelled_s = time.perf_counter() - started
+    await service.close()
+
+    print(f"scheduled {armed} follow-ups in {scheduled_s:.2f}s")
+    print(f"cancelled {cancelled} over {topics} topics in {cancelled_s:.2f}s")
+    print(f"timers left: {len(service._timers)}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--followups", type=int, default=100_000)
+    parser.add_argument("--topics", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.followups, args.topics))
+
+
+if __name__ == "__main__":
+    main()
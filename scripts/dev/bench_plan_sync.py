@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Time ``plan_sync`` with the typed comparator vs the old DeepDiff one.
+
+Builds remote/desired plans of ``n`` owned events (every other one changed)
+and runs ``plan_sync`` once per comparator, best of ``--repeat`` runs.
+
+    poetry run python scripts/dev/bench_plan_sync.py --sizes 10 100 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date, time as time_of_day
+from unittest.mock import patch
+
+from deepdiff import DeepDiff
+
+from fateforger.agents.timeboxing import sync_engine
+from fateforger.agents.timeboxing.tb_models import FixedWindow, TBEvent, TBPlan
+
+PLAN_DATE = date(2025, 6, 15)
+TZ = "Europe/Amsterdam"
+
+
+def _deepdiff_paths(remote: dict[str, str], desired: dict[str, str]) -> tuple[str, ...]:
+    """The comparator ``plan_sync`` used before the typed one."""
+    diff = DeepDiff(remote, desired, ignore_order=True, verbose_level=2)
+    paths: set[str] = set()
+    for value in diff.to_dict().values():
+        paths.update(str(path) for path in value)
+    return tuple(sorted(paths))
+
+
+def _plans(n: int) -> tuple[TBPlan, TBPlan, list[str]]:
+    slot = max(1, 1440 // n)
+    remote_events: list[TBEvent] = []
+    desired_events: list[TBEvent] = []
+    for index in range(n):
+        start_min = index * 1440 // n
+        end_min = min(start_min + slot, 1439)
+        window = FixedWindow(
+            st=time_of_day(start_min // 60, start_min % 60),
+            et=time_of_day(end_min // 60, end_min % 60),
+        )
+        remote_events.append(TBEvent(n=f"Block {index}", d="", t="DW", p=window))
+        desired_events.append(
+            TBEvent(n=f"Block {index}", d="changed" if index % 2 else "", t="DW", p=window)
+        )
+    return (
+        TBPlan(events=remote_events, date=PLAN_DATE, tz=TZ),
+        TBPlan(events=desired_events, date=PLAN_DATE, tz=TZ),
+        [f"fftb{index}" for index in range(n)],
+    )
+
+
+def _best_of(repeat: int, n: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        # Fresh plans each run so cached resolve_times does not skew the timing.
+        remote, desired, ids = _plans(n)
+        started = time.perf_counter()
+        sync_engine.plan_sync(remote, desired, {}, remote_event_ids_by_index=ids)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'n':>6}  {'typed ms':>10}  {'deepdiff ms':>12}  {'speedup':>8}")
+    for n in args.sizes:
+        typed_s = _best_of(args.repeat, n)
+        with patch.object(sync_engine, "_canonical_diff_paths", _deepdiff_paths):
+            deepdiff_s = _best_of(args.repeat, n)
+        print(
+            f"{n:>6}  {typed_s * 1e3:>10.2f}  {deepdiff_s * 1e3:>12.2f}  "
+            f"{deepdiff_s / typed_s:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
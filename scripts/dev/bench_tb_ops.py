@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Time ``apply_tb_ops`` on its structural-sharing path vs ``strict=True``.
+
+Applies 1/10/50-op update batches to a 40-event plan (one fixed anchor plus
+an after_previous chain) and reports the mean time per call on each path.
+
+    poetry run python scripts/dev/bench_tb_ops.py --rounds 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+
+from fateforger.agents.timeboxing.tb_models import TBEvent, TBPlan
+from fateforger.agents.timeboxing.tb_ops import TBPatch, UpdateEvent, apply_tb_ops
+
+
+def _chain_plan(n: int) -> TBPlan:
+    events = [TBEvent(n="Anchor", t="PR", p={"a": "fs", "st": "06:00", "dur": "PT15M"})]
+    events += [
+        TBEvent(n=f"Block {i}", t="SW", p={"a": "ap", "dur": "PT15M"})
+        for i in range(1, n)
+    ]
+    return TBPlan(events=events, date=date(2025, 1, 15))
+
+
+def _mean_us(plan: TBPlan, patch: TBPatch, *, strict: bool, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        apply_tb_ops(plan, patch, strict=strict)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=40)
+    parser.add_argument("--ops", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    plan = _chain_plan(args.events)
+    print(f"{'ops':>5}  {'fast us':>9}  {'strict us':>10}  {'speedup':>8}")
+    for n_ops in args.ops:
+        patch = TBPatch(
+            ops=[
+                UpdateEvent(i=(i * 7) % args.events, n=f"Edit {i}", d="moved")
+                for i in range(n_ops)
+            ]
+        )
+        fast_us = _mean_us(plan, patch, strict=False, rounds=args.rounds)
+        strict_us = _mean_us(plan, patch, strict=True, rounds=args.rounds)
+        print(
+            f"{n_ops:>5}  {fast_us:>9.0f}  {strict_us:>10.0f}  "
+            f"{strict_us / fast_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
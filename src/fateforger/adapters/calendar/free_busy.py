@@ -0,0 +1,135 @@
+"""Free/busy engine over a merged, sorted busy-interval index.
+
+``BusyIndex`` merges busy intervals once (O(n log n)) into disjoint, sorted
+``starts`` / ``ends`` arrays.  Queries locate their position by bisection,
+so ``is_busy`` is O(log n) and ``free_gaps`` / ``find_slots`` are
+O(log n + k) for k returned gaps — independent of how many events lie
+outside the queried window.
+
+``find_slots`` answers "first N slots of duration D within working hours"
+over a multi-day horizon from a single index, one candidate per free gap,
+ranked earliest first.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta, tzinfo
+
+
+@dataclass(frozen=True, slots=True)
+class FreeSlot:
+    """A candidate slot and the free gap that contains it."""
+
+    start: datetime
+    end: datetime
+    gap_end: datetime
+
+    @property
+    def slack(self) -> timedelta:
+        """Free time left in the gap after the slot."""
+        return self.gap_end - self.end
+
+
+class BusyIndex:
+    """Disjoint, sorted busy intervals with logarithmic lookups."""
+
+    __slots__ = ("_starts", "_ends")
+
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime]] = ()) -> None:
+        """Merge ``intervals`` (timezone-aware; empty or inverted ones are ignored)."""
+        starts: list[datetime] = []
+        ends: list[datetime] = []
+        for start, end in sorted(pair for pair in intervals if pair[1] > pair[0]):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def intervals(self) -> list[tuple[datetime, datetime]]:
+        """Return the merged busy intervals."""
+        return list(zip(self._starts, self._ends))
+
+    def is_busy(self, at: datetime) -> bool:
+        """Whether ``at`` falls inside a busy interval."""
+        index = bisect_right(self._starts, at) - 1
+        return index >= 0 and at < self._ends[index]
+
+    def free_gaps(
+        self, start: datetime, end: datetime
+    ) -> Iterator[tuple[datetime, datetime]]:
+        """Yield free ``(start, end)`` gaps inside ``[start, end)`` in order."""
+        if end <= start:
+            return
+        # First busy interval that ends after ``start``.
+        index = bisect_right(self._ends, start)
+        cursor = start
+        while index < len(self._starts) and self._starts[index] < end:
+            if self._starts[index] > cursor:
+                yield cursor, self._starts[index]
+            cursor = max(cursor, self._ends[index])
+            index += 1
+        if cursor < end:
+            yield cursor, end
+
+
+def working_windows(
+    *,
+    not_before: datetime,
+    days: int,
+    tz: tzinfo,
+    work_start: time,
+    work_end: time,
+) -> list[tuple[datetime, datetime]]:
+    """Return the daily working windows of a ``days``-day horizon.
+
+    The first window is clipped to ``not_before``; empty windows are dropped.
+    """
+    local = not_before.astimezone(tz)
+    windows: list[tuple[datetime, datetime]] = []
+    for offset in range(max(int(days), 1)):
+        day = local.date() + timedelta(days=offset)
+        start = datetime.combine(day, work_start, tz)
+        end = datetime.combine(day, work_end, tz)
+        start = max(start, local)
+        if end > start:
+            windows.append((start, end))
+    return windows
+
+
+def find_slots(
+    index: BusyIndex,
+    *,
+    windows: Iterable[tuple[datetime, datetime]],
+    duration: timedelta,
+    limit: int = 1,
+) -> list[FreeSlot]:
+    """Return up to ``limit`` slots of ``duration``, earliest first.
+
+    Each free gap (within a window) contributes at most one slot, at its
+    start, so candidates are genuinely different options.
+    """
+    slots: list[FreeSlot] = []
+    if limit < 1 or duration <= timedelta(0):
+        return slots
+    for window_start, window_end in windows:
+        for gap_start, gap_end in index.free_gaps(window_start, window_end):
+            if gap_end - gap_start < duration:
+                continue
+            slots.append(
+                FreeSlot(start=gap_start, end=gap_start + duration, gap_end=gap_end)
+            )
+            if len(slots) >= limit:
+                return slots
+    return slots
+
+
+__all__ = ["BusyIndex", "FreeSlot", "find_slots", "working_windows"]
@@ -0,0 +1,465 @@
+"""Process-wide read-through cache for calendar ``list-events`` windows.
+
+Every calendar read in the process (timeboxing day snapshots, planning
+reconciliation, next-slot search) goes through ``calendar_read_cache()``:
+
+* entries are keyed by ``(calendar_id, start, end)`` with timezone-aware
+  bounds and expire after ``settings.calendar_read_cache_ttl_seconds``;
+* a request inside a cached (or in-flight) superset window is answered by
+  filtering that window's events instead of calling the MCP server;
+* concurrent identical requests share one fetch;
+* our own writes call ``invalidate`` / ``invalidate_for_payload``,
+  which drop only the entries that contain the written event id or overlap
+  its new time range.  Writes bump a per-calendar generation, so a read
+  that was in flight during a write never repopulates the cache;
+* when the calendar MCP circuit breaker is open (``McpCircuitOpenError``)
+  an expired entry no older than ``stale_ttl_s`` is served instead of
+  failing the read.
+
+Cached events are returned as deep copies; callers may mutate them freely.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone, tzinfo
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from dateutil import parser as date_parser
+
+from fateforger.core.logging_config import record_calendar_read_cache
+from fateforger.tools.mcp_call_policy import McpCircuitOpenError
+
+EventFetch = Callable[[], Awaitable[list[dict[str, Any]] | None]]
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarWindow:
+    """A ``list-events`` request window with timezone-aware bounds."""
+
+    calendar_id: str
+    start: datetime
+    end: datetime
+
+    def __post_init__(self) -> None:
+        """Validate bounds."""
+        if self.start.tzinfo is None or self.end.tzinfo is None:
+            raise ValueError("CalendarWindow bounds must be timezone-aware")
+        if self.end < self.start:
+            raise ValueError("CalendarWindow end must not precede start")
+
+    def covers(self, other: "CalendarWindow") -> bool:
+        """Return whether this window contains ``other`` on the same calendar."""
+        return (
+            self.calendar_id == other.calendar_id
+            and self.start <= other.start
+            and other.end <= self.end
+        )
+
+    def overlaps(self, start: datetime, end: datetime) -> bool:
+        """Return whether ``[start, end)`` intersects this window."""
+        return start < self.end and end > self.start
+
+
+@dataclass(slots=True)
+class _Entry:
+    window: CalendarWindow
+    events: tuple[dict[str, Any], ...]
+    # ``None`` when an event's bounds could not be parsed; such entries only
+    # answer exact-window requests.
+    intervals: tuple[tuple[datetime, datetime], ...] | None
+    event_ids: frozenset[str]
+    fetched_at: float
+
+
+@dataclass(slots=True)
+class _Inflight:
+    window: CalendarWindow
+    task: asyncio.Task[list[dict[str, Any]] | None]
+
+
+@dataclass(frozen=True, slots=True)
+class CalendarReadCacheStats:
+    """Counters since the cache was created (or last ``clear``)."""
+
+    hits: int = 0
+    superset_hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    invalidations: int = 0
+    stale_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups answered without a new MCP call."""
+        served = self.hits + self.superset_hits + self.coalesced
+        total = served + self.misses + self.refreshes
+        return served / total if total else 0.0
+
+
+class CalendarReadCache:
+    """TTL cache of ``list-events`` results with superset reuse and coalescing."""
+
+    def __init__(
+        self,
+        *,
+        ttl_s: float,
+        max_entries: int = 256,
+        stale_ttl_s: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            ttl_s: Seconds an entry stays servable; ``0`` disables reuse but
+                keeps request coalescing.
+            max_entries: LRU bound on cached windows.
+            stale_ttl_s: Age up to which an expired entry may still answer a
+                read while the MCP circuit is open (``0`` disables).
+            clock: Monotonic clock (injectable for tests).
+        """
+        self._ttl_s = max(0.0, float(ttl_s))
+        self._stale_ttl_s = max(0.0, float(stale_ttl_s))
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._entries: OrderedDict[CalendarWindow, _Entry] = OrderedDict()
+        self._inflight: dict[CalendarWindow, _Inflight] = {}
+        self._generations: dict[str, int] = {}
+        self._stats = CalendarReadCacheStats()
+
+    @property
+    def stats(self) -> CalendarReadCacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        return self._stats
+
+    def clear(self) -> None:
+        """Drop all entries, in-flight registrations and counters."""
+        self._entries.clear()
+        self._inflight.clear()
+        self._generations.clear()
+        self._stats = CalendarReadCacheStats()
+
+    async def list_events(
+        self,
+        *,
+        calendar_id: str,
+        start: datetime,
+        end: datetime,
+        fetch: EventFetch,
+        refresh: bool = False,
+    ) -> list[dict[str, Any]] | None:
+        """Return the events overlapping ``[start, end)`` on ``calendar_id``.
+
+        Args:
+            calendar_id: Calendar to read.
+            start: Window start (timezone-aware).
+            end: Window end (timezone-aware).
+            fetch: Performs the actual ``list-events`` call for exactly this
+                window.  Returning ``None`` marks a failed read: it is passed
+                through and not cached.  Exceptions propagate uncached,
+                except that ``McpCircuitOpenError`` is answered from a stale
+                entry when one covers the window.
+            refresh: Bypass cached entries (the result still repopulates the
+                cache), e.g. for submit-time baseline refreshes.
+
+        Returns:
+            Normalized event dicts, or ``None`` when ``fetch`` reported failure.
+        """
+        window = CalendarWindow(calendar_id=calendar_id, start=start, end=end)
+        if not refresh:
+            entry = self._fresh_entry(window)
+            if entry is not None:
+                exact = entry.window == window
+                self._count("hits" if exact else "superset_hits")
+                return self._slice(entry, window)
+            inflight = self._inflight_covering(window)
+            if inflight is not None:
+                self._count("coalesced")
+                try:
+                    events = await asyncio.shield(inflight.task)
+                except McpCircuitOpenError:
+                    stale = self._serve_stale(window)
+                    if stale is None:
+                        raise
+                    return stale
+                if events is None:
+                    return None
+                return _filter_events(events, window, exact=inflight.window == window)
+
+        self._count("refreshes" if refresh else "misses")
+        generation = self._generations.get(calendar_id, 0)
+        task = asyncio.ensure_future(fetch())
+        task.add_done_callback(_consume_exception)
+        inflight = _Inflight(window=window, task=task)
+        self._inflight[window] = inflight
+        try:
+            events = await asyncio.shield(task)
+        except McpCircuitOpenError:
+            stale = self._serve_stale(window)
+            if stale is None:
+                raise
+            return stale
+        finally:
+            if self._inflight.get(window) is inflight:
+                del self._inflight[window]
+        if events is None:
+            return None
+        if self._generations.get(calendar_id, 0) == generation:
+            self._store(window, events)
+        return copy.deepcopy(events)
+
+    def invalidate(
+        self,
+        *,
+        calendar_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        event_ids: Iterable[str] = (),
+    ) -> int:
+        """Drop entries affected by a write to ``calendar_id``.
+
+        An entry is dropped when it contains one of ``event_ids`` (the
+        event's old position) or overlaps ``[start, end)`` (its new
+        position).  Without a range or ids the whole calendar is dropped.
+
+        Returns:
+            Number of cached windows removed.
+        """
+        self._generations[calendar_id] = self._generations.get(calendar_id, 0) + 1
+        ids = {event_id for event_id in event_ids if event_id}
+        has_range = start is not None and end is not None
+        whole_calendar = not has_range and not ids
+
+        def _affected(window: CalendarWindow, entry_ids: frozenset[str]) -> bool:
+            if window.calendar_id != calendar_id:
+                return False
+            if whole_calendar or (ids and not ids.isdisjoint(entry_ids)):
+                return True
+            return has_range and window.overlaps(start, end)  # type: ignore[arg-type]
+
+        stale = [
+            window
+            for window, entry in self._entries.items()
+            if _affected(window, entry.event_ids)
+        ]
+        for window in stale:
+            del self._entries[window]
+        # In-flight reads may predate the write; stop new requests joining them.
+        # Their event ids are unknown yet, so an id-only write detaches them all.
+        for window in [w for w in self._inflight if w.calendar_id == calendar_id]:
+            if whole_calendar or ids or (has_range and window.overlaps(start, end)):  # type: ignore[arg-type]
+                del self._inflight[window]
+        if stale:
+            self._count("invalidations", len(stale))
+        return len(stale)
+
+    def invalidate_for_payload(
+        self, payload: Mapping[str, Any], *, removes: bool = False
+    ) -> int:
+        """Invalidate from a ``create/update/delete-event`` argument payload.
+
+        Uses ``calendarId``, ``eventId`` and ``start``/``end`` (resolved in
+        ``timeZone`` when naive).
+
+        Args:
+            payload: Tool arguments of the write.
+            removes: The payload describes a position the event *leaves*
+                (a delete, or the before-image of an update); without times
+                the event id alone then identifies every affected window.
+                Otherwise missing or unparseable times drop the whole
+                calendar.
+        """
+        calendar_id = str(payload.get("calendarId") or "primary")
+        event_id = str(payload.get("eventId") or "")
+        tz = _zone(payload.get("timeZone"))
+        start = _parse_bound(payload.get("start"), tz)
+        end = _parse_bound(payload.get("end"), tz)
+        if start is not None and end is not None:
+            return self.invalidate(
+                calendar_id=calendar_id,
+                start=start,
+                end=max(start, end),
+                event_ids=[event_id] if event_id else (),
+            )
+        if removes and event_id:
+            return self.invalidate(calendar_id=calendar_id, event_ids=[event_id])
+        return self.invalidate(calendar_id=calendar_id)
+
+    def _fresh_entry(self, window: CalendarWindow) -> _Entry | None:
+        """Return a live entry that can answer ``window`` (exact match first)."""
+        if self._ttl_s <= 0:
+            return None
+        now = self._clock()
+        exact = self._entries.get(window)
+        if exact is not None and now - exact.fetched_at < self._ttl_s:
+            self._entries.move_to_end(window)
+            return exact
+        for cached, entry in reversed(self._entries.items()):
+            if (
+                entry.intervals is not None
+                and now - entry.fetched_at < self._ttl_s
+                and cached.covers(window)
+            ):
+                self._entries.move_to_end(cached)
+                return entry
+        return None
+
+    def _serve_stale(self, window: CalendarWindow) -> list[dict[str, Any]] | None:
+        """Answer ``window`` from an expired entry within ``stale_ttl_s``."""
+        if self._stale_ttl_s <= 0:
+            return None
+        now = self._clock()
+        for cached, entry in reversed(self._entries.items()):
+            if now - entry.fetched_at >= self._stale_ttl_s:
+                continue
+            if cached == window or (
+                entry.intervals is not None and cached.covers(window)
+            ):
+                self._count("stale_hits")
+                return self._slice(entry, window)
+        return None
+
+    def _inflight_covering(self, window: CalendarWindow) -> _Inflight | None:
+        loop = asyncio.get_running_loop()
+        exact = self._inflight.get(window)
+        if exact is not None and exact.task.get_loop() is loop:
+            return exact
+        for inflight in self._inflight.values():
+            if inflight.task.get_loop() is loop and inflight.window.covers(window):
+                return inflight
+        return None
+
+    def _store(self, window: CalendarWindow, events: list[dict[str, Any]]) -> None:
+        if self._ttl_s <= 0:
+            return
+        intervals = _event_intervals(events, window.start.tzinfo)
+        self._entries[window] = _Entry(
+            window=window,
+            events=tuple(copy.deepcopy(events)),
+            intervals=intervals,
+            event_ids=frozenset(
+                str(event["id"]) for event in events if event.get("id")
+            ),
+            fetched_at=self._clock(),
+        )
+        self._entries.move_to_end(window)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _slice(self, entry: _Entry, window: CalendarWindow) -> list[dict[str, Any]]:
+        if entry.window == window or entry.intervals is None:
+            return copy.deepcopy(list(entry.events))
+        return [
+            copy.deepcopy(event)
+            for event, (start, end) in zip(entry.events, entry.intervals)
+            if window.overlaps(start, end)
+        ]
+
+    def _count(self, field_name: str, amount: int = 1) -> None:
+        current = getattr(self._stats, field_name)
+        self._stats = replace(self._stats, **{field_name: current + amount})
+        record_calendar_read_cache(event=field_name, amount=amount)
+
+
+def _consume_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a shared fetch's exception as retrieved when every waiter left."""
+    if not task.cancelled():
+        task.exception()
+
+
+def _filter_events(
+    events: list[dict[str, Any]], window: CalendarWindow, *, exact: bool
+) -> list[dict[str, Any]]:
+    """Return deep copies of ``events`` overlapping ``window``."""
+    if exact:
+        return copy.deepcopy(events)
+    intervals = _event_intervals(events, window.start.tzinfo)
+    if intervals is None:
+        return copy.deepcopy(events)
+    return [
+        copy.deepcopy(event)
+        for event, (start, end) in zip(events, intervals)
+        if window.overlaps(start, end)
+    ]
+
+
+def _event_intervals(
+    events: list[dict[str, Any]], tz: tzinfo | None
+) -> tuple[tuple[datetime, datetime], ...] | None:
+    """Parse every event's bounds, or ``None`` if any cannot be parsed."""
+    from fateforger.contracts import EventDateTime  # noqa: PLC0415
+
+    zone = tz or timezone.utc
+    intervals: list[tuple[datetime, datetime]] = []
+    for event in events:
+        raw_start, raw_end = event.get("start"), event.get("end")
+        if not isinstance(raw_start, dict) or not isinstance(raw_end, dict):
+            return None
+        try:
+            start = EventDateTime.model_validate(raw_start).to_datetime(zone)
+            end = EventDateTime.model_validate(raw_end).to_datetime(zone)
+        except Exception:
+            return None
+        if start is None or end is None:
+            return None
+        intervals.append((start, end))
+    return tuple(intervals)
+
+
+def _zone(name: Any) -> tzinfo | None:
+    if not name:
+        return None
+    try:
+        return ZoneInfo(str(name))
+    except Exception:
+        return None
+
+
+def _parse_bound(raw: Any, tz: tzinfo | None) -> datetime | None:
+    """Parse a write payload's ``start``/``end`` into an aware datetime."""
+    if isinstance(raw, Mapping):
+        tz = _zone(raw.get("timeZone")) or tz
+        raw = raw.get("dateTime") or raw.get("date")
+    if not isinstance(raw, str) or not raw.strip():
+        return None
+    try:
+        parsed = date_parser.isoparse(raw.strip())
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is not None:
+        return parsed
+    if tz is None:
+        return None
+    return parsed.replace(tzinfo=tz)
+
+
+_CACHE: CalendarReadCache | None = None
+
+
+def calendar_read_cache() -> CalendarReadCache:
+    """Return the process-wide calendar read cache."""
+    global _CACHE
+    if _CACHE is None:
+        from fateforger.core.config import settings  # noqa: PLC0415
+
+        _CACHE = CalendarReadCache(
+            ttl_s=settings.calendar_read_cache_ttl_seconds,
+            max_entries=settings.calendar_read_cache_max_entries,
+            stale_ttl_s=settings.calendar_read_cache_stale_seconds,
+        )
+    return _CACHE
+
+
+__all__ = [
+    "CalendarReadCache",
+    "CalendarReadCacheStats",
+    "CalendarWindow",
+    "calendar_read_cache",
+]
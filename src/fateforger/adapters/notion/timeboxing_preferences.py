@@ -1,13 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import partial
 import json
 import os
+import threading
 import time
-from typing import Any, Dict, List, Optional, Sequence, Tuple
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from cachetools import TTLCache
 import ultimate_notion as uno
+from ultimate_notion.core import get_active_session
+from ultimate_notion.errors import EmptyDBError
+from ultimate_notion.obj_api.iterator import MAX_PAGE_SIZE
 from ultimate_notion.schema import AggFunc
 
 # ----------------------------
@@ -327,6 +345,98 @@ class ConstraintQueryFilters:
 
 SortSpec = List[Tuple[str, str]]  # [("Confidence", "desc"), ("Name", "asc")]
 
+_T = TypeVar("_T")
+
+# Title lookups OR-ed into one Notion query (compound filters cap at 100).
+_LOOKUP_BATCH_SIZE = 25
+# Parallel page writes per window replacement.
+_WRITE_FANOUT = 4
+
+# Process-wide cache of topic/type pages, keyed by (db id, kind, lookup key).
+# Only positive hits are kept; the TTL bounds staleness from other writers.
+_PAGE_LOOKUP_CACHE: TTLCache = TTLCache(maxsize=4096, ttl=600.0)
+_PAGE_LOOKUP_LOCK = threading.Lock()
+
+
+def _lookup_cache_key(db: Any, kind: str, key: str) -> Optional[Tuple[str, str, str]]:
+    db_id = getattr(db, "id", None)
+    if db_id is None:
+        return None
+    return (str(db_id), kind, key)
+
+
+def _cached_lookup(db: Any, kind: str, key: str) -> Optional[uno.Page]:
+    cache_key = _lookup_cache_key(db, kind, key)
+    if cache_key is None:
+        return None
+    with _PAGE_LOOKUP_LOCK:
+        return _PAGE_LOOKUP_CACHE.get(cache_key)
+
+
+def _remember_lookup(db: Any, kind: str, key: str, page: uno.Page) -> None:
+    cache_key = _lookup_cache_key(db, kind, key)
+    if cache_key is None:
+        return
+    with _PAGE_LOOKUP_LOCK:
+        _PAGE_LOOKUP_CACHE[cache_key] = page
+
+
+def clear_page_lookup_cache() -> None:
+    """Drop every cached topic/type page (e.g. after out-of-band Notion edits)."""
+
+    with _PAGE_LOOKUP_LOCK:
+        _PAGE_LOOKUP_CACHE.clear()
+
+
+def _iter_query_pages(query: Any, *, limit: Optional[int] = None) -> Iterator[uno.Page]:
+    """Yield a database query's pages, fetching result pages lazily.
+
+    ``Query.execute`` materializes every matching row before returning; this
+    walks the paginated endpoint instead and stops requesting pages once
+    ``limit`` rows have been yielded. Query objects without the raw API hooks
+    fall back to ``execute()``.
+    """
+
+    if limit is not None and limit <= 0:
+        return
+    if not hasattr(query, "_filter_obj_ref") or not hasattr(query, "database"):
+        for count, page in enumerate(query.execute(), start=1):
+            yield page
+            if limit is not None and count >= limit:
+                return
+        return
+
+    session = get_active_session()
+    raw = session.api.databases.query(query.database.obj_ref)
+    try:
+        filter_obj = query._filter_obj_ref()
+    except EmptyDBError:
+        return
+    if filter_obj:
+        raw = raw.filter(filter_obj)
+    sort_objs = query._sorts_obj_ref()
+    if sort_objs:
+        raw = raw.sort(sort_objs)
+    page_size = min(MAX_PAGE_SIZE, limit) if limit is not None else MAX_PAGE_SIZE
+    for count, obj in enumerate(raw.execute(page_size=page_size), start=1):
+        yield session._cache_add(uno.Page.wrap_obj_ref(obj))
+        if limit is not None and count >= limit:
+            return
+
+
+def _fan_out(calls: Sequence[Callable[[], _T]], *, max_workers: int = _WRITE_FANOUT) -> List[_T]:
+    """Run independent blocking Notion calls concurrently, preserving order."""
+
+    if len(calls) <= 1:
+        return [call() for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as pool:
+        return list(pool.map(lambda call: call(), calls))
+
+
+def _prop_text(page: Any, attr: str) -> str:
+    value = getattr(getattr(page, "props", None), attr, None)
+    return str(value) if value is not None else ""
+
 
 class NotionConstraintStore:
     """Notion-backed constraint persistence/retrieval with deterministic entrypoints."""
@@ -467,8 +577,7 @@ class NotionConstraintStore:
                     sort_terms.append(uno.prop(prop_name))
             query = query.sort(*sort_terms)
 
-        view = query.execute()
-        return list(view)[: max(0, limit)]
+        return list(_iter_query_pages(query, limit=max(0, limit)))
 
     # ---------- deterministic entry point #3 ----------
     def upsert_constraint(self, record: Dict[str, Any]) -> uno.Page:
@@ -619,7 +728,9 @@ class NotionConstraintStore:
             page = existing[0]
             page.update_props(**props)
             return page
-        return TBConstraintType.create(**props)
+        page = TBConstraintType.create(**props)
+        _remember_lookup(self.types_db, "type", type_id, page)
+        return page
 
     def log_extraction_event(
         self,
@@ -723,9 +834,8 @@ class NotionConstraintStore:
         return cond
 
     def _get_constraint_by_uid(self, uid: str) -> Optional[uno.Page]:
-        view = self.constraints_db.query.filter(uno.prop("UID") == uid).execute()
-        pages = list(view)
-        return pages[0] if pages else None
+        query = self.constraints_db.query.filter(uno.prop("UID") == uid)
+        return next(_iter_query_pages(query, limit=1), None)
 
     def _constraint_attr_alias(self, *candidates: str) -> Optional[str]:
         schema = self.constraints_db.schema
@@ -751,59 +861,117 @@ class NotionConstraintStore:
         create_missing: bool = True,
         memo: Optional[Dict[str, Optional[uno.Page]]] = None,
     ) -> List[uno.Page]:
-        out: List[uno.Page] = []
+        """Resolve topic names to pages (exact title, then contains, then create).
+
+        Exact titles not in ``memo`` or the process-wide lookup cache are
+        fetched with one OR-ed query per ``_LOOKUP_BATCH_SIZE`` names.
+        """
+
         cache = memo if memo is not None else {}
+        wanted: Dict[str, str] = {}
         for name in names:
             normalized = str(name or "").strip()
-            if not normalized:
-                continue
-            lookup_key = normalized.casefold()
+            if normalized:
+                wanted.setdefault(normalized.casefold(), normalized)
+
+        pending: List[str] = []
+        for lookup_key in wanted:
             if lookup_key in cache:
-                cached = cache[lookup_key]
-                if cached is not None:
-                    out.append(cached)
                 continue
+            cached = _cached_lookup(self.topics_db, "topic", lookup_key)
+            if cached is not None:
+                cache[lookup_key] = cached
+            else:
+                pending.append(lookup_key)
 
-            exact = list(
-                self.topics_db.query.filter(uno.prop("Name") == normalized).execute()
-            )
-            if exact:
-                cache[lookup_key] = exact[0]
-                out.append(exact[0])
-                continue
-            contains = list(
-                self.topics_db.query.filter(uno.prop("Name").contains(normalized)).execute()
+        exact = self._batch_lookup(
+            self.topics_db, "Name", [wanted[key] for key in pending]
+        )
+        for lookup_key in pending:
+            normalized = wanted[lookup_key]
+            page = next(
+                (page for page in exact if _prop_text(page, "name") == normalized),
+                None,
             )
-            if contains:
-                cache[lookup_key] = contains[0]
-                out.append(contains[0])
-                continue
-            if create_missing:
-                created = TBTopic.create(name=normalized, description="")
-                cache[lookup_key] = created
-                out.append(created)
-            else:
-                cache[lookup_key] = None
-        return out
+            if page is None:
+                page = next(
+                    _iter_query_pages(
+                        self.topics_db.query.filter(
+                            uno.prop("Name").contains(normalized)
+                        ),
+                        limit=1,
+                    ),
+                    None,
+                )
+            if page is None and create_missing:
+                page = TBTopic.create(name=normalized, description="")
+            cache[lookup_key] = page
+            if page is not None:
+                _remember_lookup(self.topics_db, "topic", lookup_key, page)
 
-    def _resolve_types_by_id(self, type_ids: Sequence[str]) -> List[uno.Page]:
         out: List[uno.Page] = []
-        for type_id in type_ids:
-            exact = list(
-                self.types_db.query.filter(uno.prop("Type ID") == type_id).execute()
-            )
-            if exact:
-                out.append(exact[0])
-                continue
-            by_name = list(
-                self.types_db.query.filter(uno.prop("Name") == type_id).execute()
-            )
-            if by_name:
-                out.append(by_name[0])
+        for name in names:
+            normalized = str(name or "").strip()
+            if normalized and cache.get(normalized.casefold()) is not None:
+                out.append(cache[normalized.casefold()])
         return out
 
+    def _resolve_types_by_id(
+        self, type_ids: Sequence[str], *, use_cache: bool = True
+    ) -> List[uno.Page]:
+        """Resolve type ids (matching ``Type ID``, then ``Name``) to pages.
+
+        Uncached ids share one query over both properties; ``use_cache=False``
+        forces a fresh read for callers that rewrite the page's relations.
+        """
+
+        resolved: Dict[str, uno.Page] = {}
+        pending: List[str] = []
+        for type_id in dict.fromkeys(type_ids):
+            cached = _cached_lookup(self.types_db, "type", type_id) if use_cache else None
+            if cached is not None:
+                resolved[type_id] = cached
+            else:
+                pending.append(type_id)
+
+        pages = self._batch_lookup(self.types_db, "Type ID", pending, or_prop="Name")
+        for type_id in pending:
+            page = next(
+                (page for page in pages if _prop_text(page, "type_id") == type_id),
+                None,
+            ) or next(
+                (page for page in pages if _prop_text(page, "name") == type_id),
+                None,
+            )
+            if page is not None:
+                resolved[type_id] = page
+                _remember_lookup(self.types_db, "type", type_id, page)
+        return [resolved[type_id] for type_id in type_ids if type_id in resolved]
+
+    def _batch_lookup(
+        self,
+        db: Any,
+        prop_name: str,
+        values: Sequence[str],
+        *,
+        or_prop: Optional[str] = None,
+    ) -> List[uno.Page]:
+        """Fetch pages whose ``prop_name`` (or ``or_prop``) equals any value."""
+
+        pages: List[uno.Page] = []
+        for offset in range(0, len(values), _LOOKUP_BATCH_SIZE):
+            cond = None
+            for value in values[offset : offset + _LOOKUP_BATCH_SIZE]:
+                term = uno.prop(prop_name) == value
+                if or_prop:
+                    term = term | (uno.prop(or_prop) == value)
+                cond = term if cond is None else (cond | term)
+            pages.extend(_iter_query_pages(db.query.filter(cond)))
+        return pages
+
     def _attach_constraint_type(self, constraint_page: uno.Page, type_id: str) -> None:
-        type_pages = self._resolve_types_by_id([type_id])
+        # Read the type page fresh: its relation list is rewritten below.
+        type_pages = self._resolve_types_by_id([type_id], use_cache=False)
         if not type_pages:
             return
         type_page = type_pages[0]
@@ -829,25 +997,29 @@ class NotionConstraintStore:
             page.update_props(end_date=end_dt)
 
     def _replace_windows(self, constraint_page: uno.Page, windows: List[Dict[str, Any]]):
-        old = self.windows_db.query.filter(
-            uno.prop("Constraint").contains(constraint_page)
-        ).execute()
-        for window_page in list(old):
-            if hasattr(window_page, "delete"):
-                window_page.delete()
+        old = _iter_query_pages(
+            self.windows_db.query.filter(uno.prop("Constraint").contains(constraint_page))
+        )
+        _fan_out(
+            [window_page.delete for window_page in old if hasattr(window_page, "delete")]
+        )
 
+        creates: List[Callable[[], Any]] = []
         for window in windows:
             kind = self._to_window_kind(window.get("kind"))
             start = window.get("start_time_local")
             end = window.get("end_time_local")
-            title = f"{kind.name} {start}-{end}"
-            TBConstraintWindow.create(
-                name=title,
-                constraint=[constraint_page],
-                kind=kind,
-                start_time_local=start,
-                end_time_local=end,
+            creates.append(
+                partial(
+                    TBConstraintWindow.create,
+                    name=f"{kind.name} {start}-{end}",
+                    constraint=[constraint_page],
+                    kind=kind,
+                    start_time_local=start,
+                    end_time_local=end,
+                )
             )
+        _fan_out(creates)
 
     # ----------------------------
     # Enum coercion helpers
@@ -974,6 +1146,85 @@ class NotionConstraintStore:
         raise ValueError(f"Unknown type status: {value}")
 
 
+class AsyncNotionConstraintStore:
+    """Awaitable facade over ``NotionConstraintStore``.
+
+    ultimate-notion is synchronous, so each call runs on a bounded thread pool:
+    the event loop stays free while Notion I/O is in flight, and at most
+    ``max_workers`` reads hit Notion at once.  Writes go through a separate
+    single-worker lane: upserts check-then-create by uid and attach types by
+    read-modify-write, so running them concurrently would duplicate pages and
+    drop relations.
+    """
+
+    def __init__(self, store: NotionConstraintStore, *, max_workers: int = 8) -> None:
+        self.store = store
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)),
+            thread_name_prefix="notion-constraints",
+        )
+        self._write_executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="notion-constraints-write",
+        )
+
+    async def run(self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+        """Run a blocking read (typically a store method) on the pool."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def run_write(
+        self, fn: Callable[..., _T], /, *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run a blocking callable that writes to Notion on the write lane."""
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._write_executor, partial(fn, *args, **kwargs)
+        )
+
+    async def query_types(
+        self, stage: Optional[str], event_types: Optional[Sequence[str]]
+    ) -> List[Dict[str, Any]]:
+        return await self.run(self.store.query_types, stage, event_types)
+
+    async def query_constraints(
+        self,
+        filters: ConstraintQueryFilters,
+        type_ids: Optional[Sequence[str]] = None,
+        tags: Optional[Sequence[str]] = None,
+        sort: Optional[SortSpec] = None,
+        limit: int = 50,
+    ) -> List[uno.Page]:
+        return await self.run(
+            self.store.query_constraints,
+            filters,
+            type_ids=type_ids,
+            tags=tags,
+            sort=sort,
+            limit=limit,
+        )
+
+    async def get_constraint_by_uid(self, uid: str) -> Optional[uno.Page]:
+        return await self.run(self.store._get_constraint_by_uid, uid)
+
+    async def upsert_constraint(self, record: Dict[str, Any]) -> uno.Page:
+        return await self.run_write(self.store.upsert_constraint, record)
+
+    async def upsert_constraint_type(self, payload: Dict[str, Any]) -> uno.Page:
+        return await self.run_write(self.store.upsert_constraint_type, payload)
+
+    async def log_extraction_event(self, **kwargs: Any) -> uno.Page:
+        return await self.run_write(self.store.log_extraction_event, **kwargs)
+
+    def close(self) -> None:
+        """Stop both pools; queued calls are cancelled, running ones finish."""
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._write_executor.shutdown(wait=False, cancel_futures=True)
+
+
 def get_notion_session(*, notion_token: Optional[str] = None) -> uno.Session:
     """Return a shared ultimate-notion Session, optionally seeding `NOTION_TOKEN`."""
 
@@ -1006,6 +1257,7 @@ def _write_registry_block(
 
 
 __all__ = [
+    "AsyncNotionConstraintStore",
     "CSource",
     "CStatus",
     "ConstraintQueryFilters",
@@ -1029,6 +1281,7 @@ __all__ = [
     "TBTopic",
     "TypeStatus",
     "WindowKind",
+    "clear_page_lookup_cache",
     "install_preference_dbs",
     "get_notion_session",
     "seed_default_constraint_types",
@@ -19,9 +19,15 @@ from autogen_core import (
     default_subscription,
     message_handler,
 )
-from autogen_ext.tools.mcp import McpWorkbench, StreamableHttpServerParams
+from autogen_ext.tools.mcp import StreamableHttpServerParams
 from pydantic import TypeAdapter, ValidationError
 
+from fateforger.adapters.calendar.free_busy import (
+    BusyIndex,
+    find_slots,
+    working_windows,
+)
+from fateforger.adapters.calendar.read_cache import calendar_read_cache
 from fateforger.core.config import settings
 from fateforger.debug.diag import with_timeout
 from fateforger.haunt.mixins import HauntAwareAgentMixin
@@ -30,8 +36,10 @@ from fateforger.haunt.orchestrator import HauntOrchestrator, HauntTicket
 from fateforger.llm import build_autogen_chat_client
 from fateforger.slack_bot.messages import SlackBlockMessage
 from fateforger.tools.calendar_mcp import get_calendar_mcp_tools
+from fateforger.tools.mcp_pool import PooledWorkbench, mcp_workbench_pool
 
 from .messages import (
+    SlotCandidate,
     SuggestedSlot,
     SuggestNextSlot,
     UpsertCalendarEvent,
@@ -94,13 +102,13 @@ class PlannerAgent(HauntAwareAgentMixin, RoutedAgent):
             default_channel="planner-thread",
         )
         self._delegate: AssistantAgent | None = None
-        self._workbench: McpWorkbench | None = None
+        self._workbench: PooledWorkbench | None = None
 
-    def _ensure_workbench(self) -> McpWorkbench:
+    def _ensure_workbench(self) -> PooledWorkbench:
         if self._workbench:
             return self._workbench
         params = StreamableHttpServerParams(url=SERVER_URL, timeout=10.0)
-        self._workbench = McpWorkbench(params)
+        self._workbench = mcp_workbench_pool().workbench(params)
         return self._workbench
 
     @staticmethod
@@ -388,62 +396,25 @@ class PlannerAgent(HauntAwareAgentMixin, RoutedAgent):
 
         now = dt.datetime.now(dt.timezone.utc).astimezone(tz)
         duration = dt.timedelta(minutes=message.duration_min)
+        windows = working_windows(
+            not_before=now + dt.timedelta(minutes=5),
+            days=message.horizon_days,
+            tz=tz,
+            work_start=dt.time(message.work_start_hour, 0),
+            work_end=dt.time(message.work_end_hour, 0),
+        )
+        if not windows:
+            return SuggestedSlot(ok=False, error="No free slot found")
+        horizon_start, horizon_end = windows[0][0], windows[-1][1]
 
-        # TODO: when is this called, and doesnt the mcp tool already have a trool to see free vs busy?
-        def _busy_intervals(
-            events: list[dict],
-        ) -> list[tuple[dt.datetime, dt.datetime]]:
-            intervals: list[tuple[dt.datetime, dt.datetime]] = []
-            for event in events:
-                if (event.get("status") or "").lower() == "cancelled":
-                    continue
-                start = self._parse_event_dt(event.get("start"), tz=tz)
-                end = self._parse_event_dt(event.get("end"), tz=tz)
-                if start and end and end > start:
-                    intervals.append((start, end))
-            intervals.sort(key=lambda pair: pair[0])
-            merged: list[tuple[dt.datetime, dt.datetime]] = []
-            for start, end in intervals:
-                if not merged or start > merged[-1][1]:
-                    merged.append((start, end))
-                else:
-                    merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-            return merged
-
-        def _first_gap(
-            window_start: dt.datetime,
-            window_end: dt.datetime,
-            busy: list[tuple[dt.datetime, dt.datetime]],
-        ) -> dt.datetime | None:
-            cursor = window_start
-            for start, end in busy:
-                if start - cursor >= duration:
-                    return cursor
-                cursor = max(cursor, end)
-                if cursor >= window_end:
-                    return None
-            if window_end - cursor >= duration:
-                return cursor
-            return None
-
-        horizon_days = max(int(message.horizon_days), 1)
-        for day_offset in range(0, horizon_days):
-            day = (now + dt.timedelta(days=day_offset)).date()
-            window_start = dt.datetime.combine(
-                day, dt.time(message.work_start_hour, 0), tz
-            )
-            window_end = dt.datetime.combine(day, dt.time(message.work_end_hour, 0), tz)
-            if day_offset == 0:
-                window_start = max(window_start, now + dt.timedelta(minutes=5))
-            if window_end <= window_start:
-                continue
-
+        # One list-events read covers every working window of the horizon.
+        async def _fetch() -> list[dict] | None:
             result = await workbench.call_tool(
                 "list-events",
                 arguments={
                     "calendarId": message.calendar_id,
-                    "timeMin": self._calendar_tool_datetime(window_start),
-                    "timeMax": self._calendar_tool_datetime(window_end),
+                    "timeMin": self._calendar_tool_datetime(horizon_start),
+                    "timeMax": self._calendar_tool_datetime(horizon_end),
                     "singleEvents": True,
                     "orderBy": "startTime",
                 },
@@ -452,28 +423,83 @@ class PlannerAgent(HauntAwareAgentMixin, RoutedAgent):
             tool_error = self._extract_tool_error(payload)
             if tool_error:
                 logger.warning(
-                    "PlannerAgent list-events failed for slot search: calendar=%s day=%s error=%s",
+                    "PlannerAgent list-events failed for slot search: calendar=%s window=%s..%s error=%s",
                     message.calendar_id,
-                    day.isoformat(),
+                    horizon_start.isoformat(),
+                    horizon_end.isoformat(),
                     tool_error,
                 )
-                continue
-            events = self._normalize_events(payload)
-            start = _first_gap(window_start, window_end, _busy_intervals(events))
-            if start:
-                end = start + duration
-                return SuggestedSlot(
-                    ok=True,
-                    start_utc=start.astimezone(dt.timezone.utc).isoformat(),
-                    end_utc=end.astimezone(dt.timezone.utc).isoformat(),
-                    time_zone=tz.key,
+                return None
+            return self._normalize_events(payload)
+
+        events = await calendar_read_cache().list_events(
+            calendar_id=message.calendar_id,
+            start=horizon_start,
+            end=horizon_end,
+            fetch=_fetch,
+        )
+        if events is None:
+            return SuggestedSlot(ok=False, error="No free slot found")
+
+        slots = find_slots(
+            self._busy_index(events, tz=tz),
+            windows=windows,
+            duration=duration,
+            limit=max(int(message.max_candidates), 1),
+        )
+        if slots:
+            candidates = tuple(
+                SlotCandidate(
+                    start_utc=slot.start.astimezone(dt.timezone.utc).isoformat(),
+                    end_utc=slot.end.astimezone(dt.timezone.utc).isoformat(),
                 )
+                for slot in slots
+            )
+            return SuggestedSlot(
+                ok=True,
+                start_utc=candidates[0].start_utc,
+                end_utc=candidates[0].end_utc,
+                time_zone=tz.key,
+                candidates=candidates,
+            )
 
         return SuggestedSlot(ok=False, error="No free slot found")
 
+    @classmethod
+    def _busy_index(cls, events: list[dict], *, tz: ZoneInfo) -> BusyIndex:
+        """Index the busy time of ``events`` (cancelled and free events skipped)."""
+        intervals: list[tuple[dt.datetime, dt.datetime]] = []
+        for event in events:
+            if (event.get("status") or "").lower() == "cancelled":
+                continue
+            if (event.get("transparency") or "").lower() == "transparent":
+                continue
+            start = cls._parse_event_dt(event.get("start"), tz=tz)
+            end = cls._parse_event_dt(event.get("end"), tz=tz)
+            if start and end:
+                intervals.append((start, end))
+        return BusyIndex(intervals)
+
     @message_handler
     async def handle_upsert_calendar_event(
         self, message: UpsertCalendarEvent, ctx: MessageContext
+    ) -> UpsertCalendarEventResult:
+        try:
+            return await self._upsert_calendar_event(message)
+        finally:
+            # Drop cached reads holding the event's old or new position.
+            calendar_read_cache().invalidate_for_payload(
+                {
+                    "calendarId": message.calendar_id,
+                    "eventId": message.event_id,
+                    "start": message.start,
+                    "end": message.end,
+                    "timeZone": message.time_zone,
+                }
+            )
+
+    async def _upsert_calendar_event(
+        self, message: UpsertCalendarEvent
     ) -> UpsertCalendarEventResult:
         logger.info(
             "Upserting calendar event: calendar=%s, event_id=%s, summary=%s",
@@ -858,7 +884,7 @@ class CalendarEventWorkerAgent(RoutedAgent):
     def __init__(self, name: str, server_url: str):
         super().__init__(description=name)
         params = StreamableHttpServerParams(url=server_url, timeout=5.0)
-        self.workbench = McpWorkbench(params)  # auto-starts on first call if needed
+        self.workbench = mcp_workbench_pool().workbench(params)
 
     @message_handler
     async def handle_calendar_event(
@@ -13,6 +13,13 @@ class SuggestNextSlot:
     horizon_days: int = 2  # TODO: this should be a setting, not hardcoded here
     work_start_hour: int = 9  # TODO: this should be a setting, not hardcoded here
     work_end_hour: int = 18  # TODO: this should be a setting, not hardcoded here
+    max_candidates: int = 3
+
+
+@dataclass(frozen=True)
+class SlotCandidate:
+    start_utc: str
+    end_utc: str
 
 
 @dataclass(frozen=True)
@@ -22,6 +29,8 @@ class SuggestedSlot:
     end_utc: str | None = None
     time_zone: str | None = None
     error: str | None = None
+    # Ranked options (earliest first); the first equals ``start_utc``/``end_utc``.
+    candidates: tuple[SlotCandidate, ...] = ()
 
 
 @dataclass(frozen=True)
@@ -46,6 +55,7 @@ class UpsertCalendarEventResult:
 
 
 __all__ = [
+    "SlotCandidate",
     "SuggestNextSlot",
     "SuggestedSlot",
     "UpsertCalendarEvent",
@@ -16,6 +16,7 @@ from pydantic import BaseModel, Field
 from fateforger.agents.timeboxing.durable_constraint_store import (
     DurableConstraintStore,
     build_durable_constraint_store,
+    durable_store_share_key,
 )
 from fateforger.agents.timeboxing.graphiti_constraint_memory import (
     build_graphiti_client_from_settings,
@@ -82,6 +83,7 @@ class TaskDefaultsMemoryStore:
             self._unavailable_reason_code = "backend_disabled"
             return None
         try:
+            user_id = None
             if self._backend == "constraint_mcp":
                 self._client = ConstraintMemoryClient(timeout=self.timeout_s)
             elif self._backend == "graphiti":
@@ -92,7 +94,10 @@ class TaskDefaultsMemoryStore:
                 self._client = build_graphiti_client_from_settings(user_id=user_id)
             else:
                 raise ValueError(f"Unsupported tasks defaults memory backend: {self._backend}")
-            self._store = build_durable_constraint_store(self._client)
+            self._store = build_durable_constraint_store(
+                self._client,
+                share_key=durable_store_share_key(self._backend, user_id=user_id),
+            )
             self._unavailable_reason = None
             self._unavailable_reason_code = None
         except Exception as exc:
@@ -15,6 +15,7 @@ from typing import Any, Literal
 from pydantic import BaseModel, Field, ValidationError
 from yarl import URL
 
+from fateforger.tools.mcp_pool import mcp_workbench_pool
 from fateforger.tools.ticktick_mcp import (
     get_ticktick_mcp_url,
     normalize_ticktick_mcp_url,
@@ -1179,7 +1180,7 @@ class TickTickListManager:
         if self._workbench is not None:
             return self._workbench
         try:
-            from autogen_ext.tools.mcp import McpWorkbench, StreamableHttpServerParams
+            from autogen_ext.tools.mcp import StreamableHttpServerParams
         except Exception as exc:  # pragma: no cover
             raise RuntimeError(
                 "autogen_ext tools are required for TickTick MCP access"
@@ -1211,7 +1212,7 @@ class TickTickListManager:
             if not ok:
                 raise RuntimeError(reason or "TickTick MCP endpoint is unavailable.")
         params = StreamableHttpServerParams(url=self._server_url, timeout=self._timeout)
-        self._workbench = McpWorkbench(params)
+        self._workbench = mcp_workbench_pool().workbench(params)
         return self._workbench
 
     @staticmethod
@@ -14,6 +14,7 @@ from typing import Any, Sequence
 from pydantic import BaseModel, Field
 from yarl import URL
 
+from fateforger.tools.mcp_pool import mcp_workbench_pool
 from fateforger.tools.mcp_url_validation import rewrite_mcp_host
 from fateforger.tools.notion_mcp import (
     get_notion_mcp_headers,
@@ -624,7 +625,7 @@ class NotionSprintManager:
         if self._workbench is not None:
             return self._workbench
         try:
-            from autogen_ext.tools.mcp import McpWorkbench, StreamableHttpServerParams
+            from autogen_ext.tools.mcp import StreamableHttpServerParams
         except Exception as exc:  # pragma: no cover
             raise RuntimeError(
                 "autogen_ext tools are required for Notion MCP access"
@@ -661,7 +662,7 @@ class NotionSprintManager:
             headers=get_notion_mcp_headers(),
             timeout=self._timeout,
         )
-        self._workbench = McpWorkbench(params)
+        self._workbench = mcp_workbench_pool().workbench(params)
         return self._workbench
 
     @staticmethod
@@ -9,13 +9,14 @@ import logging
 import os
 import re
 import sys
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta, timezone
 from enum import Enum
 from functools import wraps
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Callable, Dict, List, Literal, ParamSpec, Type, TypeVar
+from typing import Any, Awaitable, Callable, Dict, List, Literal, ParamSpec, Type, TypeVar
 from zoneinfo import ZoneInfo
 
 from autogen_agentchat.agents import AssistantAgent
@@ -29,6 +30,7 @@ from autogen_core import (
     message_handler,
 )
 from autogen_core.tools import FunctionTool
+from cachetools import TTLCache
 from dateutil import parser as date_parser
 from pydantic import BaseModel
 from pydantic import Field as PydanticField
@@ -90,9 +92,11 @@ from .contracts import (
     TaskCandidate,
     WorkWindow,
 )
+from .constraint_query_cache import CachedDurableConstraintStore, ConstraintCacheEpoch
 from .durable_constraint_store import (
     DurableConstraintStore,
     build_durable_constraint_store,
+    durable_store_share_key,
 )
 from .flow_graph import build_timeboxing_graphflow
 from .mcp_clients import ConstraintMemoryClient, McpCalendarClient
@@ -121,6 +125,7 @@ from .nlu import (
 # dead code. The live write path is _upsert_constraints_to_durable_store.
 # Remove this import together with _ensure_constraint_mcp_tools below.
 from .notion_constraint_extractor import NotionConstraintExtractor
+from .patch_commands import is_patch_command
 from .patching import TimeboxPatcher
 from .planning_aspects import ConstraintAspectClassification
 from .planning_policy import QUALITY_RUBRIC_PROMPT
@@ -139,6 +144,13 @@ from .preferences import (
 from .prompt_rendering import render_skeleton_draft_system_prompt
 from .pydantic_parsing import parse_chat_content, parse_model_list, parse_model_optional
 from .scheduler_prefetch_capability import SchedulerPrefetchCapability
+from .session_store import (
+    SESSION_TRANSIENT,
+    SessionCache,
+    SessionCodec,
+    SqlAlchemyTimeboxingSessionStore,
+    ensure_timeboxing_session_schema,
+)
 from .stage_gating import (
     CAPTURE_INPUTS_PROMPT,
     COLLECT_CONSTRAINTS_PROMPT,
@@ -194,6 +206,28 @@ def _fallback_on_parse_error(default: R) -> Callable[[Callable[P, R]], Callable[
     return _decorator
 
 
+def _persists_sessions(
+    func: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """Write touched sessions through to the session store after a handler.
+
+    The sessions the handler itself used are always saved, even when another
+    handler's flush already took them from the cache's shared touched set.
+    """
+
+    @wraps(func)
+    async def _wrapped(*args: P.args, **kwargs: P.kwargs) -> R:
+        sessions = getattr(args[0], "_sessions", None)
+        turn = sessions.turn() if isinstance(sessions, SessionCache) else nullcontext()
+        with turn:
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                await args[0]._flush_sessions()  # type: ignore[attr-defined]
+
+    return _wrapped
+
+
 class _ConstraintInterpretationPayload(BaseModel):
     """Input payload for constraint interpretation (multilingual, structured output)."""
 
@@ -302,20 +336,26 @@ class Session:
     )
     durable_constraints_loaded_stages: set[str] = field(default_factory=set)
     durable_constraints_date: str | None = None
-    pending_durable_constraints: bool = False
-    pending_durable_stages: set[str] = field(default_factory=set)
+    pending_durable_constraints: bool = field(default=False, metadata=SESSION_TRANSIENT)
+    pending_durable_stages: set[str] = field(
+        default_factory=set, metadata=SESSION_TRANSIENT
+    )
     durable_constraints_failed_stages: Dict[str, str] = field(default_factory=dict)
-    pending_calendar_prefetch: bool = False
+    pending_calendar_prefetch: bool = field(default=False, metadata=SESSION_TRANSIENT)
     background_updates: List[str] = field(default_factory=list)
     prefetched_pending_tasks: List[TaskCandidate] = field(default_factory=list)
-    pending_tasks_prefetch: bool = False
+    pending_tasks_prefetch: bool = field(default=False, metadata=SESSION_TRANSIENT)
     timebox: Timebox | None = None
     pre_generated_skeleton: Timebox | None = None
     pre_generated_skeleton_plan: TBPlan | None = None
     pre_generated_skeleton_markdown: str | None = None
     pre_generated_skeleton_fingerprint: str | None = None
-    pre_generated_skeleton_task: asyncio.Task | None = None
-    pending_skeleton_pre_generation: bool = False
+    pre_generated_skeleton_task: asyncio.Task | None = field(
+        default=None, metadata=SESSION_TRANSIENT
+    )
+    pending_skeleton_pre_generation: bool = field(
+        default=False, metadata=SESSION_TRANSIENT
+    )
     skeleton_overview_markdown: str | None = None
     tb_plan: TBPlan | None = None
     base_snapshot: TBPlan | None = None
@@ -340,18 +380,30 @@ class Session:
     last_quality_label: str | None = None
     last_quality_next_step: str | None = None
     constraints_prefetched: bool = False
-    pending_constraint_extractions: set[str] = field(default_factory=set)
-    last_extraction_task: asyncio.Task | None = None
-    graphflow: GraphFlow | None = None
-    reply_turn_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
-    graph_turn_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    pending_constraint_extractions: set[str] = field(
+        default_factory=set, metadata=SESSION_TRANSIENT
+    )
+    last_extraction_task: asyncio.Task | None = field(
+        default=None, metadata=SESSION_TRANSIENT
+    )
+    graphflow: GraphFlow | None = field(default=None, metadata=SESSION_TRANSIENT)
+    reply_turn_lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, repr=False, metadata=SESSION_TRANSIENT
+    )
+    graph_turn_lock: asyncio.Lock = field(
+        default_factory=asyncio.Lock, repr=False, metadata=SESSION_TRANSIENT
+    )
     skip_stage_execution: bool = False
     force_stage_rerun: bool = False
     thread_state: str | None = None
     session_key: str | None = None
     debug_log_path: str | None = None
-    graph_turn_started_at_monotonic: float | None = None
-    graph_turn_deadline_monotonic: float | None = None
+    graph_turn_started_at_monotonic: float | None = field(
+        default=None, metadata=SESSION_TRANSIENT
+    )
+    graph_turn_deadline_monotonic: float | None = field(
+        default=None, metadata=SESSION_TRANSIENT
+    )
 
 
 @dataclass
@@ -423,7 +475,11 @@ class TimeboxingFlowAgent(RoutedAgent):
     def __init__(self, name: str) -> None:
         """Initialize the timeboxing agent and supporting clients."""
         super().__init__(description=name)
-        self._sessions: Dict[str, Session] = {}
+        self._sessions: SessionCache[Session] = SessionCache(
+            max_entries=TIMEBOXING_LIMITS.session_cache_max_entries,
+            idle_ttl_s=TIMEBOXING_TIMEOUTS.session_idle_ttl_s,
+        )
+        self._session_store: SqlAlchemyTimeboxingSessionStore[Session] | None = None
         self._model_client = build_autogen_chat_client(
             "timeboxing_agent", parallel_tool_calls=False
         )
@@ -437,6 +493,8 @@ class TimeboxingFlowAgent(RoutedAgent):
         self._constraint_memory_client: Any | None = None
         self._constraint_memory_unavailable_reason: str | None = None
         self._durable_constraint_store: DurableConstraintStore | None = None
+        self._durable_store_caches: TTLCache = self._new_durable_store_caches()
+        self._durable_cache_epoch = ConstraintCacheEpoch()
         self._ticktick_client: TickTickMcpClient | None = None
         self._constraint_store: ConstraintStore | None = None
         self._constraint_engine = None
@@ -1006,16 +1064,82 @@ class TimeboxingFlowAgent(RoutedAgent):
         if existing is not None:
             return existing
         client = self._ensure_constraint_memory_client()
-        store = build_durable_constraint_store(client)
+        backend = str(getattr(settings, "timeboxing_memory_backend", "constraint_mcp"))
+        user_id = None
+        if backend.strip().lower() == "graphiti":
+            user_id = (
+                str(getattr(settings, "graphiti_user_id", "") or "").strip()
+                or "timeboxing"
+            )
+        store = build_durable_constraint_store(
+            client, share_key=durable_store_share_key(backend, user_id=user_id)
+        )
         self._durable_constraint_store = store
         return store
 
+    @staticmethod
+    def _new_durable_store_caches() -> TTLCache:
+        """Per-session read caches, dropped once a session has gone idle."""
+        return TTLCache(
+            maxsize=TIMEBOXING_LIMITS.session_cache_max_entries,
+            ttl=TIMEBOXING_TIMEOUTS.session_idle_ttl_s,
+        )
+
+    def _session_durable_store(
+        self, session: Session | None
+    ) -> DurableConstraintStore | None:
+        """Return the durable store behind this session's read-through cache.
+
+        ``session=None`` returns an agent-wide cache for callers without a
+        session (the stage-gating ``search_constraints`` tool).  All caches
+        share one write epoch, so a write through any of them clears them all.
+        """
+        store = self._ensure_durable_constraint_store()
+        if store is None:
+            return None
+        caches = getattr(self, "_durable_store_caches", None)
+        if caches is None:
+            caches = self._durable_store_caches = self._new_durable_store_caches()
+        epoch = getattr(self, "_durable_cache_epoch", None)
+        if epoch is None:
+            epoch = self._durable_cache_epoch = ConstraintCacheEpoch()
+        key = self._durable_cache_key(session)
+        cached = caches.get(key)
+        if cached is None or cached.store is not store:
+            cached = CachedDurableConstraintStore(
+                store,
+                ttl_s=float(
+                    getattr(settings, "timeboxing_constraint_cache_ttl_seconds", 120.0)
+                ),
+                superset_limit=int(
+                    getattr(settings, "timeboxing_constraint_cache_superset_limit", 200)
+                ),
+                epoch=epoch,
+            )
+            caches[key] = cached
+        return cached
+
+    @staticmethod
+    def _durable_cache_key(session: Session | None) -> str:
+        if session is None:
+            return ""
+        return session.session_key or f"{session.channel_id}:{session.thread_ts}"
+
+    def _log_durable_cache_stats(self, session: Session) -> None:
+        """Write the session's constraint read-cache counters to its debug log."""
+        caches = getattr(self, "_durable_store_caches", None)
+        cached = caches.get(self._durable_cache_key(session)) if caches else None
+        if isinstance(cached, CachedDurableConstraintStore):
+            self._session_debug(
+                session, "durable_cache_stats", **cached.stats.as_log_payload()
+            )
+
     # TODO: thia should be a tool, not a bolted on method
     async def _fetch_durable_constraints(
         self, session: Session, *, stage: TimeboxingStage
     ) -> List[Constraint]:
         """Fetch durable constraints for a stage from the configured memory backend."""
-        store = self._ensure_durable_constraint_store()
+        store = self._session_durable_store(session)
         if not store:
             self._session_debug(
                 session,
@@ -1103,6 +1227,7 @@ class TimeboxingFlowAgent(RoutedAgent):
                 ],
                 query_plan=plan_payload,
             )
+            self._log_durable_cache_stats(session)
         except Exception as exc:
             # This is a background prefetch and we want failures to be visible in Slack.
             msg = f"Durable constraints failed to load: {type(exc).__name__}: {exc}"
@@ -1659,7 +1784,7 @@ class TimeboxingFlowAgent(RoutedAgent):
             try:
                 await self._durable_constraint_semaphore.acquire()
                 acquired = True
-                store = self._ensure_durable_constraint_store()
+                store = self._session_durable_store(session)
                 if store is None:
                     return
                 result = await store.dedupe_constraints(limit=2000, dry_run=False)
@@ -1704,7 +1829,7 @@ class TimeboxingFlowAgent(RoutedAgent):
         """Upsert extracted constraints deterministically into the durable MCP store."""
         if not constraints:
             return 0
-        store = self._ensure_durable_constraint_store()
+        store = self._session_durable_store(session)
         if store is None:
             return 0
         prepared: list[tuple[ConstraintBase, dict[str, Any], dict[str, Any]]] = []
@@ -2260,6 +2385,7 @@ class TimeboxingFlowAgent(RoutedAgent):
                 day=date.fromisoformat(planned_date),
                 tz=tz,
                 diagnostics=diagnostics,
+                refresh=force_refresh,
             )
             immovables = snapshot.immovables
             session.prefetched_immovables_by_date[planned_date] = immovables
@@ -4612,7 +4738,31 @@ class TimeboxingFlowAgent(RoutedAgent):
         patch_message: str,
         user_message: str,
     ) -> RefineToolExecutionOutcome:
-        """Run prompt-guided patch tooling while always queueing memory in background."""
+        """Run prompt-guided patch tooling while always queueing memory in background.
+
+        Explicit ``/edit`` commands (when the patcher has local commands
+        enabled) skip tool selection and go straight to the patcher.
+        """
+        patcher = getattr(self, "_timebox_patcher", None)
+        if getattr(patcher, "local_commands_enabled", False) and is_patch_command(
+            user_message or ""
+        ):
+            calendar = await self._execute_refine_patch_and_sync(
+                session=session,
+                patch_message=patch_message,
+            )
+            task = self._queue_reflection_memory_write(
+                session=session,
+                user_message=user_message,
+                calendar=calendar,
+                memory_operations=[],
+            )
+            return RefineToolExecutionOutcome(
+                patch_selected=True,
+                memory_queued=task is not None,
+                fallback_patch_used=False,
+                calendar=calendar,
+            )
         requested_patch: list[str] = []
         memory_operations: list[str] = []
         memory_request_text = (user_message or "").strip() or (
@@ -4960,7 +5110,7 @@ class TimeboxingFlowAgent(RoutedAgent):
         limit: int = 20,
     ) -> dict[str, Any]:
         """Execute one durable-memory tool action with shared validation and logging."""
-        store = self._ensure_durable_constraint_store()
+        store = self._session_durable_store(session)
         if store is None:
             return self._record_memory_tool_result(
                 session=session,
@@ -5240,14 +5390,14 @@ class TimeboxingFlowAgent(RoutedAgent):
         user_message: str,
         calendar: CalendarSyncOutcome,
         memory_operations: list[str],
-    ) -> None:
+    ) -> asyncio.Task | None:
         """Persist a lightweight per-turn reflection entry in durable memory."""
         text = (user_message or "").strip()
         if not text:
-            return
+            return None
         store = self._ensure_durable_constraint_store()
         if store is None:
-            return
+            return None
         payload = {
             "user_id": session.user_id,
             "stage": session.stage.value if session.stage else None,
@@ -5278,14 +5428,14 @@ class TimeboxingFlowAgent(RoutedAgent):
                     error=str(exc)[:500],
                 )
 
-        asyncio.create_task(_background())
+        return asyncio.create_task(_background())
 
     def _build_refine_memory_component(
         self, *, session: Session
     ) -> ConstraintPlanningMemory:
         """Build a per-turn AutoGen memory component for stage-aware constraint injection."""
         component = ConstraintPlanningMemory(
-            store_provider=self._ensure_durable_constraint_store,
+            store_provider=lambda: self._session_durable_store(session),
             max_items=12,
         )
         component.set_planning_state(
@@ -6302,7 +6452,7 @@ class TimeboxingFlowAgent(RoutedAgent):
                     "Skipped search_constraints for Stage 1 because no concrete query "
                     "facet was provided. Using deterministic saved-default prefetch."
                 )
-            client = agent_ref._ensure_durable_constraint_store()
+            client = agent_ref._session_durable_store(None)
             return await search_constraints(
                 queries=query_payloads,
                 planned_date=planned_date,
@@ -6334,6 +6484,100 @@ class TimeboxingFlowAgent(RoutedAgent):
         self._constraint_store = ConstraintStore(sessionmaker)
         self._constraint_engine = engine
 
+    async def _ensure_session_store(
+        self,
+    ) -> SqlAlchemyTimeboxingSessionStore[Session] | None:
+        """Initialize the session store on the constraint-store engine."""
+        store = getattr(self, "_session_store", None)
+        if store is not None or not settings.timeboxing_session_persistence:
+            return store
+        await self._ensure_constraint_store()
+        engine = getattr(self, "_constraint_engine", None)
+        if engine is None:
+            return None
+        await ensure_timeboxing_session_schema(engine)
+        self._session_store = SqlAlchemyTimeboxingSessionStore(
+            async_sessionmaker(engine, expire_on_commit=False),
+            SessionCodec(Session),
+        )
+        return self._session_store
+
+    async def _load_session(self, key: str) -> Session | None:
+        """Return the live session for ``key``, rehydrating it from the store."""
+        session = self._sessions.get(key)
+        if session is not None or not isinstance(self._sessions, SessionCache):
+            return session
+        try:
+            store = await self._ensure_session_store()
+            if store is None:
+                return None
+            session = await store.load(key)
+        except Exception:
+            logger.warning("Failed to load timeboxing session key=%s", key, exc_info=True)
+            return None
+        if session is None:
+            return None
+        session.session_key = key
+        self._sessions[key] = session
+        self._session_debug(session, "session_rehydrated", stage=session.stage.value)
+        return session
+
+    def _session_is_busy(self, session: Session) -> bool:
+        """Return whether ``session`` has in-flight work and must stay in memory.
+
+        Background prefetches write their results onto the in-memory session,
+        so a session with any pending prefetch flag is pinned too.
+        """
+        if session.graph_turn_lock.locked() or session.reply_turn_lock.locked():
+            return True
+        if (
+            session.pending_calendar_prefetch
+            or session.pending_durable_constraints
+            or session.pending_tasks_prefetch
+        ):
+            return True
+        extraction_tasks = getattr(self, "_constraint_extraction_tasks", {})
+        tasks = [
+            session.pre_generated_skeleton_task,
+            session.last_extraction_task,
+            *(extraction_tasks.get(key) for key in session.pending_constraint_extractions),
+        ]
+        return any(task is not None and not task.done() for task in tasks)
+
+    async def _flush_sessions(self) -> None:
+        """Persist sessions touched this turn and evict idle/overflow sessions.
+
+        Without a session store nothing is evicted, so no session is lost.
+        """
+        sessions = getattr(self, "_sessions", None)
+        if not isinstance(sessions, SessionCache):
+            return
+        evict: list[str] = []
+        try:
+            touched = sessions.take_touched()
+            evict = sessions.eviction_candidates(pinned=self._session_is_busy)
+            if not touched and not evict:
+                return
+            store = await self._ensure_session_store()
+            if store is None:
+                return
+            for key in dict.fromkeys([*touched, *evict]):
+                session = sessions.peek(key)
+                if session is None:
+                    continue
+                await store.save(
+                    key,
+                    session,
+                    user_id=session.user_id,
+                    channel_id=session.channel_id,
+                    thread_ts=session.thread_ts,
+                )
+        except Exception:
+            logger.warning("Failed to persist timeboxing sessions", exc_info=True)
+            return
+        for key in evict:
+            sessions.pop(key, None)
+
     async def _extract_constraints(
         self,
         session: Session,
@@ -7041,6 +7285,7 @@ class TimeboxingFlowAgent(RoutedAgent):
     # endregion
 
     @message_handler
+    @_persists_sessions
     async def on_start(
         self, message: StartTimeboxing, ctx: MessageContext
     ) -> TextMessage | SlackBlockMessage:
@@ -7058,6 +7303,7 @@ class TimeboxingFlowAgent(RoutedAgent):
             now=now_utc,
             tz=ZoneInfo(tz_name),
         )
+        await self._load_session(key)
         session, created = self._ensure_uncommitted_session(
             key=key,
             thread_ts=message.thread_ts,
@@ -7085,6 +7331,7 @@ class TimeboxingFlowAgent(RoutedAgent):
         return self._build_commit_prompt_blocks(session=session)
 
     @message_handler
+    @_persists_sessions
     async def on_commit_date(
         self, message: TimeboxingCommitDate, ctx: MessageContext
     ) -> TextMessage | SlackBlockMessage:
@@ -7095,7 +7342,7 @@ class TimeboxingFlowAgent(RoutedAgent):
             channel_id=message.channel_id,
             thread_ts=message.thread_ts,
         )
-        session = self._sessions.get(key)
+        session = await self._load_session(key)
         if not session:
             session = Session(
                 thread_ts=message.thread_ts,
@@ -7144,6 +7391,7 @@ class TimeboxingFlowAgent(RoutedAgent):
         return outgoing
 
     @message_handler
+    @_persists_sessions
     async def on_user_reply(
         self, message: TimeboxingUserReply, ctx: MessageContext
     ) -> TextMessage | SlackBlockMessage | SlackThreadStateMessage:
@@ -7154,7 +7402,7 @@ class TimeboxingFlowAgent(RoutedAgent):
             channel_id=message.channel_id,
             thread_ts=message.thread_ts,
         )
-        session = self._sessions.get(key)
+        session = await self._load_session(key)
         if not session:
             tz_name = self._resolve_tz_name(self._default_tz_name())
             now_utc = datetime.now(timezone.utc)
@@ -7347,12 +7595,13 @@ class TimeboxingFlowAgent(RoutedAgent):
             return outgoing
 
     @message_handler
+    @_persists_sessions
     async def on_user_text(
         self, message: TextMessage, ctx: MessageContext
     ) -> TextMessage | SlackBlockMessage | SlackThreadStateMessage:
         """Handle generic text messages routed to the timeboxing agent."""
         key = self._session_key(ctx)
-        session = self._sessions.get(key)
+        session = await self._load_session(key)
         if not session:
             return TextMessage(
                 content="Let's start by telling me what window you want to plan.",
@@ -7419,12 +7668,13 @@ class TimeboxingFlowAgent(RoutedAgent):
         return outgoing
 
     @message_handler
+    @_persists_sessions
     async def on_stage_action(
         self, message: TimeboxingStageAction, ctx: MessageContext
     ) -> TextMessage | SlackBlockMessage | SlackThreadStateMessage:
         """Handle deterministic stage-control actions from Slack buttons."""
         key = self._session_key(ctx, fallback=message.thread_ts)
-        session = self._sessions.get(key)
+        session = await self._load_session(key)
         if not session:
             return TextMessage(
                 content="That timeboxing session is no longer active.",
@@ -7554,12 +7804,13 @@ class TimeboxingFlowAgent(RoutedAgent):
             raise
 
     @message_handler
+    @_persists_sessions
     async def on_confirm_submit(
         self, message: TimeboxingConfirmSubmit, ctx: MessageContext
     ) -> TextMessage | SlackBlockMessage:
         """Handle explicit Stage 5 confirm-submit action."""
         key = self._session_key(ctx, fallback=message.thread_ts)
-        session = self._sessions.get(key)
+        session = await self._load_session(key)
         if not session:
             return TextMessage(
                 content="That timeboxing session is no longer active.",
@@ -7811,12 +8062,13 @@ class TimeboxingFlowAgent(RoutedAgent):
         )
 
     @message_handler
+    @_persists_sessions
     async def on_cancel_submit(
         self, message: TimeboxingCancelSubmit, ctx: MessageContext
     ) -> TextMessage:
         """Handle Stage 5 cancel-submit action and return to refine stage."""
         key = self._session_key(ctx, fallback=message.thread_ts)
-        session = self._sessions.get(key)
+        session = await self._load_session(key)
         if not session:
             return TextMessage(
                 content="That timeboxing session is no longer active.",
@@ -7833,12 +8085,13 @@ class TimeboxingFlowAgent(RoutedAgent):
         )
 
     @message_handler
+    @_persists_sessions
     async def on_undo_submit(
         self, message: TimeboxingUndoSubmit, ctx: MessageContext
     ) -> TextMessage | SlackBlockMessage:
         """Handle Stage 5 undo-submit action using session-backed transaction state."""
         key = self._session_key(ctx, fallback=message.thread_ts)
-        session = self._sessions.get(key)
+        session = await self._load_session(key)
         if not session:
             return TextMessage(
                 content="That timeboxing session is no longer active.",
@@ -7906,6 +8159,7 @@ class TimeboxingFlowAgent(RoutedAgent):
         )
 
     @message_handler
+    @_persists_sessions
     async def on_finalise(
         self, message: TimeboxingFinalResult, ctx: MessageContext
     ) -> TextMessage:
@@ -7922,6 +8176,14 @@ class TimeboxingFlowAgent(RoutedAgent):
             if session.session_key and session.session_key != key:
                 self._close_session_debug_logger(session.session_key)
         self._close_session_debug_logger(key)
+        store = getattr(self, "_session_store", None)
+        if store is not None:
+            try:
+                await store.delete(key)
+            except Exception:
+                logger.warning(
+                    "Failed to delete timeboxing session key=%s", key, exc_info=True
+                )
         return TextMessage(
             content=f"Session {message.thread_ts} marked {message.status}: {message.summary}",
             source=self.id.type,
@@ -11,6 +11,7 @@ from dataclasses import dataclass, field
 from datetime import time
 from typing import Any, Literal
 
+from .day_grid import DayGrid, minute_of_day
 from .tb_models import TBPlan
 
 MatchKind = Literal["id", "canonical", "fuzzy"]
@@ -248,15 +249,24 @@ def reconcile_calendar_ops(
         remaining_desired.discard(desired_record.index)
         remaining_remote.discard(remote_record.index)
 
-    # Pass 3: conservative fuzzy match.
+    # Pass 3: conservative fuzzy match, bucketed by normalized summary.
+    # Buckets hold remote records in ascending index order so the strict ``>``
+    # comparison keeps the lowest-index record on score ties.
+    remote_by_summary: dict[str, list[RemoteEventRecord]] = {}
+    for index in sorted(remaining_remote):
+        record = remote_by_index[index]
+        remote_by_summary.setdefault(_normalize_summary(record.summary), []).append(
+            record
+        )
     for desired_index in sorted(remaining_desired):
         desired_record = desired_by_index[desired_index]
-        desired_summary = _normalize_summary(desired_record.summary)
+        bucket = remote_by_summary.get(_normalize_summary(desired_record.summary))
+        if not bucket:
+            continue
         best_score: tuple[int, int, int] | None = None
         best_remote: RemoteEventRecord | None = None
-        for remote_index in sorted(remaining_remote):
-            remote_record = remote_by_index[remote_index]
-            if _normalize_summary(remote_record.summary) != desired_summary:
+        for remote_record in bucket:
+            if remote_record.index not in remaining_remote:
                 continue
             overlap = _overlap_minutes(
                 desired_record.start_time,
@@ -290,42 +300,52 @@ def reconcile_calendar_ops(
     # Pass 4: overlap guard against foreign immovables.
     # If a desired event almost fully overlaps a foreign remote event, treat it as
     # a no-op match to avoid creating duplicate calendar blocks (e.g., seeded lunch).
+    # Foreign candidates live in a ``DayGrid`` so each desired event only visits
+    # the candidates that intersect it.
+    foreign_records = [
+        remote_by_index[index]
+        for index in sorted(remaining_remote)
+        if not remote_by_index[index].is_owned
+    ]
+    foreign_grid = DayGrid.from_times(
+        (record.start_time, record.end_time) for record in foreign_records
+    )
     for desired_index in sorted(remaining_desired):
+        if not foreign_records:
+            break
         desired_record = desired_by_index[desired_index]
         desired_duration = _duration_minutes(
             desired_record.start_time, desired_record.end_time
         )
         if desired_duration <= 0:
             continue
-        best_score: tuple[int, int, int, int] | None = None
+        desired_start = minute_of_day(desired_record.start_time)
+        desired_end = minute_of_day(desired_record.end_time)
+        best_key: tuple[int, int, int, int, int] | None = None
         best_remote: RemoteEventRecord | None = None
-        for remote_index in sorted(remaining_remote):
-            remote_record = remote_by_index[remote_index]
-            if remote_record.is_owned:
+        for position in foreign_grid.overlapping(desired_start, desired_end):
+            remote_record = foreign_records[position]
+            if remote_record.index not in remaining_remote:
                 continue
-            remote_duration = _duration_minutes(
-                remote_record.start_time, remote_record.end_time
+            remote_start, remote_end = foreign_grid.span_minutes(position)
+            overlap = foreign_grid.overlap_minutes(position, desired_start, desired_end)
+            overlap_percent = int(
+                (overlap * 100) / min(desired_duration, remote_end - remote_start)
             )
-            if remote_duration <= 0:
-                continue
-            overlap = _overlap_minutes(
-                desired_record.start_time,
-                desired_record.end_time,
-                remote_record.start_time,
-                remote_record.end_time,
-            )
-            if overlap <= 0:
-                continue
-            overlap_percent = int((overlap * 100) / min(desired_duration, remote_duration))
             if overlap_percent < foreign_overlap_match_min_percent:
                 continue
-            start_delta = _minutes_between(
-                desired_record.start_time, remote_record.start_time
+            start_delta = abs(desired_start - remote_start)
+            end_delta = abs(desired_end - remote_end)
+            # Lowest remote index wins ties, matching an ascending-index scan.
+            key = (
+                overlap_percent,
+                overlap,
+                -start_delta,
+                -end_delta,
+                -remote_record.index,
             )
-            end_delta = _minutes_between(desired_record.end_time, remote_record.end_time)
-            score = (overlap_percent, overlap, -start_delta, -end_delta)
-            if best_score is None or score > best_score:
-                best_score = score
+            if best_key is None or key > best_key:
+                best_key = key
                 best_remote = remote_record
         if best_remote is None:
             continue
@@ -36,6 +36,8 @@ class TimeboxingTimeouts:
     slow_turn_warn_s: float = 30.0
     refine_summary_min_budget_s: float = 25.0
     refine_quality_min_budget_s: float = 45.0
+    refine_patcher_hedge_stagger_s: float = 2.0
+    session_idle_ttl_s: float = 1800.0
 
 
 @dataclass(frozen=True, slots=True)
@@ -51,7 +53,18 @@ class TimeboxingLimits:
 
     durable_constraint_type_ids_limit: int = 12
     durable_constraint_query_limit: int = 50
+    durable_identity_index_rows: int = 5000
+    durable_identity_index_ttl_s: float = 60.0
+    durable_store_read_concurrency: int = 16
+    durable_store_write_concurrency: int = 4
     refine_patcher_constraint_limit: int = 24
+    refine_patcher_hedge_candidates: int = 1
+    session_cache_max_entries: int = 256
+
+    calendar_sync_concurrency: int = 4
+    calendar_sync_rate_per_s: float = 8.0
+    calendar_sync_burst: int = 4
+    calendar_sync_batch_size: int = 50
 
 
 @dataclass(frozen=True, slots=True)
@@ -0,0 +1,439 @@
+"""Session-scoped read-through cache in front of a ``DurableConstraintStore``.
+
+One timeboxing session queries the durable store from several places (stage
+prefetch via ``ConstraintRetriever``, the ``search_constraints`` tool, the
+memory tools and the refine memory component), mostly with the same
+``as_of`` / statuses filters and only the stage changing.
+``CachedDurableConstraintStore`` wraps the store for one session:
+
+* ``query_constraints`` / ``query_types`` results are memoized by a
+  normalized filter key and expire after ``ttl_s``;
+* concurrent identical queries share one backend call;
+* a stage-filtered query is answered from a cached *complete* result of the
+  same query without a stage filter, by keeping rows whose
+  ``applies_stages`` contain the stage.  On a miss the wrapper fetches that
+  stage-less superset (up to ``superset_limit`` rows) once, so later stages
+  with the same filters are served locally.  Supersets are only fetched
+  once the backend has returned rows carrying ``applies_stages`` (the Notion
+  MCP server's rows do not);
+* every write method (upsert / update / archive / supersede / dedupe) goes
+  through to the store and bumps a ``ConstraintCacheEpoch`` shared by all
+  wrappers of that store, which clears every session's cached reads.
+
+Cached rows are returned as deep copies; callers may mutate them freely.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any
+
+from fateforger.core.logging_config import record_constraint_query_cache
+
+from .durable_constraint_store import DurableConstraintStore
+
+
+@dataclass(slots=True)
+class ConstraintCacheEpoch:
+    """Write counter shared by every cache wrapping the same store."""
+
+    value: int = 0
+
+    def bump(self) -> None:
+        self.value += 1
+
+
+@dataclass(frozen=True, slots=True)
+class ConstraintQueryKey:
+    """Normalized ``query_constraints`` arguments, excluding ``limit``."""
+
+    filters: tuple[tuple[str, Any], ...]
+    stage: str
+    type_ids: tuple[str, ...] | None
+    tags: tuple[str, ...] | None
+    sort: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        filters: dict[str, Any] | None,
+        type_ids: list[str] | None,
+        tags: list[str] | None,
+        sort: list[list[str]] | None,
+    ) -> "ConstraintQueryKey":
+        """Normalize arguments so equivalent queries share one key.
+
+        ``None``, blank strings and empty lists are dropped (backends treat
+        them as "no filter"); list filters become sorted tuples.
+        """
+        normalized: list[tuple[str, Any]] = []
+        stage = ""
+        for name, value in (filters or {}).items():
+            if name == "stage":
+                stage = str(value or "").strip()
+                continue
+            value = _normalize_value(value)
+            if value is not None:
+                normalized.append((str(name), value))
+        return cls(
+            filters=tuple(sorted(normalized)),
+            stage=stage,
+            type_ids=_normalize_value(type_ids),
+            tags=_normalize_value(tags),
+            sort=tuple(
+                (str(item[0]), str(item[1]).lower())
+                for item in (sort or [])
+                if isinstance(item, (list, tuple)) and len(item) >= 2
+            ),
+        )
+
+    def without_stage(self) -> "ConstraintQueryKey":
+        """Return the key of the same query with no stage filter."""
+        return replace(self, stage="")
+
+
+def _normalize_value(value: Any) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = sorted({str(item).strip() for item in value if str(item).strip()})
+        return tuple(items) or None
+    return value
+
+
+@dataclass(slots=True)
+class _Entry:
+    rows: tuple[dict[str, Any], ...]
+    limit: int
+    fetched_at: float
+
+    @property
+    def complete(self) -> bool:
+        """Whether the backend returned every matching row."""
+        return len(self.rows) < self.limit
+
+
+@dataclass(frozen=True, slots=True)
+class ConstraintQueryCacheStats:
+    """Counters since the cache was created."""
+
+    hits: int = 0
+    superset_hits: int = 0
+    coalesced: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def saved_rpcs(self) -> int:
+        """Reads answered without a new backend call."""
+        return self.hits + self.superset_hits + self.coalesced
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of reads answered without a new backend call."""
+        total = self.saved_rpcs + self.misses
+        return self.saved_rpcs / total if total else 0.0
+
+    def as_log_payload(self) -> dict[str, Any]:
+        """Return the counters plus derived rates for debug logging."""
+        return {
+            "hits": self.hits,
+            "superset_hits": self.superset_hits,
+            "coalesced": self.coalesced,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "saved_rpcs": self.saved_rpcs,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+class CachedDurableConstraintStore:
+    """Read-through ``DurableConstraintStore`` wrapper for one session."""
+
+    def __init__(
+        self,
+        store: DurableConstraintStore,
+        *,
+        ttl_s: float,
+        epoch: ConstraintCacheEpoch | None = None,
+        superset_limit: int = 200,
+        max_entries: int = 128,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Wrap ``store``.
+
+        Args:
+            store: Backend store; also receives every non-read call.
+            ttl_s: Seconds a cached read stays servable; ``0`` disables reuse
+                but keeps request coalescing.
+            epoch: Write counter shared with other wrappers of ``store``.
+            superset_limit: Row limit of the stage-less superset fetched for
+                a stage-filtered miss; ``0`` disables superset fetches.
+            max_entries: LRU bound on cached reads.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.store = store
+        self._ttl_s = max(0.0, float(ttl_s))
+        self._epoch = epoch or ConstraintCacheEpoch()
+        self._seen_epoch = self._epoch.value
+        self._superset_limit = max(0, int(superset_limit))
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._entries: OrderedDict[Any, _Entry] = OrderedDict()
+        self._inflight: dict[Any, tuple[int, asyncio.Task[list[dict[str, Any]]]]] = {}
+        # Whether rows carry ``applies_stages``; learned from the first rows.
+        self._stage_filterable: bool | None = None
+        self._stats = ConstraintQueryCacheStats()
+
+    @property
+    def stats(self) -> ConstraintQueryCacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        return self._stats
+
+    def __getattr__(self, name: str) -> Any:
+        # Every other read (``get_constraint``, ``find_equivalent_constraints``,
+        # ``add_reflection``, merge helpers, ...) goes straight to the store,
+        # so ``getattr(store, name, None)`` probes keep their meaning.
+        if name == "store":
+            raise AttributeError(name)
+        return getattr(self.store, name)
+
+    # ── Cached reads ──────────────────────────────────────────────────────
+
+    async def query_constraints(
+        self,
+        *,
+        filters: dict[str, Any],
+        type_ids: list[str] | None = None,
+        tags: list[str] | None = None,
+        sort: list[list[str]] | None = None,
+        limit: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Return constraint rows, from the cache when possible."""
+        key = ConstraintQueryKey.build(
+            filters=filters, type_ids=type_ids, tags=tags, sort=sort
+        )
+        limit = max(0, int(limit))
+        call = {"filters": filters, "type_ids": type_ids, "tags": tags, "sort": sort}
+        self._sync_epoch()
+        entry = self._fresh_entry(key)
+        if entry is not None and (entry.complete or entry.limit >= limit):
+            self._count("hits")
+            return _copy_rows(entry.rows[:limit])
+        if key.stage:
+            broad = self._fresh_entry(key.without_stage())
+            rows = self._stage_rows(broad, key.stage)
+            if rows is not None:
+                self._count("superset_hits")
+                return rows[:limit]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None and inflight[0] >= limit:
+            self._count("coalesced")
+            return _copy_rows(await asyncio.shield(inflight[1]))[:limit]
+
+        if key.stage and self._stage_filterable and self._superset_limit:
+            broad_call = {
+                **call,
+                "filters": {k: v for k, v in (filters or {}).items() if k != "stage"},
+            }
+            broad = await self._fetch_superset(key.without_stage(), broad_call, limit)
+            rows = self._stage_rows(broad, key.stage)
+            if rows is not None:
+                return rows[:limit]
+        self._count("misses")
+        return _copy_rows(await self._fetch(key, call, limit))
+
+    async def query_types(
+        self, *, stage: str | None = None, event_types: list[str] | None = None
+    ) -> list[dict[str, Any]]:
+        """Return ranked constraint types, from the cache when possible."""
+        key = ("types", str(stage or "").strip(), _normalize_value(event_types))
+        self._sync_epoch()
+        entry = self._fresh_entry(key)
+        if entry is not None:
+            self._count("hits")
+            return _copy_rows(entry.rows)
+        self._count("misses")
+        generation = self._epoch.value
+        rows = await self.store.query_types(stage=stage, event_types=event_types)
+        if self._epoch.value == generation:
+            self._store_entry(key, list(rows or []), limit=len(rows or []) + 1)
+        return _copy_rows(rows or [])
+
+    # ── Writes (invalidate every wrapper of the store) ────────────────────
+
+    def invalidate(self) -> None:
+        """Drop cached reads in every wrapper sharing this cache's epoch."""
+        self._epoch.bump()
+        self._sync_epoch()
+
+    async def upsert_constraint(
+        self, *, record: dict[str, Any], event: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        try:
+            return await self.store.upsert_constraint(record=record, event=event)
+        finally:
+            self.invalidate()
+
+    async def update_constraint(
+        self,
+        *,
+        uid: str,
+        patch: dict[str, Any],
+        event: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        try:
+            return await self.store.update_constraint(uid=uid, patch=patch, event=event)
+        finally:
+            self.invalidate()
+
+    async def archive_constraint(
+        self, *, uid: str, reason: str | None = None
+    ) -> dict[str, Any]:
+        try:
+            return await self.store.archive_constraint(uid=uid, reason=reason)
+        finally:
+            self.invalidate()
+
+    async def supersede_constraint(
+        self,
+        *,
+        uid: str,
+        new_record: dict[str, Any],
+        event: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        try:
+            return await self.store.supersede_constraint(
+                uid=uid, new_record=new_record, event=event
+            )
+        finally:
+            self.invalidate()
+
+    async def dedupe_constraints(
+        self, *, limit: int = 500, dry_run: bool = False
+    ) -> dict[str, Any]:
+        try:
+            return await self.store.dedupe_constraints(limit=limit, dry_run=dry_run)
+        finally:
+            if not dry_run:
+                self.invalidate()
+
+    # ── Internals ─────────────────────────────────────────────────────────
+
+    async def _fetch(
+        self, key: ConstraintQueryKey, call: dict[str, Any], limit: int
+    ) -> list[dict[str, Any]]:
+        """Run one backend query for ``key``, shared with identical callers.
+
+        ``call`` holds the first caller's own arguments, passed through as-is.
+        """
+        generation = self._epoch.value
+        task = asyncio.ensure_future(self.store.query_constraints(**call, limit=limit))
+        task.add_done_callback(_consume_exception)
+        self._inflight[key] = (limit, task)
+        try:
+            rows = list(await asyncio.shield(task) or [])
+        finally:
+            if self._inflight.get(key, (0, None))[1] is task:
+                del self._inflight[key]
+        if rows and self._stage_filterable is None:
+            self._stage_filterable = _rows_have_stages(rows)
+        if self._epoch.value == generation:
+            self._store_entry(key, rows, limit=limit)
+        return rows
+
+    async def _fetch_superset(
+        self, broad_key: ConstraintQueryKey, call: dict[str, Any], limit: int
+    ) -> _Entry:
+        """Fetch (or join the in-flight fetch of) the stage-less superset."""
+        broad_limit = max(self._superset_limit, limit)
+        inflight = self._inflight.get(broad_key)
+        if inflight is not None and inflight[0] >= broad_limit:
+            self._count("coalesced")
+            rows = await asyncio.shield(inflight[1])
+            return _Entry(tuple(rows or []), inflight[0], self._clock())
+        self._count("misses")
+        rows = await self._fetch(broad_key, call, broad_limit)
+        return _Entry(tuple(rows), broad_limit, self._clock())
+
+    def _stage_rows(
+        self, broad: _Entry | None, stage: str
+    ) -> list[dict[str, Any]] | None:
+        """Filter a complete stage-less result down to ``stage``."""
+        if broad is None or not broad.complete or not _rows_have_stages(broad.rows):
+            return None
+        return [
+            copy.deepcopy(row)
+            for row in broad.rows
+            if stage in {str(item).strip() for item in row["applies_stages"]}
+        ]
+
+    def _fresh_entry(self, key: Any) -> _Entry | None:
+        if self._ttl_s <= 0:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._clock() - entry.fetched_at >= self._ttl_s:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store_entry(self, key: Any, rows: list[dict[str, Any]], *, limit: int) -> None:
+        if self._ttl_s <= 0:
+            return
+        self._entries[key] = _Entry(
+            rows=tuple(copy.deepcopy(rows)), limit=limit, fetched_at=self._clock()
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _sync_epoch(self) -> None:
+        """Drop cached reads if any wrapper of the store has written since."""
+        if self._seen_epoch == self._epoch.value:
+            return
+        self._seen_epoch = self._epoch.value
+        dropped = len(self._entries)
+        self._entries.clear()
+        self._inflight.clear()
+        if dropped:
+            self._count("invalidations", dropped)
+
+    def _count(self, field_name: str, amount: int = 1) -> None:
+        current = getattr(self._stats, field_name)
+        self._stats = replace(self._stats, **{field_name: current + amount})
+        record_constraint_query_cache(event=field_name, amount=amount)
+
+
+def _rows_have_stages(rows: Sequence[dict[str, Any]]) -> bool:
+    """Whether every row says which stages it applies to."""
+    return all(isinstance(row.get("applies_stages"), list) for row in rows)
+
+
+def _copy_rows(rows: Any) -> list[dict[str, Any]]:
+    return [copy.deepcopy(row) for row in rows]
+
+
+def _consume_exception(task: asyncio.Task[Any]) -> None:
+    """Mark a shared query's exception as retrieved when every waiter left."""
+    if not task.cancelled():
+        task.exception()
+
+
+__all__ = [
+    "CachedDurableConstraintStore",
+    "ConstraintCacheEpoch",
+    "ConstraintQueryCacheStats",
+    "ConstraintQueryKey",
+]
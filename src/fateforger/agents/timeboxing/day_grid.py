@@ -0,0 +1,283 @@
+"""Compact int-array representation of one day's intervals.
+
+``DayGrid`` stores intervals as parallel ``array('i')`` columns of
+second-of-day offsets, so plan-wide checks run as single passes over
+machine ints instead of repeated ``datetime.combine`` calls:
+
+- ``first_sequence_overlap`` / ``sequence_overlaps`` — O(n) ordering check
+  over consecutive intervals (the validator semantics of ``Timebox`` and
+  ``TBPlan``).  These compare exact second offsets.
+- ``conflicts`` — every overlapping pair via one sorted sweep,
+  O(n log n + k), optionally only across calendar layers.
+- ``occupancy`` / ``busy_minutes`` / ``utilization`` / ``free_windows`` —
+  minute-resolution capacity stats from a 1440-slot difference array.
+- ``overlapping`` — bisect lookup of intervals intersecting a query span
+  (the reconciliation overlap guard).
+
+Grids for several calendars combine with ``DayGrid.overlay``; each interval
+keeps its ``label`` and ``layer`` so conflicts can be attributed.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import time
+from itertools import accumulate
+
+MINUTES_PER_DAY = 24 * 60
+
+
+def seconds_of_day(value: time) -> int:
+    """Return ``value`` as whole seconds since midnight."""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def minute_of_day(value: time) -> int:
+    """Return ``value`` as whole minutes since midnight (seconds floored)."""
+    return value.hour * 60 + value.minute
+
+
+@dataclass(frozen=True, slots=True)
+class GridConflict:
+    """Two intervals that overlap, by position in the grid."""
+
+    first: int
+    second: int
+    start_min: int
+    end_min: int
+
+    @property
+    def minutes(self) -> int:
+        """Overlap length in minutes."""
+        return self.end_min - self.start_min
+
+
+class DayGrid:
+    """One day's intervals as int arrays with linear-time overlap checks."""
+
+    __slots__ = (
+        "_starts",
+        "_ends",
+        "_labels",
+        "_layers",
+        "_sorted",
+        "_longest",
+        "_occupancy",
+    )
+
+    def __init__(
+        self,
+        starts: Iterable[int],
+        ends: Iterable[int],
+        *,
+        labels: Iterable[str] | None = None,
+        layers: Iterable[str] | None = None,
+    ) -> None:
+        """Build a grid from second-of-day ``starts`` / ``ends`` columns.
+
+        Intervals keep their input order; an interval whose end is not after
+        its start (e.g. one crossing midnight) covers no minutes.
+        """
+        self._starts = array("i", starts)
+        self._ends = array("i", ends)
+        size = len(self._starts)
+        self._labels = tuple(labels) if labels is not None else ("",) * size
+        self._layers = tuple(layers) if layers is not None else ("",) * size
+        if not (len(self._ends) == len(self._labels) == len(self._layers) == size):
+            raise ValueError("DayGrid columns must have the same length")
+        self._sorted: tuple[list[int], list[int]] | None = None
+        self._longest = 0
+        self._occupancy: array | None = None
+
+    @classmethod
+    def from_times(
+        cls,
+        spans: Iterable[tuple[time, time]],
+        *,
+        labels: Iterable[str] | None = None,
+        layer: str = "",
+    ) -> "DayGrid":
+        """Build a grid from ``(start, end)`` times of a single day."""
+        starts = array("i")
+        ends = array("i")
+        for start, end in spans:
+            starts.append(seconds_of_day(start))
+            ends.append(seconds_of_day(end))
+        return cls(starts, ends, labels=labels, layers=(layer,) * len(starts))
+
+    @classmethod
+    def overlay(cls, grids: Iterable["DayGrid"]) -> "DayGrid":
+        """Stack several grids (e.g. one per calendar) into one.
+
+        Positions follow the input order: the first grid's intervals come
+        first, then the second's, and so on.
+        """
+        starts = array("i")
+        ends = array("i")
+        labels: list[str] = []
+        layers: list[str] = []
+        for grid in grids:
+            starts.extend(grid._starts)
+            ends.extend(grid._ends)
+            labels.extend(grid._labels)
+            layers.extend(grid._layers)
+        return cls(starts, ends, labels=labels, layers=layers)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def label(self, index: int) -> str:
+        """Return the label of the interval at ``index``."""
+        return self._labels[index]
+
+    def layer(self, index: int) -> str:
+        """Return the layer (calendar) of the interval at ``index``."""
+        return self._layers[index]
+
+    def span_minutes(self, index: int) -> tuple[int, int]:
+        """Return the interval at ``index`` as ``(start_min, end_min)``."""
+        return self._starts[index] // 60, self._ends[index] // 60
+
+    # ── Ordering checks ───────────────────────────────────────────────────
+
+    def sequence_overlaps(self) -> list[int]:
+        """Return every ``i`` where interval ``i`` ends after ``i + 1`` starts."""
+        return [
+            index
+            for index, (end, next_start) in enumerate(
+                zip(self._ends, self._starts[1:])
+            )
+            if end > next_start
+        ]
+
+    def first_sequence_overlap(self) -> int | None:
+        """Return the first ``i`` where interval ``i`` ends after ``i + 1`` starts."""
+        for index, (end, next_start) in enumerate(zip(self._ends, self._starts[1:])):
+            if end > next_start:
+                return index
+        return None
+
+    # ── Pairwise conflicts ────────────────────────────────────────────────
+
+    def conflicts(self, *, across_layers_only: bool = False) -> list[GridConflict]:
+        """List every pair of intervals sharing at least one minute.
+
+        Pairs are reported as ``first < second`` in sweep order (by start
+        minute, then position).  With ``across_layers_only`` only pairs from
+        different layers are reported, e.g. plan vs. remote calendar.
+        """
+        order, _starts = self._sorted_order()
+        found: list[GridConflict] = []
+        active: list[int] = []
+        for index in order:
+            start_min, end_min = self.span_minutes(index)
+            active = [other for other in active if self._ends[other] // 60 > start_min]
+            for other in active:
+                if across_layers_only and self._layers[other] == self._layers[index]:
+                    continue
+                found.append(
+                    GridConflict(
+                        first=min(other, index),
+                        second=max(other, index),
+                        start_min=start_min,
+                        end_min=min(end_min, self._ends[other] // 60),
+                    )
+                )
+            active.append(index)
+        return found
+
+    def overlapping(self, start_min: int, end_min: int) -> Iterator[int]:
+        """Yield positions of intervals sharing a minute with ``[start_min, end_min)``.
+
+        Candidates are located by bisection over start minutes bounded by the
+        longest interval, so a query touches only nearby intervals.
+        """
+        order, starts = self._sorted_order()
+        lo = bisect_right(starts, start_min - self._longest)
+        hi = bisect_left(starts, end_min)
+        for position in range(lo, hi):
+            index = order[position]
+            if self.overlap_minutes(index, start_min, end_min) > 0:
+                yield index
+
+    def overlap_minutes(self, index: int, start_min: int, end_min: int) -> int:
+        """Return the minutes interval ``index`` shares with ``[start_min, end_min)``."""
+        span_start, span_end = self.span_minutes(index)
+        return max(0, min(end_min, span_end) - max(start_min, span_start))
+
+    def _sorted_order(self) -> tuple[list[int], list[int]]:
+        """Return non-empty positions sorted by start minute, and their starts."""
+        if self._sorted is None:
+            keyed = sorted(
+                (start // 60, index)
+                for index, (start, end) in enumerate(zip(self._starts, self._ends))
+                if end // 60 > start // 60
+            )
+            self._longest = max(
+                (self._ends[index] // 60 - start for start, index in keyed), default=0
+            )
+            self._sorted = (
+                [index for _start, index in keyed],
+                [start for start, _index in keyed],
+            )
+        return self._sorted
+
+    # ── Capacity ──────────────────────────────────────────────────────────
+
+    def occupancy(self) -> array:
+        """Return per-minute counts of intervals covering each minute of the day."""
+        if self._occupancy is None:
+            diff = [0] * (MINUTES_PER_DAY + 1)
+            for start, end in zip(self._starts, self._ends):
+                start_min = max(0, start // 60)
+                end_min = min(MINUTES_PER_DAY, end // 60)
+                if end_min > start_min:
+                    diff[start_min] += 1
+                    diff[end_min] -= 1
+            self._occupancy = array("H", accumulate(diff[:MINUTES_PER_DAY]))
+        return self._occupancy
+
+    def busy_minutes(self, start_min: int = 0, end_min: int = MINUTES_PER_DAY) -> int:
+        """Return minutes in ``[start_min, end_min)`` covered by any interval."""
+        window = self.occupancy()[max(0, start_min) : min(MINUTES_PER_DAY, end_min)]
+        return len(window) - window.count(0)
+
+    def utilization(self, start_min: int = 0, end_min: int = MINUTES_PER_DAY) -> float:
+        """Return the busy fraction of ``[start_min, end_min)`` (0.0 when empty)."""
+        length = min(MINUTES_PER_DAY, end_min) - max(0, start_min)
+        if length <= 0:
+            return 0.0
+        return self.busy_minutes(start_min, end_min) / length
+
+    def free_windows(
+        self,
+        start_min: int = 0,
+        end_min: int = MINUTES_PER_DAY,
+        *,
+        min_minutes: int = 1,
+    ) -> list[tuple[int, int]]:
+        """Return free ``(start_min, end_min)`` windows of at least ``min_minutes``."""
+        order, starts = self._sorted_order()
+        windows: list[tuple[int, int]] = []
+        cursor = start_min
+        for index, span_start in zip(order, starts):
+            if span_start >= end_min:
+                break
+            if span_start - cursor >= min_minutes:
+                windows.append((cursor, span_start))
+            cursor = max(cursor, self._ends[index] // 60)
+        if end_min - cursor >= min_minutes:
+            windows.append((cursor, end_min))
+        return windows
+
+
+__all__ = [
+    "DayGrid",
+    "GridConflict",
+    "MINUTES_PER_DAY",
+    "minute_of_day",
+    "seconds_of_day",
+]
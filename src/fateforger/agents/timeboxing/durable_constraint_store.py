@@ -2,19 +2,35 @@
 
 This module wraps the concrete durable-memory clients (Mem0, etc.)
 behind one small interface so orchestration code can stay backend-neutral.
+
+The adapter keeps a semantic-identity index of the stored constraints: it is
+maintained on every upsert, update and archive made through the adapter and
+re-synced from the backend once it is older than
+``durable_identity_index_ttl_s`` (and before every dedupe pass), so writes made
+by other processes or directly in the backend are matched too.  Only rows whose
+``updated_at`` changed since the last sync are re-read.  Adapters for one
+backend share one index per event loop
+(``build_durable_constraint_store(share_key=...)``); each keeps its own client.
 """
 
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import time
+import weakref
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Protocol
+from functools import lru_cache
+from typing import Any, Protocol, TypeVar
 
 from deepdiff import DeepDiff
 import jsonpatch
 from pydantic import TypeAdapter, ValidationError
 
+from .constants import TIMEBOXING_LIMITS
+
+_T = TypeVar("_T")
 
 _DECLINED_STATUS = "declined"
 _STATUS_RANK = {
@@ -27,6 +43,7 @@ _NECESSITY_RANK = {
     "should": 1,
     "prefer": 2,
 }
+_NEAR_MATCH_MIN_SCORE = 8
 
 
 def _to_text(value: Any) -> str:
@@ -73,6 +90,7 @@ def _normalize_windows(values: Any) -> list[tuple[str, str, str]]:
     return sorted(out)
 
 
+@lru_cache(maxsize=4096)
 def _normalize_time(text: str) -> str:
     """Normalize a local HH:MM-like text to strict HH:MM when possible."""
     candidate = _to_text(text)
@@ -208,6 +226,12 @@ def _updated_at_epoch(metadata: dict[str, Any]) -> float:
     return parsed.timestamp()
 
 
+def _row_version(row: dict[str, Any] | None) -> str:
+    """Return the backend ``updated_at`` watermark of a row (``""`` if unknown)."""
+    row = row or {}
+    return _to_text(dict(row.get("metadata") or {}).get("updated_at") or row.get("updated_at"))
+
+
 def _candidate_rank(entry: dict[str, Any]) -> tuple[int, int, float, str]:
     """Sort candidates by strongest active record then most recent."""
     constraint = entry.get("constraint_record") or {}
@@ -222,6 +246,180 @@ def _candidate_rank(entry: dict[str, Any]) -> tuple[int, int, float, str]:
     )
 
 
+def _semantic_bands(identity: dict[str, Any]) -> set[tuple[str, ...]]:
+    """Return the near-match buckets a semantic identity falls into.
+
+    Bands are chosen so that any pair scoring ``_NEAR_MATCH_MIN_SCORE`` or
+    more in ``_semantic_similarity_score`` shares at least one band: without
+    a shared name, topic or window a pair can only reach 8 through the rule
+    kind plus either the scope or (all remaining fields including) the
+    timezone.  Band lookup therefore finds every candidate a full scan would.
+    """
+    bands: set[tuple[str, ...]] = set()
+    name = identity.get("name")
+    if name:
+        bands.add(("name", name))
+    bands.update(("topic", topic) for topic in identity.get("topics") or [])
+    bands.update(
+        ("window", *_window_key(item)) for item in identity.get("windows") or []
+    )
+    rule_kind = identity.get("rule_kind")
+    if rule_kind and identity.get("scope"):
+        bands.add(("rule_scope", rule_kind, identity["scope"]))
+    if rule_kind and identity.get("timezone"):
+        bands.add(("rule_timezone", rule_kind, identity["timezone"]))
+    return bands
+
+
+def _index_entry(
+    uid: str,
+    payload: dict[str, Any] | None,
+    row: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Build the ``uid`` / ``constraint_record`` / ``metadata`` candidate view."""
+    source = payload if isinstance(payload, dict) else row
+    return {
+        "uid": uid,
+        "constraint_record": _constraint_record(source),
+        "metadata": dict((source or {}).get("metadata") or row or {}),
+    }
+
+
+async def _gather_bounded(
+    calls: Iterable[Awaitable[_T]],
+    *,
+    limit: int,
+) -> list[_T | BaseException]:
+    """Await ``calls`` with at most ``limit`` in flight, collecting exceptions."""
+    semaphore = asyncio.Semaphore(max(1, int(limit)))
+
+    async def _run(call: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await call
+
+    return await asyncio.gather(*(_run(call) for call in calls), return_exceptions=True)
+
+
+class _SemanticIdentityIndex:
+    """In-memory index of stored constraints by semantic identity.
+
+    Exact equivalents share one ``_semantic_identity`` key; near matches are
+    scored only against entries sharing a ``_semantic_bands`` bucket.  Keys
+    that may have gained a duplicate since the last dedupe pass are tracked
+    in ``dirty``.  ``synced_at`` is the monotonic time of the last backend
+    sync (``None`` until the first one); ``lock`` serializes syncs across
+    every adapter sharing the index.
+    """
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.synced_at: float | None = None
+        self.dirty: set[str] = set()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._identities: dict[str, tuple[str, dict[str, Any]]] = {}
+        self._exact: dict[str, set[str]] = {}
+        self._bands: dict[tuple[str, ...], set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._entries
+
+    @property
+    def hydrated(self) -> bool:
+        """Return whether the index was synced from the backend at least once."""
+        return self.synced_at is not None
+
+    def uids(self) -> set[str]:
+        """Return every indexed uid."""
+        return set(self._entries)
+
+    def version(self, uid: str) -> str:
+        """Return the ``updated_at`` watermark indexed for ``uid``."""
+        return _row_version(dict(self._entries.get(uid) or {}).get("metadata"))
+
+    def put(self, entry: dict[str, Any]) -> None:
+        """Insert or replace ``entry``, marking its identity dirty when needed."""
+        uid = _to_text(entry.get("uid"))
+        if not uid:
+            return
+        constraint = dict(entry.get("constraint_record") or {})
+        key, identity = _semantic_identity(constraint)
+        status = _to_text(constraint.get("status")).lower()
+        previous = self._entries.get(uid)
+        previous_key = self._identities.get(uid, ("", {}))[0]
+        previous_status = _to_text(
+            dict((previous or {}).get("constraint_record") or {}).get("status")
+        ).lower()
+        self.remove(uid)
+        self._entries[uid] = entry
+        self._identities[uid] = (key, identity)
+        self._exact.setdefault(key, set()).add(uid)
+        for band in _semantic_bands(identity):
+            self._bands.setdefault(band, set()).add(uid)
+        if status != _DECLINED_STATUS and (
+            previous is None
+            or previous_key != key
+            or previous_status == _DECLINED_STATUS
+        ):
+            self.dirty.add(key)
+
+    def remove(self, uid: str) -> None:
+        """Drop ``uid`` from every bucket."""
+        if self._entries.pop(uid, None) is None:
+            return
+        key, identity = self._identities.pop(uid)
+        self._discard(self._exact, key, uid)
+        for band in _semantic_bands(identity):
+            self._discard(self._bands, band, uid)
+
+    def mark_archived(self, uid: str) -> None:
+        """Record that ``uid`` was archived (its identity is unchanged)."""
+        entry = self._entries.get(uid)
+        if entry is None:
+            return
+        constraint = dict(entry.get("constraint_record") or {})
+        constraint["status"] = _DECLINED_STATUS
+        self._entries[uid] = {**entry, "constraint_record": constraint}
+
+    def group(self, key: str) -> list[dict[str, Any]]:
+        """Return every entry sharing the semantic identity ``key``."""
+        return [self._entries[uid] for uid in self._exact.get(key, ())]
+
+    def match(self, key: str, identity: dict[str, Any]) -> dict[str, Any] | None:
+        """Return the strongest exact, else near, equivalent of ``identity``."""
+        exact = self.group(key)
+        if exact:
+            return min(exact, key=_candidate_rank)
+        candidates: set[str] = set()
+        for band in _semantic_bands(identity):
+            candidates.update(self._bands.get(band, ()))
+        best: tuple[tuple[Any, ...], dict[str, Any]] | None = None
+        for uid in candidates:
+            similarity = _semantic_similarity_score(identity, self._identities[uid][1])
+            if similarity < _NEAR_MATCH_MIN_SCORE:
+                continue
+            entry = self._entries[uid]
+            rank = (-similarity, *_candidate_rank(entry))
+            if best is None or rank < best[0]:
+                best = (rank, entry)
+        return best[1] if best else None
+
+    @staticmethod
+    def _discard(
+        buckets: dict[Any, set[str]],
+        bucket: Any,
+        uid: str,
+    ) -> None:
+        members = buckets.get(bucket)
+        if members is None:
+            return
+        members.discard(uid)
+        if not members:
+            del buckets[bucket]
+
+
 class DurableConstraintStore(Protocol):
     """Common read/write contract used by timeboxing orchestration."""
 
@@ -318,6 +516,11 @@ class ClientBackedDurableConstraintStore:
     """Thin adapter around existing MCP/Mem0 client implementations."""
 
     client: Any
+    identity_index_ttl_s: float = TIMEBOXING_LIMITS.durable_identity_index_ttl_s
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    _identity_index: _SemanticIdentityIndex = field(
+        default_factory=_SemanticIdentityIndex, init=False, repr=False
+    )
 
     async def get_store_info(self) -> dict[str, Any]:
         getter = getattr(self.client, "get_store_info", None)
@@ -359,7 +562,9 @@ class ClientBackedDurableConstraintStore:
         record: dict[str, Any],
         event: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        return await self.client.upsert_constraint(record=record, event=event)
+        result = await self.client.upsert_constraint(record=record, event=event)
+        await self._refresh_index_entry(uid=_to_text((result or {}).get("uid")))
+        return result
 
     async def get_constraint(self, *, uid: str) -> dict[str, Any] | None:
         getter = getattr(self.client, "get_constraint", None)
@@ -385,9 +590,12 @@ class ClientBackedDurableConstraintStore:
         event: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         updater = getattr(self.client, "update_constraint", None)
-        if callable(updater):
-            return await updater(uid=uid, patch=patch, event=event)
-        return {"uid": uid, "updated": False, "reason": "unsupported_backend"}
+        if not callable(updater):
+            return {"uid": uid, "updated": False, "reason": "unsupported_backend"}
+        result = await updater(uid=uid, patch=patch, event=event)
+        if (result or {}).get("updated"):
+            await self._refresh_index_entry(uid=uid)
+        return result
 
     async def archive_constraint(
         self,
@@ -397,12 +605,16 @@ class ClientBackedDurableConstraintStore:
     ) -> dict[str, Any]:
         archiver = getattr(self.client, "archive_constraint", None)
         if callable(archiver):
-            return await archiver(uid=uid, reason=reason)
-        return await self.update_constraint(
-            uid=uid,
-            patch={"status": "declined"},
-            event={"action": "archive", "reason": reason},
-        )
+            result = await archiver(uid=uid, reason=reason)
+        else:
+            result = await self.update_constraint(
+                uid=uid,
+                patch={"status": "declined"},
+                event={"action": "archive", "reason": reason},
+            )
+        if (result or {}).get("updated"):
+            self._identity_index.mark_archived(_to_text(uid))
+        return result
 
     async def supersede_constraint(
         self,
@@ -466,79 +678,93 @@ class ClientBackedDurableConstraintStore:
         records: list[dict[str, Any]],
         limit: int = 200,
     ) -> dict[str, dict[str, Any]]:
-        """Return strongest semantic matches for many records in one candidate scan."""
-        incoming_by_uid: dict[str, dict[str, Any]] = {}
-        search_names: list[str] = []
-        tags: set[str] = set()
+        """Return strongest semantic matches for many records from the identity index.
+
+        Exact semantic-identity matches win; otherwise the best near match
+        (similarity of at least 8) among entries sharing a band is returned.
+        ``limit`` bounds the rows read when the index is (re)synced.
+        """
+        incoming: dict[str, tuple[str, dict[str, Any]]] = {}
         for record in records:
             constraint = _constraint_record(record)
             if not constraint:
                 continue
-            semantic_key, _ = _semantic_identity(constraint)
+            semantic_key, identity = _semantic_identity(constraint)
             lifecycle = dict(constraint.get("lifecycle") or {})
             uid = _to_text(lifecycle.get("uid") or record.get("uid")) or f"semantic:{semantic_key}"
-            incoming_by_uid[uid] = constraint
-            name = _to_text(constraint.get("name"))
-            if name:
-                search_names.append(name)
-            tags.update(_to_text(item) for item in _to_list(constraint.get("topics")) if _to_text(item))
-        if not incoming_by_uid:
+            incoming[uid] = (semantic_key, identity)
+        if not incoming:
             return {}
 
-        row_limit = max(max(1, int(limit)), len(incoming_by_uid) * 50)
-        rows = await self.query_constraints(
-            filters={
-                "require_active": False,
-                "text_query": " ".join(search_names[:6]) or None,
-            },
-            type_ids=None,
-            tags=sorted(tags) or None,
-            sort=[["Status", "descending"]],
-            limit=row_limit,
-        )
-        if not rows and search_names:
+        index = await self._ensure_identity_index(limit=limit)
+        out: dict[str, dict[str, Any]] = {}
+        for uid, (semantic_key, identity) in incoming.items():
+            match = index.match(semantic_key, identity)
+            if match is not None:
+                out[uid] = dict(match)
+        return out
+
+    async def _ensure_identity_index(
+        self,
+        *,
+        limit: int,
+        max_age_s: float | None = None,
+    ) -> _SemanticIdentityIndex:
+        """Return the identity index, re-syncing it from the backend when stale.
+
+        The index is stale once it is older than ``max_age_s`` (default
+        ``identity_index_ttl_s``).  A sync lists the rows, re-reads only those
+        that are new or whose ``updated_at`` moved (or that carry none), and
+        drops uids the backend no longer returns, so writes that bypassed this
+        adapter reach the index and mark their identities dirty.
+        """
+        index = self._identity_index
+        max_age = self.identity_index_ttl_s if max_age_s is None else max_age_s
+        if self._identity_index_fresh(index, max_age):
+            return index
+        async with index.lock:
+            if self._identity_index_fresh(index, max_age):
+                return index
+            started = self.clock()
+            row_limit = max(int(limit), TIMEBOXING_LIMITS.durable_identity_index_rows)
             rows = await self.query_constraints(
                 filters={"require_active": False},
                 type_ids=None,
-                tags=sorted(tags) or None,
+                tags=None,
                 sort=[["Status", "descending"]],
                 limit=row_limit,
             )
-        candidate_entries = await self._load_constraint_entries(rows=rows)
-        candidate_pool: list[tuple[dict[str, Any], dict[str, Any]]] = []
-        for entry in candidate_entries:
-            _, candidate_identity = _semantic_identity(
-                dict(entry.get("constraint_record") or {})
-            )
-            candidate_pool.append((entry, candidate_identity))
-
-        out: dict[str, dict[str, Any]] = {}
-        for uid, constraint in incoming_by_uid.items():
-            _, identity = _semantic_identity(constraint)
-            exact_matches: list[dict[str, Any]] = []
-            near_matches: list[tuple[int, dict[str, Any]]] = []
-            for entry, candidate_identity in candidate_pool:
-                if candidate_identity == identity:
-                    exact_matches.append(entry)
-                    continue
-                similarity = _semantic_similarity_score(identity, candidate_identity)
-                if similarity < 8:
-                    continue
-                near_matches.append((similarity, entry))
-
-            if exact_matches:
-                exact_matches.sort(key=_candidate_rank)
-                out[uid] = exact_matches[0]
-                continue
-            if near_matches:
-                near_matches.sort(
-                    key=lambda item: (
-                        -item[0],
-                        *_candidate_rank(item[1]),
-                    )
-                )
-                out[uid] = near_matches[0][1]
-        return out
+            changed = [
+                row
+                for row in rows
+                if _to_text(row.get("uid")) not in index
+                or not _row_version(row)
+                or _row_version(row) != index.version(_to_text(row.get("uid")))
+            ]
+            for entry in await self._load_constraint_entries(rows=changed):
+                index.put(entry)
+            if len(rows) < row_limit:
+                listed = {_to_text(row.get("uid")) for row in rows}
+                for uid in index.uids() - listed:
+                    index.remove(uid)
+            index.synced_at = started
+        return index
+
+    def _identity_index_fresh(
+        self,
+        index: _SemanticIdentityIndex,
+        max_age_s: float,
+    ) -> bool:
+        synced_at = index.synced_at
+        return synced_at is not None and self.clock() - synced_at < max_age_s
+
+    async def _refresh_index_entry(self, *, uid: str) -> None:
+        """Re-read ``uid`` into a hydrated index after a write through this store."""
+        if not uid or not self._identity_index.hydrated:
+            return
+        payload = await self.get_constraint(uid=uid)
+        if isinstance(payload, dict):
+            self._identity_index.put(_index_entry(uid, payload))
 
     async def _load_constraint_entries(
         self,
@@ -554,22 +780,14 @@ class ClientBackedDurableConstraintStore:
         if not by_uid:
             return []
         uids = list(by_uid)
-        full_payloads = await asyncio.gather(
-            *(self.get_constraint(uid=uid) for uid in uids),
-            return_exceptions=True,
+        full_payloads = await _gather_bounded(
+            (self.get_constraint(uid=uid) for uid in uids),
+            limit=TIMEBOXING_LIMITS.durable_store_read_concurrency,
         )
-        out: list[dict[str, Any]] = []
-        for uid, full in zip(uids, full_payloads, strict=False):
-            row = by_uid[uid]
-            payload = full if isinstance(full, dict) else row
-            out.append(
-                {
-                    "uid": uid,
-                    "constraint_record": _constraint_record(payload),
-                    "metadata": dict((payload or {}).get("metadata") or row),
-                }
-            )
-        return out
+        return [
+            _index_entry(uid, full if isinstance(full, dict) else None, by_uid[uid])
+            for uid, full in zip(uids, full_payloads, strict=False)
+        ]
 
     async def dedupe_constraints(
         self,
@@ -577,39 +795,46 @@ class ClientBackedDurableConstraintStore:
         limit: int = 500,
         dry_run: bool = False,
     ) -> dict[str, Any]:
-        """Detect and archive duplicate semantic constraints."""
-        rows = await self.query_constraints(
-            filters={"require_active": False},
-            type_ids=None,
-            tags=None,
-            sort=[["Status", "descending"]],
-            limit=max(1, int(limit)),
-        )
-        groups: dict[str, list[dict[str, Any]]] = {}
-        for entry in await self._load_constraint_entries(rows=rows):
-            uid = _to_text(entry.get("uid"))
-            constraint = _constraint_record(entry)
-            key, _ = _semantic_identity(constraint)
-            groups.setdefault(key, []).append(entry)
-
+        """Detect and archive duplicate semantic constraints.
+
+        The identity index is re-synced first, so rows written outside this
+        adapter are included.  Only identities that may have gained a
+        duplicate since the previous pass (new entries, changed identities,
+        reactivated records) are regrouped.  Canonical updates and archives for every group run as one
+        batch bounded by ``durable_store_write_concurrency``; identities whose
+        archives fail stay queued for the next pass.
+        """
+        index = await self._ensure_identity_index(limit=limit, max_age_s=0.0)
+        dirty_keys = sorted(index.dirty)
+        if not dry_run:
+            index.dirty.clear()
+
+        scanned = 0
         duplicates_found = 0
-        duplicates_archived = 0
-        canonical_updates = 0
-        failed_archives = 0
         merged_groups: list[dict[str, Any]] = []
-        for entries in groups.values():
+        writes: list[Awaitable[dict[str, Any]]] = []
+        write_targets: list[tuple[str, str]] = []
+        for key in dirty_keys:
+            entries = index.group(key)
+            scanned += len(entries)
             if len(entries) <= 1:
                 continue
             ranked = sorted(entries, key=_candidate_rank)
             canonical = ranked[0]
-            duplicates = ranked[1:]
-            duplicate_uids = [_to_text(item.get("uid")) for item in duplicates if _to_text(item.get("uid"))]
+            canonical_uid = _to_text(canonical.get("uid"))
+            duplicate_uids = [
+                _to_text(item.get("uid"))
+                for item in ranked[1:]
+                if _to_text(item.get("uid"))
+                and _to_text(dict(item.get("constraint_record") or {}).get("status")).lower()
+                != _DECLINED_STATUS
+            ]
             if not duplicate_uids:
                 continue
             duplicates_found += len(duplicate_uids)
             merged_groups.append(
                 {
-                    "canonical_uid": _to_text(canonical.get("uid")),
+                    "canonical_uid": canonical_uid,
                     "duplicate_uids": duplicate_uids,
                 }
             )
@@ -622,30 +847,45 @@ class ClientBackedDurableConstraintStore:
             for duplicate_uid in duplicate_uids:
                 if duplicate_uid not in supersedes:
                     supersedes.append(duplicate_uid)
-            if supersedes:
-                update_result = await self.update_constraint(
-                    uid=_to_text(canonical.get("uid")),
+            writes.append(
+                self.update_constraint(
+                    uid=canonical_uid,
                     patch={"supersedes_uids": supersedes},
                     event={
                         "action": "dedupe_merge",
                         "dedupe_archived_uids": duplicate_uids,
                     },
                 )
-                if update_result.get("updated"):
-                    canonical_updates += 1
-
+            )
+            write_targets.append(("update", key))
             for duplicate_uid in duplicate_uids:
-                archive_result = await self.archive_constraint(
-                    uid=duplicate_uid,
-                    reason=f"dedupe:canonical:{_to_text(canonical.get('uid'))}",
+                writes.append(
+                    self.archive_constraint(
+                        uid=duplicate_uid,
+                        reason=f"dedupe:canonical:{canonical_uid}",
+                    )
                 )
-                if archive_result.get("updated"):
-                    duplicates_archived += 1
-                else:
-                    failed_archives += 1
+                write_targets.append(("archive", key))
+
+        duplicates_archived = 0
+        canonical_updates = 0
+        failed_archives = 0
+        results = await _gather_bounded(
+            writes, limit=TIMEBOXING_LIMITS.durable_store_write_concurrency
+        )
+        for (action, key), result in zip(write_targets, results, strict=True):
+            updated = isinstance(result, dict) and bool(result.get("updated"))
+            if action == "update":
+                canonical_updates += int(updated)
+            elif updated:
+                duplicates_archived += 1
+            else:
+                failed_archives += 1
+                index.dirty.add(key)
 
         return {
-            "scanned": len(rows),
+            "scanned": scanned,
+            "indexed": len(index),
             "duplicate_groups": len(merged_groups),
             "duplicates_found": duplicates_found,
             "duplicates_archived": duplicates_archived,
@@ -796,15 +1036,51 @@ class ClientBackedDurableConstraintStore:
         return {"saved": False, "reason": "unsupported_backend"}
 
 
-def build_durable_constraint_store(client: Any | None) -> DurableConstraintStore | None:
-    """Create an adapter around a concrete durable-memory client."""
+def durable_store_share_key(backend: str, *, user_id: str | None = None) -> str:
+    """Return the ``share_key`` naming one durable-memory backend (and user)."""
+    parts = (_to_text(backend).lower(), _to_text(user_id))
+    return ":".join(part for part in parts if part)
+
+
+_SHARED_INDEXES: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, tuple[type, _SemanticIdentityIndex]]
+] = weakref.WeakKeyDictionary()
+
+
+def build_durable_constraint_store(
+    client: Any | None,
+    *,
+    share_key: str | None = None,
+) -> DurableConstraintStore | None:
+    """Create an adapter around a concrete durable-memory client.
+
+    Callers talking to the same backend pass the same ``share_key`` (for
+    example ``"graphiti:<user_id>"``) so their adapters share one identity
+    index per event loop.  Every call returns a new adapter around the
+    caller's own ``client``; the index is shared only between clients of the
+    same type.  Without a running loop the adapter gets a private index.
+    """
     if client is None:
         return None
-    return ClientBackedDurableConstraintStore(client=client)
+    store = ClientBackedDurableConstraintStore(client=client)
+    if not share_key:
+        return store
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return store
+    indexes = _SHARED_INDEXES.setdefault(loop, {})
+    shared = indexes.get(share_key)
+    if shared is None or shared[0] is not type(client):
+        shared = (type(client), store._identity_index)
+        indexes[share_key] = shared
+    store._identity_index = shared[1]
+    return store
 
 
 __all__ = [
     "DurableConstraintStore",
     "ClientBackedDurableConstraintStore",
     "build_durable_constraint_store",
+    "durable_store_share_key",
 ]
@@ -1,13 +1,17 @@
 """Graphiti-backed durable constraint memory adapter.
 
-Current implementation provides a local JSON-backed temporal memory substrate
+Current implementation provides a local JSONL-backed temporal memory substrate
 with the same contract as the legacy mem0 adapter so orchestration can switch
 backend paths without changing the durable store interface.
 """
 
 from __future__ import annotations
 
+import heapq
 import json
+import os
+from array import array
+from bisect import bisect_right, insort
 from datetime import datetime, timezone
 from pathlib import Path
 from threading import Lock
@@ -21,8 +25,102 @@ from fateforger.core.config import settings
 from .mem0_constraint_memory import Mem0ConstraintMemoryClient
 
 
+def _row_tokens(row: dict[str, Any]) -> frozenset[str]:
+    """Return the whitespace-delimited tokens of a row's search blob.
+
+    Query terms contain no whitespace, so a term is a substring of the blob
+    exactly when it is a substring of one of these tokens.
+    """
+    blob = (
+        str(row.get("content") or "")
+        + " "
+        + json.dumps(dict(row.get("metadata") or {}), ensure_ascii=True, sort_keys=True)
+    ).lower()
+    return frozenset(blob.split())
+
+
+def _row_user(row: dict[str, Any]) -> str:
+    return str(dict(row.get("metadata") or {}).get("user_id") or "").strip()
+
+
+def _row_updated_at(row: dict[str, Any]) -> str:
+    return str(dict(row.get("metadata") or {}).get("updated_at") or "")
+
+
+class _UserPartition:
+    """Rows of one user with an inverted token index.
+
+    ``order`` keeps ``(updated_at, seq)`` sorted for zero-score fills.  Term
+    lookups scan a newline-joined copy of the vocabulary with ``str.find``
+    and map hits back to tokens by offset, so a query costs one pass over
+    distinct tokens plus the matching postings — never a pass over rows.
+    """
+
+    __slots__ = ("order", "postings", "_tokens", "_text", "_offsets")
+
+    def __init__(self) -> None:
+        self.order: list[tuple[str, int]] = []
+        self.postings: dict[str, list[int]] = {}
+        self._tokens: list[str] = []
+        self._text = ""
+        self._offsets = array("q")
+
+    def add(self, seq: int, updated_at: str, tokens: frozenset[str]) -> None:
+        entry = (updated_at, seq)
+        if not self.order or self.order[-1] <= entry:
+            self.order.append(entry)
+        else:
+            insort(self.order, entry)
+        for token in tokens:
+            posting = self.postings.get(token)
+            if posting is None:
+                self.postings[token] = [seq]
+                self._tokens.append(token)
+            else:
+                posting.append(seq)
+
+    def matching(self, term: str) -> set[int]:
+        """Return row seqs whose blob contains ``term`` as a substring."""
+        self._refresh_vocabulary()
+        text, offsets, tokens = self._text, self._offsets, self._tokens
+        seqs: set[int] = set()
+        position = text.find(term)
+        while position != -1:
+            index = bisect_right(offsets, position) - 1
+            seqs.update(self.postings[tokens[index]])
+            if index + 1 >= len(offsets):
+                break
+            position = text.find(term, offsets[index + 1])
+        return seqs
+
+    def _refresh_vocabulary(self) -> None:
+        indexed = len(self._offsets)
+        if indexed == len(self._tokens):
+            return
+        parts = [self._text] if self._text else []
+        cursor = len(self._text) + 1 if self._text else 0
+        for token in self._tokens[indexed:]:
+            self._offsets.append(cursor)
+            parts.append(token)
+            cursor += len(token) + 1
+        self._text = "\n".join(parts)
+
+
 class _GraphitiLocalMemoryBackend:
-    """Minimal local backend that mimics memory add/query behavior."""
+    """Local memory backend: append-only JSONL log plus in-memory indexes.
+
+    Each ``add`` appends one line to the log; rows are indexed per user so
+    ``query`` scores only rows sharing a term with the query and fills the
+    remainder of the limit from the per-user ``updated_at`` order.  Ranking
+    is unchanged from the original full-scan implementation: rows score one
+    point per query term found (as a substring) in their content or
+    JSON-encoded metadata, then sort by score desc, ``updated_at`` asc and
+    insertion order.
+
+    The log is streamed at startup.  A legacy JSON-array file, or a log with
+    unreadable lines (e.g. a torn final write), is compacted into clean JSONL
+    before new rows are appended.
+    """
 
     def __init__(self, *, path: str, user_id: str, limit: int) -> None:
         self._path = Path(path)
@@ -31,6 +129,7 @@ class _GraphitiLocalMemoryBackend:
         self._limit = max(1, int(limit))
         self._lock = Lock()
         self._rows: list[dict[str, Any]] = []
+        self._partitions: dict[str, _UserPartition] = {}
         self._load()
 
     @property
@@ -38,20 +137,59 @@ class _GraphitiLocalMemoryBackend:
         return str(self._path)
 
     def _load(self) -> None:
+        self._rows = []
+        self._partitions = {}
         if not self._path.exists():
-            self._rows = []
             return
-        try:
-            payload = json.loads(self._path.read_text(encoding="utf-8"))
-        except Exception:
-            payload = []
-        self._rows = payload if isinstance(payload, list) else []
-
-    def _persist(self) -> None:
-        self._path.write_text(
-            json.dumps(self._rows, ensure_ascii=True, sort_keys=True),
-            encoding="utf-8",
-        )
+        needs_compaction = False
+        with self._path.open("r", encoding="utf-8") as handle:
+            head = handle.read(1)
+            while head.isspace():
+                head = handle.read(1)
+            handle.seek(0)
+            if head == "[":
+                # Legacy format: the whole file is one JSON array.
+                try:
+                    payload = json.load(handle)
+                except Exception:
+                    payload = []
+                rows = payload if isinstance(payload, list) else []
+                for row in rows:
+                    if isinstance(row, dict):
+                        self._index_row(row)
+                needs_compaction = True
+            else:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    try:
+                        row = json.loads(line)
+                    except Exception:
+                        row = None
+                    if not isinstance(row, dict) or not line.endswith("\n"):
+                        needs_compaction = True
+                        if not isinstance(row, dict):
+                            continue
+                    self._index_row(row)
+        if needs_compaction:
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the log as one clean JSONL line per row (atomic replace)."""
+        with self._lock:
+            tmp_path = self._path.with_name(self._path.name + ".compact")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                for row in self._rows:
+                    handle.write(_encode_row(row))
+            os.replace(tmp_path, self._path)
+
+    def _index_row(self, row: dict[str, Any]) -> None:
+        seq = len(self._rows)
+        self._rows.append(row)
+        partition = self._partitions.get(_row_user(row))
+        if partition is None:
+            partition = self._partitions[_row_user(row)] = _UserPartition()
+        partition.add(seq, _row_updated_at(row), _row_tokens(row))
 
     async def add(self, content: MemoryContent) -> None:
         """Persist one memory row."""
@@ -69,42 +207,69 @@ class _GraphitiLocalMemoryBackend:
             "created_at": now_iso,
         }
         with self._lock:
-            self._rows.append(row)
-            self._persist()
+            with self._path.open("a", encoding="utf-8") as handle:
+                handle.write(_encode_row(row))
+            self._index_row(row)
+
+    def iter_memories(self) -> list[MemoryContent]:
+        """Return every memory visible to this user, in insertion order."""
+        with self._lock:
+            seqs = sorted(
+                seq
+                for key in dict.fromkeys((self._user_id, ""))
+                if (partition := self._partitions.get(key)) is not None
+                for _updated_at, seq in partition.order
+            )
+            selected = [self._rows[seq] for seq in seqs]
+        return [_memory_content(row) for row in selected]
 
     async def query(self, query: str, *, limit: int = 50) -> MemoryQueryResult:
         """Query memories with deterministic lexical ranking."""
         query_terms = [term for term in str(query or "").lower().split() if term]
         row_limit = max(1, int(limit or self._limit))
         with self._lock:
-            rows = list(self._rows)
-        scored: list[tuple[int, str, dict[str, Any]]] = []
-        for row in rows:
-            metadata = dict(row.get("metadata") or {})
-            row_user = str(metadata.get("user_id") or "").strip()
-            if row_user and row_user != self._user_id:
-                continue
-            blob = (
-                str(row.get("content") or "")
-                + " "
-                + json.dumps(metadata, ensure_ascii=True, sort_keys=True)
-            ).lower()
-            score = 0
+            partitions = [
+                partition
+                for key in dict.fromkeys((self._user_id, ""))
+                if (partition := self._partitions.get(key)) is not None
+            ]
+            scores: dict[int, int] = {}
+            matches: dict[str, set[int]] = {}
             for term in query_terms:
-                if term in blob:
-                    score += 1
-            scored.append((score, str(metadata.get("updated_at") or ""), row))
-        scored.sort(key=lambda item: (-item[0], item[1]), reverse=False)
-        results: list[MemoryContent] = []
-        for _, _, row in scored[:row_limit]:
-            results.append(
-                MemoryContent(
-                    content=str(row.get("content") or ""),
-                    mime_type=str(row.get("mime_type") or "text/plain"),
-                    metadata=dict(row.get("metadata") or {}),
-                )
-            )
-        return MemoryQueryResult(results=results)
+                if term not in matches:
+                    matches[term] = set().union(
+                        *(partition.matching(term) for partition in partitions)
+                    )
+                for seq in matches[term]:
+                    scores[seq] = scores.get(seq, 0) + 1
+            rows = self._rows
+            ranked = sorted(
+                scores,
+                key=lambda seq: (-scores[seq], _row_updated_at(rows[seq]), seq),
+            )[:row_limit]
+            if len(ranked) < row_limit:
+                for _updated_at, seq in heapq.merge(
+                    *(partition.order for partition in partitions)
+                ):
+                    if seq in scores:
+                        continue
+                    ranked.append(seq)
+                    if len(ranked) >= row_limit:
+                        break
+            selected = [rows[seq] for seq in ranked]
+        return MemoryQueryResult(results=[_memory_content(row) for row in selected])
+
+
+def _encode_row(row: dict[str, Any]) -> str:
+    return json.dumps(row, ensure_ascii=True, sort_keys=True) + "\n"
+
+
+def _memory_content(row: dict[str, Any]) -> MemoryContent:
+    return MemoryContent(
+        content=str(row.get("content") or ""),
+        mime_type=str(row.get("mime_type") or "text/plain"),
+        metadata=dict(row.get("metadata") or {}),
+    )
 
 
 class GraphitiConstraintMemoryClient(Mem0ConstraintMemoryClient):
@@ -16,7 +16,10 @@ from zoneinfo import ZoneInfo
 from dateutil import parser as date_parser
 
 from fateforger.adapters.calendar.models import GCalEventsResponse
+from fateforger.adapters.calendar.read_cache import calendar_read_cache
 from fateforger.core.logging_config import record_error, record_tool_call
+from fateforger.tools.mcp_call_policy import McpCircuitOpenError
+from fateforger.tools.mcp_pool import mcp_workbench_pool
 from fateforger.tools.constraint_mcp import (
     build_constraint_server_env,
     resolve_constraint_repo_root,
@@ -186,7 +189,7 @@ class ConstraintMemoryClient:
             timeout: MCP read timeout seconds for stdio transport.
         """
         try:
-            from autogen_ext.tools.mcp import McpWorkbench, StdioServerParams
+            from autogen_ext.tools.mcp import StdioServerParams
         except Exception as exc:  # pragma: no cover
             raise RuntimeError(
                 "autogen_ext tools are required for constraint memory access"
@@ -201,7 +204,7 @@ class ConstraintMemoryClient:
             cwd=str(root),
             read_timeout_seconds=timeout,
         )
-        self._workbench = McpWorkbench(params)
+        self._workbench = mcp_workbench_pool().workbench(params)
 
     async def _call_tool_json(
         self, tool_name: str, *, arguments: dict[str, Any]
@@ -347,10 +350,8 @@ class McpCalendarClient:
         return StreamableHttpServerParams(url=self._server_url, timeout=self._timeout)
 
     def _build_workbench(self):
-        """Build a fresh MCP workbench from current params."""
-        from autogen_ext.tools.mcp import McpWorkbench
-
-        return McpWorkbench(self._params)
+        """Return a pooled MCP workbench proxy for the current params."""
+        return mcp_workbench_pool().workbench(self._params)
 
     @classmethod
     def _is_recoverable_transport_error(cls, exc: Exception) -> bool:
@@ -361,9 +362,9 @@ class McpCalendarClient:
         return any(marker in text for marker in cls._RECOVERABLE_ERROR_MARKERS)
 
     async def _reset_workbench(self) -> None:
-        """Close the current workbench and create a fresh one for retry."""
+        """Drop the server's pooled sessions (or close a private workbench) for retry."""
         current = self._workbench
-        close = getattr(current, "close", None)
+        close = getattr(current, "reset", None) or getattr(current, "close", None)
         if callable(close):
             maybe = close()
             if hasattr(maybe, "__await__"):
@@ -397,9 +398,12 @@ class McpCalendarClient:
                             "error": (str(exc) or type(exc).__name__)[:300],
                         }
                     )
-                error_type = (
-                    "transport_recoverable" if recoverable else "transport_fatal"
-                )
+                if isinstance(exc, McpCircuitOpenError):
+                    error_type = "circuit_open"
+                else:
+                    error_type = (
+                        "transport_recoverable" if recoverable else "transport_fatal"
+                    )
                 record_error(component="McpCalendarClient", error_type=error_type)
                 record_tool_call(
                     agent="mcp_calendar",
@@ -412,9 +416,7 @@ class McpCalendarClient:
 
     async def get_tools(self) -> list:
         """Return MCP tool definitions for AutoGen tool wiring."""
-        from autogen_ext.tools.mcp import mcp_server_tools
-
-        tools = await mcp_server_tools(self._params)
+        tools = await mcp_workbench_pool().discover_tools(self._params)
         if not tools:
             raise RuntimeError("calendar MCP server returned no tools")
         return tools
@@ -547,19 +549,20 @@ class McpCalendarClient:
         return dt_val.astimezone(tz).strftime("%H:%M")
 
     @staticmethod
+    def _window_bounds(
+        *, day: date, tz: ZoneInfo, days: int = 1
+    ) -> tuple[datetime, datetime]:
+        """Return the timezone-aware ``[start, end)`` of ``days`` local days."""
+        start = datetime.combine(day, datetime.min.time(), tz)
+        return start, start + timedelta(days=days)
+
+    @classmethod
     def _list_events_args(
-        *, calendar_id: str, day: date, tz: ZoneInfo
+        cls, *, calendar_id: str, day: date, tz: ZoneInfo, days: int = 1
     ) -> dict[str, Any]:
-        start = datetime.combine(day, datetime.min.time(), tz).replace(
-            tzinfo=None,
-            microsecond=0,
-        )
-        end = (
-            datetime.combine(day, datetime.min.time(), tz) + timedelta(days=1)
-        ).replace(
-            tzinfo=None,
-            microsecond=0,
-        )
+        start, end = cls._window_bounds(day=day, tz=tz, days=days)
+        start = start.replace(tzinfo=None, microsecond=0)
+        end = end.replace(tzinfo=None, microsecond=0)
         return {
             "calendarId": calendar_id,
             "timeMin": start.isoformat(timespec="seconds"),
@@ -594,48 +597,136 @@ class McpCalendarClient:
             immovables.append({"title": summary, "start": start_str, "end": end_str})
         return immovables
 
-    async def list_day_snapshot(
+    async def _list_events_response(
         self,
         *,
-        calendar_id: str,
-        day: date,
-        tz: ZoneInfo,
+        args: dict[str, Any],
+        start: datetime,
+        end: datetime,
         diagnostics: dict[str, Any] | None = None,
-    ) -> CalendarDaySnapshot:
-        """Fetch a typed day snapshot with both raw events and immovables."""
-        args = self._list_events_args(calendar_id=calendar_id, day=day, tz=tz)
+        refresh: bool = False,
+    ) -> GCalEventsResponse:
+        """Read ``list-events`` through the shared cache as a typed response.
+
+        ``start``/``end`` are the timezone-aware bounds that ``args`` encodes
+        as local wall-clock times.
+        """
         if diagnostics is not None:
             diagnostics["request"] = args
-        payload = await self._call_tool_payload(
-            tool_name="list-events",
-            arguments=args,
-            diagnostics=diagnostics,
-        )
+
+        async def _fetch() -> list[dict[str, Any]] | None:
+            if diagnostics is not None:
+                diagnostics["cache"] = "miss"
+            payload = await self._call_tool_payload(
+                tool_name="list-events",
+                arguments=args,
+                diagnostics=diagnostics,
+            )
+            if diagnostics is not None:
+                diagnostics["payload_type"] = type(payload).__name__
+                if isinstance(payload, dict):
+                    diagnostics["payload_keys"] = sorted(payload.keys())
+            if not isinstance(payload, (dict, list)):
+                return None
+            return self._normalize_events(payload)
+
         if diagnostics is not None:
-            diagnostics["payload_type"] = type(payload).__name__
-            if isinstance(payload, dict):
-                diagnostics["payload_keys"] = sorted(payload.keys())
-        events = self._normalize_events(payload)
-        total_count = len(events)
-        if isinstance(payload, dict):
-            raw_total = payload.get("totalCount") or payload.get("total_count")
-            if isinstance(raw_total, int):
-                total_count = raw_total
+            diagnostics["cache"] = "hit"
+        events = await calendar_read_cache().list_events(
+            calendar_id=str(args["calendarId"]),
+            start=start,
+            end=end,
+            fetch=_fetch,
+            refresh=refresh,
+        )
         try:
-            response = GCalEventsResponse.model_validate(
+            return GCalEventsResponse.model_validate(
                 {
-                    "events": events,
-                    "totalCount": total_count,
+                    "events": events or [],
+                    "totalCount": len(events or []),
                 }
             )
         except Exception:
-            response = GCalEventsResponse(events=[], totalCount=0)
+            return GCalEventsResponse(events=[], totalCount=0)
+
+    async def list_day_snapshot(
+        self,
+        *,
+        calendar_id: str,
+        day: date,
+        tz: ZoneInfo,
+        diagnostics: dict[str, Any] | None = None,
+        refresh: bool = False,
+    ) -> CalendarDaySnapshot:
+        """Fetch a typed day snapshot with both raw events and immovables.
+
+        Args:
+            refresh: Skip the shared read cache (the fresh result replaces it).
+        """
+        args = self._list_events_args(calendar_id=calendar_id, day=day, tz=tz)
+        start, end = self._window_bounds(day=day, tz=tz)
+        response = await self._list_events_response(
+            args=args,
+            start=start,
+            end=end,
+            diagnostics=diagnostics,
+            refresh=refresh,
+        )
         immovables = self._immovables_from_response(response=response, day=day, tz=tz)
         if diagnostics is not None:
             diagnostics["raw_event_count"] = len(response.events)
             diagnostics["immovable_count"] = len(immovables)
         return CalendarDaySnapshot(response=response, immovables=immovables)
 
+    async def list_range_snapshots(
+        self,
+        *,
+        calendar_id: str,
+        start_day: date,
+        end_day: date,
+        tz: ZoneInfo,
+        diagnostics: dict[str, Any] | None = None,
+    ) -> dict[date, CalendarDaySnapshot]:
+        """Fetch per-day snapshots for ``start_day..end_day`` with one ``list-events`` call.
+
+        Events are bucketed by their local start date; every day in the range
+        gets a snapshot (possibly empty).
+        """
+        if end_day < start_day:
+            raise ValueError("end_day must be on or after start_day")
+        days = (end_day - start_day).days + 1
+        args = self._list_events_args(
+            calendar_id=calendar_id, day=start_day, tz=tz, days=days
+        )
+        start, end = self._window_bounds(day=start_day, tz=tz, days=days)
+        response = await self._list_events_response(
+            args=args, start=start, end=end, diagnostics=diagnostics
+        )
+        events_by_day: dict[date, list[Any]] = {
+            start_day + timedelta(days=offset): [] for offset in range(days)
+        }
+        for event in response.events:
+            event_dict = event.model_dump(mode="json", by_alias=True)
+            start_dt = self._parse_event_dt(event_dict.get("start"), tz=tz)
+            if start_dt is None:
+                continue
+            bucket = events_by_day.get(start_dt.astimezone(tz).date())
+            if bucket is not None:
+                bucket.append(event)
+        snapshots: dict[date, CalendarDaySnapshot] = {}
+        for day, events in events_by_day.items():
+            day_response = GCalEventsResponse(events=events, totalCount=len(events))
+            snapshots[day] = CalendarDaySnapshot(
+                response=day_response,
+                immovables=self._immovables_from_response(
+                    response=day_response, day=day, tz=tz
+                ),
+            )
+        if diagnostics is not None:
+            diagnostics["raw_event_count"] = len(response.events)
+            diagnostics["day_count"] = days
+        return snapshots
+
     async def list_day_immovables(
         self,
         *,
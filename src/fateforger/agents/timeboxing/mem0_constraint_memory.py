@@ -8,8 +8,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+from dataclasses import dataclass
 from datetime import date, datetime, timezone
-from typing import Any, Sequence
+from typing import Any
 
 import jsonpatch
 from autogen_core.memory import MemoryContent, MemoryQueryResult
@@ -98,14 +99,6 @@ def _to_text_list(values: Any) -> list[str]:
     return out
 
 
-def _match_any(values: Sequence[str], expected: Sequence[str]) -> bool:
-    """Return true when at least one expected value is present."""
-    if not expected:
-        return True
-    actual = {str(value).strip().lower() for value in values if str(value).strip()}
-    return any(str(value).strip().lower() in actual for value in expected)
-
-
 def _apply_json_patch_document(
     *,
     document: dict[str, Any],
@@ -122,6 +115,241 @@ def _apply_json_patch_document(
     return patched
 
 
+_DATE_ADAPTER = TypeAdapter(date)
+
+
+def _parse_index_date(value: Any) -> date | None:
+    """``_parse_iso_date`` with a shared adapter, for one-time index parsing."""
+    text = str(value).strip() if value is not None else ""
+    if not text:
+        return None
+    try:
+        return _DATE_ADAPTER.validate_python(text)
+    except ValidationError:
+        return None
+
+
+def _lowered(values: Any) -> frozenset[str]:
+    return frozenset(value.lower() for value in _to_text_list(values))
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexedConstraint:
+    """Latest serialized row of one constraint uid with pre-parsed fields."""
+
+    uid: str
+    updated_at: str
+    metadata: dict[str, Any]
+    row: dict[str, Any]
+    type_key: str
+    scope: str
+    status: str
+    necessity: str
+    stages: frozenset[str]
+    event_types: frozenset[str]
+    topics: frozenset[str]
+    start: date | None
+    end: date | None
+    haystack: str
+
+    @classmethod
+    def build(
+        cls, *, uid: str, metadata: dict[str, Any], row: dict[str, Any]
+    ) -> "_IndexedConstraint":
+        return cls(
+            uid=uid,
+            updated_at=str(metadata.get("updated_at") or ""),
+            metadata=metadata,
+            row=row,
+            type_key=str(row.get("type_id") or row.get("rule_kind") or "").lower(),
+            scope=str(row.get("scope") or "").lower(),
+            status=str(row.get("status") or "").lower(),
+            necessity=str(row.get("necessity") or "").lower(),
+            stages=frozenset(_to_text_list(row.get("applies_stages"))),
+            event_types=_lowered(row.get("applies_event_types")),
+            topics=_lowered(row.get("topics")),
+            start=_parse_index_date(row.get("start_date")),
+            end=_parse_index_date(row.get("end_date")),
+            haystack=" ".join(
+                [
+                    str(row.get("name") or ""),
+                    str(row.get("description") or ""),
+                    " ".join(_to_text_list(row.get("topics"))),
+                ]
+            ).lower(),
+        )
+
+    def postings(self) -> list[tuple[str, str]]:
+        keys = [
+            ("type", self.type_key),
+            ("scope", self.scope),
+            ("status", self.status),
+            ("necessity", self.necessity),
+        ]
+        keys.extend(("stage", stage) for stage in self.stages)
+        keys.extend(("event_type", value) for value in self.event_types)
+        keys.extend(("topic", value) for value in self.topics)
+        return keys
+
+
+@dataclass(frozen=True, slots=True)
+class _ConstraintFilter:
+    """Constraint query filters normalized once per query.
+
+    For each posting field ``None`` means "no filter", while an explicitly
+    given list that normalizes to nothing (e.g. ``type_ids=[""]``) matches
+    nothing.  Tags and ``*_any`` lists that normalize to nothing are ignored.
+    """
+
+    types: frozenset[str] | None
+    topics: frozenset[str] | None
+    stage: str
+    event_types: frozenset[str] | None
+    scopes: frozenset[str] | None
+    statuses: frozenset[str] | None
+    necessities: frozenset[str] | None
+    require_active: bool
+    as_of: date
+    text_query: str
+
+    @classmethod
+    def compile(
+        cls,
+        *,
+        filters: dict[str, Any],
+        type_ids: list[str] | None,
+        tags: list[str] | None,
+    ) -> "_ConstraintFilter":
+        def _optional(values: Any) -> frozenset[str] | None:
+            lowered = _lowered(values)
+            return lowered or None
+
+        return cls(
+            types=_lowered(type_ids) if type_ids else None,
+            topics=_optional(tags) if tags else None,
+            stage=str(filters.get("stage") or "").strip(),
+            event_types=_optional(filters.get("event_types_any")),
+            scopes=_optional(filters.get("scopes_any")),
+            statuses=_optional(filters.get("statuses_any")),
+            necessities=_optional(filters.get("necessities_any")),
+            require_active=bool(filters.get("require_active", True)),
+            as_of=_parse_iso_date(filters.get("as_of")) or datetime.utcnow().date(),
+            text_query=str(filters.get("text_query") or "").strip().lower(),
+        )
+
+    def posting_keys(self) -> list[list[tuple[str, str]]]:
+        """Return, per active posting filter, the keys any of which must match."""
+        groups: list[list[tuple[str, str]]] = []
+        for field, values in (
+            ("type", self.types),
+            ("scope", self.scopes),
+            ("status", self.statuses),
+            ("necessity", self.necessities),
+            ("event_type", self.event_types),
+            ("topic", self.topics),
+        ):
+            if values is not None:
+                groups.append([(field, value) for value in values])
+        if self.stage:
+            groups.append([("stage", self.stage)])
+        return groups
+
+    def matches(self, entry: _IndexedConstraint) -> bool:
+        if self.types is not None and entry.type_key not in self.types:
+            return False
+        if self.topics is not None and self.topics.isdisjoint(entry.topics):
+            return False
+        if self.require_active:
+            if entry.start and entry.start > self.as_of:
+                return False
+            if entry.end and entry.end < self.as_of:
+                return False
+        if self.stage and self.stage not in entry.stages:
+            return False
+        if self.event_types is not None and self.event_types.isdisjoint(
+            entry.event_types
+        ):
+            return False
+        if self.scopes is not None and entry.scope not in self.scopes:
+            return False
+        if self.statuses is not None and entry.status not in self.statuses:
+            return False
+        if self.necessities is not None and entry.necessity not in self.necessities:
+            return False
+        if self.text_query and self.text_query not in entry.haystack:
+            return False
+        return True
+
+
+class _ConstraintMetadataIndex:
+    """Latest constraint row per uid, with posting sets for structured filters.
+
+    Filled once from a backend that can enumerate every memory (``hydrated``)
+    and then kept current by every constraint write made through the owning
+    client.  Search-only backends use a throwaway index per query instead.
+    """
+
+    def __init__(self) -> None:
+        self.hydrated = False
+        self._entries: dict[str, _IndexedConstraint] = {}
+        self._postings: dict[tuple[str, str], set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, uid: str) -> _IndexedConstraint | None:
+        return self._entries.get(uid)
+
+    def upsert(self, metadata: dict[str, Any]) -> None:
+        """Index a constraint memory unless a newer version is already held."""
+        if metadata.get("kind") != "timeboxing_constraint":
+            return
+        uid = str(metadata.get("uid") or "").strip()
+        if not uid:
+            return
+        current = self._entries.get(uid)
+        if current is not None and str(metadata.get("updated_at") or "") < current.updated_at:
+            return
+        if current is not None:
+            for key in current.postings():
+                posting = self._postings.get(key)
+                if posting is not None:
+                    posting.discard(uid)
+                    if not posting:
+                        del self._postings[key]
+        entry = _IndexedConstraint.build(
+            uid=uid,
+            metadata=metadata,
+            row=Mem0ConstraintMemoryClient._serialize_constraint(metadata),
+        )
+        self._entries[uid] = entry
+        for key in entry.postings():
+            self._postings.setdefault(key, set()).add(uid)
+
+    def select(self, query: _ConstraintFilter) -> list[_IndexedConstraint]:
+        """Return matching entries, most recently updated first."""
+        candidates: set[str] | None = None
+        groups = sorted(
+            (
+                set().union(*(self._postings.get(key, ()) for key in keys))
+                for keys in query.posting_keys()
+            ),
+            key=len,
+        )
+        for group in groups:
+            candidates = group if candidates is None else candidates & group
+            if not candidates:
+                return []
+        pool = (
+            self._entries.values()
+            if candidates is None
+            else (self._entries[uid] for uid in candidates)
+        )
+        selected = [entry for entry in pool if query.matches(entry)]
+        selected.sort(key=lambda entry: (entry.updated_at, entry.uid), reverse=True)
+        return selected
+
+
 class Mem0ConstraintMemoryClient:
     """Mem0-backed constraint memory with the same API as ConstraintMemoryClient."""
 
@@ -138,6 +366,7 @@ class Mem0ConstraintMemoryClient:
         self._user_id = user_id
         self._limit = max(1, int(limit))
         self._is_cloud = bool(is_cloud)
+        self._constraint_index = _ConstraintMetadataIndex()
 
         if memory_backend is not None:
             self._memory = memory_backend
@@ -303,14 +532,16 @@ class Mem0ConstraintMemoryClient:
                 {"user_id": user_id},
                 False,
             )
-            return
-        await self._memory.add(
-            MemoryContent(
-                content=content,
-                mime_type="text/plain",
-                metadata={**payload_metadata, "user_id": user_id},
+        else:
+            await self._memory.add(
+                MemoryContent(
+                    content=content,
+                    mime_type="text/plain",
+                    metadata={**payload_metadata, "user_id": user_id},
+                )
             )
-        )
+        if self._constraint_index.hydrated:
+            self._constraint_index.upsert(metadata)
 
     @staticmethod
     def _serialize_constraint(metadata: dict[str, Any]) -> dict[str, Any]:
@@ -360,78 +591,6 @@ class Mem0ConstraintMemoryClient:
             parts.append("topics " + " ".join(_to_text_list(tags)))
         return " | ".join(parts)
 
-    @staticmethod
-    def _matches_filters(
-        *,
-        row: dict[str, Any],
-        filters: dict[str, Any],
-        type_ids: list[str] | None,
-        tags: list[str] | None,
-    ) -> bool:
-        """Apply deterministic filtering on serialized rows."""
-        if not isinstance(row, dict):
-            return False
-        if type_ids:
-            allowed = {value.lower() for value in _to_text_list(type_ids)}
-            row_type = str(row.get("type_id") or row.get("rule_kind") or "").lower()
-            if row_type not in allowed:
-                return False
-        if tags and not _match_any(
-            _to_text_list(row.get("topics")), _to_text_list(tags)
-        ):
-            return False
-
-        as_of = _parse_iso_date(filters.get("as_of")) or datetime.utcnow().date()
-        require_active = bool(filters.get("require_active", True))
-        if require_active:
-            start = _parse_iso_date(row.get("start_date"))
-            end = _parse_iso_date(row.get("end_date"))
-            if start and start > as_of:
-                return False
-            if end and end < as_of:
-                return False
-
-        stage = str(filters.get("stage") or "").strip()
-        if stage and stage not in _to_text_list(row.get("applies_stages")):
-            return False
-
-        event_types = _to_text_list(filters.get("event_types_any"))
-        if event_types and not _match_any(
-            _to_text_list(row.get("applies_event_types")), event_types
-        ):
-            return False
-
-        scopes = _to_text_list(filters.get("scopes_any"))
-        if scopes and str(row.get("scope") or "").lower() not in {
-            value.lower() for value in scopes
-        }:
-            return False
-
-        statuses = _to_text_list(filters.get("statuses_any"))
-        if statuses and str(row.get("status") or "").lower() not in {
-            value.lower() for value in statuses
-        }:
-            return False
-
-        necessities = _to_text_list(filters.get("necessities_any"))
-        if necessities and str(row.get("necessity") or "").lower() not in {
-            value.lower() for value in necessities
-        }:
-            return False
-
-        text_query = str(filters.get("text_query") or "").strip().lower()
-        if text_query:
-            haystack = " ".join(
-                [
-                    str(row.get("name") or ""),
-                    str(row.get("description") or ""),
-                    " ".join(_to_text_list(row.get("topics"))),
-                ]
-            ).lower()
-            if text_query not in haystack:
-                return False
-        return True
-
     async def _search_memories(
         self,
         *,
@@ -452,6 +611,10 @@ class Mem0ConstraintMemoryClient:
         cleaned_uid = str(uid or "").strip()
         if not cleaned_uid:
             return None
+        index = await self._ensure_constraint_index()
+        entry = index.get(cleaned_uid) if index is not None else None
+        if entry is not None:
+            return dict(entry.metadata)
         candidates: list[dict[str, Any]] = []
         for query_text in (f"uid:{cleaned_uid}", cleaned_uid, "timeboxing constraint"):
             result = await self._search_memories(
@@ -672,37 +835,65 @@ class Mem0ConstraintMemoryClient:
         sort: list[list[str]] | None = None,
         limit: int = 50,
     ) -> list[dict[str, Any]]:
-        """Query constraint rows with deterministic post-filtering."""
-        query_text = self._query_text(filters=filters, type_ids=type_ids, tags=tags)
-        search = await self._search_memories(
-            query_text=query_text, limit=max(limit * 5, 100)
-        )
+        """Query the latest constraint rows matching ``filters``.
 
-        deduped: dict[str, tuple[str, dict[str, Any]]] = {}
-        for memory in search.results:
-            metadata = dict(memory.metadata or {})
-            if metadata.get("kind") != "timeboxing_constraint":
-                continue
-            row = self._serialize_constraint(metadata)
-            if not self._matches_filters(
-                row=row,
-                filters=filters,
-                type_ids=type_ids,
-                tags=tags,
-            ):
-                continue
-            uid = str(row.get("uid") or "").strip()
-            if not uid:
-                continue
-            updated_at = str(metadata.get("updated_at") or "")
-            current = deduped.get(uid)
-            if current is None or updated_at >= current[0]:
-                deduped[uid] = (updated_at, row)
+        On backends that enumerate every memory, structured filters resolve
+        through the per-uid metadata index and only a ``text_query`` runs a
+        memory search, whose hits (in relevance order) are then checked against
+        the index.  Search-only backends (Mem0) search on every call, so rows
+        beyond a previous search's top-k or written by another client are seen.
+        """
+        index = await self._ensure_constraint_index()
+        query = _ConstraintFilter.compile(filters=filters, type_ids=type_ids, tags=tags)
+        if index is not None and not query.text_query:
+            entries = index.select(query)
+        else:
+            search = await self._search_memories(
+                query_text=self._query_text(
+                    filters=filters, type_ids=type_ids, tags=tags
+                ),
+                limit=max(limit * 5, 100),
+            )
+            hits = index if index is not None else _ConstraintMetadataIndex()
+            uids: dict[str, None] = {}
+            for memory in search.results:
+                metadata = dict(memory.metadata or {})
+                hits.upsert(metadata)
+                uid = str(metadata.get("uid") or "").strip()
+                if metadata.get("kind") == "timeboxing_constraint" and uid:
+                    uids[uid] = None
+            if query.text_query:
+                entries = [
+                    entry
+                    for uid in uids
+                    if (entry := hits.get(uid)) is not None and query.matches(entry)
+                ]
+            else:
+                entries = hits.select(query)
 
-        rows = [entry[1] for entry in deduped.values()]
+        rows = [dict(entry.row) for entry in entries]
         rows = self._sort_rows(rows, sort=sort)
         return rows[: max(0, limit)]
 
+    async def _ensure_constraint_index(self) -> _ConstraintMetadataIndex | None:
+        """Return the metadata index, hydrating it from the backend once.
+
+        Only backends exposing ``iter_memories()`` (the local Graphiti store)
+        get an index: a search-seeded snapshot would silently miss rows past
+        its top-k and rows written by other clients.  Returns ``None`` for
+        search-only backends.
+        """
+        index = self._constraint_index
+        if index.hydrated:
+            return index
+        iter_memories = getattr(self._memory, "iter_memories", None)
+        if not callable(iter_memories):
+            return None
+        for memory in iter_memories():
+            index.upsert(dict(memory.metadata or {}))
+        index.hydrated = True
+        return index
+
     async def query_types(
         self, *, stage: str | None = None, event_types: list[str] | None = None
     ) -> list[dict[str, Any]]:
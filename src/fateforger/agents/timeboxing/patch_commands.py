@@ -0,0 +1,224 @@
+"""Explicit ``/edit`` commands that bypass the LLM patcher.
+
+Only messages starting with the exact ``/edit`` prefix are considered, so
+free-form refine text is never interpreted here (intent stays with the LLM,
+per ``AGENT_INTENT_DETERMINISM_AUDIT.md``).  After the prefix, a small, fully
+anchored grammar maps straight onto ``tb_ops``: a command only matches when
+it names exactly one existing event verbatim (case-insensitive) and uses a
+structured time (``HH:MM``) or duration (``90m``, ``2h``, ``1h30m``,
+``PT1H30M``).  Anything else returns ``None`` and goes to the LLM patcher.
+
+Grammar after ``/edit`` (one command, or several joined by ``;`` / ``and`` /
+``then``)::
+
+    (delete|remove|drop) <event>
+    (move|shift|reschedule) <event> to <HH:MM>
+    (move|shift) <event> (before|after) <event>
+    (make|set|change) <event> [to] <duration> [long]
+    (shorten|extend) <event> to <duration>
+    rename <event> to <name>
+
+``<event>`` may be prefixed with ``the`` and suffixed with ``block`` /
+``event``.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, time, timedelta
+
+from isodate import parse_duration
+
+from .tb_models import FixedStart, FixedWindow, TBPlan
+from .tb_ops import MoveEvent, RemoveEvent, TBPatch, UpdateEvent, apply_tb_ops
+
+PATCH_COMMAND_PREFIX = "/edit"
+
+_NAME = r"(?:the\s+)?(?P<{}>.+?)(?:\s+(?:block|event))?"
+_TIME = r"(?P<time>[01]?\d:[0-5]\d|2[0-3]:[0-5]\d)"
+_DURATION = r"(?P<dur>PT[0-9HMS.]+|\d+(?:\.\d+)?\s*h(?:\s*\d+\s*m)?|\d+\s*m)"
+
+_REMOVE_RE = re.compile(rf"(?:delete|remove|drop)\s+{_NAME.format('name')}", re.I)
+_MOVE_TIME_RE = re.compile(
+    rf"(?:move|shift|reschedule)\s+{_NAME.format('name')}\s+to\s+{_TIME}", re.I
+)
+_MOVE_REL_RE = re.compile(
+    rf"(?:move|shift)\s+{_NAME.format('name')}\s+(?P<rel>before|after)\s+"
+    rf"{_NAME.format('other')}",
+    re.I,
+)
+_DURATION_RE = re.compile(
+    rf"(?:(?:make|set|change)\s+{_NAME.format('name')}\s+(?:to\s+)?"
+    rf"|(?:shorten|extend)\s+{_NAME.format('name2')}\s+to\s+)"
+    rf"{_DURATION}(?:\s+long)?",
+    re.I,
+)
+_RENAME_RE = re.compile(
+    rf"rename\s+{_NAME.format('name')}\s+to\s+(?P<new>[^;]+?)", re.I
+)
+_CLAUSE_SPLIT_RE = re.compile(r"\s*(?:;|\band then\b|\bthen\b|\band\b)\s*", re.I)
+_HOURS_MINUTES_RE = re.compile(r"(?:(?P<h>\d+(?:\.\d+)?)\s*h)?\s*(?:(?P<m>\d+)\s*m)?")
+
+
+def is_patch_command(text: str) -> bool:
+    """Return whether ``text`` uses the explicit ``/edit`` command syntax."""
+    head = text.lstrip()
+    rest = head[len(PATCH_COMMAND_PREFIX) :]
+    return head.startswith(PATCH_COMMAND_PREFIX) and (not rest or rest[0].isspace())
+
+
+def parse_patch_command(plan: TBPlan, text: str) -> TBPatch | None:
+    """Map an explicit ``/edit`` command onto a ``TBPatch``.
+
+    Args:
+        plan: The plan the command refers to.
+        text: The user's instruction (without any planning-context block).
+
+    Returns:
+        A patch that applies cleanly to ``plan``, or ``None`` when the text
+        is not an ``/edit`` command, does not match the grammar, or any
+        referenced event is ambiguous.
+    """
+    if not is_patch_command(text):
+        return None
+    command = text.lstrip()[len(PATCH_COMMAND_PREFIX) :].strip().rstrip(".!").strip()
+    if not command:
+        return None
+    single = _parse_clause(plan, command)
+    if single is not None:
+        return TBPatch(ops=[single])
+
+    clauses = [c for c in _CLAUSE_SPLIT_RE.split(command) if c]
+    if len(clauses) < 2:
+        return None
+    ops = []
+    current = plan
+    for clause in clauses:
+        op = _parse_clause(current, clause)
+        if op is None:
+            return None
+        ops.append(op)
+        # Later clauses resolve names against the partially patched plan.
+        try:
+            current = apply_tb_ops(current, TBPatch(ops=[op]))
+        except (IndexError, ValueError):
+            return None
+    return TBPatch(ops=ops)
+
+
+def _parse_clause(
+    plan: TBPlan, clause: str
+) -> UpdateEvent | MoveEvent | RemoveEvent | None:
+    """Parse one command clause against ``plan``."""
+    if match := _MOVE_TIME_RE.fullmatch(clause):
+        index = _find_event(plan, match["name"])
+        if index is None:
+            return None
+        return _move_to_time(plan, index, time.fromisoformat(match["time"].zfill(5)))
+
+    if match := _MOVE_REL_RE.fullmatch(clause):
+        index = _find_event(plan, match["name"])
+        other = _find_event(plan, match["other"])
+        if index is None or other is None or index == other:
+            return None
+        # ``MoveEvent.to`` indexes the list after the event is popped.
+        anchor = other - 1 if other > index else other
+        if match["rel"].lower() == "after":
+            anchor += 1
+        return MoveEvent(fr=index, to=anchor)
+
+    if match := _DURATION_RE.fullmatch(clause):
+        index = _find_event(plan, match["name"] or match["name2"])
+        duration = _parse_duration(match["dur"])
+        if index is None or duration is None:
+            return None
+        return _set_duration(plan, index, duration)
+
+    if match := _RENAME_RE.fullmatch(clause):
+        index = _find_event(plan, match["name"])
+        new_name = match["new"].strip().strip("\"'")
+        if index is None or not new_name:
+            return None
+        return UpdateEvent(i=index, n=new_name)
+
+    if match := _REMOVE_RE.fullmatch(clause):
+        index = _find_event(plan, match["name"])
+        if index is None:
+            return None
+        return RemoveEvent(i=index)
+
+    return None
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.strip().strip("\"'").lower().split())
+
+
+def _find_event(plan: TBPlan, name: str | None) -> int | None:
+    """Return the index of the single event named ``name``, else ``None``."""
+    if not name:
+        return None
+    wanted = _normalize(name)
+    matches = [i for i, ev in enumerate(plan.events) if _normalize(ev.n) == wanted]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _parse_duration(raw: str) -> timedelta | None:
+    """Parse ``PT…`` / ``2h`` / ``90m`` / ``1h30m`` into a positive duration."""
+    raw = raw.strip()
+    if raw.upper().startswith("PT"):
+        try:
+            duration = parse_duration(raw.upper())
+        except Exception:
+            return None
+    else:
+        match = _HOURS_MINUTES_RE.fullmatch(raw.lower().replace(" ", ""))
+        if match is None or not (match["h"] or match["m"]):
+            return None
+        duration = timedelta(
+            hours=float(match["h"] or 0), minutes=int(match["m"] or 0)
+        )
+    if not isinstance(duration, timedelta) or duration <= timedelta(0):
+        return None
+    return duration
+
+
+def _duration_of(plan: TBPlan, index: int) -> timedelta:
+    timing = plan.events[index].p
+    if timing.a == "fw":
+        start = datetime.combine(plan.date, timing.st)
+        return datetime.combine(plan.date, timing.et) - start
+    return timing.dur
+
+
+def _end_time(plan: TBPlan, start: time, duration: timedelta) -> time | None:
+    """Return ``start + duration`` if it stays within the plan's day."""
+    end = datetime.combine(plan.date, start) + duration
+    if end.date() != plan.date:
+        return None
+    return end.time()
+
+
+def _move_to_time(plan: TBPlan, index: int, start: time) -> UpdateEvent | None:
+    """Pin an event to ``start``, keeping its duration (and window shape)."""
+    duration = _duration_of(plan, index)
+    end = _end_time(plan, start, duration)
+    if end is None:
+        return None
+    if plan.events[index].p.a == "fw":
+        return UpdateEvent(i=index, p=FixedWindow(st=start, et=end))
+    return UpdateEvent(i=index, p=FixedStart(st=start, dur=duration))
+
+
+def _set_duration(plan: TBPlan, index: int, duration: timedelta) -> UpdateEvent | None:
+    """Change an event's duration while keeping its anchor type."""
+    timing = plan.events[index].p
+    if timing.a == "fw":
+        end = _end_time(plan, timing.st, duration)
+        if end is None:
+            return None
+        return UpdateEvent(i=index, p=FixedWindow(st=timing.st, et=end))
+    return UpdateEvent(i=index, p=timing.model_copy(update={"dur": duration}))
+
+
+__all__ = ["PATCH_COMMAND_PREFIX", "is_patch_command", "parse_patch_command"]
@@ -15,23 +15,29 @@ helpers so existing nodes can transition incrementally.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
 import time
 from collections.abc import Iterator
+from dataclasses import dataclass, field
 from typing import Any, Callable, Iterable, List, Literal
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
 from autogen_core import CancellationToken
 
+from fateforger.core.logging_config import (
+    record_local_patch_command,
+    record_patch_candidate,
+)
 from fateforger.debug.diag import with_timeout
 from fateforger.llm import build_autogen_chat_client
 from fateforger.llm.toon import toon_encode
 
 from .actions import TimeboxAction
-from .constants import TIMEBOXING_TIMEOUTS
+from .constants import TIMEBOXING_LIMITS, TIMEBOXING_TIMEOUTS
 from .planning_policy import (
     PLANNING_POLICY_VERSION,
     QUALITY_RUBRIC_PROMPT,
@@ -39,6 +45,7 @@ from .planning_policy import (
     STAGE3_OUTLINE_PROMPT,
     STAGE4_REFINEMENT_PROMPT,
 )
+from .patch_commands import is_patch_command, parse_patch_command
 from .preferences import Constraint
 from .tb_models import TBPlan
 from .tb_ops import TBPatch, apply_tb_ops
@@ -47,6 +54,9 @@ from .toon_views import constraints_rows
 
 logger = logging.getLogger(__name__)
 
+# Header the coordinator puts between the user's text and the context JSON.
+_PLANNING_CONTEXT_HEADER = "\n\nPlanning context:\n"
+
 # ── System prompt for the patcher agent ──────────────────────────────────
 
 _PATCHER_SYSTEM_PROMPT = f"""\
@@ -98,6 +108,79 @@ Return ONLY the TBPatch JSON.
 """
 
 
+@dataclass(frozen=True, slots=True)
+class PatchHedgingPolicy:
+    """How many patch candidates to generate concurrently per attempt.
+
+    With ``candidates > 1`` each attempt launches that many LLM generations
+    in parallel; the first one that applies and validates wins and the rest
+    are cancelled.  Worst-case LLM calls per ``apply_patch`` are
+    ``candidates * max_attempts``.
+
+    Attributes:
+        candidates: Concurrent generations per attempt (``1`` = sequential).
+        stagger_s: Delay before each extra candidate starts, so a fast
+            first draft can win before the hedges spend tokens.
+    """
+
+    candidates: int = 1
+    stagger_s: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.candidates < 1:
+            raise ValueError("candidates must be >= 1")
+        if self.stagger_s < 0:
+            raise ValueError("stagger_s must be >= 0")
+
+
+@dataclass(slots=True)
+class PatchCandidateOutcome:
+    """How one patch candidate ended."""
+
+    attempt: int
+    candidate: int
+    status: Literal["won", "failed", "cancelled"]
+    runtime_s: float
+    error: str | None = None
+
+
+@dataclass(slots=True)
+class PatchRunReport:
+    """Per-call summary of an ``apply_patch`` run (see ``last_report``)."""
+
+    request_id: str
+    policy: PatchHedgingPolicy
+    source: Literal["local", "llm"] = "llm"
+    attempts: int = 0
+    latency_s: float = 0.0
+    winner: PatchCandidateOutcome | None = None
+    outcomes: list[PatchCandidateOutcome] = field(default_factory=list)
+
+    @property
+    def loser_runtime_s(self) -> float:
+        """Total time spent in candidates that did not win."""
+        return sum(o.runtime_s for o in self.outcomes if o.status != "won")
+
+
+@dataclass(slots=True)
+class LocalCommandStats:
+    """Running counts for ``/edit`` commands seen by the local fast path."""
+
+    hits: int = 0
+    misses: int = 0
+    rejected: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of ``/edit`` commands served without an LLM call."""
+        total = self.hits + self.misses + self.rejected
+        return self.hits / total if total else 0.0
+
+
+class _Superseded(Exception):
+    """Raised inside a candidate when another candidate already won."""
+
+
 class TimeboxPatcher:
     """Apply user-requested refinements to a ``TBPlan`` via typed domain ops.
 
@@ -114,6 +197,8 @@ class TimeboxPatcher:
         model_client: Any | None = None,
         agent_type: str = "timebox_patcher",
         max_attempts: int | None = None,
+        hedging: PatchHedgingPolicy | None = None,
+        local_commands: bool | None = None,
     ) -> None:
         """Initialize the patcher.
 
@@ -122,6 +207,12 @@ class TimeboxPatcher:
                 built from the ``agent_type`` config key.
             agent_type: Config key for ``build_autogen_chat_client``.
             max_attempts: Maximum patch attempts before failing hard.
+            hedging: Concurrent candidate policy.  Defaults to
+                ``TIMEBOX_PATCHER_HEDGE_CANDIDATES`` (``1`` = sequential).
+            local_commands: Apply explicit ``/edit`` commands with
+                ``parse_patch_command`` instead of the LLM.  Defaults to
+                ``TIMEBOX_PATCHER_LOCAL_COMMANDS`` (off unless set to
+                ``1``/``true``).
         """
         self._model_client = model_client or build_autogen_chat_client(
             agent_type,
@@ -132,6 +223,20 @@ class TimeboxPatcher:
         )
         self._max_attempts = max_attempts if max_attempts is not None else env_attempts
         self._max_attempts = max(1, int(self._max_attempts))
+        self._hedging = hedging or PatchHedgingPolicy(
+            candidates=_coerce_positive_int(
+                os.getenv("TIMEBOX_PATCHER_HEDGE_CANDIDATES"),
+                default=TIMEBOXING_LIMITS.refine_patcher_hedge_candidates,
+            ),
+            stagger_s=TIMEBOXING_TIMEOUTS.refine_patcher_hedge_stagger_s,
+        )
+        if local_commands is None:
+            local_commands = os.getenv(
+                "TIMEBOX_PATCHER_LOCAL_COMMANDS", "0"
+            ).strip().lower() in {"1", "true", "yes", "on"}
+        self._local_commands = local_commands
+        self.local_stats = LocalCommandStats()
+        self.last_report: PatchRunReport | None = None
 
     async def apply_patch(
         self,
@@ -167,17 +272,35 @@ class TimeboxPatcher:
         constraints_list = list(constraints or [])
         actions_list = list(actions or [])
         request_id = f"patch-{int(time.time() * 1000)}"
-        agent = AssistantAgent(
-            name="TimeboxPatcherAgent",
-            model_client=self._model_client,
-            system_message=_patcher_system_prompt_with_schema(),
-            reflect_on_tool_use=False,
-        )
+        policy = self._hedging
+        report = PatchRunReport(request_id=request_id, policy=policy)
+        self.last_report = report
+        started = time.perf_counter()
+        if self._local_commands:
+            local = self._apply_local_command(
+                current, user_message, plan_validator=plan_validator
+            )
+            if local is not None:
+                report.source = "local"
+                report.latency_s = time.perf_counter() - started
+                return local
+        # One agent per candidate slot: AssistantAgent keeps its own model
+        # context, so concurrent candidates must not share one.
+        agents = [
+            AssistantAgent(
+                name="TimeboxPatcherAgent",
+                model_client=self._model_client,
+                system_message=_patcher_system_prompt_with_schema(),
+                reflect_on_tool_use=False,
+            )
+            for _ in range(policy.candidates)
+        ]
         retry_feedback: str | None = None
         last_error: Exception | None = None
         last_retryable = True
 
         for attempt in range(1, self._max_attempts + 1):
+            report.attempts = attempt
             context = _build_context(
                 current,
                 user_message,
@@ -186,10 +309,11 @@ class TimeboxPatcher:
                 retry_feedback=retry_feedback,
             )
             logger.debug(
-                "timebox_patcher request_id=%s attempt=%s/%s events=%s constraints=%s actions=%s",
+                "timebox_patcher request_id=%s attempt=%s/%s candidates=%s events=%s constraints=%s actions=%s",
                 request_id,
                 attempt,
                 self._max_attempts,
+                policy.candidates,
                 len(current.events),
                 len(constraints_list),
                 len(actions_list),
@@ -200,64 +324,260 @@ class TimeboxPatcher:
                     request_id,
                     retry_feedback,
                 )
-            try:
-                response = await with_timeout(
-                    "timeboxing:patcher",
-                    agent.on_messages(
-                        [TextMessage(content=context, source="user")],
-                        CancellationToken(),
-                    ),
-                    timeout_s=TIMEBOXING_TIMEOUTS.skeleton_draft_s,
-                )
-                raw_content = getattr(getattr(response, "chat_message", None), "content", None)
-                logger.debug(
-                    "timebox_patcher request_id=%s attempt=%s raw_len=%s raw_content=%s",
-                    request_id,
-                    attempt,
-                    len(raw_content) if isinstance(raw_content, str) else None,
-                    _to_log_string(raw_content),
-                )
-                patch = _extract_patch(response)
-                logger.debug(
-                    "timebox_patcher request_id=%s attempt=%s patch=%s",
-                    request_id,
-                    attempt,
-                    patch.model_dump_json(),
-                )
-                patched = apply_tb_ops(current, patch)
-                if plan_validator is not None:
-                    plan_validator(patched)
+            result, errors = await self._run_candidates(
+                agents,
+                context=context,
+                current=current,
+                plan_validator=plan_validator,
+                attempt=attempt,
+                report=report,
+            )
+            if result is not None:
+                patched, patch = result
+                report.latency_s = time.perf_counter() - started
                 logger.info(
-                    "timebox_patcher request_id=%s success attempt=%s/%s ops=%s",
+                    "timebox_patcher request_id=%s success attempt=%s/%s candidate=%s/%s ops=%s loser_runtime_s=%.2f",
                     request_id,
                     attempt,
                     self._max_attempts,
+                    report.winner.candidate if report.winner else 0,
+                    policy.candidates,
                     len(patch.ops),
+                    report.loser_runtime_s,
                 )
                 return patched, patch
-            except Exception as exc:
-                last_error = exc
-                retryable = _is_retryable_patch_error(exc)
-                last_retryable = retryable
-                retry_feedback = _build_retry_feedback(error=exc)
-                logger.warning(
-                    "timebox_patcher request_id=%s failed attempt=%s/%s retryable=%s error=%s",
-                    request_id,
-                    attempt,
-                    self._max_attempts,
-                    retryable,
-                    retry_feedback,
-                )
-                if not retryable:
-                    break
-                continue
 
+            # Feed back the lowest-numbered candidate's error, like sequential mode.
+            exc = (
+                errors[0]
+                if errors
+                else RuntimeError("all patch candidates were cancelled")
+            )
+            last_error = exc
+            last_retryable = all(_is_retryable_patch_error(e) for e in errors)
+            retry_feedback = _build_retry_feedback(error=exc)
+            logger.warning(
+                "timebox_patcher request_id=%s failed attempt=%s/%s retryable=%s error=%s",
+                request_id,
+                attempt,
+                self._max_attempts,
+                last_retryable,
+                retry_feedback,
+            )
+            if not last_retryable:
+                break
+
+        report.latency_s = time.perf_counter() - started
         assert last_error is not None
         qualifier = "non-retryable " if not last_retryable else ""
         raise ValueError(
             f"Timebox patch failed after {attempt} attempts due to {qualifier}error: {last_error}"
         ) from last_error
 
+    @property
+    def local_commands_enabled(self) -> bool:
+        """Whether explicit ``/edit`` commands are applied without the LLM."""
+        return self._local_commands
+
+    def _apply_local_command(
+        self,
+        current: TBPlan,
+        user_message: str,
+        *,
+        plan_validator: Callable[[TBPlan], Any] | None,
+    ) -> tuple[TBPlan, TBPatch] | None:
+        """Apply an explicit ``/edit`` command without the LLM, if it is one.
+
+        Returns ``None`` when the message is not an ``/edit`` command.  An
+        ``/edit`` command outside the grammar counts a miss, and one whose
+        plan fails ``apply_tb_ops`` / ``plan_validator`` a rejection; the
+        caller then uses the LLM.
+        """
+        instruction = user_message.split(_PLANNING_CONTEXT_HEADER, 1)[0]
+        if not is_patch_command(instruction):
+            return None
+        patch = parse_patch_command(current, instruction)
+        if patch is None:
+            self._record_local("miss")
+            return None
+        try:
+            patched = apply_tb_ops(current, patch)
+            if plan_validator is not None:
+                plan_validator(patched)
+        except Exception as exc:
+            self._record_local("rejected")
+            logger.info(
+                "timebox_patcher local command rejected, using LLM: %s", exc
+            )
+            return None
+        self._record_local("hit")
+        logger.info(
+            "timebox_patcher local command hit ops=%s hit_rate=%.2f",
+            len(patch.ops),
+            self.local_stats.hit_rate,
+        )
+        return patched, patch
+
+    def _record_local(self, outcome: Literal["hit", "miss", "rejected"]) -> None:
+        stats = self.local_stats
+        if outcome == "hit":
+            stats.hits += 1
+        elif outcome == "miss":
+            stats.misses += 1
+        else:
+            stats.rejected += 1
+        record_local_patch_command(outcome=outcome)
+
+    async def _run_candidates(
+        self,
+        agents: list[AssistantAgent],
+        *,
+        context: str,
+        current: TBPlan,
+        plan_validator: Callable[[TBPlan], Any] | None,
+        attempt: int,
+        report: PatchRunReport,
+    ) -> tuple[tuple[TBPlan, TBPatch] | None, list[Exception]]:
+        """Run one attempt's candidates; return the winner or all errors.
+
+        Args:
+            agents: One agent per candidate slot.
+            context: Prompt context shared by every candidate.
+            current: Plan the patch is applied to.
+            plan_validator: Optional validator for the patched plan.
+            attempt: 1-based attempt number (for the report).
+            report: Report that collects each candidate's outcome.
+
+        Returns:
+            ``(winner, errors)``; ``winner`` is ``None`` when every candidate
+            failed, and ``errors`` is then ordered by candidate index (empty
+            when every candidate ended cancelled or superseded).
+        """
+        won = asyncio.Event()
+        tokens = [CancellationToken() for _ in agents]
+        tasks = [
+            asyncio.create_task(
+                self._run_candidate(
+                    agent,
+                    index=index,
+                    context=context,
+                    current=current,
+                    plan_validator=plan_validator,
+                    won=won,
+                    token=tokens[index],
+                    attempt=attempt,
+                    report=report,
+                )
+            )
+            for index, agent in enumerate(agents)
+        ]
+        winner: tuple[TBPlan, TBPatch] | None = None
+        pending = set(tasks)
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    # A candidate cancelled from inside (e.g. by its agent)
+                    # is a lost candidate, not a cancellation of this call.
+                    if not task.cancelled() and task.exception() is None:
+                        winner = task.result()
+        finally:
+            for index, task in enumerate(tasks):
+                if not task.done():
+                    tokens[index].cancel()
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if winner is not None:
+            return winner, []
+        errors = [
+            task.exception()
+            for task in tasks
+            if not task.cancelled()
+            and not isinstance(task.exception(), _Superseded)
+        ]
+        return None, [e for e in errors if e is not None]
+
+    async def _run_candidate(
+        self,
+        agent: AssistantAgent,
+        *,
+        index: int,
+        context: str,
+        current: TBPlan,
+        plan_validator: Callable[[TBPlan], Any] | None,
+        won: asyncio.Event,
+        token: CancellationToken,
+        attempt: int,
+        report: PatchRunReport,
+    ) -> tuple[TBPlan, TBPatch]:
+        """Generate, apply and validate one patch candidate."""
+        request_id = report.request_id
+        if index and self._hedging.stagger_s:
+            await asyncio.sleep(self._hedging.stagger_s * index)
+        started = time.perf_counter()
+
+        def _finish(
+            status: Literal["won", "failed", "cancelled"], error: str | None = None
+        ) -> None:
+            outcome = PatchCandidateOutcome(
+                attempt=attempt,
+                candidate=index,
+                status=status,
+                runtime_s=time.perf_counter() - started,
+                error=error,
+            )
+            report.outcomes.append(outcome)
+            if status == "won":
+                report.winner = outcome
+            record_patch_candidate(outcome=status, runtime_s=outcome.runtime_s)
+
+        try:
+            if won.is_set():
+                raise _Superseded()
+            response = await with_timeout(
+                "timeboxing:patcher",
+                agent.on_messages(
+                    [TextMessage(content=context, source="user")],
+                    token,
+                ),
+                timeout_s=TIMEBOXING_TIMEOUTS.skeleton_draft_s,
+            )
+            raw_content = getattr(getattr(response, "chat_message", None), "content", None)
+            logger.debug(
+                "timebox_patcher request_id=%s attempt=%s candidate=%s raw_len=%s raw_content=%s",
+                request_id,
+                attempt,
+                index,
+                len(raw_content) if isinstance(raw_content, str) else None,
+                _to_log_string(raw_content),
+            )
+            patch = _extract_patch(response)
+            logger.debug(
+                "timebox_patcher request_id=%s attempt=%s candidate=%s patch=%s",
+                request_id,
+                attempt,
+                index,
+                patch.model_dump_json(),
+            )
+            # No awaits from here on: the first candidate to validate claims
+            # the win before any other candidate can run its validator.
+            if won.is_set():
+                raise _Superseded()
+            patched = apply_tb_ops(current, patch)
+            if plan_validator is not None:
+                plan_validator(patched)
+            won.set()
+        except (asyncio.CancelledError, _Superseded):
+            _finish("cancelled")
+            raise
+        except Exception as exc:
+            _finish("failed", error=str(exc) or type(exc).__name__)
+            raise
+        _finish("won")
+        return patched, patch
+
     async def apply_patch_legacy(
         self,
         *,
@@ -553,4 +873,10 @@ def _extract_error_details(error: Exception) -> list[str]:
     return details
 
 
-__all__ = ["TimeboxPatcher"]
+__all__ = [
+    "LocalCommandStats",
+    "PatchCandidateOutcome",
+    "PatchHedgingPolicy",
+    "PatchRunReport",
+    "TimeboxPatcher",
+]
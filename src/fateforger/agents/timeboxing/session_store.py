@@ -0,0 +1,309 @@
+"""Persistence and bounded in-memory caching for timeboxing sessions.
+
+``TimeboxingFlowAgent`` keeps live ``Session`` objects in a ``SessionCache``
+(LRU + idle TTL).  After each handled message the touched sessions are
+written through ``SqlAlchemyTimeboxingSessionStore``; evicted or restarted
+sessions are rehydrated lazily by session key on first touch.
+
+Sessions are serialized with ``SessionCodec``: every dataclass field not
+marked ``SESSION_TRANSIENT`` (tasks, locks, GraphFlow, in-flight background
+flags) is dumped through a pydantic ``TypeAdapter`` to compact JSON and
+zlib-compressed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Generic, TypeVar, get_type_hints
+
+from pydantic import TypeAdapter
+from sqlalchemy import DateTime, LargeBinary, String, delete, select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, declarative_base, mapped_column
+
+Base = declarative_base()
+
+T = TypeVar("T")
+
+# ``dataclasses.field(metadata=SESSION_TRANSIENT)`` excludes a field from
+# persistence; it is reset to its default on rehydration.
+SESSION_TRANSIENT: dict[str, bool] = {"transient": True}
+
+# Keys used by the handler turn running in the current task (``SessionCache.turn``).
+_TURN_KEYS: ContextVar[set[str] | None] = ContextVar(
+    "timeboxing_session_turn_keys", default=None
+)
+
+
+class TimeboxingSessionRecord(Base):
+    __tablename__ = "timeboxing_sessions"
+
+    session_key: Mapped[str] = mapped_column(String, primary_key=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    channel_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    thread_ts: Mapped[str | None] = mapped_column(String, nullable=True)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+
+class SessionCodec(Generic[T]):
+    """Compact, forward-compatible (de)serializer for a session dataclass."""
+
+    def __init__(self, cls: type[T]) -> None:
+        """Build per-field adapters for ``cls``.
+
+        Args:
+            cls: Dataclass to serialize.  Fields whose metadata contains
+                ``SESSION_TRANSIENT`` are skipped.
+        """
+        hints = get_type_hints(cls)
+        self._cls = cls
+        self._adapters: dict[str, TypeAdapter[Any]] = {
+            f.name: TypeAdapter(hints[f.name])
+            for f in fields(cls)  # type: ignore[arg-type]
+            if not f.metadata.get("transient")
+        }
+
+    def encode(self, obj: T) -> bytes:
+        """Serialize ``obj`` to zlib-compressed JSON."""
+        data = {
+            name: adapter.dump_python(getattr(obj, name), mode="json")
+            for name, adapter in self._adapters.items()
+        }
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        return zlib.compress(text.encode("utf-8"))
+
+    def decode(self, blob: bytes) -> T:
+        """Rebuild an instance; unknown keys are ignored, missing ones defaulted."""
+        data = json.loads(zlib.decompress(blob).decode("utf-8"))
+        kwargs = {
+            name: adapter.validate_python(data[name])
+            for name, adapter in self._adapters.items()
+            if name in data
+        }
+        return self._cls(**kwargs)
+
+
+class SqlAlchemyTimeboxingSessionStore(Generic[T]):
+    """Session persistence on the shared async SQLAlchemy engine."""
+
+    def __init__(
+        self, sessionmaker: async_sessionmaker[AsyncSession], codec: SessionCodec[T]
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self._codec = codec
+        self._digests: dict[str, bytes] = {}
+
+    async def load(self, session_key: str) -> T | None:
+        """Return the persisted session for ``session_key``, if any."""
+        async with self._sessionmaker() as db:
+            row = await db.get(TimeboxingSessionRecord, session_key)
+            if row is None:
+                return None
+            self._digests[session_key] = _digest(row.payload)
+            return self._codec.decode(row.payload)
+
+    async def save(
+        self,
+        session_key: str,
+        session: T,
+        *,
+        user_id: str,
+        channel_id: str | None,
+        thread_ts: str | None,
+    ) -> bool:
+        """Upsert ``session``; skip the write when the payload is unchanged.
+
+        Returns:
+            ``True`` when a row was written.
+        """
+        payload = self._codec.encode(session)
+        digest = _digest(payload)
+        if self._digests.get(session_key) == digest:
+            return False
+        async with self._sessionmaker() as db:
+            row = await db.get(TimeboxingSessionRecord, session_key)
+            if row is None:
+                row = TimeboxingSessionRecord(session_key=session_key)
+                db.add(row)
+            row.user_id = user_id
+            row.channel_id = channel_id
+            row.thread_ts = thread_ts
+            row.payload = payload
+            row.updated_at = datetime.utcnow()
+            await db.commit()
+        self._digests[session_key] = digest
+        return True
+
+    async def delete(self, session_key: str) -> None:
+        """Remove a persisted session (e.g. once it is finalized)."""
+        self._digests.pop(session_key, None)
+        async with self._sessionmaker() as db:
+            await db.execute(
+                delete(TimeboxingSessionRecord).where(
+                    TimeboxingSessionRecord.session_key == session_key
+                )
+            )
+            await db.commit()
+
+    async def keys_for_user(self, user_id: str) -> list[str]:
+        """Return persisted session keys for ``user_id``."""
+        async with self._sessionmaker() as db:
+            result = await db.execute(
+                select(TimeboxingSessionRecord.session_key).where(
+                    TimeboxingSessionRecord.user_id == user_id
+                )
+            )
+            return list(result.scalars().all())
+
+
+class SessionCache(Generic[T]):
+    """Dict-like in-memory session map with LRU and idle-TTL eviction.
+
+    Reads and writes record the key as *touched* so the owner can persist
+    exactly the sessions a turn used (``take_touched``).  Inside ``turn``
+    the keys are also recorded for the current task, so a turn still saves
+    its own sessions after a concurrent turn took the shared set.  Eviction is
+    cooperative: ``eviction_candidates`` only names keys; the owner persists
+    them and then ``pop``s.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        idle_ttl_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._entries: OrderedDict[str, T] = OrderedDict()
+        self._last_used: dict[str, float] = {}
+        self._touched: set[str] = set()
+        self._max_entries = max(1, int(max_entries))
+        self._idle_ttl_s = float(idle_ttl_s)
+        self._clock = clock
+
+    def _touch(self, key: str) -> None:
+        self._entries.move_to_end(key)
+        self._last_used[key] = self._clock()
+        self._touched.add(key)
+        turn_keys = _TURN_KEYS.get()
+        if turn_keys is not None:
+            turn_keys.add(key)
+
+    def get(self, key: str, default: T | None = None) -> T | None:
+        value = self._entries.get(key)
+        if value is None:
+            return default
+        self._touch(key)
+        return value
+
+    def peek(self, key: str) -> T | None:
+        """Return the session without refreshing its LRU position."""
+        return self._entries.get(key)
+
+    def __getitem__(self, key: str) -> T:
+        value = self._entries[key]
+        self._touch(key)
+        return value
+
+    def __setitem__(self, key: str, value: T) -> None:
+        self._entries[key] = value
+        self._touch(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def keys(self) -> list[str]:
+        return list(self._entries)
+
+    def values(self) -> list[T]:
+        return list(self._entries.values())
+
+    def items(self) -> list[tuple[str, T]]:
+        return list(self._entries.items())
+
+    def pop(self, key: str, default: T | None = None) -> T | None:
+        self._last_used.pop(key, None)
+        self._touched.discard(key)
+        return self._entries.pop(key, default)
+
+    @contextmanager
+    def turn(self) -> Iterator[None]:
+        """Record the keys the current task uses until exit (nested turns share)."""
+        if _TURN_KEYS.get() is not None:
+            yield
+            return
+        token = _TURN_KEYS.set(set())
+        try:
+            yield
+        finally:
+            _TURN_KEYS.reset(token)
+
+    def take_touched(self) -> list[str]:
+        """Return and clear the keys used since the last call.
+
+        Inside ``turn`` the keys this task used are always included, even if
+        another task's call already cleared them from the shared set.
+        """
+        keys = dict.fromkeys([*(_TURN_KEYS.get() or ()), *self._touched])
+        self._touched.clear()
+        return [key for key in keys if key in self._entries]
+
+    def eviction_candidates(self, *, pinned: Callable[[T], bool]) -> list[str]:
+        """Keys idle past the TTL, plus the least recently used over capacity.
+
+        Args:
+            pinned: Sessions for which this returns ``True`` (e.g. mid-turn)
+                are never proposed.
+        """
+        now = self._clock()
+        overflow = len(self._entries) - self._max_entries
+        candidates: list[str] = []
+        for key, value in self._entries.items():  # oldest first
+            idle = now - self._last_used.get(key, now) >= self._idle_ttl_s
+            if not (idle or overflow > 0) or pinned(value):
+                continue
+            candidates.append(key)
+            overflow -= 1
+        return candidates
+
+
+def _digest(payload: bytes) -> bytes:
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+async def ensure_timeboxing_session_schema(engine: AsyncEngine) -> None:
+    """Ensure the timeboxing session table exists."""
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: TimeboxingSessionRecord.__table__.create(
+                sync_conn, checkfirst=True
+            )
+        )
+
+
+__all__ = [
+    "SESSION_TRANSIENT",
+    "SessionCache",
+    "SessionCodec",
+    "SqlAlchemyTimeboxingSessionStore",
+    "TimeboxingSessionRecord",
+    "ensure_timeboxing_session_schema",
+]
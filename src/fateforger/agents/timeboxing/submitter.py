@@ -6,14 +6,22 @@ Replaces the stub submitter with real MCP-based sync operations.
 from __future__ import annotations
 
 import logging
-from typing import Any
+from datetime import date
+from typing import Any, Mapping
+
+from fateforger.adapters.calendar.models import GCalEventsResponse
 
 from fateforger.core.config import settings
+from fateforger.tools.mcp_pool import mcp_workbench_pool
 
+from .constants import TIMEBOXING_LIMITS
 from .sync_engine import (
+    SyncExecutionPolicy,
     SyncTransaction,
     execute_sync,
+    execute_sync_range,
     plan_sync,
+    plan_sync_range,
     undo_sync,
 )
 from .tb_models import TBPlan
@@ -32,26 +40,34 @@ class CalendarSubmitter:
         *,
         server_url: str | None = None,
         timeout_s: float = 10.0,
+        execution_policy: SyncExecutionPolicy | None = None,
     ) -> None:
         """Initialize the submitter.
 
         Args:
             server_url: MCP calendar server URL.  Falls back to config.
             timeout_s: HTTP timeout for MCP calls.
+            execution_policy: Concurrency / rate limits for sync execution.
+                Defaults to ``TIMEBOXING_LIMITS``.
         """
         self._server_url = server_url or settings.mcp_calendar_server_url
         self._timeout_s = timeout_s
+        self._execution_policy = execution_policy or SyncExecutionPolicy(
+            max_concurrency=TIMEBOXING_LIMITS.calendar_sync_concurrency,
+            rate_per_s=TIMEBOXING_LIMITS.calendar_sync_rate_per_s,
+            burst=TIMEBOXING_LIMITS.calendar_sync_burst,
+        )
         self._last_tx: SyncTransaction | None = None
 
     def _get_workbench(self) -> Any:
-        """Create an MCP workbench for the calendar server.
+        """Return a pooled MCP workbench for the calendar server.
 
         Returns:
-            An ``McpWorkbench`` instance.
+            A ``PooledWorkbench`` leasing shared calendar sessions.
         """
-        from autogen_ext.tools.mcp import McpWorkbench, StreamableHttpServerParams
+        from autogen_ext.tools.mcp import StreamableHttpServerParams
 
-        return McpWorkbench(
+        return mcp_workbench_pool().workbench(
             StreamableHttpServerParams(
                 url=self._server_url,
                 timeout=self._timeout_s,
@@ -101,12 +117,60 @@ class CalendarSubmitter:
         )
 
         wb = self._get_workbench()
-        tx = await execute_sync(ops, wb, halt_on_error=True)
+        tx = await execute_sync(
+            ops,
+            wb,
+            halt_on_error=True,
+            policy=self._execution_policy,
+            batch=True,
+            max_batch_size=TIMEBOXING_LIMITS.calendar_sync_batch_size,
+        )
         self._last_tx = tx
 
         logger.info("Sync transaction status: %s", tx.status)
         return tx
 
+    async def submit_range(
+        self,
+        desired_by_day: Mapping[date, TBPlan],
+        *,
+        remote_by_day: Mapping[date, GCalEventsResponse],
+        calendar_id: str = "primary",
+    ) -> tuple[SyncTransaction, dict[date, SyncTransaction]]:
+        """Diff and submit several days as one combined transaction.
+
+        Args:
+            desired_by_day: Target ``TBPlan`` per day.
+            remote_by_day: Remote ``list-events`` response per day (e.g. from
+                ``McpCalendarClient.list_range_snapshots``).
+            calendar_id: Target GCal calendar ID.
+
+        Returns:
+            ``(combined_tx, per_day_tx)``; pass a per-day transaction to
+            ``undo_transaction`` to roll back a single day.
+        """
+        ops = plan_sync_range(remote_by_day, desired_by_day, calendar_id=calendar_id)
+        if not ops:
+            logger.info("No sync ops needed for %d day(s).", len(desired_by_day))
+            tx = SyncTransaction(status="committed")
+            self._last_tx = tx
+            return tx, {}
+
+        logger.info(
+            "Submitting %d sync ops across %d day(s).", len(ops), len(desired_by_day)
+        )
+        wb = self._get_workbench()
+        tx, per_day = await execute_sync_range(
+            ops,
+            wb,
+            halt_on_error=True,
+            policy=self._execution_policy,
+            batch=True,
+        )
+        self._last_tx = tx
+        logger.info("Range sync transaction status: %s", tx.status)
+        return tx, per_day
+
     async def undo_last(self) -> SyncTransaction | None:
         """Undo the last submitted transaction.
 
@@ -118,7 +182,9 @@ class CalendarSubmitter:
             return None
 
         wb = self._get_workbench()
-        undo_tx = await undo_sync(self._last_tx, wb)
+        undo_tx = await undo_sync(
+            self._last_tx, wb, policy=self._execution_policy, batch=True
+        )
         self._last_tx = None  # Clear after undo
         return undo_tx
 
@@ -135,7 +201,7 @@ class CalendarSubmitter:
             logger.warning("Transaction is not undoable (status=%s).", tx.status)
             return None
         wb = self._get_workbench()
-        undo_tx = await undo_sync(tx, wb)
+        undo_tx = await undo_sync(tx, wb, policy=self._execution_policy, batch=True)
         if self._last_tx is tx:
             self._last_tx = None
         return undo_tx
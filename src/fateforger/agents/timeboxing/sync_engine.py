@@ -7,29 +7,43 @@ deterministic undo.
 
 Key design decisions
 --------------------
-* **DeepDiff** detects meaningful field changes (summary, start, end,
-  description, colorId) and ignores GCal noise (etag, updated, sequence).
+* A typed field-level comparator (``_canonical_diff_paths``) detects
+  meaningful field changes (summary, start, end, description, colorId) and
+  ignores GCal noise (etag, updated, sequence).
 * Agent-owned events are identified by a deterministic ``fftb*`` event-ID
   prefix (base32hex).  Foreign events are never mutated.
 * ``undo_sync`` replays compensating ops in reverse order.
+* ``execute_sync`` optionally runs independent ops concurrently under a
+  ``SyncExecutionPolicy`` (concurrency cap + token-bucket rate limit).  Ops
+  that target the same event ID stay serialized in list order.
+* When the calendar MCP server advertises a batch mutation tool
+  (``BATCH_TOOL_NAMES``), ``execute_sync(..., batch=True)`` sends the whole
+  transaction as one request per ``max_batch_size`` chunk and maps results
+  back per op; otherwise it falls back to the per-op path.
+* ``plan_sync_range`` plans several days from one ``list-events`` window and
+  tags each op with its ``plan_date`` so ``split_transaction_by_day`` can undo
+  a single day of a combined transaction.
 """
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
+import json
 import logging
+import time as time_module
 from dataclasses import dataclass, field
 from datetime import date as date_type
 from datetime import datetime, time, timezone
 from enum import Enum
-from typing import Any
+from typing import Any, Mapping
 from zoneinfo import ZoneInfo
 
 from dateutil import parser as date_parser
-from deepdiff import DeepDiff
 
 from fateforger.adapters.calendar.models import GCalEventsResponse
+from fateforger.adapters.calendar.read_cache import calendar_read_cache
 
 from .calendar_reconciliation import reconcile_calendar_ops
 from .tb_models import ET_COLOR_MAP, FixedWindow, TBEvent, TBPlan, gcal_color_to_et
@@ -39,6 +53,12 @@ logger = logging.getLogger(__name__)
 FFTB_PREFIX = "fftb"
 """Prefix for agent-owned GCal event IDs."""
 
+BATCH_TOOL_NAMES = ("batch-events", "batch-mutate-events")
+"""MCP tool names accepted as bulk create/update/delete endpoints (first wins)."""
+
+DEFAULT_MAX_BATCH_SIZE = 50
+"""Google Calendar batch requests accept at most 50 calls."""
+
 
 # ── Helpers ──────────────────────────────────────────────────────────────
 
@@ -79,7 +99,12 @@ def _calendar_mcp_datetime(value: datetime) -> str:
     return value.replace(tzinfo=None, microsecond=0).isoformat()
 
 
-# ── Canonical representation (for DeepDiff) ──────────────────────────────
+# ── Canonical representation (for diffing) ───────────────────────────────
+
+_CANONICAL_FIELDS = ("summary", "start", "end", "description", "colorId")
+"""Fields of the canonical event shape (``_canonical_diff_paths`` sorts its output)."""
+
+_CANONICAL_PATHS = {name: f"root['{name}']" for name in _CANONICAL_FIELDS}
 
 
 def _canonical(resolved: dict) -> dict[str, str]:
@@ -100,6 +125,30 @@ def _canonical(resolved: dict) -> dict[str, str]:
     }
 
 
+def _canonical_diff_paths(
+    remote: dict[str, str], desired: dict[str, str]
+) -> tuple[str, ...]:
+    """Return sorted changed paths between two canonical event dicts.
+
+    Paths use the ``root['field']`` form so ``SyncOp.diff_paths`` stays stable
+    for callers and logs.
+
+    Args:
+        remote: Canonical dict for the remote event.
+        desired: Canonical dict for the desired event.
+
+    Returns:
+        Sorted tuple of changed paths (empty when identical).
+    """
+    return tuple(
+        sorted(
+            _CANONICAL_PATHS[name]
+            for name in _CANONICAL_FIELDS
+            if remote[name] != desired[name]
+        )
+    )
+
+
 # ── GCal response → TBPlan ──────────────────────────────────────────────
 
 
@@ -202,6 +251,7 @@ class SyncOp:
         after_payload: The MCP tool arguments for the forward op.
         before_payload: Snapshot before mutation (for undo).
         tool_name: MCP tool name (``create-event``, etc.).
+        plan_date: The planning day this op belongs to (set by ``plan_sync``).
     """
 
     op_type: SyncOpType
@@ -210,6 +260,7 @@ class SyncOp:
     before_payload: dict[str, Any] | None = None
     diff_paths: tuple[str, ...] = field(default_factory=tuple)
     tool_name: str = ""
+    plan_date: date_type | None = None
 
     def __post_init__(self) -> None:
         """Derive ``tool_name`` from ``op_type`` if not set."""
@@ -236,7 +287,56 @@ class SyncTransaction:
     )
 
 
-# ── Plan sync (DeepDiff-based) ───────────────────────────────────────────
+@dataclass(frozen=True, slots=True)
+class SyncExecutionPolicy:
+    """Concurrency and rate limits for ``execute_sync``.
+
+    Attributes:
+        max_concurrency: Maximum number of in-flight MCP calls.
+        rate_per_s: Sustained MCP calls per second (``None`` disables limiting).
+        burst: Token-bucket capacity (calls allowed back-to-back).
+    """
+
+    max_concurrency: int = 4
+    rate_per_s: float | None = None
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate limits."""
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if self.rate_per_s is not None and self.rate_per_s <= 0:
+            raise ValueError("rate_per_s must be > 0 when set")
+        if self.burst < 1:
+            raise ValueError("burst must be >= 1")
+
+
+class _TokenBucket:
+    """Async token bucket used to rate-limit MCP calls."""
+
+    def __init__(self, *, rate_per_s: float, burst: int) -> None:
+        self._rate = rate_per_s
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time_module.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and consume it."""
+        async with self._lock:
+            while True:
+                now = time_module.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
+
+
+# ── Plan sync ───────────────────────────────────────────────────────────
 
 
 def plan_sync(
@@ -279,21 +379,18 @@ def plan_sync(
                 op_type=SyncOpType.CREATE,
                 gcal_event_id=event_id,
                 after_payload=payload,
+                plan_date=desired.date,
             )
         )
 
     for match in plan.updates:
         if not match.remote.event_id:
             continue
-        remote_canonical = _canonical(match.remote.resolved)
-        desired_canonical = _canonical(match.desired.resolved)
-        diff = DeepDiff(
-            remote_canonical,
-            desired_canonical,
-            ignore_order=True,
-            verbose_level=2,
+        diff_paths = _canonical_diff_paths(
+            _canonical(match.remote.resolved),
+            _canonical(match.desired.resolved),
         )
-        if not diff:
+        if not diff_paths:
             continue
         if not match.remote.is_owned:
             logger.info(
@@ -329,20 +426,16 @@ def plan_sync(
                 gcal_event_id=match.remote.event_id,
                 after_payload=after_payload,
                 before_payload=before_payload,
-                diff_paths=_deepdiff_paths(diff),
+                diff_paths=diff_paths,
+                plan_date=desired.date,
             )
         )
 
     for foreign_match in plan.noops:
-        remote_canonical = _canonical(foreign_match.remote.resolved)
-        desired_canonical = _canonical(foreign_match.desired.resolved)
-        diff = DeepDiff(
-            remote_canonical,
-            desired_canonical,
-            ignore_order=True,
-            verbose_level=2,
-        )
-        if diff:
+        if _canonical_diff_paths(
+            _canonical(foreign_match.remote.resolved),
+            _canonical(foreign_match.desired.resolved),
+        ):
             logger.info(
                 "No-op for foreign event match (kind=%s, summary=%s).",
                 foreign_match.match_kind,
@@ -368,6 +461,7 @@ def plan_sync(
                 gcal_event_id=remote_record.event_id,
                 after_payload={"calendarId": calendar_id, "eventId": remote_record.event_id},
                 before_payload=before_payload,
+                plan_date=desired.date,
             )
         )
 
@@ -384,6 +478,89 @@ def plan_sync(
     return ops
 
 
+def plan_sync_range(
+    remote_by_day: Mapping[date_type, GCalEventsResponse],
+    desired_by_day: Mapping[date_type, TBPlan],
+    *,
+    calendar_id: str = "primary",
+) -> list[SyncOp]:
+    """Plan sync ops for several days as one combined, ordered op list.
+
+    Each day is reconciled independently with ``plan_sync`` against its own
+    remote snapshot (typically bucketed from a single ``list-events`` window,
+    see ``McpCalendarClient.list_range_snapshots``).  Reconciliation is pure
+    CPU work in the millisecond range, so days are planned in-process; the
+    range win comes from the single fetch and one combined execution.
+
+    Args:
+        remote_by_day: Remote ``list-events`` response per day.  Missing days
+            are treated as empty.
+        desired_by_day: Desired ``TBPlan`` per day (``plan.date`` must match).
+        calendar_id: Target calendar ID.
+
+    Returns:
+        Ops sorted by type (CREATE → UPDATE → DELETE), then by day, each
+        tagged with ``plan_date``.
+    """
+    ops: list[SyncOp] = []
+    for day in sorted(desired_by_day):
+        desired = desired_by_day[day]
+        if desired.date != day:
+            raise ValueError(
+                f"desired plan for {day.isoformat()} has date {desired.date.isoformat()}"
+            )
+        response = remote_by_day.get(day) or GCalEventsResponse(events=[], totalCount=0)
+        remote, event_id_map, remote_ids = gcal_response_to_tb_plan_with_identity(
+            response,
+            plan_date=day,
+            tz_name=desired.tz,
+        )
+        ops.extend(
+            plan_sync(
+                remote,
+                desired,
+                event_id_map,
+                remote_event_ids_by_index=remote_ids,
+                calendar_id=calendar_id,
+            )
+        )
+    order = {SyncOpType.CREATE: 0, SyncOpType.UPDATE: 1, SyncOpType.DELETE: 2}
+    ops.sort(key=lambda op: order.get(op.op_type, 99))
+    return ops
+
+
+def split_transaction_by_day(tx: SyncTransaction) -> dict[date_type, SyncTransaction]:
+    """Split a combined transaction into per-day transactions for undo.
+
+    Ops without ``plan_date`` are ignored.  Each per-day transaction keeps
+    the ops/results index alignment ``undo_sync`` requires.
+
+    Args:
+        tx: An executed (combined) transaction.
+
+    Returns:
+        Mapping of day → transaction holding that day's ops and results.
+    """
+    if len(tx.results) != len(tx.ops):
+        raise ValueError(
+            "Cannot split sync transaction without complete per-op execution results."
+        )
+    by_day: dict[date_type, SyncTransaction] = {}
+    for op, result in zip(tx.ops, tx.results):
+        if op.plan_date is None:
+            continue
+        day_tx = by_day.setdefault(
+            op.plan_date,
+            SyncTransaction(status=tx.status, timestamp=tx.timestamp),
+        )
+        day_tx.ops.append(op)
+        day_tx.results.append(result)
+    for day_tx in by_day.values():
+        if all(result.get("ok") for result in day_tx.results):
+            day_tx.status = "committed"
+    return by_day
+
+
 # ── Execute / Undo ───────────────────────────────────────────────────────
 
 
@@ -392,75 +569,375 @@ async def execute_sync(
     mcp_workbench: Any,
     *,
     halt_on_error: bool = False,
+    policy: SyncExecutionPolicy | None = None,
+    batch: bool = False,
+    max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
 ) -> SyncTransaction:
     """Execute sync ops against the MCP calendar server.
 
+    Without a ``policy`` ops run one at a time in list order.  With a policy,
+    ops on distinct event IDs run concurrently while ops sharing an event ID
+    keep their relative (CREATE → UPDATE → DELETE) order.
+
     Args:
         ops: Ordered list of ``SyncOp`` to execute.
         mcp_workbench: An ``McpWorkbench`` instance for MCP tool calls.
+        halt_on_error: Stop issuing new ops after the first failure.
+        policy: Optional concurrency / rate-limit policy.
+        batch: Use the server's batch tool when advertised (per-op fallback).
+        max_batch_size: Maximum ops per batch request.
 
     Returns:
         A ``SyncTransaction`` with per-op results and overall status.
     """
+    try:
+        return await _execute_sync(
+            ops,
+            mcp_workbench,
+            halt_on_error=halt_on_error,
+            policy=policy,
+            batch=batch,
+            max_batch_size=max_batch_size,
+        )
+    finally:
+        _invalidate_calendar_reads(ops)
+
+
+async def _execute_sync(
+    ops: list[SyncOp],
+    mcp_workbench: Any,
+    *,
+    halt_on_error: bool,
+    policy: SyncExecutionPolicy | None,
+    batch: bool,
+    max_batch_size: int,
+) -> SyncTransaction:
+    """Dispatch ``execute_sync`` to the batched, concurrent or sequential path."""
+    if batch and ops:
+        batch_tool = await resolve_batch_tool(mcp_workbench)
+        if batch_tool:
+            return await _execute_sync_batched(
+                ops,
+                mcp_workbench,
+                batch_tool=batch_tool,
+                halt_on_error=halt_on_error,
+                max_batch_size=max_batch_size,
+            )
+        logger.debug("Calendar MCP server has no batch tool; using per-op sync.")
+
+    if policy is not None:
+        return await _execute_sync_concurrent(
+            ops,
+            mcp_workbench,
+            halt_on_error=halt_on_error,
+            policy=policy,
+        )
+
     tx = SyncTransaction(ops=ops)
     all_ok = True
 
     for op in ops:
-        try:
-            result = await mcp_workbench.call_tool(
-                op.tool_name,
-                arguments=op.after_payload,
-            )
-            is_error = getattr(result, "is_error", False)
-            content = _extract_result_content(result)
-            tx.results.append(
-                {
-                    "tool": op.tool_name,
-                    "event_id": op.gcal_event_id,
-                    "op_type": op.op_type.value,
-                    "diff_paths": list(op.diff_paths),
-                    "ok": not is_error,
-                    "content": content,
-                }
+        result = await _execute_op(op, mcp_workbench)
+        tx.results.append(result)
+        if not result["ok"]:
+            all_ok = False
+            if halt_on_error:
+                break
+
+    tx.status = _transaction_status(all_ok, halt_on_error=halt_on_error)
+    return tx
+
+
+def _invalidate_calendar_reads(ops: list[SyncOp]) -> None:
+    """Drop shared calendar read-cache windows touched by ``ops``.
+
+    Each op's ``after_payload`` names the event's new position (or only its
+    id, for deletes); ``before_payload`` covers the position it left.
+    """
+    cache = calendar_read_cache()
+    for op in ops:
+        cache.invalidate_for_payload(
+            {"eventId": op.gcal_event_id, **op.after_payload},
+            removes=op.op_type == SyncOpType.DELETE,
+        )
+        if op.before_payload:
+            cache.invalidate_for_payload(
+                {"eventId": op.gcal_event_id, **op.before_payload}, removes=True
             )
-            if is_error:
-                all_ok = False
-                logger.warning(
-                    "Sync op failed: %s %s — %s",
-                    op.tool_name,
-                    op.gcal_event_id,
-                    content,
-                )
+
+
+async def _execute_sync_concurrent(
+    ops: list[SyncOp],
+    mcp_workbench: Any,
+    *,
+    halt_on_error: bool,
+    policy: SyncExecutionPolicy,
+) -> SyncTransaction:
+    """Run independent ops concurrently; serialize ops sharing an event ID.
+
+    Results are index-aligned with ``ops``.  Ops never started because of
+    ``halt_on_error`` are recorded as failed with ``skipped=True`` so the
+    transaction stays undoable.
+    """
+    tx = SyncTransaction(ops=ops)
+    results: list[dict[str, Any] | None] = [None] * len(ops)
+    chains: dict[str, list[int]] = {}
+    for index, op in enumerate(ops):
+        chains.setdefault(op.gcal_event_id, []).append(index)
+
+    semaphore = asyncio.Semaphore(policy.max_concurrency)
+    bucket = (
+        _TokenBucket(rate_per_s=policy.rate_per_s, burst=policy.burst)
+        if policy.rate_per_s is not None
+        else None
+    )
+    halted = asyncio.Event()
+
+    async def _run_chain(indices: list[int]) -> None:
+        for index in indices:
+            if halted.is_set():
+                return
+            async with semaphore:
+                if halted.is_set():
+                    return
+                if bucket is not None:
+                    await bucket.acquire()
+                result = await _execute_op(ops[index], mcp_workbench)
+            results[index] = result
+            if not result["ok"]:
                 if halt_on_error:
-                    break
-        except Exception as exc:
+                    halted.set()
+                # Later ops on the same event depend on this one.
+                return
+
+    await asyncio.gather(*(_run_chain(indices) for indices in chains.values()))
+
+    all_ok = True
+    for index, op in enumerate(ops):
+        result = results[index]
+        if result is None:
+            result = _op_result(op, ok=False, error="skipped", skipped=True)
+        if not result["ok"]:
             all_ok = False
-            tx.results.append(
-                {
-                    "tool": op.tool_name,
-                    "event_id": op.gcal_event_id,
-                    "op_type": op.op_type.value,
-                    "diff_paths": list(op.diff_paths),
-                    "ok": False,
-                    "error": str(exc),
-                }
+        tx.results.append(result)
+
+    tx.status = _transaction_status(all_ok, halt_on_error=halt_on_error)
+    return tx
+
+
+async def resolve_batch_tool(mcp_workbench: Any) -> str | None:
+    """Return the batch mutation tool advertised by the MCP server, if any.
+
+    Args:
+        mcp_workbench: An ``McpWorkbench`` instance.
+
+    Returns:
+        The first name from ``BATCH_TOOL_NAMES`` the server lists, else ``None``.
+    """
+    try:
+        tools = await mcp_workbench.list_tools()
+    except Exception:
+        logger.warning("Calendar MCP list_tools failed; batch sync disabled.", exc_info=True)
+        return None
+    advertised: set[str] = set()
+    for tool in tools or []:
+        name = tool.get("name") if isinstance(tool, dict) else getattr(tool, "name", None)
+        if isinstance(name, str):
+            advertised.add(name)
+    for name in BATCH_TOOL_NAMES:
+        if name in advertised:
+            return name
+    return None
+
+
+async def _execute_sync_batched(
+    ops: list[SyncOp],
+    mcp_workbench: Any,
+    *,
+    batch_tool: str,
+    halt_on_error: bool,
+    max_batch_size: int,
+) -> SyncTransaction:
+    """Send ops through the server batch tool in ``max_batch_size`` chunks.
+
+    Each chunk is one MCP call whose ``operations`` preserve list order, so
+    same-event CREATE → UPDATE → DELETE ordering is left to the server.
+    Results are index-aligned with ``ops``.
+    """
+    if max_batch_size < 1:
+        raise ValueError("max_batch_size must be >= 1")
+    tx = SyncTransaction(ops=ops)
+    all_ok = True
+
+    for chunk_start in range(0, len(ops), max_batch_size):
+        chunk = ops[chunk_start : chunk_start + max_batch_size]
+        if halt_on_error and not all_ok:
+            tx.results.extend(
+                _op_result(op, ok=False, error="skipped", skipped=True) for op in chunk
             )
-            logger.exception("Sync op exception: %s %s", op.tool_name, op.gcal_event_id)
-            if halt_on_error:
-                break
+            continue
+        chunk_results = await _execute_batch_chunk(
+            chunk,
+            mcp_workbench,
+            batch_tool=batch_tool,
+            halt_on_error=halt_on_error,
+        )
+        if not all(result["ok"] for result in chunk_results):
+            all_ok = False
+        tx.results.extend(chunk_results)
 
-    if all_ok:
-        tx.status = "committed"
-    elif halt_on_error:
-        tx.status = "partial_halted"
-    else:
-        tx.status = "partial"
+    tx.status = _transaction_status(all_ok, halt_on_error=halt_on_error)
     return tx
 
 
+async def _execute_batch_chunk(
+    chunk: list[SyncOp],
+    mcp_workbench: Any,
+    *,
+    batch_tool: str,
+    halt_on_error: bool,
+) -> list[dict[str, Any]]:
+    """Execute one batch request and map its response back per op."""
+    arguments = {
+        "operations": [
+            {
+                "type": op.op_type.value,
+                "tool": op.tool_name,
+                "arguments": op.after_payload,
+            }
+            for op in chunk
+        ],
+        "haltOnError": halt_on_error,
+    }
+    try:
+        result = await mcp_workbench.call_tool(batch_tool, arguments=arguments)
+    except Exception as exc:
+        logger.exception("Batch sync exception: %s (%d ops)", batch_tool, len(chunk))
+        return [_op_result(op, ok=False, error=str(exc)) for op in chunk]
+
+    content = _extract_result_content(result)
+    if getattr(result, "is_error", False):
+        logger.warning("Batch sync failed: %s — %s", batch_tool, content)
+        return [_op_result(op, ok=False, error=content) for op in chunk]
+
+    entries = _parse_batch_entries(content)
+    results: list[dict[str, Any]] = []
+    for index, op in enumerate(chunk):
+        entry = entries.get(index)
+        if entry is None:
+            results.append(
+                _op_result(op, ok=False, error="missing batch result", skipped=True)
+            )
+            continue
+        error = entry.get("error")
+        ok = bool(entry.get("ok", entry.get("success", not error)))
+        entry_content = json.dumps(entry, sort_keys=True, default=str)
+        if not ok:
+            logger.warning(
+                "Sync op failed: %s %s — %s",
+                op.tool_name,
+                op.gcal_event_id,
+                error or entry_content,
+            )
+        results.append(
+            _op_result(
+                op,
+                ok=ok,
+                content=entry_content,
+                error=str(error) if error and not ok else None,
+            )
+        )
+    return results
+
+
+def _parse_batch_entries(content: str) -> dict[int, dict[str, Any]]:
+    """Parse a batch tool response into ``{op_index: entry}``.
+
+    Accepts a bare JSON list or ``{"results": [...]}``; entries may carry an
+    explicit ``index`` and otherwise align by position.
+    """
+    try:
+        payload = json.loads(content)
+    except (TypeError, ValueError):
+        logger.warning("Batch sync returned non-JSON content: %s", content[:300])
+        return {}
+    if isinstance(payload, dict):
+        payload = payload.get("results")
+    if not isinstance(payload, list):
+        return {}
+    entries: dict[int, dict[str, Any]] = {}
+    for position, entry in enumerate(payload):
+        if not isinstance(entry, dict):
+            continue
+        raw_index = entry.get("index", position)
+        index = raw_index if isinstance(raw_index, int) else position
+        entries[index] = entry
+    return entries
+
+
+async def _execute_op(op: SyncOp, mcp_workbench: Any) -> dict[str, Any]:
+    """Execute a single op and return its result dict (never raises)."""
+    try:
+        result = await mcp_workbench.call_tool(
+            op.tool_name,
+            arguments=op.after_payload,
+        )
+    except Exception as exc:
+        logger.exception("Sync op exception: %s %s", op.tool_name, op.gcal_event_id)
+        return _op_result(op, ok=False, error=str(exc))
+
+    is_error = getattr(result, "is_error", False)
+    content = _extract_result_content(result)
+    if is_error:
+        logger.warning(
+            "Sync op failed: %s %s — %s",
+            op.tool_name,
+            op.gcal_event_id,
+            content,
+        )
+    return _op_result(op, ok=not is_error, content=content)
+
+
+def _op_result(
+    op: SyncOp,
+    *,
+    ok: bool,
+    content: str | None = None,
+    error: str | None = None,
+    skipped: bool = False,
+) -> dict[str, Any]:
+    """Build the per-op result dict stored on ``SyncTransaction.results``."""
+    result: dict[str, Any] = {
+        "tool": op.tool_name,
+        "event_id": op.gcal_event_id,
+        "op_type": op.op_type.value,
+        "diff_paths": list(op.diff_paths),
+        "ok": ok,
+    }
+    if content is not None:
+        result["content"] = content
+    if error is not None:
+        result["error"] = error
+    if skipped:
+        result["skipped"] = True
+    return result
+
+
+def _transaction_status(all_ok: bool, *, halt_on_error: bool) -> str:
+    """Map execution outcome to a ``SyncTransaction.status`` value."""
+    if all_ok:
+        return "committed"
+    if halt_on_error:
+        return "partial_halted"
+    return "partial"
+
+
 async def undo_sync(
     tx: SyncTransaction,
     mcp_workbench: Any,
+    *,
+    policy: SyncExecutionPolicy | None = None,
+    batch: bool = False,
 ) -> SyncTransaction:
     """Undo a committed sync transaction via compensating ops.
 
@@ -471,6 +948,8 @@ async def undo_sync(
     Args:
         tx: The transaction to undo.
         mcp_workbench: An ``McpWorkbench`` instance.
+        policy: Optional concurrency / rate-limit policy for the undo ops.
+        batch: Send undo ops through the server batch tool when available.
 
     Returns:
         A new ``SyncTransaction`` representing the undo.
@@ -520,11 +999,48 @@ async def undo_sync(
     if not undo_ops:
         return SyncTransaction(status="undone")
 
-    undo_tx = await execute_sync(undo_ops, mcp_workbench)
+    undo_tx = await execute_sync(
+        undo_ops, mcp_workbench, policy=policy, batch=batch
+    )
     undo_tx.status = "undone" if undo_tx.status == "committed" else "undo_partial"
     return undo_tx
 
 
+async def execute_sync_range(
+    ops: list[SyncOp],
+    mcp_workbench: Any,
+    *,
+    halt_on_error: bool = False,
+    policy: SyncExecutionPolicy | None = None,
+    batch: bool = False,
+) -> tuple[SyncTransaction, dict[date_type, SyncTransaction]]:
+    """Execute a ``plan_sync_range`` op list as one combined transaction.
+
+    Args:
+        ops: Combined ops from ``plan_sync_range``.
+        mcp_workbench: An ``McpWorkbench`` instance.
+        halt_on_error: Stop issuing new ops after the first failure.
+        policy: Optional concurrency / rate-limit policy.
+        batch: Use the server's batch tool when advertised.
+
+    Returns:
+        ``(combined_tx, per_day_tx)``; per-day transactions can be passed to
+        ``undo_sync`` individually.
+    """
+    if policy is None and halt_on_error:
+        # The sequential halting path truncates results; per-day undo needs
+        # index-aligned results, which the policy path always provides.
+        policy = SyncExecutionPolicy(max_concurrency=1)
+    tx = await execute_sync(
+        ops,
+        mcp_workbench,
+        halt_on_error=halt_on_error,
+        policy=policy,
+        batch=batch,
+    )
+    return tx, split_transaction_by_day(tx)
+
+
 # ── Internal helpers ─────────────────────────────────────────────────────
 
 
@@ -589,36 +1105,22 @@ def _extract_result_content(result: Any) -> str:
     return str(result)
 
 
-def _deepdiff_paths(diff: Any) -> tuple[str, ...]:
-    """Extract stable changed-paths from a DeepDiff payload."""
-    if hasattr(diff, "to_dict"):
-        payload = diff.to_dict()
-    elif isinstance(diff, dict):
-        payload = diff
-    else:
-        return ()
-    paths: set[str] = set()
-    for value in payload.values():
-        if isinstance(value, dict):
-            for path in value.keys():
-                paths.add(str(path))
-            continue
-        if isinstance(value, (list, set, tuple)):
-            for item in value:
-                paths.add(str(item))
-    return tuple(sorted(paths))
-
-
 __all__ = [
+    "BATCH_TOOL_NAMES",
     "FFTB_PREFIX",
+    "SyncExecutionPolicy",
     "SyncOp",
     "SyncOpType",
     "SyncTransaction",
     "base32hex_id",
     "execute_sync",
+    "execute_sync_range",
     "gcal_response_to_tb_plan",
     "gcal_response_to_tb_plan_with_identity",
     "is_owned_event",
     "plan_sync",
+    "plan_sync_range",
+    "resolve_batch_tool",
+    "split_transaction_by_day",
     "undo_sync",
 ]
@@ -9,13 +9,23 @@ Extracted from ``notebooks/making_timebox_session_stage_4_work.ipynb`` cell 33.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import date as date_type
 from datetime import datetime, time, timedelta
 from enum import Enum
-from typing import Annotated, Literal, Union
+from typing import Annotated, Iterable, Literal, Union
 
 from isodate import parse_duration as _parse_dur
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+
+from .day_grid import DayGrid
 
 # ── EventType (compact codes, no SQLAlchemy) ──────────────────────────────
 
@@ -150,6 +160,21 @@ class TBEvent(BaseModel):
 # ── TBPlan (the generation-time timebox) ──────────────────────────────────
 
 
+@dataclass(frozen=True, slots=True)
+class _ResolvedTimesCache:
+    """Resolved records for a specific ``(date, events)`` snapshot.
+
+    ``events`` holds the exact ``TBEvent`` objects that were resolved; a
+    plan whose event list shares a prefix of identical objects can reuse the
+    matching prefix of ``records``.  ``TBEvent`` instances are treated as
+    immutable — patches replace events rather than mutating them.
+    """
+
+    date: date_type
+    events: tuple[TBEvent, ...]
+    records: tuple[dict, ...]
+
+
 class TBPlan(BaseModel):
     """A day's timebox plan — lightweight container for LLM generation."""
 
@@ -159,6 +184,8 @@ class TBPlan(BaseModel):
     date: date_type = Field(default_factory=date_type.today)
     tz: str = Field(default="Europe/Amsterdam", description="IANA timezone")
 
+    _resolved_cache: _ResolvedTimesCache | None = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def chain_must_be_anchored(self) -> "TBPlan":
         """At least one non-BG event must have a fixed time to anchor the chain."""
@@ -169,91 +196,185 @@ class TBPlan(BaseModel):
             )
         return self
 
+    def reuse_resolved_times(self, source: "TBPlan") -> None:
+        """Seed this plan's resolution cache from ``source``.
+
+        Used by ``apply_tb_ops`` so a patched plan only re-resolves events from
+        the first changed position onward.
+        """
+        if getattr(self, "_resolved_cache", None) is None:
+            self._store_resolved_cache(getattr(source, "_resolved_cache", None))
+
     def resolve_times(self, *, validate_non_overlap: bool = True) -> list[dict]:
         """Deterministically compute concrete start/end for every event.
 
+        Results are cached on the plan.  When the event list changes, only
+        events from the first changed index (stepping back over any
+        ``before_next`` run that depends on it) are recomputed.
+
         Returns:
             List of dicts with keys: ``n``, ``d``, ``t``, ``start_time``,
             ``end_time``, ``duration``, ``index``.
         """
-        planning_date = self.date
-        resolved: list[dict] = []
-
-        # ── Forward pass: after_previous, fixed_start, fixed_window ──
-        last_end_dt: datetime | None = None
-        for i, ev in enumerate(self.events):
-            r: dict = {"n": ev.n, "d": ev.d, "t": ev.t.value, "index": i}
-            p = ev.p
-
-            if p.a == "ap":  # after_previous
-                if last_end_dt is None:
-                    raise ValueError(
-                        f"Event '{ev.n}' (after_previous) has no preceding event"
-                    )
-                start_dt = last_end_dt
-                end_dt = start_dt + p.dur
-                r.update(
-                    start_time=start_dt.time(),
-                    end_time=end_dt.time(),
-                    duration=p.dur,
-                )
+        records = self._resolved_records()
 
-            elif p.a == "fs":  # fixed_start
-                start_dt = datetime.combine(planning_date, p.st)
-                end_dt = start_dt + p.dur
-                r.update(
-                    start_time=p.st,
-                    end_time=end_dt.time(),
-                    duration=p.dur,
+        # ── Overlap check (non-BG only) ──
+        # Desired/generated plans should remain strict, but remote calendar
+        # snapshots can legitimately contain overlaps from prior edits.
+        # All times share ``self.date``, so second-of-day offsets compare the
+        # same as ``datetime.combine(self.date, ...)`` values.
+        if validate_non_overlap:
+            chain = [r for r in records if r["t"] != "BG"]
+            index = _records_grid(chain).first_sequence_overlap()
+            if index is not None:
+                a, b = chain[index], chain[index + 1]
+                raise ValueError(
+                    f"Overlap: '{a['n']}' ends {a['end_time']} "
+                    f"but '{b['n']}' starts {b['start_time']}"
                 )
 
-            elif p.a == "fw":  # fixed_window
-                start_dt = datetime.combine(planning_date, p.st)
-                end_dt = datetime.combine(planning_date, p.et)
-                r.update(
-                    start_time=p.st,
-                    end_time=p.et,
-                    duration=end_dt - start_dt,
-                )
+        return [dict(r) for r in records]
 
-            elif p.a == "bn":  # before_next — resolved in backward pass
-                r.update(duration=p.dur, _pending="bn")
-                resolved.append(r)
-                continue  # don't update last_end_dt yet
+    def day_grid(self, *, include_background: bool = False, layer: str = "") -> DayGrid:
+        """Return the resolved plan as a ``DayGrid`` labelled by event name.
 
-            last_end_dt = datetime.combine(planning_date, r["end_time"])
-            resolved.append(r)
+        Background events are excluded unless ``include_background`` is set,
+        matching the overlap check.  Overlaps are not validated here.
+        """
+        records = self._resolved_records()
+        if not include_background:
+            records = tuple(r for r in records if r["t"] != "BG")
+        return _records_grid(records, layer=layer)
+
+    def _resolved_records(self) -> tuple[dict, ...]:
+        """Return cached resolved records, recomputing only the dirty suffix."""
+        events = tuple(self.events)
+        cache = getattr(self, "_resolved_cache", None)
+        start = 0
+        if cache is not None and cache.date == self.date:
+            start = _first_changed_index(cache.events, events)
+            if start == len(events) == len(cache.events):
+                return cache.records
+            # ``before_next`` events resolve against the following event, so
+            # a change at ``start`` also invalidates the bn run right before it.
+            while start > 0 and events[start - 1].p.a == "bn":
+                start -= 1
+            prefix = cache.records[:start]
+        else:
+            prefix = ()
+        records = prefix + tuple(_resolve_suffix(self.date, events, start, prefix))
+        self._store_resolved_cache(
+            _ResolvedTimesCache(date=self.date, events=events, records=records)
+        )
+        return records
+
+    def _store_resolved_cache(self, cache: _ResolvedTimesCache | None) -> None:
+        """Store the resolution cache, skipping instances built without init."""
+        try:
+            self._resolved_cache = cache
+        except AttributeError:
+            # ``TBPlan.__new__`` instances have no private-attribute storage.
+            pass
+
+
+def _records_grid(records: Iterable[dict], *, layer: str = "") -> DayGrid:
+    """Build a ``DayGrid`` over resolved records, labelled by event name."""
+    records = tuple(records)
+    return DayGrid.from_times(
+        ((r["start_time"], r["end_time"]) for r in records),
+        labels=[r["n"] for r in records],
+        layer=layer,
+    )
 
-        # ── Backward pass: resolve before_next ──
-        next_start_dt: datetime | None = None
-        for r in reversed(resolved):
-            if r.get("_pending") == "bn":
-                if next_start_dt is None:
-                    raise ValueError(
-                        f"Event '{r['n']}' (before_next) has no following event"
-                    )
-                end_dt = next_start_dt
-                start_dt = end_dt - r["duration"]
-                r.update(start_time=start_dt.time(), end_time=end_dt.time())
-                del r["_pending"]
-            if "start_time" in r:
-                next_start_dt = datetime.combine(planning_date, r["start_time"])
 
-        # ── Overlap check (non-BG only) ──
-        # Desired/generated plans should remain strict, but remote calendar
-        # snapshots can legitimately contain overlaps from prior edits.
-        if validate_non_overlap:
-            chain = [r for r in resolved if r["t"] != "BG"]
-            for a, b in zip(chain, chain[1:]):
-                a_end = datetime.combine(planning_date, a["end_time"])
-                b_start = datetime.combine(planning_date, b["start_time"])
-                if a_end > b_start:
-                    raise ValueError(
-                        f"Overlap: '{a['n']}' ends {a['end_time']} "
-                        f"but '{b['n']}' starts {b['start_time']}"
-                    )
-
-        return resolved
+def _first_changed_index(
+    old: tuple[TBEvent, ...], new: tuple[TBEvent, ...]
+) -> int:
+    """Return the first index where ``new`` differs (by identity) from ``old``."""
+    limit = min(len(old), len(new))
+    for index in range(limit):
+        if old[index] is not new[index]:
+            return index
+    return limit
+
+
+def _resolve_suffix(
+    planning_date: date_type,
+    events: tuple[TBEvent, ...],
+    start: int,
+    prefix: tuple[dict, ...],
+) -> list[dict]:
+    """Resolve ``events[start:]`` given the already-resolved ``prefix``.
+
+    ``prefix`` never ends in a ``before_next`` event, so its last record is
+    the forward anchor for the suffix.
+    """
+    resolved: list[dict] = []
+
+    # ── Forward pass: after_previous, fixed_start, fixed_window ──
+    last_end_dt: datetime | None = (
+        datetime.combine(planning_date, prefix[-1]["end_time"]) if prefix else None
+    )
+    for i in range(start, len(events)):
+        ev = events[i]
+        r: dict = {"n": ev.n, "d": ev.d, "t": ev.t.value, "index": i}
+        p = ev.p
+
+        if p.a == "ap":  # after_previous
+            if last_end_dt is None:
+                raise ValueError(
+                    f"Event '{ev.n}' (after_previous) has no preceding event"
+                )
+            start_dt = last_end_dt
+            end_dt = start_dt + p.dur
+            r.update(
+                start_time=start_dt.time(),
+                end_time=end_dt.time(),
+                duration=p.dur,
+            )
+
+        elif p.a == "fs":  # fixed_start
+            start_dt = datetime.combine(planning_date, p.st)
+            end_dt = start_dt + p.dur
+            r.update(
+                start_time=p.st,
+                end_time=end_dt.time(),
+                duration=p.dur,
+            )
+
+        elif p.a == "fw":  # fixed_window
+            start_dt = datetime.combine(planning_date, p.st)
+            end_dt = datetime.combine(planning_date, p.et)
+            r.update(
+                start_time=p.st,
+                end_time=p.et,
+                duration=end_dt - start_dt,
+            )
+
+        elif p.a == "bn":  # before_next — resolved in backward pass
+            r.update(duration=p.dur, _pending="bn")
+            resolved.append(r)
+            continue  # don't update last_end_dt yet
+
+        last_end_dt = datetime.combine(planning_date, r["end_time"])
+        resolved.append(r)
+
+    # ── Backward pass: resolve before_next ──
+    next_start_dt: datetime | None = None
+    for r in reversed(resolved):
+        if r.get("_pending") == "bn":
+            if next_start_dt is None:
+                raise ValueError(
+                    f"Event '{r['n']}' (before_next) has no following event"
+                )
+            end_dt = next_start_dt
+            start_dt = end_dt - r["duration"]
+            r.update(start_time=start_dt.time(), end_time=end_dt.time())
+            del r["_pending"]
+        if "start_time" in r:
+            next_start_dt = datetime.combine(planning_date, r["start_time"])
+
+    return resolved
 
 
 __all__ = [
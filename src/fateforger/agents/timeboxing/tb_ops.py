@@ -79,12 +79,19 @@ class TBPatch(BaseModel):
 # ── Patch applicator ─────────────────────────────────────────────────────
 
 
-def apply_tb_ops(plan: TBPlan, patch: TBPatch) -> TBPlan:
+def apply_tb_ops(plan: TBPlan, patch: TBPatch, *, strict: bool = False) -> TBPlan:
     """Apply domain operations sequentially, return a new validated ``TBPlan``.
 
+    By default a structural-sharing fast path is used: untouched events are
+    shared with ``plan``, ``ue`` ops only check the fields they set, and the
+    plan-level anchor validator is skipped when the tracked anchor counts show
+    the chain is still anchored.  Anything the fast path cannot prove valid is
+    re-applied through the strict path, so errors are identical.
+
     Args:
         plan: The current plan.
         patch: Batch of typed operations to apply.
+        strict: Always revalidate every touched event and the whole plan.
 
     Returns:
         A new ``TBPlan`` with the operations applied.
@@ -92,6 +99,16 @@ def apply_tb_ops(plan: TBPlan, patch: TBPatch) -> TBPlan:
     Raises:
         IndexError: If an operation references an out-of-range event index.
     """
+    patched = None if strict else _apply_tb_ops_fast(plan, patch)
+    if patched is None:
+        patched = _apply_tb_ops_strict(plan, patch)
+    # Unchanged leading events keep their resolved times.
+    patched.reuse_resolved_times(plan)
+    return patched
+
+
+def _apply_tb_ops_strict(plan: TBPlan, patch: TBPatch) -> TBPlan:
+    """Apply ops with full ``TBEvent`` and ``TBPlan`` revalidation."""
     events = list(plan.events)  # mutable copy
 
     for op in patch.ops:
@@ -117,11 +134,7 @@ def apply_tb_ops(plan: TBPlan, patch: TBPatch) -> TBPlan:
                     )
                 current = events[op.i]
                 merged = current.model_dump()
-                updates = {
-                    k: v
-                    for k, v in [("n", op.n), ("d", op.d), ("t", op.t), ("p", op.p)]
-                    if v is not None
-                }
+                updates = _update_fields(op)
                 # Serialize Pydantic models / enums so model_validate re-validates
                 if "p" in updates and isinstance(updates["p"], BaseModel):
                     updates["p"] = updates["p"].model_dump()
@@ -143,6 +156,92 @@ def apply_tb_ops(plan: TBPlan, patch: TBPatch) -> TBPlan:
     return TBPlan(events=events, date=plan.date, tz=plan.tz)
 
 
+def _apply_tb_ops_fast(plan: TBPlan, patch: TBPatch) -> TBPlan | None:
+    """Apply ops without revalidating untouched events.
+
+    ``plan`` is assumed valid, so the anchor validator only needs re-running
+    when an op drops an anchor, or adds an unanchored chain event to a plan
+    that had no chain.  Returns ``None`` whenever an op is out of range or the
+    result might be invalid; the caller then falls back to
+    ``_apply_tb_ops_strict`` so it raises the canonical error.
+    """
+    events = list(plan.events)  # shallow copy; TBEvent instances are shared
+    anchor_lost = False
+    unanchored_added = False
+
+    for op in patch.ops:
+        match op.op:
+            case "ae":  # add_events
+                if op.after is not None:
+                    for offset, ev in enumerate(op.events):
+                        events.insert(op.after + 1 + offset, ev)
+                else:
+                    events.extend(op.events)
+                unanchored_added = unanchored_added or any(
+                    _anchor_flags(ev) == (1, 0) for ev in op.events
+                )
+
+            case "re":  # remove_event
+                if op.i < 0 or op.i >= len(events):
+                    return None
+                if _anchor_flags(events.pop(op.i))[1]:
+                    anchor_lost = True
+
+            case "ue":  # update_event
+                if op.i < 0 or op.i >= len(events):
+                    return None
+                current = events[op.i]
+                updates = _update_fields(op)
+                # ``op.t`` / ``op.p`` are already validated; only the
+                # cross-field BG rule can be broken by combining them.
+                t = updates.get("t", current.t)
+                p = updates.get("p", current.p)
+                if t == ET.BG and p.a not in ("fs", "fw"):
+                    return None
+                updated = current.model_copy(update=updates)
+                old_chain, old_anchor = _anchor_flags(current)
+                new_chain, new_anchor = _anchor_flags(updated)
+                anchor_lost = anchor_lost or old_anchor > new_anchor
+                unanchored_added = unanchored_added or (
+                    new_chain > old_chain and not new_anchor
+                )
+                events[op.i] = updated
+
+            case "me":  # move_event
+                if op.fr < 0 or op.fr >= len(events):
+                    return None
+                ev = events.pop(op.fr)
+                events.insert(min(op.to, len(events)), ev)
+
+            case "ra":  # replace_all
+                events = list(op.events)
+                anchor_lost = True  # nothing is known about the new list
+
+    if anchor_lost or (
+        unanchored_added and not any(e.t != ET.BG for e in plan.events)
+    ):
+        chain = [e for e in events if e.t != ET.BG]
+        if chain and not any(e.p.a in ("fs", "fw") for e in chain):
+            return None  # let ``chain_must_be_anchored`` raise
+    return TBPlan.model_construct(events=events, date=plan.date, tz=plan.tz)
+
+
+def _update_fields(op: UpdateEvent) -> dict:
+    """Return the fields an ``UpdateEvent`` actually sets."""
+    return {
+        k: v
+        for k, v in [("n", op.n), ("d", op.d), ("t", op.t), ("p", op.p)]
+        if v is not None
+    }
+
+
+def _anchor_flags(event: TBEvent) -> tuple[int, int]:
+    """Return ``(is_chain, is_anchor)`` as seen by ``chain_must_be_anchored``."""
+    if event.t == ET.BG:
+        return 0, 0
+    return 1, int(event.p.a in ("fs", "fw"))
+
+
 __all__ = [
     "AddEvents",
     "MoveEvent",
@@ -158,6 +158,7 @@ class Settings(BaseSettings):
     notion_sprint_data_source_urls: str = Field(
         default=""
     )
+    notion_constraint_store_max_workers: int = Field(default=8, ge=1)
 
     # Database Configuration
     alembic_database_url: str = Field(default="sqlite:///data/admonish.db")
@@ -188,12 +189,48 @@ class Settings(BaseSettings):
     )
     slack_register_user_timeout_seconds: float = Field(default=3.0, gt=0.0)
     slack_route_dispatch_timeout_seconds: float = Field(default=75.0, gt=0.0)
+    # Slack message ingestion: event dedupe window, turns running at once
+    # across threads, per-thread backlog bound, and burst-coalescing settle time.
+    slack_ingest_dedupe_ttl_seconds: float = Field(default=600.0, gt=0.0)
+    slack_ingest_max_concurrency: int = Field(default=16, ge=1)
+    slack_ingest_max_pending_per_thread: int = Field(default=20, ge=1)
+    slack_ingest_coalesce_window_seconds: float = Field(default=0.2, ge=0.0)
+
+    # Process-wide calendar list-events cache (0 disables reuse).
+    calendar_read_cache_ttl_seconds: float = Field(default=60.0, ge=0.0)
+    calendar_read_cache_max_entries: int = Field(default=256, ge=1)
+    # Planning guardian: users reconciled in parallel, and the bound on the
+    # background startup pass (startup itself never waits for it).
+    planning_reconcile_concurrency: int = Field(default=8, ge=1)
+    planning_reconcile_startup_timeout_seconds: float = Field(default=300.0, gt=0.0)
+
+    # Durable haunt jobs: how far ahead stored jobs are loaded into the
+    # scheduler, and the page size used while loading.
+    haunt_job_window_minutes: float = Field(default=60.0, gt=0.0)
+    haunt_job_load_batch_size: int = Field(default=500, ge=1)
+
+    # Max age of entries served while the calendar MCP circuit is open.
+    calendar_read_cache_stale_seconds: float = Field(default=900.0, ge=0.0)
+
+    # Shared MCP workbench pool (per server; 0 interval disables health checks).
+    mcp_pool_size: int = Field(default=2, ge=1)
+    mcp_pool_max_concurrency: int = Field(default=8, ge=1)
+    mcp_pool_health_interval_seconds: float = Field(default=60.0, ge=0.0)
+    # Per-tool adaptive timeout cap and circuit breaker for pooled MCP calls.
+    mcp_call_max_timeout_seconds: float = Field(default=30.0, ge=2.0)
+    mcp_call_failure_threshold: int = Field(default=5, ge=1)
+    mcp_call_open_cooldown_seconds: float = Field(default=30.0, ge=0.0)
 
     # Timeboxing feature flags
     timeboxing_memory_backend: str = Field(
         default="constraint_mcp"
     )
     tasks_defaults_memory_backend: str = Field(default="constraint_mcp")
+    # Persist timeboxing sessions to ``database_url`` after every turn.
+    timeboxing_session_persistence: bool = Field(default=True)
+    # Per-session read cache over durable constraint queries.
+    timeboxing_constraint_cache_ttl_seconds: float = Field(default=120.0, ge=0.0)
+    timeboxing_constraint_cache_superset_limit: int = Field(default=200, ge=0)
 
     # Legacy Mem0 Memory Configuration (deprecated)
     mem0_user_id: str = Field(default="timeboxing")
@@ -15,9 +15,10 @@ from urllib import request as url_request
 from fateforger.debug.log_index import append_index_entry
 
 try:
-    from prometheus_client import Counter, Histogram, start_http_server
+    from prometheus_client import Counter, Gauge, Histogram, start_http_server
 except Exception:  # pragma: no cover - optional runtime dependency
     Counter = None  # type: ignore[assignment]
+    Gauge = None  # type: ignore[assignment]
     Histogram = None  # type: ignore[assignment]
     start_http_server = None  # type: ignore[assignment]
 
@@ -51,6 +52,23 @@ _METRIC_ERRORS = None
 _METRIC_STAGE_DURATION = None
 _METRIC_OBS_DROPPED = None
 _METRIC_ADMONISHMENTS = None
+_METRIC_PATCH_CANDIDATES = None
+_METRIC_PATCH_CANDIDATE_RUNTIME = None
+_METRIC_LOCAL_PATCH_COMMANDS = None
+_METRIC_CALENDAR_READ_CACHE = None
+_METRIC_CONSTRAINT_QUERY_CACHE = None
+_METRIC_MCP_POOL = None
+_METRIC_MCP_CALL_DURATION = None
+_METRIC_MCP_CIRCUIT_STATE = None
+_METRIC_MCP_CIRCUIT_REJECTIONS = None
+_METRIC_PLANNING_RECONCILE_USER = None
+_METRIC_PLANNING_RECONCILE_PENDING = None
+_METRIC_HAUNT_FOLLOWUPS_CANCELLED = None
+_METRIC_SLACK_INGEST_EVENTS = None
+_METRIC_SLACK_INGEST_QUEUE_DEPTH = None
+_METRIC_SLACK_INGEST_WAIT = None
+
+_MCP_CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
 
 _CHANNEL_ID_RE = re.compile(r"^[CDG][A-Z0-9]+$")
 _STAGE_AGENT_RE = re.compile(r"^Stage(?P<stage>[A-Za-z]+)Node(?:_|$)")
@@ -166,6 +184,37 @@ def record_admonishment_event(*, component: str, event: str, status: str) -> Non
     ).inc()
 
 
+def record_patch_candidate(*, outcome: str, runtime_s: float) -> None:
+    """Count one timebox patch candidate and observe how long it ran.
+
+    Labels:
+      outcome: ``won``, ``failed`` or ``cancelled`` (hedged losers).
+    """
+    _ensure_metrics_initialized()
+    safe_outcome = _bounded_label(outcome, fallback="unknown")
+    if _METRIC_PATCH_CANDIDATES is not None:
+        _METRIC_PATCH_CANDIDATES.labels(outcome=safe_outcome).inc()
+    if _METRIC_PATCH_CANDIDATE_RUNTIME is not None:
+        _METRIC_PATCH_CANDIDATE_RUNTIME.labels(outcome=safe_outcome).observe(
+            max(0.0, float(runtime_s))
+        )
+
+
+def record_local_patch_command(*, outcome: str) -> None:
+    """Count one deterministic edit-command attempt (no-op without metrics).
+
+    Labels:
+      outcome: ``hit`` (served locally), ``miss`` (not a command) or
+        ``rejected`` (parsed but failed apply/validation; LLM fallback).
+    """
+    _ensure_metrics_initialized()
+    if _METRIC_LOCAL_PATCH_COMMANDS is None:
+        return
+    _METRIC_LOCAL_PATCH_COMMANDS.labels(
+        outcome=_bounded_label(outcome, fallback="unknown")
+    ).inc()
+
+
 def emit_llm_audit_event(event: dict[str, Any]) -> None:
     """Emit one structured LLM I/O audit event through the configured audit sink."""
     _emit_llm_audit_event(event)
@@ -709,13 +758,171 @@ def _coerce_llm_audit_sink(value: str | None) -> str:
     return sink
 
 
+def record_calendar_read_cache(*, event: str, amount: int = 1) -> None:
+    """Count calendar read-cache lookups and invalidations (no-op without metrics).
+
+    Labels:
+      event: ``hits``, ``superset_hits``, ``coalesced``, ``misses``,
+        ``refreshes``, ``stale_hits`` (served while the MCP circuit is open)
+        or ``invalidations`` (windows dropped by our writes).
+    """
+    _ensure_metrics_initialized()
+    if _METRIC_CALENDAR_READ_CACHE is None:
+        return
+    _METRIC_CALENDAR_READ_CACHE.labels(
+        event=_bounded_label(event, fallback="unknown")
+    ).inc(amount)
+
+
+def record_mcp_pool_event(event: str) -> None:
+    """Count MCP workbench pool session lifecycle events (no-op without metrics).
+
+    Labels:
+      event: ``session_started`` or ``session_discarded`` (errored, unhealthy
+        or reset sessions).
+    """
+    _ensure_metrics_initialized()
+    if _METRIC_MCP_POOL is None:
+        return
+    _METRIC_MCP_POOL.labels(event=_bounded_label(event, fallback="unknown")).inc()
+
+
+def observe_mcp_call(*, server: str, tool: str, outcome: str, duration_s: float) -> None:
+    """Observe one MCP tool call's latency (no-op without metrics).
+
+    Labels:
+      outcome: ``ok``, ``reported`` (server-side tool error), ``error`` or
+        ``timeout``.
+    """
+    _ensure_metrics_initialized()
+    if _METRIC_MCP_CALL_DURATION is None:
+        return
+    _METRIC_MCP_CALL_DURATION.labels(
+        server=_bounded_label(server, fallback="unknown"),
+        tool=_bounded_label(tool, fallback="unknown"),
+        outcome=_bounded_label(outcome, fallback="unknown"),
+    ).observe(max(0.0, float(duration_s)))
+
+
+def record_mcp_circuit_state(*, server: str, tool: str, state: str) -> None:
+    """Publish an MCP tool's breaker state (0 closed, 1 half-open, 2 open)."""
+    _ensure_metrics_initialized()
+    if _METRIC_MCP_CIRCUIT_STATE is None:
+        return
+    _METRIC_MCP_CIRCUIT_STATE.labels(
+        server=_bounded_label(server, fallback="unknown"),
+        tool=_bounded_label(tool, fallback="unknown"),
+    ).set(_MCP_CIRCUIT_STATE_VALUES.get(state, 0))
+
+
+def record_mcp_circuit_rejection(*, server: str, tool: str) -> None:
+    """Count MCP calls rejected because the tool's breaker is open."""
+    _ensure_metrics_initialized()
+    if _METRIC_MCP_CIRCUIT_REJECTIONS is None:
+        return
+    _METRIC_MCP_CIRCUIT_REJECTIONS.labels(
+        server=_bounded_label(server, fallback="unknown"),
+        tool=_bounded_label(tool, fallback="unknown"),
+    ).inc()
+
+
+def observe_planning_reconcile_user(*, outcome: str, duration_s: float) -> None:
+    """Observe one user's planning reconcile (no-op without metrics).
+
+    Labels:
+      outcome: ``ok`` or ``error``.
+    """
+    _ensure_metrics_initialized()
+    if _METRIC_PLANNING_RECONCILE_USER is None:
+        return
+    _METRIC_PLANNING_RECONCILE_USER.labels(
+        outcome=_bounded_label(outcome, fallback="unknown")
+    ).observe(max(0.0, float(duration_s)))
+
+
+def set_planning_reconcile_pending(pending: int) -> None:
+    """Publish how many users the running planning reconcile has left."""
+    _ensure_metrics_initialized()
+    if _METRIC_PLANNING_RECONCILE_PENDING is None:
+        return
+    _METRIC_PLANNING_RECONCILE_PENDING.set(max(0, int(pending)))
+
+
+def record_haunt_followups_cancelled(*, source: str, count: int) -> None:
+    """Count cancelled haunting follow-ups (no-op without metrics).
+
+    Labels:
+      source: ``user_activity`` (reply-driven) or ``explicit``.
+    """
+    _ensure_metrics_initialized()
+    if _METRIC_HAUNT_FOLLOWUPS_CANCELLED is None or count <= 0:
+        return
+    _METRIC_HAUNT_FOLLOWUPS_CANCELLED.labels(
+        source=_bounded_label(source, fallback="unknown")
+    ).inc(count)
+
+
+def record_slack_ingest_event(*, outcome: str, amount: int = 1) -> None:
+    """Count Slack events seen by the ingestion queue (no-op without metrics).
+
+    Labels:
+      outcome: ``accepted``, ``duplicate``, ``coalesced`` or ``dropped``.
+    """
+    _ensure_metrics_initialized()
+    if _METRIC_SLACK_INGEST_EVENTS is None or amount <= 0:
+        return
+    _METRIC_SLACK_INGEST_EVENTS.labels(
+        outcome=_bounded_label(outcome, fallback="unknown")
+    ).inc(amount)
+
+
+def set_slack_ingest_queue_depth(depth: int) -> None:
+    """Publish how many Slack events are waiting for a thread turn."""
+    _ensure_metrics_initialized()
+    if _METRIC_SLACK_INGEST_QUEUE_DEPTH is None:
+        return
+    _METRIC_SLACK_INGEST_QUEUE_DEPTH.set(max(0, int(depth)))
+
+
+def observe_slack_ingest_wait(*, wait_s: float) -> None:
+    """Observe how long a Slack event waited before its turn started."""
+    _ensure_metrics_initialized()
+    if _METRIC_SLACK_INGEST_WAIT is None:
+        return
+    _METRIC_SLACK_INGEST_WAIT.observe(max(0.0, float(wait_s)))
+
+
+def record_constraint_query_cache(*, event: str, amount: int = 1) -> None:
+    """Count durable-constraint read-cache lookups (no-op without metrics).
+
+    Labels:
+      event: ``hits``, ``superset_hits`` (stage filtered from a cached
+        stage-less result), ``coalesced``, ``misses`` or ``invalidations``
+        (cached reads dropped after a write).
+    """
+    _ensure_metrics_initialized()
+    if _METRIC_CONSTRAINT_QUERY_CACHE is None:
+        return
+    _METRIC_CONSTRAINT_QUERY_CACHE.labels(
+        event=_bounded_label(event, fallback="unknown")
+    ).inc(amount)
+
+
 def _ensure_metrics_initialized() -> None:
     global _METRICS_READY
     global _METRIC_LLM_CALLS, _METRIC_LLM_TOKENS, _METRIC_TOOL_CALLS
     global _METRIC_ERRORS, _METRIC_STAGE_DURATION, _METRIC_OBS_DROPPED
     global _METRIC_ADMONISHMENTS
-
-    if _METRICS_READY or Counter is None or Histogram is None:
+    global _METRIC_PATCH_CANDIDATES, _METRIC_PATCH_CANDIDATE_RUNTIME
+    global _METRIC_LOCAL_PATCH_COMMANDS, _METRIC_CALENDAR_READ_CACHE
+    global _METRIC_MCP_POOL, _METRIC_MCP_CALL_DURATION
+    global _METRIC_MCP_CIRCUIT_STATE, _METRIC_MCP_CIRCUIT_REJECTIONS
+    global _METRIC_PLANNING_RECONCILE_USER, _METRIC_PLANNING_RECONCILE_PENDING
+    global _METRIC_HAUNT_FOLLOWUPS_CANCELLED
+    global _METRIC_SLACK_INGEST_EVENTS, _METRIC_SLACK_INGEST_QUEUE_DEPTH
+    global _METRIC_SLACK_INGEST_WAIT, _METRIC_CONSTRAINT_QUERY_CACHE
+
+    if _METRICS_READY or Counter is None or Histogram is None or Gauge is None:
         return
     _METRIC_LLM_CALLS = Counter(
         "fateforger_llm_calls_total",
@@ -753,6 +960,82 @@ def _ensure_metrics_initialized() -> None:
         "Admonishment and planning-card action outcomes",
         ["component", "event", "status"],
     )
+    _METRIC_PATCH_CANDIDATES = Counter(
+        "fateforger_patch_candidates_total",
+        "Timebox patch candidates by outcome",
+        ["outcome"],
+    )
+    _METRIC_PATCH_CANDIDATE_RUNTIME = Histogram(
+        "fateforger_patch_candidate_runtime_seconds",
+        "Time each timebox patch candidate ran before winning, failing or cancel",
+        ["outcome"],
+        buckets=(0.5, 1, 2, 5, 10, 20, 30, 60, 120),
+    )
+    _METRIC_LOCAL_PATCH_COMMANDS = Counter(
+        "fateforger_local_patch_commands_total",
+        "Timebox refine messages handled by the deterministic command path",
+        ["outcome"],
+    )
+    _METRIC_CALENDAR_READ_CACHE = Counter(
+        "fateforger_calendar_read_cache_total",
+        "Calendar list-events cache lookups by result, plus invalidated windows",
+        ["event"],
+    )
+    _METRIC_MCP_POOL = Counter(
+        "fateforger_mcp_pool_sessions_total",
+        "MCP workbench pool sessions started and discarded",
+        ["event"],
+    )
+    _METRIC_MCP_CALL_DURATION = Histogram(
+        "fateforger_mcp_call_duration_seconds",
+        "MCP tool call latency by outcome",
+        ["server", "tool", "outcome"],
+        buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 30),
+    )
+    _METRIC_MCP_CIRCUIT_STATE = Gauge(
+        "fateforger_mcp_circuit_state",
+        "MCP tool circuit breaker state (0 closed, 1 half-open, 2 open)",
+        ["server", "tool"],
+    )
+    _METRIC_MCP_CIRCUIT_REJECTIONS = Counter(
+        "fateforger_mcp_circuit_rejections_total",
+        "MCP tool calls failed fast by an open circuit breaker",
+        ["server", "tool"],
+    )
+    _METRIC_PLANNING_RECONCILE_USER = Histogram(
+        "fateforger_planning_reconcile_user_seconds",
+        "Per-user planning reconcile duration by outcome",
+        ["outcome"],
+        buckets=(0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+    )
+    _METRIC_PLANNING_RECONCILE_PENDING = Gauge(
+        "fateforger_planning_reconcile_pending_users",
+        "Users not yet reconciled by the running planning reconcile",
+    )
+    _METRIC_HAUNT_FOLLOWUPS_CANCELLED = Counter(
+        "fateforger_haunt_followups_cancelled_total",
+        "Haunting follow-ups cancelled, by trigger",
+        ["source"],
+    )
+    _METRIC_SLACK_INGEST_EVENTS = Counter(
+        "fateforger_slack_ingest_events_total",
+        "Slack events seen by the ingestion queue, by outcome",
+        ["outcome"],
+    )
+    _METRIC_SLACK_INGEST_QUEUE_DEPTH = Gauge(
+        "fateforger_slack_ingest_queue_depth",
+        "Slack events queued behind a running or pending thread turn",
+    )
+    _METRIC_SLACK_INGEST_WAIT = Histogram(
+        "fateforger_slack_ingest_wait_seconds",
+        "Time a Slack event waited in the ingestion queue before its turn",
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60),
+    )
+    _METRIC_CONSTRAINT_QUERY_CACHE = Counter(
+        "fateforger_constraint_query_cache_total",
+        "Durable constraint read-cache lookups by result, plus invalidated reads",
+        ["event"],
+    )
     _METRICS_READY = True
 
 
@@ -3,6 +3,7 @@ import logging
 import os
 import subprocess
 from dataclasses import dataclass
+from datetime import timedelta
 from pathlib import Path
 from typing import Callable
 
@@ -34,6 +35,11 @@ from fateforger.haunt.event_draft_store import (
     ensure_event_draft_schema,
 )
 from fateforger.haunt.intervention import HauntingInterventionHandler
+from fateforger.haunt.job_store import (
+    DurableJobScheduler,
+    SqlAlchemyJobStore,
+    ensure_job_store_schema,
+)
 from fateforger.haunt.messages import UserFacingMessage
 from fateforger.haunt.orchestrator import HauntOrchestrator
 from fateforger.haunt.planning_guardian import PlanningGuardian
@@ -56,6 +62,7 @@ from fateforger.haunt.settings_store import (
     ensure_admonishment_settings_schema,
 )
 from fateforger.haunt.tools import build_haunting_tools
+from fateforger.tools.mcp_pool import mcp_workbench_pool
 
 USER_CHANNEL_AGENT_TYPE = "user_channel"
 HAUNTING_AGENT_TYPE = "haunting_agent"
@@ -180,7 +187,7 @@ async def _discover_mcp_tools(
     headers: dict[str, str] | None,
     timeout_s: float,
 ) -> list:
-    from autogen_ext.tools.mcp import StreamableHttpServerParams, mcp_server_tools
+    from autogen_ext.tools.mcp import StreamableHttpServerParams
 
     params_kwargs: dict[str, object] = {
         "url": url,
@@ -194,7 +201,9 @@ async def _discover_mcp_tools(
         )
     except TypeError:
         params = StreamableHttpServerParams(**params_kwargs)
-    return await asyncio.wait_for(mcp_server_tools(params), timeout=timeout_s + 0.5)
+    return await asyncio.wait_for(
+        mcp_workbench_pool().discover_tools(params), timeout=timeout_s + 0.5
+    )
 
 
 async def _probe_runtime_mcp_server(
@@ -269,10 +278,14 @@ async def _run_initial_planning_reconcile(
     *,
     planning_guardian: PlanningGuardian,
     timeout_s: float = 15.0,
+    skip_scheduled: bool = False,
 ) -> bool:
     """Run startup planning reconcile without aborting runtime initialization."""
+    kwargs = {"skip_scheduled": True} if skip_scheduled else {}
     try:
-        await asyncio.wait_for(planning_guardian.reconcile_all(), timeout=timeout_s)
+        await asyncio.wait_for(
+            planning_guardian.reconcile_all(**kwargs), timeout=timeout_s
+        )
         logger.info("Initial planning reconcile completed successfully")
         return True
     except TimeoutError:
@@ -289,14 +302,13 @@ async def _run_initial_planning_reconcile(
 def _create_scheduler(database_url: str | None) -> AsyncIOScheduler:
     """Create scheduler with in-memory jobstore.
 
-    Jobs are re-scheduled on startup via reconcile_all(), so persistence
-    is not required. This avoids pickle issues with instance methods.
+    Follow-ups and planning nudges persist as data through
+    ``DurableJobScheduler`` (``haunt/job_store.py``), which re-materializes
+    them here on startup. APScheduler's SQLAlchemy jobstore is not used
+    because instance methods referencing the scheduler can't be pickled.
     """
-    # Note: We don't use SQLAlchemy jobstore because instance methods
-    # referencing the scheduler can't be pickled. Instead, we rely on
-    # reconcile_all() being called on every startup to re-schedule jobs.
     scheduler = AsyncIOScheduler()
-    logger.info("Scheduler initialized (jobs re-scheduled on startup)")
+    logger.info("Scheduler initialized (durable jobs restored from the job store)")
     return scheduler
 
 
@@ -325,8 +337,17 @@ async def _create_runtime() -> SingleThreadedAgentRuntime:
     planning_session_store = SqlAlchemyPlanningSessionStore(sessionmaker)
     await ensure_event_draft_schema(settings_engine)
     event_draft_store = SqlAlchemyEventDraftStore(sessionmaker)
+    await ensure_job_store_schema(settings_engine)
+    job_scheduler = DurableJobScheduler(
+        scheduler,
+        SqlAlchemyJobStore(sessionmaker),
+        window=timedelta(minutes=settings.haunt_job_window_minutes),
+        batch_size=settings.haunt_job_load_batch_size,
+    )
 
-    haunting_service = HauntingService(scheduler, settings_store=settings_store)
+    haunting_service = HauntingService(
+        scheduler, settings_store=settings_store, job_scheduler=job_scheduler
+    )
     intervention = HauntingInterventionHandler(
         haunting_service, user_channel_type=USER_CHANNEL_AGENT_TYPE
     )
@@ -384,7 +405,15 @@ async def _create_runtime() -> SingleThreadedAgentRuntime:
         calendar_client=calendar_client,
         dispatcher=dispatch_planning,
         planning_session_store=planning_session_store,
+        job_scheduler=job_scheduler,
     )
+    # Load stored follow-ups before any timer fires or user activity arrives,
+    # so the first cancellation does not page the store.
+    followups = await haunting_service.load_stored_followups()
+    logger.info("Loaded %d stored haunt follow-ups", followups)
+    # Handlers for both job kinds are registered; restore stored jobs now.
+    restored = await job_scheduler.start()
+    logger.info("Restored %d durable haunt jobs", restored)
 
     await PlannerAgent.register(
         runtime,
@@ -464,6 +493,7 @@ async def _create_runtime() -> SingleThreadedAgentRuntime:
     runtime.start()
     setattr(runtime, "haunt_orchestrator", haunt)
     setattr(runtime, "haunting_service", haunting_service)
+    setattr(runtime, "haunt_job_scheduler", job_scheduler)
     setattr(runtime, "haunting_tools", haunting_tools)
     setattr(runtime, "haunting_settings_engine", settings_engine)
     setattr(runtime, "planning_reconciler", reconciler)
@@ -474,16 +504,23 @@ async def _create_runtime() -> SingleThreadedAgentRuntime:
         scheduler,
         anchor_store=planning_anchor_store,
         reconciler=reconciler,
+        max_concurrency=settings.planning_reconcile_concurrency,
     )
     planning_guardian.schedule_daily()
-    # Kick off reconcile on startup so nudges are scheduled immediately.
-    # This is critical since we use in-memory scheduler (jobs lost on restart).
-    await _run_initial_planning_reconcile(
-        planning_guardian=planning_guardian,
-        timeout_s=15.0,
+    # Kick off reconcile on startup for users without restored nudges (new
+    # anchors, or nudges that all expired while down). It runs in the
+    # background so startup does not wait on the user base.
+    planning_reconcile_task = asyncio.create_task(
+        _run_initial_planning_reconcile(
+            planning_guardian=planning_guardian,
+            timeout_s=settings.planning_reconcile_startup_timeout_seconds,
+            skip_scheduled=True,
+        ),
+        name="initial_planning_reconcile",
     )
 
     setattr(runtime, "planning_guardian", planning_guardian)
+    setattr(runtime, "planning_reconcile_task", planning_reconcile_task)
     return runtime
 
 
@@ -517,10 +554,23 @@ async def shutdown_runtime() -> None:
             return
         _runtime = None
 
+    planning_reconcile_task = getattr(runtime, "planning_reconcile_task", None)
+    if isinstance(planning_reconcile_task, asyncio.Task):
+        planning_reconcile_task.cancel()
+
     await runtime.stop()
     await runtime.close()
 
-    scheduler = getattr(getattr(runtime, "haunting_service", None), "_scheduler", None)
+    haunting_service = getattr(runtime, "haunting_service", None)
+    for owner in (
+        haunting_service,
+        getattr(runtime, "haunt_orchestrator", None),
+        getattr(runtime, "haunt_job_scheduler", None),
+    ):
+        close_timers = getattr(owner, "close", None)
+        if callable(close_timers):
+            await close_timers()
+    scheduler = getattr(haunting_service, "_scheduler", None)
     scheduler.shutdown(wait=False)
 
     settings_engine = getattr(runtime, "haunting_settings_engine", None)
@@ -530,6 +580,8 @@ async def shutdown_runtime() -> None:
     calendar_client = getattr(planning_reconciler, "calendar_client", None)
     await calendar_client.close()
 
+    await mcp_workbench_pool().close()
+
 
 # in this file we register the agents
 
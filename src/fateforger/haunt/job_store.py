@@ -0,0 +1,476 @@
+"""Restart-safe, pickle-free persistence for haunting and planning jobs.
+
+APScheduler's SQLAlchemy job store cannot be used (instance-method callables
+cannot be pickled).  ``DurableJobScheduler`` instead stores every job as
+data — ``(job_id, kind, run_at, payload)`` plus lookup keys — in the
+``haunt_scheduled_jobs`` table.
+
+* Owners register an async handler per ``kind`` and call ``schedule`` /
+  ``cancel``; rows are upserted / deleted as the jobs change.  ``scope``,
+  ``task_id`` and ``user_id`` are indexed for bulk lookups (``find_any``).
+* Only jobs due within ``window`` are materialized, as entries of one
+  ``TimerQueue`` heap that fires due jobs in batches.  ``start`` loads the
+  first window (keyset-paged in ``batch_size`` rows) and a periodic
+  APScheduler job extends it, so booting with thousands of stored jobs
+  neither reruns calendar reconciliation nor arms every stored job.
+* Jobs overdue by more than their ``misfire_grace_s`` are dropped on load;
+  other overdue jobs run immediately.
+* After a handler returns, the row is deleted unless the handler
+  rescheduled the same ``job_id`` (the row's ``run_at`` changed).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import DateTime, Integer, String, Text, delete, or_, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Mapped, declarative_base, mapped_column
+
+from .timer_queue import TimerQueue
+
+logger = logging.getLogger(__name__)
+
+Base = declarative_base()
+
+JobHandler = Callable[["JobSpec"], Awaitable[None]]
+
+
+class ScheduledJobRecord(Base):
+    __tablename__ = "haunt_scheduled_jobs"
+
+    job_id: Mapped[str] = mapped_column(String, primary_key=True)
+    kind: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    scope: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    task_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    user_id: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    run_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
+    misfire_grace_s: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+
+@dataclass(frozen=True)
+class JobSpec:
+    """A persisted job: what to run (``kind`` + JSON ``payload``) and when."""
+
+    job_id: str
+    kind: str
+    run_at: datetime
+    payload: dict[str, Any] = field(default_factory=dict)
+    scope: str | None = None
+    task_id: str | None = None
+    user_id: str | None = None
+    misfire_grace_s: int | None = None
+
+
+class SqlAlchemyJobStore:
+    """CRUD and windowed reads over ``haunt_scheduled_jobs``."""
+
+    def __init__(self, sessionmaker: async_sessionmaker[AsyncSession]) -> None:
+        self._sessionmaker = sessionmaker
+
+    async def upsert(self, spec: JobSpec) -> None:
+        async with self._sessionmaker() as session:
+            row = await session.get(ScheduledJobRecord, spec.job_id)
+            if row is None:
+                row = ScheduledJobRecord(job_id=spec.job_id)
+                session.add(row)
+            row.kind = spec.kind
+            row.scope = spec.scope
+            row.task_id = spec.task_id
+            row.user_id = spec.user_id
+            row.run_at = _to_db(spec.run_at)
+            row.misfire_grace_s = spec.misfire_grace_s
+            row.payload = json.dumps(spec.payload, separators=(",", ":"), default=str)
+            row.updated_at = datetime.utcnow()
+            await session.commit()
+
+    async def get(self, job_id: str) -> JobSpec | None:
+        async with self._sessionmaker() as session:
+            row = await session.get(ScheduledJobRecord, job_id)
+            return _to_spec(row) if row else None
+
+    async def delete(self, job_ids: Iterable[str]) -> int:
+        ids = list(dict.fromkeys(job_ids))
+        if not ids:
+            return 0
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                delete(ScheduledJobRecord).where(ScheduledJobRecord.job_id.in_(ids))
+            )
+            await session.commit()
+            return int(result.rowcount or 0)
+
+    async def delete_if_unchanged(self, job_id: str, run_at: datetime) -> bool:
+        """Delete ``job_id`` only if it still runs at ``run_at``."""
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                delete(ScheduledJobRecord).where(
+                    ScheduledJobRecord.job_id == job_id,
+                    ScheduledJobRecord.run_at == _to_db(run_at),
+                )
+            )
+            await session.commit()
+            return bool(result.rowcount)
+
+    async def due_before(
+        self,
+        until: datetime,
+        *,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[JobSpec]:
+        """Return up to ``limit`` jobs with ``run_at < until`` in run order.
+
+        Args:
+            until: Exclusive upper bound.
+            limit: Page size.
+            after: Keyset cursor ``(run_at, job_id)`` of the previous page.
+        """
+        query = select(ScheduledJobRecord).where(
+            ScheduledJobRecord.run_at < _to_db(until)
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(ScheduledJobRecord.run_at, ScheduledJobRecord.job_id)
+                > (_to_db(after[0]), after[1])
+            )
+        query = query.order_by(
+            ScheduledJobRecord.run_at, ScheduledJobRecord.job_id
+        ).limit(limit)
+        async with self._sessionmaker() as session:
+            result = await session.execute(query)
+            return [_to_spec(row) for row in result.scalars().all()]
+
+    async def find(
+        self,
+        *,
+        kind: str | None = None,
+        scope: str | None = None,
+        task_id: str | None = None,
+        job_id_prefix: str | None = None,
+    ) -> list[JobSpec]:
+        """Return jobs matching every given filter (at least one required)."""
+        filters = []
+        if kind is not None:
+            filters.append(ScheduledJobRecord.kind == kind)
+        if scope is not None:
+            filters.append(ScheduledJobRecord.scope == scope)
+        if task_id is not None:
+            filters.append(ScheduledJobRecord.task_id == task_id)
+        if job_id_prefix is not None:
+            filters.append(ScheduledJobRecord.job_id.startswith(job_id_prefix))
+        if not filters:
+            raise ValueError("find() requires at least one filter")
+        async with self._sessionmaker() as session:
+            result = await session.execute(select(ScheduledJobRecord).where(*filters))
+            return [_to_spec(row) for row in result.scalars().all()]
+
+    async def find_any(
+        self,
+        *,
+        kind: str,
+        scopes: Iterable[str] = (),
+        task_ids: Iterable[str] = (),
+        user_ids: Iterable[str] = (),
+    ) -> list[JobSpec]:
+        """Return ``kind`` jobs matching any of the given keys, in one query."""
+        clauses = []
+        for column, values in (
+            (ScheduledJobRecord.scope, scopes),
+            (ScheduledJobRecord.task_id, task_ids),
+            (ScheduledJobRecord.user_id, user_ids),
+        ):
+            values = list(dict.fromkeys(v for v in values if v))
+            if values:
+                clauses.append(column.in_(values))
+        if not clauses:
+            return []
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                select(ScheduledJobRecord).where(
+                    ScheduledJobRecord.kind == kind, or_(*clauses)
+                )
+            )
+            return [_to_spec(row) for row in result.scalars().all()]
+
+    async def by_kind(
+        self, kind: str, *, limit: int, after: str | None = None
+    ) -> list[JobSpec]:
+        """Return up to ``limit`` ``kind`` jobs in ``job_id`` order.
+
+        Args:
+            kind: Job kind.
+            limit: Page size.
+            after: Keyset cursor (last ``job_id`` of the previous page).
+        """
+        query = select(ScheduledJobRecord).where(ScheduledJobRecord.kind == kind)
+        if after is not None:
+            query = query.where(ScheduledJobRecord.job_id > after)
+        query = query.order_by(ScheduledJobRecord.job_id).limit(limit)
+        async with self._sessionmaker() as session:
+            result = await session.execute(query)
+            return [_to_spec(row) for row in result.scalars().all()]
+
+    async def scopes_with_jobs(self, *, kind: str, after: datetime) -> set[str]:
+        """Return the scopes that have a ``kind`` job due after ``after``."""
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                select(ScheduledJobRecord.scope)
+                .where(
+                    ScheduledJobRecord.kind == kind,
+                    ScheduledJobRecord.run_at > _to_db(after),
+                    ScheduledJobRecord.scope.is_not(None),
+                )
+                .distinct()
+            )
+            return {scope for scope in result.scalars().all() if scope}
+
+
+class DurableJobScheduler:
+    """Persists job specs and arms timers for the near-term ones."""
+
+    def __init__(
+        self,
+        scheduler: AsyncIOScheduler,
+        store: SqlAlchemyJobStore,
+        *,
+        window: timedelta = timedelta(hours=1),
+        batch_size: int = 500,
+        now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        timer_clock: Callable[[], float] | None = None,
+    ) -> None:
+        self._scheduler = scheduler
+        self._store = store
+        self._window = window
+        self._batch_size = max(1, int(batch_size))
+        self._now = now
+        self._handlers: dict[str, JobHandler] = {}
+        # Jobs with an armed timer, by job id.
+        self._materialized: dict[str, JobSpec] = {}
+        # Jobs whose handler is running or whose row is not yet deleted, by
+        # job id -> run_at, so a window load in between does not re-arm them.
+        self._in_flight: dict[str, datetime] = {}
+        self._timers = TimerQueue(
+            self._run_due, max_batch=self._batch_size, clock=timer_clock
+        )
+        # Everything due before this instant has been materialized.
+        self._horizon: datetime | None = None
+
+    @property
+    def store(self) -> SqlAlchemyJobStore:
+        return self._store
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        """Route due jobs of ``kind`` to ``handler``."""
+        self._handlers[kind] = handler
+
+    async def start(self) -> int:
+        """Load the first window and schedule the periodic window loader.
+
+        Returns:
+            Number of jobs materialized from the store.
+        """
+        loaded = await self.load_window()
+        self._scheduler.add_job(
+            self.load_window,
+            trigger="interval",
+            seconds=max(1.0, self._window.total_seconds() / 2),
+            id="durable_jobs:load_window",
+            replace_existing=True,
+        )
+        return loaded
+
+    async def load_window(self) -> int:
+        """Materialize stored jobs due before ``now + window``."""
+        now = _aware(self._now())
+        until = now + self._window
+        loaded = expired = 0
+        cursor: tuple[datetime, str] | None = None
+        while True:
+            page = await self._store.due_before(
+                until, limit=self._batch_size, after=cursor
+            )
+            stale: list[str] = []
+            for spec in page:
+                if spec.job_id in self._materialized:
+                    continue
+                if self._in_flight.get(spec.job_id) == spec.run_at:
+                    continue
+                if _misfired(spec, now):
+                    stale.append(spec.job_id)
+                    continue
+                self._materialize(spec, now=now)
+                loaded += 1
+            if stale:
+                expired += await self._store.delete(stale)
+            if len(page) < self._batch_size:
+                break
+            cursor = (page[-1].run_at, page[-1].job_id)
+        self._horizon = until
+        if loaded or expired:
+            logger.info(
+                "Durable jobs loaded=%d expired=%d window_end=%s",
+                loaded,
+                expired,
+                until.isoformat(),
+            )
+        return loaded
+
+    async def schedule(self, spec: JobSpec) -> None:
+        """Persist ``spec`` (replacing any job with the same id)."""
+        spec = _normalized(spec)
+        await self._store.upsert(spec)
+        if self._horizon is not None and spec.run_at < self._horizon:
+            self._materialize(spec, now=_aware(self._now()))
+        else:
+            self._unmaterialize(spec.job_id)
+
+    async def cancel(self, job_ids: Iterable[str]) -> int:
+        """Delete jobs by id; returns how many stored rows were removed."""
+        ids = list(job_ids)
+        for job_id in ids:
+            self._unmaterialize(job_id)
+        return await self._store.delete(ids)
+
+    async def get(self, job_id: str) -> JobSpec | None:
+        return self._materialized.get(job_id) or await self._store.get(job_id)
+
+    async def find(self, **filters: Any) -> list[JobSpec]:
+        return await self._store.find(**filters)
+
+    async def find_any(self, **keys: Any) -> list[JobSpec]:
+        return await self._store.find_any(**keys)
+
+    async def find_pages(self, *, kind: str) -> AsyncIterator[list[JobSpec]]:
+        """Yield every stored ``kind`` job in keyset pages of ``batch_size``."""
+        cursor: str | None = None
+        while True:
+            page = await self._store.by_kind(
+                kind, limit=self._batch_size, after=cursor
+            )
+            if page:
+                yield page
+            if len(page) < self._batch_size:
+                return
+            cursor = page[-1].job_id
+
+    async def scopes_with_jobs(self, *, kind: str) -> set[str]:
+        """Scopes with a pending ``kind`` job (used to skip startup reconciles)."""
+        return await self._store.scopes_with_jobs(kind=kind, after=_aware(self._now()))
+
+    def is_armed(self, job_id: str) -> bool:
+        """Whether ``job_id`` currently has a timer (is within the window)."""
+        return job_id in self._timers
+
+    async def fire_due(self) -> int:
+        """Run armed jobs that are due now (for a manual ``timer_clock``)."""
+        return await self._timers.fire_due()
+
+    async def close(self) -> None:
+        """Stop firing timers; stored jobs are restored by the next ``start``."""
+        await self._timers.close()
+
+    def _materialize(self, spec: JobSpec, *, now: datetime) -> None:
+        self._materialized[spec.job_id] = spec
+        self._timers.schedule(spec.job_id, (spec.run_at - now).total_seconds())
+
+    def _unmaterialize(self, job_id: str) -> None:
+        if self._materialized.pop(job_id, None) is not None:
+            self._timers.cancel(job_id)
+
+    async def _run_due(self, job_ids: list[str]) -> None:
+        await asyncio.gather(*(self._run(job_id) for job_id in job_ids))
+
+    async def _run(self, job_id: str) -> None:
+        spec = self._materialized.pop(job_id, None)
+        if spec is None:
+            return
+        self._in_flight[job_id] = spec.run_at
+        try:
+            handler = self._handlers.get(spec.kind)
+            if handler is None:
+                logger.warning(
+                    "No handler for durable job kind=%s id=%s", spec.kind, job_id
+                )
+            else:
+                try:
+                    await handler(spec)
+                except Exception:
+                    logger.exception("Durable job %s (%s) failed", job_id, spec.kind)
+            await self._store.delete_if_unchanged(job_id, spec.run_at)
+        finally:
+            if self._in_flight.get(job_id) == spec.run_at:
+                del self._in_flight[job_id]
+
+
+def _aware(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC (the haunting services use ``utcnow``)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _to_db(value: datetime) -> datetime:
+    return _aware(value).replace(tzinfo=None)
+
+
+def _normalized(spec: JobSpec) -> JobSpec:
+    return JobSpec(
+        job_id=spec.job_id,
+        kind=spec.kind,
+        run_at=_aware(spec.run_at),
+        payload=dict(spec.payload),
+        scope=spec.scope,
+        task_id=spec.task_id,
+        user_id=spec.user_id,
+        misfire_grace_s=spec.misfire_grace_s,
+    )
+
+
+def _misfired(spec: JobSpec, now: datetime) -> bool:
+    if spec.misfire_grace_s is None:
+        return False
+    return now - spec.run_at > timedelta(seconds=spec.misfire_grace_s)
+
+
+def _to_spec(row: ScheduledJobRecord) -> JobSpec:
+    return JobSpec(
+        job_id=row.job_id,
+        kind=row.kind,
+        run_at=_aware(row.run_at),
+        payload=json.loads(row.payload or "{}"),
+        scope=row.scope,
+        task_id=row.task_id,
+        user_id=row.user_id,
+        misfire_grace_s=row.misfire_grace_s,
+    )
+
+
+async def ensure_job_store_schema(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: ScheduledJobRecord.__table__.create(
+                sync_conn, checkfirst=True
+            )
+        )
+
+
+__all__ = [
+    "DurableJobScheduler",
+    "JobHandler",
+    "JobSpec",
+    "ScheduledJobRecord",
+    "SqlAlchemyJobStore",
+    "ensure_job_store_schema",
+]
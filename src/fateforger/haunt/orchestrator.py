@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import logging
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Awaitable, Callable, Dict, Optional, Tuple
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from .models import CalendarHook, FollowUpPlan, HauntDirection, HauntEnvelope, HauntTicket
+from .timer_queue import TimerQueue
+
+logger = logging.getLogger(__name__)
 
 HauntCallback = Callable[[HauntTicket], Awaitable[None]]
 
@@ -22,6 +26,7 @@ class HauntOrchestrator:
         self._tickets: Dict[str, HauntTicket] = {}
         self._session_index: Dict[tuple[str, str], set[str]] = {}
         self._lock = asyncio.Lock()
+        self._timers = TimerQueue(self._dispatch_due)
 
     def register_agent(
         self,
@@ -90,7 +95,7 @@ class HauntOrchestrator:
             await self._ack_session(session_id, agent_id)
 
     async def _store_ticket(self, ticket: HauntTicket, *, replace: bool = False) -> None:
-        """Persist ticket in memory and ensure APScheduler knows about it."""
+        """Keep the ticket in memory and arm its timer."""
 
         existing = self._tickets.get(ticket.ticket_id)
         if existing and not replace:
@@ -103,17 +108,23 @@ class HauntOrchestrator:
         self._tickets[ticket.ticket_id] = ticket
         self._session_index.setdefault(key, set()).add(ticket.ticket_id)
 
-        self._scheduler.add_job(
-            self._dispatch_ticket,
-            trigger="date",
-            run_date=ticket.run_at,
-            id=ticket.ticket_id,
-            kwargs={"ticket_id": ticket.ticket_id},
-            replace_existing=True,
+        self._timers.schedule(ticket.ticket_id, _seconds_until(ticket.run_at))
+
+    async def close(self) -> None:
+        """Stop firing timers."""
+        await self._timers.close()
+
+    async def _dispatch_due(self, ticket_ids: list[str]) -> None:
+        results = await asyncio.gather(
+            *(self._dispatch_ticket(ticket_id) for ticket_id in ticket_ids),
+            return_exceptions=True,
         )
+        for ticket_id, result in zip(ticket_ids, results):
+            if isinstance(result, Exception):
+                logger.error("Haunt ticket %s failed", ticket_id, exc_info=result)
 
     async def _dispatch_ticket(self, ticket_id: str) -> None:
-        """APScheduler callback – forwards the ticket to the owning agent."""
+        """Timer callback – forwards the ticket to the owning agent."""
 
         async with self._lock:
             ticket = self._tickets.get(ticket_id)
@@ -149,10 +160,7 @@ class HauntOrchestrator:
             if not ids:
                 self._session_index.pop(key, None)
 
-        try:
-            self._scheduler.remove_job(ticket.ticket_id)
-        except Exception:
-            pass
+        self._timers.cancel(ticket.ticket_id)
 
     async def _ack_session(self, session_id: str, agent_id: str) -> None:
         key = (session_id, agent_id)
@@ -189,3 +197,11 @@ class HauntOrchestrator:
         base = f"haunt::{agent_id}"
         tail = suffix or uuid.uuid4().hex
         return f"{base}::{tail}"
+
+
+def _seconds_until(run_at: datetime) -> float:
+    if run_at.tzinfo is None:
+        now = datetime.utcnow()
+    else:
+        now = datetime.now(timezone.utc)
+    return (run_at - now).total_seconds()
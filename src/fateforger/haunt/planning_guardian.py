@@ -1,17 +1,40 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Callable
+from typing import Any, Callable
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
-from .planning_store import SqlAlchemyPlanningAnchorStore
-from .reconcile import PlanningReconciler
+from fateforger.core.logging_config import (
+    observe_planning_reconcile_user,
+    set_planning_reconcile_pending,
+)
+
+from .planning_store import PlanningAnchorPayload, SqlAlchemyPlanningAnchorStore
+from .reconcile import PLANNING_REMINDER_JOB_KIND, PlanningReconciler
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PlanningReconcileReport:
+    """Outcome of one ``reconcile_all`` pass."""
+
+    users: int = 0
+    skipped: int = 0
+    failed: list[str] = field(default_factory=list)
+    durations_s: dict[str, float] = field(default_factory=dict)
+    total_s: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return self.users - len(self.failed)
+
+
 class PlanningGuardian:
     """Runs the missing-planning reconciliation over all configured users."""
 
@@ -22,11 +45,13 @@ class PlanningGuardian:
         anchor_store: SqlAlchemyPlanningAnchorStore,
         reconciler: PlanningReconciler,
         now: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+        max_concurrency: int = 8,
     ) -> None:
         self._scheduler = scheduler
         self._anchor_store = anchor_store
         self._reconciler = reconciler
         self._now = now
+        self._max_concurrency = max(1, int(max_concurrency))
 
     def schedule_daily(self, *, hour_utc: int = 6, minute_utc: int = 0) -> None:
         self._scheduler.add_job(
@@ -38,22 +63,95 @@ class PlanningGuardian:
             replace_existing=True,
         )
 
-    async def reconcile_all(self) -> None:
+    async def reconcile_all(
+        self, *, skip_scheduled: bool = False
+    ) -> PlanningReconcileReport:
+        """Reconcile every anchored user with bounded concurrency.
+
+        Stored planning refs for all users are prefetched in one query; the
+        per-user calendar lookups then fan out, at most ``max_concurrency``
+        at a time.  One user's failure never aborts the others.
+
+        Args:
+            skip_scheduled: Skip users that already have durable nudges
+                pending (used at startup, where restored jobs are current).
+        """
+        report = PlanningReconcileReport()
         anchors = await self._anchor_store.list_all()
+        job_scheduler = getattr(self._reconciler, "job_scheduler", None)
+        if anchors and skip_scheduled and job_scheduler is not None:
+            scheduled = await job_scheduler.scopes_with_jobs(
+                kind=PLANNING_REMINDER_JOB_KIND
+            )
+            report.skipped = sum(1 for a in anchors if a.user_id in scheduled)
+            anchors = [a for a in anchors if a.user_id not in scheduled]
         if not anchors:
-            return
+            return report
+        started = time.monotonic()
         now = self._now()
-        for anchor in anchors:
-            try:
-                await self._reconciler.reconcile_missing_planning(
-                    scope=anchor.user_id,
-                    user_id=anchor.user_id,
-                    channel_id=anchor.channel_id,
-                    planning_event_id=anchor.event_id,
-                    now=now,
-                )
-            except Exception:
-                logger.exception("Planning reconcile failed for %s", anchor.user_id)
+        report.users = len(anchors)
+        prefetch = getattr(self._reconciler, "prefetch_stored_sessions", None)
+        stored = (
+            await prefetch(user_ids=[a.user_id for a in anchors], now=now)
+            if callable(prefetch)
+            else None
+        )
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        pending = len(anchors)
+        set_planning_reconcile_pending(pending)
+
+        async def _one(anchor: PlanningAnchorPayload) -> None:
+            nonlocal pending
+            async with semaphore:
+                user_started = time.monotonic()
+                outcome = "ok"
+                try:
+                    await self._reconcile_anchor(anchor, now=now, stored=stored)
+                except Exception:
+                    outcome = "error"
+                    report.failed.append(anchor.user_id)
+                    logger.exception("Planning reconcile failed for %s", anchor.user_id)
+                finally:
+                    elapsed = time.monotonic() - user_started
+                    report.durations_s[anchor.user_id] = elapsed
+                    observe_planning_reconcile_user(outcome=outcome, duration_s=elapsed)
+                    pending -= 1
+                    set_planning_reconcile_pending(pending)
+
+        try:
+            await asyncio.gather(*(_one(anchor) for anchor in anchors))
+        finally:
+            set_planning_reconcile_pending(0)
+        report.total_s = time.monotonic() - started
+        slowest = sorted(report.durations_s.items(), key=lambda kv: kv[1])[-3:]
+        logger.info(
+            "Planning reconcile finished users=%d skipped=%d failed=%d total_s=%.2f slowest=%s",
+            report.users,
+            report.skipped,
+            len(report.failed),
+            report.total_s,
+            ", ".join(f"{user}={secs:.2f}s" for user, secs in reversed(slowest)),
+        )
+        return report
+
+    async def _reconcile_anchor(
+        self,
+        anchor: PlanningAnchorPayload,
+        *,
+        now: datetime,
+        stored: dict[str, list[Any]] | None,
+    ) -> None:
+        kwargs: dict[str, Any] = {}
+        if stored is not None:
+            kwargs["stored_sessions"] = stored.get(anchor.user_id, [])
+        await self._reconciler.reconcile_missing_planning(
+            scope=anchor.user_id,
+            user_id=anchor.user_id,
+            channel_id=anchor.channel_id,
+            planning_event_id=anchor.event_id,
+            now=now,
+            **kwargs,
+        )
 
     async def reconcile_user(self, *, user_id: str) -> None:
         anchor = await self._anchor_store.get(user_id=user_id)
@@ -96,4 +194,4 @@ class PlanningGuardian:
         )
 
 
-__all__ = ["PlanningGuardian"]
+__all__ = ["PlanningGuardian", "PlanningReconcileReport"]
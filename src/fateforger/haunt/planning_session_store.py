@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import date, datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
 
 from sqlalchemy import (
     Date,
@@ -171,6 +171,42 @@ class SqlAlchemyPlanningSessionStore:
             )
             return [_to_payload(row) for row in result.scalars().all()]
 
+    async def list_for_users_between(
+        self,
+        *,
+        user_ids: Iterable[str],
+        start_date: date,
+        end_date: date,
+        statuses: tuple[PlanningSessionStatus | str, ...] = (
+            PlanningSessionStatus.PLANNED,
+            PlanningSessionStatus.IN_PROGRESS,
+        ),
+    ) -> dict[str, list[PlanningSessionRefPayload]]:
+        """Batch form of ``list_for_user_between``: one query for many users.
+
+        Returns:
+            Refs grouped by user id; every requested user has an entry.
+        """
+        wanted = sorted({user_id for user_id in user_ids if user_id})
+        grouped: dict[str, list[PlanningSessionRefPayload]] = {
+            user_id: [] for user_id in wanted
+        }
+        if not wanted:
+            return grouped
+        allowed = tuple(_status_value(status) for status in statuses)
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                select(PlanningSessionRef).where(
+                    PlanningSessionRef.user_id.in_(wanted),
+                    PlanningSessionRef.planned_date >= start_date,
+                    PlanningSessionRef.planned_date <= end_date,
+                    PlanningSessionRef.status.in_(allowed),
+                )
+            )
+            for row in result.scalars().all():
+                grouped[row.user_id].append(_to_payload(row))
+        return grouped
+
     async def get_by_event_id(
         self, *, calendar_id: str, event_id: str
     ) -> Optional[PlanningSessionRefPayload]:
@@ -2,19 +2,22 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from datetime import date, datetime, time, timedelta, timezone
 from typing import Any, Awaitable, Callable, Iterable, Protocol
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from dateutil import parser as date_parser
 
+from fateforger.adapters.calendar.read_cache import calendar_read_cache
+from fateforger.haunt.job_store import DurableJobScheduler, JobSpec
+from fateforger.tools.mcp_pool import mcp_workbench_pool
+
 logger = logging.getLogger(__name__)
 
 try:
-    from autogen_ext.tools.mcp import McpWorkbench, StreamableHttpServerParams
+    from autogen_ext.tools.mcp import StreamableHttpServerParams
 except Exception:  # pragma: no cover - optional dependency
-    McpWorkbench = None
     StreamableHttpServerParams = None
 
 
@@ -43,6 +46,10 @@ class PlanningSessionStore(Protocol):
     async def upsert(self, **kwargs: Any) -> Any: ...
 
 
+# Marks "no prefetched refs supplied" (distinct from an empty prefetch).
+_NOT_PREFETCHED: Any = object()
+
+
 @dataclass(frozen=True)
 class PlanningRuleConfig:
     horizon: timedelta = timedelta(hours=24)
@@ -61,6 +68,9 @@ class PlanningRuleConfig:
     calendar_id: str = "primary"
 
 
+PLANNING_REMINDER_JOB_KIND = "planning.reminder"
+
+
 @dataclass(frozen=True)
 class JobKey:
     namespace: str
@@ -96,10 +106,10 @@ class DesiredJob:
 
 class McpCalendarClient:
     def __init__(self, *, server_url: str, timeout: float = 10.0) -> None:
-        if McpWorkbench is None or StreamableHttpServerParams is None:
+        if StreamableHttpServerParams is None:
             raise RuntimeError("autogen_ext tools are required for MCP calendar access")
         params = StreamableHttpServerParams(url=server_url, timeout=timeout)
-        self._workbench = McpWorkbench(params)
+        self._workbench = mcp_workbench_pool().workbench(params)
 
     async def get_event(self, *, calendar_id: str, event_id: str) -> dict | None:
         args = {"calendarId": calendar_id, "eventId": event_id}
@@ -119,6 +129,32 @@ class McpCalendarClient:
         time_min: str,
         time_max: str,
     ) -> list[dict]:
+        """List events via the shared calendar read cache.
+
+        Naive or unparseable bounds bypass the cache.
+        """
+
+        async def _fetch() -> list[dict] | None:
+            return await self._fetch_events(
+                calendar_id=calendar_id, time_min=time_min, time_max=time_max
+            )
+
+        start = _parse_aware_bound(time_min)
+        end = _parse_aware_bound(time_max)
+        if start is None or end is None or end < start:
+            return await _fetch() or []
+        events = await calendar_read_cache().list_events(
+            calendar_id=calendar_id, start=start, end=end, fetch=_fetch
+        )
+        return events or []
+
+    async def _fetch_events(
+        self,
+        *,
+        calendar_id: str,
+        time_min: str,
+        time_max: str,
+    ) -> list[dict] | None:
         args = {
             "calendarId": calendar_id,
             "timeMin": time_min,
@@ -133,7 +169,7 @@ class McpCalendarClient:
                 "calendar-mcp list-events returned tool error payload: %s",
                 payload.strip(),
             )
-            return []
+            return None
         return _normalize_events(payload)
 
     async def close(self) -> None:
@@ -163,6 +199,7 @@ class PlanningSessionRule:
         channel_id: str | None = None,
         planning_event_id: str | None = None,
         first_nudge_offset: timedelta | None = None,
+        stored_sessions: list[Any] | None = _NOT_PREFETCHED,
     ) -> list[DesiredJob]:
         start = now.astimezone(timezone.utc)
         end = start + self._config.horizon
@@ -199,7 +236,7 @@ class PlanningSessionRule:
                 return []
 
         stored = await self._resolve_planning_from_stored_sessions(
-            user_id=user_id, start=start, end=end
+            user_id=user_id, start=start, end=end, prefetched=stored_sessions
         )
         stored_hit = stored is not None
         if stored:
@@ -379,24 +416,57 @@ class PlanningSessionRule:
 
         return offsets
 
-    async def _resolve_planning_from_stored_sessions(
-        self, *, user_id: str | None, start: datetime, end: datetime
-    ) -> dict | None:
-        if not user_id or not self._planning_session_store:
+    async def prefetch_stored_sessions(
+        self, *, user_ids: Iterable[str], now: datetime
+    ) -> dict[str, list[Any]] | None:
+        """Load every user's stored planning refs for this horizon in one query.
+
+        Returns:
+            Refs by user id, or ``None`` when the store cannot batch (callers
+            then fall back to per-user lookups inside ``evaluate``).
+        """
+        batch = getattr(self._planning_session_store, "list_for_users_between", None)
+        if not callable(batch):
             return None
+        start = now.astimezone(timezone.utc)
+        end = start + self._config.horizon
         try:
-            statuses = ("planned", "in_progress")
-            stored = await self._planning_session_store.list_for_user_between(
-                user_id=user_id,
+            return await batch(
+                user_ids=list(user_ids),
                 start_date=start.date(),
                 end_date=end.date(),
-                statuses=statuses,
+                statuses=("planned", "in_progress"),
             )
         except Exception:
-            logger.exception(
-                "Stored planning session lookup failed for user=%s", user_id
-            )
+            logger.exception("Batched planning session prefetch failed")
+            return None
+
+    async def _resolve_planning_from_stored_sessions(
+        self,
+        *,
+        user_id: str | None,
+        start: datetime,
+        end: datetime,
+        prefetched: list[Any] | None = _NOT_PREFETCHED,
+    ) -> dict | None:
+        if not user_id or not self._planning_session_store:
             return None
+        if prefetched is not _NOT_PREFETCHED:
+            stored = list(prefetched or [])
+        else:
+            try:
+                statuses = ("planned", "in_progress")
+                stored = await self._planning_session_store.list_for_user_between(
+                    user_id=user_id,
+                    start_date=start.date(),
+                    end_date=end.date(),
+                    statuses=statuses,
+                )
+            except Exception:
+                logger.exception(
+                    "Stored planning session lookup failed for user=%s", user_id
+                )
+                return None
 
         seen: set[tuple[str, str]] = set()
         for session in stored:
@@ -590,8 +660,12 @@ class PlanningReconciler:
         planning_session_store: PlanningSessionStore | None = None,
         dispatcher: Callable[[PlanningReminder], Awaitable[None]] | None = None,
         rule: PlanningSessionRule | None = None,
+        job_scheduler: DurableJobScheduler | None = None,
     ) -> None:
         self._scheduler = scheduler
+        self._job_scheduler = job_scheduler
+        if job_scheduler is not None:
+            job_scheduler.register(PLANNING_REMINDER_JOB_KIND, self._run_durable_reminder)
         self._calendar_client = calendar_client
         self._dispatcher = dispatcher or self._log_dispatch
         self._rule = rule or PlanningSessionRule(
@@ -603,6 +677,16 @@ class PlanningReconciler:
     def calendar_client(self) -> CalendarClient:
         return self._calendar_client
 
+    @property
+    def job_scheduler(self) -> DurableJobScheduler | None:
+        return self._job_scheduler
+
+    async def prefetch_stored_sessions(
+        self, *, user_ids: Iterable[str], now: datetime
+    ) -> dict[str, list[Any]] | None:
+        """Batch-load stored planning refs for ``reconcile_missing_planning``."""
+        return await self._rule.prefetch_stored_sessions(user_ids=user_ids, now=now)
+
     def set_dispatcher(
         self, dispatcher: Callable[[PlanningReminder], Awaitable[None]]
     ) -> None:
@@ -625,6 +709,7 @@ class PlanningReconciler:
         planning_event_id: str | None = None,
         first_nudge_offset: timedelta | None = None,
         now: datetime | None = None,
+        stored_sessions: list[Any] | None = _NOT_PREFETCHED,
     ) -> list[DesiredJob]:
         now_dt = now or datetime.now(timezone.utc)
         desired = await self._rule.evaluate(
@@ -634,8 +719,12 @@ class PlanningReconciler:
             channel_id=channel_id,
             planning_event_id=planning_event_id,
             first_nudge_offset=first_nudge_offset,
+            stored_sessions=stored_sessions,
         )
         prefix = f"rule:{self._rule.rule_id}:{scope}:"
+        if self._job_scheduler is not None:
+            await self._sync_durable_jobs(scope=scope, prefix=prefix, desired=desired)
+            return desired
         current_ids = {
             job.id for job in self._scheduler.get_jobs() if job.id.startswith(prefix)
         }
@@ -659,6 +748,31 @@ class PlanningReconciler:
 
         return desired
 
+    async def _sync_durable_jobs(
+        self, *, scope: str, prefix: str, desired: list[DesiredJob]
+    ) -> None:
+        current = await self._job_scheduler.find(
+            kind=PLANNING_REMINDER_JOB_KIND, scope=scope, job_id_prefix=prefix
+        )
+        desired_ids = {job.key.as_id() for job in desired}
+        await self._job_scheduler.cancel(
+            spec.job_id for spec in current if spec.job_id not in desired_ids
+        )
+        for job in desired:
+            await self._job_scheduler.schedule(
+                JobSpec(
+                    job_id=job.key.as_id(),
+                    kind=PLANNING_REMINDER_JOB_KIND,
+                    run_at=job.run_at,
+                    payload=asdict(job.payload),
+                    scope=scope,
+                    misfire_grace_s=job.misfire_grace_time_s,
+                )
+            )
+
+    async def _run_durable_reminder(self, spec: JobSpec) -> None:
+        await self._emit_reminder(PlanningReminder(**spec.payload))
+
     async def _emit_reminder(self, reminder: PlanningReminder) -> None:
         logger.info(
             "Emitting planning reminder for %s (kind=%s, attempt=%d) via %s",
@@ -766,6 +880,15 @@ def _parse_event_dt(raw: Any, *, tz: timezone) -> datetime | None:
     return None
 
 
+def _parse_aware_bound(value: str) -> datetime | None:
+    """Parse a ``timeMin``/``timeMax`` string; ``None`` unless timezone-aware."""
+    try:
+        parsed = date_parser.isoparse(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return parsed if parsed.tzinfo is not None else None
+
+
 def _format_mcp_datetime(dt: datetime) -> str:
     """Return MCP-compatible datetime strings without fractional seconds."""
     return dt.replace(microsecond=0).isoformat()
@@ -791,6 +914,7 @@ __all__ = [
     "DesiredJob",
     "JobKey",
     "McpCalendarClient",
+    "PLANNING_REMINDER_JOB_KIND",
     "PlanningReconciler",
     "PlanningReminder",
     "PlanningRuleConfig",
@@ -2,18 +2,27 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Awaitable, Callable, Optional, Protocol
+from typing import Awaitable, Callable, Optional, Protocol, TypeVar
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from autogen_core import TopicId
 
+from fateforger.core.logging_config import record_haunt_followups_cancelled
+
+from .job_store import DurableJobScheduler, JobSpec
 from .messages import FollowUpDue, FollowUpSpec
 from .settings_store import AdmonishmentSettingsPatch, AdmonishmentSettingsPayload
+from .timer_queue import TimerQueue
 
 logger = logging.getLogger(__name__)
 
+FOLLOWUP_JOB_KIND = "haunt.followup"
+
+T = TypeVar("T")
+
 
 @dataclass
 class PendingFollowUp:
@@ -28,6 +37,24 @@ class PendingFollowUp:
     created_at: datetime
 
 
+@dataclass(frozen=True)
+class FollowUpCancelReport:
+    """Counts from one bulk cancellation.
+
+    Attributes:
+        matched: Follow-ups found through the given ids / keys.
+        cancelled: Follow-ups removed (in memory or from the durable store).
+        kept: Matched follow-ups left alone because they do not cancel on
+            user replies (activity recording only).
+        stored: Part of ``cancelled`` that existed only in the durable store.
+    """
+
+    matched: int = 0
+    cancelled: int = 0
+    kept: int = 0
+    stored: int = 0
+
+
 class AdmonishmentSettingsStore(Protocol):
     async def get_settings(
         self, *, user_id: str, channel_id: str | None = None
@@ -53,19 +80,39 @@ class HauntingService:
         *,
         now: Callable[[], datetime] = datetime.utcnow,
         settings_store: AdmonishmentSettingsStore | None = None,
+        job_scheduler: DurableJobScheduler | None = None,
     ) -> None:
         self._scheduler = scheduler
+        self._job_scheduler = job_scheduler
+        if job_scheduler is not None:
+            job_scheduler.register(FOLLOWUP_JOB_KIND, self._run_durable_followup)
         self._now = now
         self._settings_store = settings_store
         self._pending: dict[str, PendingFollowUp] = {}
         self._topic_index: dict[str, set[str]] = {}
         self._task_index: dict[str, set[str]] = {}
+        self._user_index: dict[str, set[str]] = {}
+        # Follow-ups stored before this process started, loaded into
+        # ``_pending`` once so cancellation never has to query the store.
+        self._restored_ids: set[str] = set()
+        self._stored_loaded = job_scheduler is None
+        self._stored_load: asyncio.Task[int] | None = None
         self._lock = asyncio.Lock()
+        # Job-store writes are decided under ``_lock`` but awaited after it is
+        # released; each chains behind the previous one so they land in order.
+        self._job_write_tail: asyncio.Task | None = None
+        # Without a durable scheduler, deadlines live in one heap keyed by
+        # message id instead of one APScheduler job per follow-up.
+        self._timers = TimerQueue(self._dispatch_due)
         self._on_due: Callable[[FollowUpDue], Awaitable[None]] | None = None
 
     def set_dispatcher(self, dispatcher: Callable[[FollowUpDue], Awaitable[None]]) -> None:
         self._on_due = dispatcher
 
+    async def close(self) -> None:
+        """Stop firing in-memory follow-up timers."""
+        await self._timers.close()
+
     async def schedule_followup(
         self,
         *,
@@ -102,9 +149,14 @@ class HauntingService:
         async with self._lock:
             existing = self._pending.get(message_id)
             if existing:
-                await self._remove_record(existing)
+                self._drop_record(existing)
             self._store_record(record)
-            self._schedule_job(record, record.created_at + effective_spec.after)
+            write = self._queue_job_write(
+                lambda: self._schedule_job(
+                    record, record.created_at + effective_spec.after
+                )
+            )
+        await write
 
         return record
 
@@ -115,22 +167,31 @@ class HauntingService:
         task_id: str | None,
         user_id: str | None = None,
     ) -> int:
-        topic_key = _topic_key(topic_id)
-        async with self._lock:
-            candidates = set()
-            if topic_key:
-                candidates.update(self._topic_index.get(topic_key, set()))
-            if task_id:
-                candidates.update(self._task_index.get(task_id, set()))
+        """Cancel reply-cancellable follow-ups on ``topic_id`` / ``task_id``.
 
-            cancel_ids = {
-                message_id
-                for message_id in candidates
-                if self._pending.get(message_id)
-                and self._pending[message_id].spec.cancel_on_user_reply
-            }
+        ``user_id`` does not widen the match; pass ``user_ids`` to
+        ``record_user_activity_bulk`` to cancel everything owed to a user.
+        """
+        report = await self.record_user_activity_bulk(
+            topic_ids=[topic_id], task_ids=[task_id]
+        )
+        return report.cancelled
 
-        return await self.cancel_followups(message_ids=cancel_ids)
+    async def record_user_activity_bulk(
+        self,
+        *,
+        topic_ids: Iterable[TopicId | str | None] = (),
+        task_ids: Iterable[str | None] = (),
+        user_ids: Iterable[str | None] = (),
+    ) -> FollowUpCancelReport:
+        """Cancel reply-cancellable follow-ups for many keys in one pass."""
+        return await self._cancel_bulk(
+            message_ids=(),
+            topic_ids=topic_ids,
+            task_ids=task_ids,
+            user_ids=user_ids,
+            reply_only=True,
+        )
 
     async def cancel_followups(
         self,
@@ -140,27 +201,100 @@ class HauntingService:
         task_id: str | None = None,
         message_ids: Optional[set[str]] = None,
     ) -> int:
-        topic_key = _topic_key(topic_id)
-        async with self._lock:
-            ids = set(message_ids or set())
-            if message_id:
-                ids.add(message_id)
-            if topic_key:
-                ids.update(self._topic_index.get(topic_key, set()))
-            if task_id:
-                ids.update(self._task_index.get(task_id, set()))
-
-            records = [self._pending.get(message_id) for message_id in ids]
-            to_remove = [record for record in records if record]
+        report = await self.cancel_followups_bulk(
+            message_ids=[message_id, *(message_ids or ())],
+            topic_ids=[topic_id],
+            task_ids=[task_id],
+        )
+        return report.cancelled
 
-            for record in to_remove:
-                await self._remove_record(record)
+    async def cancel_followups_bulk(
+        self,
+        *,
+        message_ids: Iterable[str | None] = (),
+        topic_ids: Iterable[TopicId | str | None] = (),
+        task_ids: Iterable[str | None] = (),
+        user_ids: Iterable[str | None] = (),
+    ) -> FollowUpCancelReport:
+        """Cancel every follow-up matching any of the given ids / keys."""
+        return await self._cancel_bulk(
+            message_ids=message_ids,
+            topic_ids=topic_ids,
+            task_ids=task_ids,
+            user_ids=user_ids,
+            reply_only=False,
+        )
 
-        return len(to_remove)
+    async def _cancel_bulk(
+        self,
+        *,
+        message_ids: Iterable[str | None],
+        topic_ids: Iterable[TopicId | str | None],
+        task_ids: Iterable[str | None],
+        user_ids: Iterable[str | None],
+        reply_only: bool,
+    ) -> FollowUpCancelReport:
+        """Collect and drop matches in memory under one lock acquisition.
+
+        Stored follow-ups are loaded into ``_pending`` at startup (or on the
+        first call), so matching never queries the store; the store deletes for the dropped
+        follow-ups run after the lock is released.
+        """
+        explicit = {message_id for message_id in message_ids if message_id}
+        topic_keys = {key for key in map(_topic_key, topic_ids) if key}
+        task_keys = {task_id for task_id in task_ids if task_id}
+        user_keys = {user_id for user_id in user_ids if user_id}
+
+        await self.load_stored_followups()
+        async with self._lock:
+            ids = set(explicit)
+            for index, keys in (
+                (self._topic_index, topic_keys),
+                (self._task_index, task_keys),
+                (self._user_index, user_keys),
+            ):
+                for key in keys:
+                    ids.update(index.get(key, ()))
+            in_memory = [self._pending[mid] for mid in ids if mid in self._pending]
+            matched = len(in_memory)
+            if reply_only:
+                in_memory = [r for r in in_memory if r.spec.cancel_on_user_reply]
+            kept = matched - len(in_memory)
+
+            removed_ids = [record.message_id for record in in_memory]
+            restored = len(self._restored_ids.intersection(removed_ids))
+            for record in in_memory:
+                self._drop_record(record)
+            # Explicit ids with no pending follow-up may still have a row
+            # written by another scheduler; delete those by id as well.
+            extra_ids = set() if reply_only else explicit.difference(removed_ids)
+            write = None
+            if removed_ids or extra_ids:
+                write = self._queue_job_write(
+                    lambda: self._unschedule_jobs(removed_ids, extra_ids)
+                )
+
+        extra = await write if write is not None else 0
+        report = FollowUpCancelReport(
+            matched=matched + extra,
+            cancelled=len(in_memory) + extra,
+            kept=kept,
+            stored=restored + extra,
+        )
+        record_haunt_followups_cancelled(
+            source="user_activity" if reply_only else "explicit",
+            count=report.cancelled,
+        )
+        return report
 
     async def get_followup(self, message_id: str) -> Optional[PendingFollowUp]:
         async with self._lock:
-            return self._pending.get(message_id)
+            record = self._pending.get(message_id)
+        if record is None and self._job_scheduler is not None:
+            spec = await self._job_scheduler.get(self._job_id(message_id))
+            if spec is not None and spec.kind == FOLLOWUP_JOB_KIND:
+                record = _record_from_payload(spec.payload)
+        return record
 
     def _store_record(self, record: PendingFollowUp) -> None:
         self._pending[record.message_id] = record
@@ -168,90 +302,228 @@ class HauntingService:
             self._topic_index.setdefault(record.topic_id, set()).add(record.message_id)
         if record.task_id:
             self._task_index.setdefault(record.task_id, set()).add(record.message_id)
+        if record.user_id:
+            self._user_index.setdefault(record.user_id, set()).add(record.message_id)
 
-    async def _remove_record(self, record: PendingFollowUp) -> None:
+    def _drop_record(self, record: PendingFollowUp) -> None:
+        """Remove ``record`` from the pending map and indexes (not the timer)."""
         self._pending.pop(record.message_id, None)
-        if record.topic_id:
-            ids = self._topic_index.get(record.topic_id)
+        self._restored_ids.discard(record.message_id)
+        for index, key in (
+            (self._topic_index, record.topic_id),
+            (self._task_index, record.task_id),
+            (self._user_index, record.user_id),
+        ):
+            ids = index.get(key) if key else None
             if ids and record.message_id in ids:
                 ids.remove(record.message_id)
                 if not ids:
-                    self._topic_index.pop(record.topic_id, None)
-        if record.task_id:
-            ids = self._task_index.get(record.task_id)
-            if ids and record.message_id in ids:
-                ids.remove(record.message_id)
-                if not ids:
-                    self._task_index.pop(record.task_id, None)
-        self._unschedule_job(record.message_id)
-
-    def _schedule_job(self, record: PendingFollowUp, run_at: datetime) -> None:
-        self._scheduler.add_job(
-            self._dispatch_followup,
-            trigger="date",
-            run_date=run_at,
-            id=self._job_id(record.message_id),
-            kwargs={"message_id": record.message_id},
-            replace_existing=True,
+                    index.pop(key, None)
+
+    async def _schedule_job(self, record: PendingFollowUp, run_at: datetime) -> None:
+        if self._job_scheduler is not None:
+            await self._job_scheduler.schedule(
+                JobSpec(
+                    job_id=self._job_id(record.message_id),
+                    kind=FOLLOWUP_JOB_KIND,
+                    run_at=run_at,
+                    payload=_record_to_payload(record),
+                    scope=record.topic_id,
+                    task_id=record.task_id,
+                    user_id=record.user_id,
+                )
+            )
+            return
+        delay = run_at - self._now()
+        self._timers.schedule(record.message_id, delay.total_seconds())
+
+    async def _unschedule_jobs(
+        self, removed_ids: list[str], stored_ids: Iterable[str]
+    ) -> int:
+        """Unschedule dropped in-memory follow-ups and delete store-only rows.
+
+        Returns:
+            How many ``stored_ids`` rows existed (always 0 without a store).
+        """
+        if self._job_scheduler is None:
+            self._timers.cancel_many(removed_ids)
+            return 0
+        stored_ids = list(stored_ids)
+        deleted = await self._job_scheduler.cancel(
+            self._job_id(message_id) for message_id in [*removed_ids, *stored_ids]
         )
+        return min(len(stored_ids), max(0, deleted - len(removed_ids)))
 
-    def _unschedule_job(self, message_id: str) -> None:
-        try:
-            self._scheduler.remove_job(self._job_id(message_id))
-        except Exception:
-            pass
+    def _queue_job_write(self, write: Callable[[], Awaitable[T]]) -> asyncio.Task[T]:
+        """Start ``write`` once earlier queued writes finish (lock held, no I/O).
+
+        The caller awaits the returned task after releasing ``_lock``, so a
+        cancel decided after a reschedule can never reach the store first.
+        """
+        previous = self._job_write_tail
+
+        async def _run() -> T:
+            if previous is not None and not previous.done():
+                await asyncio.wait([previous])
+            return await write()
+
+        task = asyncio.get_running_loop().create_task(_run())
+        self._job_write_tail = task
+        return task
 
     async def _dispatch_followup(self, message_id: str) -> None:
+        await self._dispatch_due([message_id])
+
+    async def _dispatch_due(self, message_ids: list[str]) -> None:
+        """Dispatch a batch of due follow-ups, taking the lock once per phase."""
         async with self._lock:
-            record = self._pending.get(message_id)
-            if not record:
-                return
-            due = FollowUpDue(
-                message_id=record.message_id,
-                topic_id=record.topic_id,
-                task_id=record.task_id,
-                attempt=record.attempt,
-                escalation=record.spec.escalation,
-                user_id=record.user_id,
-            )
+            dues = [
+                FollowUpDue(
+                    message_id=record.message_id,
+                    topic_id=record.topic_id,
+                    task_id=record.task_id,
+                    attempt=record.attempt,
+                    escalation=record.spec.escalation,
+                    user_id=record.user_id,
+                )
+                for record in (self._pending.get(mid) for mid in message_ids)
+                if record
+            ]
+        if not dues:
+            return
 
         if self._on_due is None:
-            logger.warning("No follow-up dispatcher configured; dropping %s", message_id)
+            logger.warning(
+                "No follow-up dispatcher configured; dropping %s",
+                ", ".join(due.message_id for due in dues),
+            )
         else:
-            try:
-                await self._on_due(due)
-            except Exception:
-                logger.exception("Failed to dispatch follow-up for %s", message_id)
-
+            results = await asyncio.gather(
+                *(self._on_due(due) for due in dues), return_exceptions=True
+            )
+            for due, result in zip(dues, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Failed to dispatch follow-up for %s",
+                        due.message_id,
+                        exc_info=result,
+                    )
+
+        rescheduled: list[tuple[PendingFollowUp, datetime]] = []
+        retired: list[str] = []
         async with self._lock:
-            record = self._pending.get(message_id)
-            if not record:
+            for due in dues:
+                advanced = self._advance_followup(due.message_id)
+                if advanced is None:
+                    continue
+                record, run_at = advanced
+                if run_at is None:
+                    retired.append(record.message_id)
+                else:
+                    rescheduled.append((record, run_at))
+            if not rescheduled and not retired:
                 return
+            write = self._queue_job_write(
+                lambda: self._persist_advanced(rescheduled, retired)
+            )
+        await write
+
+    def _advance_followup(
+        self, message_id: str
+    ) -> Optional[tuple[PendingFollowUp, Optional[datetime]]]:
+        """Move a dispatched follow-up to its next attempt (lock held, no I/O).
+
+        Returns:
+            ``None`` if it is no longer pending, ``(record, None)`` if it was
+            retired, else the updated record and its next run time.
+        """
+        record = self._pending.get(message_id)
+        if not record:
+            return None
 
-            next_attempt = record.attempt + 1
-            max_attempts = record.spec.max_attempts or 1
-            if next_attempt >= max_attempts:
-                await self._remove_record(record)
-                return
+        next_attempt = record.attempt + 1
+        max_attempts = record.spec.max_attempts or 1
+        if next_attempt >= max_attempts:
+            self._drop_record(record)
+            return record, None
+
+        updated = PendingFollowUp(
+            message_id=record.message_id,
+            topic_id=record.topic_id,
+            task_id=record.task_id,
+            user_id=record.user_id,
+            channel_id=record.channel_id,
+            content=record.content,
+            spec=record.spec,
+            attempt=next_attempt,
+            created_at=record.created_at,
+        )
+        self._pending[message_id] = updated
+
+        if not record.spec.after:
+            self._drop_record(updated)
+            return record, None
+        delay = _next_delay(record.spec.after, next_attempt)
+        return updated, self._now() + delay
 
-            updated = PendingFollowUp(
-                message_id=record.message_id,
-                topic_id=record.topic_id,
-                task_id=record.task_id,
-                user_id=record.user_id,
-                channel_id=record.channel_id,
-                content=record.content,
-                spec=record.spec,
-                attempt=next_attempt,
-                created_at=record.created_at,
+    async def _persist_advanced(
+        self,
+        rescheduled: list[tuple[PendingFollowUp, datetime]],
+        retired: list[str],
+    ) -> None:
+        """Write one dispatched batch's next attempts and retirements."""
+        if retired:
+            await self._unschedule_jobs(retired, ())
+        for record, run_at in rescheduled:
+            await self._schedule_job(record, run_at)
+
+    async def _run_durable_followup(self, spec: JobSpec) -> None:
+        """Dispatch a stored follow-up, rehydrating it after a restart."""
+        record = _record_from_payload(spec.payload)
+        async with self._lock:
+            if record.message_id not in self._pending:
+                # Once stored rows are loaded every live follow-up is pending;
+                # a missing id was cancelled or retired after its timer popped.
+                if self._stored_loaded:
+                    return
+                self._store_record(record)
+        await self._dispatch_followup(record.message_id)
+
+    async def load_stored_followups(self) -> int:
+        """Load follow-ups stored before this process started (once).
+
+        Call at startup, before the durable scheduler starts firing; the
+        first cancellation otherwise triggers it. Rows are read in keyset
+        pages outside ``_lock`` and merged under it one page at a time;
+        concurrent callers share one load.
+
+        Returns:
+            How many stored follow-ups were restored into memory.
+        """
+        if self._stored_loaded:
+            return 0
+        if self._stored_load is None:
+            self._stored_load = asyncio.get_running_loop().create_task(
+                self._load_stored_pages()
             )
-            self._pending[message_id] = updated
+        return await asyncio.shield(self._stored_load)
 
-            if not record.spec.after:
-                await self._remove_record(record)
-                return
-            delay = _next_delay(record.spec.after, next_attempt)
-            self._schedule_job(updated, self._now() + delay)
+    async def _load_stored_pages(self) -> int:
+        restored = 0
+        try:
+            async for specs in self._job_scheduler.find_pages(kind=FOLLOWUP_JOB_KIND):
+                async with self._lock:
+                    for spec in specs:
+                        record = _record_from_payload(spec.payload)
+                        if record.message_id not in self._pending:
+                            self._store_record(record)
+                            self._restored_ids.add(record.message_id)
+                            restored += 1
+        except BaseException:
+            self._stored_load = None
+            raise
+        self._stored_loaded = True
+        return restored
 
     async def get_settings(
         self, *, user_id: str, channel_id: str | None = None
@@ -332,9 +604,57 @@ def _topic_key(topic_id: TopicId | str | None) -> str | None:
     return str(topic_id)
 
 
+def _record_to_payload(record: PendingFollowUp) -> dict:
+    spec = record.spec
+    return {
+        "message_id": record.message_id,
+        "topic_id": record.topic_id,
+        "task_id": record.task_id,
+        "user_id": record.user_id,
+        "channel_id": record.channel_id,
+        "content": record.content,
+        "attempt": record.attempt,
+        "created_at": record.created_at.isoformat(),
+        "spec": {
+            "should_schedule": spec.should_schedule,
+            "after_s": spec.after.total_seconds() if spec.after else None,
+            "max_attempts": spec.max_attempts,
+            "escalation": spec.escalation,
+            "cancel_on_user_reply": spec.cancel_on_user_reply,
+        },
+    }
+
+
+def _record_from_payload(payload: dict) -> PendingFollowUp:
+    spec = payload.get("spec") or {}
+    after_s = spec.get("after_s")
+    return PendingFollowUp(
+        message_id=payload["message_id"],
+        topic_id=payload.get("topic_id"),
+        task_id=payload.get("task_id"),
+        user_id=payload.get("user_id"),
+        channel_id=payload.get("channel_id"),
+        content=payload.get("content") or "",
+        spec=FollowUpSpec(
+            should_schedule=bool(spec.get("should_schedule", True)),
+            after=timedelta(seconds=after_s) if after_s is not None else None,
+            max_attempts=spec.get("max_attempts"),
+            escalation=spec.get("escalation"),
+            cancel_on_user_reply=spec.get("cancel_on_user_reply"),
+        ),
+        attempt=int(payload.get("attempt") or 0),
+        created_at=datetime.fromisoformat(payload["created_at"]),
+    )
+
+
 def _next_delay(base: timedelta, attempt: int) -> timedelta:
     multiplier = 2 ** max(attempt, 0)
     return base * multiplier
 
 
-__all__ = ["HauntingService", "PendingFollowUp", "AdmonishmentSettingsStore"]
+__all__ = [
+    "AdmonishmentSettingsStore",
+    "FollowUpCancelReport",
+    "HauntingService",
+    "PendingFollowUp",
+]
@@ -0,0 +1,204 @@
+"""Heap-based timer queue for follow-up deadlines.
+
+One ``TimerQueue`` replaces per-item APScheduler ``date`` jobs:
+
+* ``schedule(key, delay_s)`` pushes ``(deadline, seq, key)`` onto a heap and
+  records the live entry per key — O(log n); rescheduling a key simply
+  supersedes its previous entry.
+* ``cancel`` / ``cancel_many`` drop the live entry only — O(1) per key; stale
+  heap entries are skipped when popped and the heap is compacted once they
+  outnumber live entries.
+* A single asyncio task sleeps until the earliest deadline and hands every
+  due key to ``on_due`` in one batch (at most ``max_batch`` per call).  Each
+  batch runs as its own tracked task, so a slow dispatch does not hold back
+  later deadlines.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+DueCallback = Callable[[list[str]], Awaitable[None]]
+
+_COMPACT_MIN_STALE = 1024
+
+
+class TimerQueue:
+    """Deadline heap with O(1) cancellation and batched firing."""
+
+    def __init__(
+        self,
+        on_due: DueCallback,
+        *,
+        max_batch: int = 500,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        """Create an empty queue.
+
+        Args:
+            on_due: Awaited with the keys whose deadline passed.
+            max_batch: Upper bound on keys per ``on_due`` call.
+            clock: Monotonic clock in seconds (defaults to the running loop's).
+        """
+        self._on_due = on_due
+        self._max_batch = max(1, int(max_batch))
+        self._clock = clock
+        self._heap: list[tuple[float, int, str]] = []
+        self._live: dict[str, tuple[float, int]] = {}
+        self._seq = 0
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._live
+
+    def deadline(self, key: str) -> float | None:
+        """Return the pending deadline of ``key`` (clock seconds)."""
+        entry = self._live.get(key)
+        return entry[0] if entry else None
+
+    def schedule(self, key: str, delay_s: float) -> None:
+        """Fire ``key`` after ``delay_s`` seconds, replacing any pending timer."""
+        deadline = self._now() + max(0.0, delay_s)
+        self._seq += 1
+        self._live[key] = (deadline, self._seq)
+        heapq.heappush(self._heap, (deadline, self._seq, key))
+        self._wake(earliest=self._heap[0][2] == key)
+
+    def cancel(self, key: str) -> bool:
+        """Cancel ``key``'s pending timer; returns whether one existed."""
+        if self._live.pop(key, None) is None:
+            return False
+        self._maybe_compact()
+        return True
+
+    def cancel_many(self, keys: Iterable[str]) -> int:
+        """Cancel several timers; returns how many were pending."""
+        live = self._live
+        removed = sum(1 for key in keys if live.pop(key, None) is not None)
+        if removed:
+            self._maybe_compact()
+        return removed
+
+    def pop_due(self, now: float | None = None, *, limit: int | None = None) -> list[str]:
+        """Remove and return keys due at ``now`` in deadline order."""
+        now = self._now() if now is None else now
+        limit = self._max_batch if limit is None else limit
+        heap, live = self._heap, self._live
+        due: list[str] = []
+        while heap and len(due) < limit:
+            deadline, seq, key = heap[0]
+            if live.get(key, (None, None))[1] != seq:
+                heapq.heappop(heap)
+                continue
+            if deadline > now:
+                break
+            heapq.heappop(heap)
+            del live[key]
+            due.append(key)
+        return due
+
+    def next_deadline(self) -> float | None:
+        """Return the earliest live deadline, discarding stale heap heads."""
+        heap, live = self._heap, self._live
+        while heap:
+            _deadline, seq, key = heap[0]
+            if live.get(key, (None, None))[1] == seq:
+                return heap[0][0]
+            heapq.heappop(heap)
+        return None
+
+    async def fire_due(self) -> int:
+        """Fire every key that is due now; returns how many fired.
+
+        The background task does this on its own; with a manual ``clock``
+        the owner calls it instead.
+        """
+        fired = 0
+        while batch := self.pop_due():
+            fired += len(batch)
+            await self._on_due(batch)
+        return fired
+
+    async def close(self) -> None:
+        """Stop the firing task and wait for batches already handed out.
+
+        Pending timers are kept but no longer fire.
+        """
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+    def _now(self) -> float:
+        if self._clock is not None:
+            return self._clock()
+        return asyncio.get_running_loop().time()
+
+    def _wake(self, *, earliest: bool) -> None:
+        if self._clock is not None:
+            return  # Manual clock: the owner drives ``pop_due``.
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(), name="haunt-timer-queue"
+            )
+        elif earliest and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            deadline = self.next_deadline()
+            if deadline is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            delay = deadline - self._now()
+            if delay > 0:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+                continue
+            batch = self.pop_due()
+            if not batch:
+                continue
+            dispatch = asyncio.get_running_loop().create_task(
+                self._dispatch(batch), name="haunt-timer-batch"
+            )
+            self._dispatches.add(dispatch)
+            dispatch.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[str]) -> None:
+        try:
+            await self._on_due(batch)
+        except Exception:
+            logger.exception("Timer batch of %d keys failed", len(batch))
+
+    def _maybe_compact(self) -> None:
+        stale = len(self._heap) - len(self._live)
+        if stale < _COMPACT_MIN_STALE or stale <= len(self._live):
+            return
+        self._heap = [
+            (deadline, seq, key) for key, (deadline, seq) in self._live.items()
+        ]
+        heapq.heapify(self._heap)
+
+
+__all__ = ["DueCallback", "TimerQueue"]
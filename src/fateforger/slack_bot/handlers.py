@@ -86,6 +86,7 @@ from fateforger.slack_bot.timeboxing_submit import (
 )
 
 from .focus import FocusManager
+from .ingestion import SlackIngestQueue, event_thread_key
 from .ui import link_button, open_link_blocks
 from .workspace import (
     DEFAULT_PERSONAS,
@@ -959,10 +960,7 @@ async def route_slack_event(
 
     # In DMs, avoid creating a new "focus thread" per message (ts changes every message).
     # Instead, keep a stable key so multi-turn conversations work without requiring threads.
-    if is_dm and not thread_ts:
-        origin_key = f"{channel}:dm"
-    else:
-        origin_key = FocusManager.thread_key(channel, thread_ts, ts)
+    origin_key = event_thread_key(event)
     binding = focus.get_focus(origin_key)
     user_focus = (
         focus.get_user_focus(user) if (is_dm and user and user != "unknown") else None
@@ -1833,6 +1831,23 @@ def register_handlers(
                 stage="slack_route_dispatch", duration_s=perf_counter() - started
             )
 
+    async def _run_ingested_turn(event: dict, route: dict) -> None:
+        await _route_slack_event_with_guard(event=event, **route)
+
+    # Message events are deduplicated (Slack retries, double-sends) and run one
+    # turn at a time per thread; bursts queued behind a turn become one turn.
+    ingest = SlackIngestQueue(
+        _run_ingested_turn,
+        max_concurrency=int(getattr(settings, "slack_ingest_max_concurrency", 16)),
+        max_pending_per_thread=int(
+            getattr(settings, "slack_ingest_max_pending_per_thread", 20)
+        ),
+        coalesce_window_s=float(
+            getattr(settings, "slack_ingest_coalesce_window_seconds", 0.2)
+        ),
+        dedupe_ttl_s=float(getattr(settings, "slack_ingest_dedupe_ttl_seconds", 600.0)),
+    )
+
     # --- Slash Commands ---
 
     @app.command("/ff-focus")
@@ -2681,6 +2696,8 @@ def register_handlers(
     async def on_app_mention(body, say, context, client, logger):
         await _ensure_workspace_registry(client)
         event = body.get("event", {})
+        if ingest.is_duplicate(event, body=body):
+            return
         user_id = event.get("user") or ""
         channel_id = event.get("channel") or ""
         channel_type = event.get("channel_type") or "channel"
@@ -2692,12 +2709,15 @@ def register_handlers(
                 channel_type=channel_type,
                 origin="app_mention",
             )
-        await _route_slack_event_with_guard(
-            event=event,
-            say=say,
-            bot_user_id=context.get("bot_user_id"),
-            client=client,
-            origin="app_mention",
+        await ingest.submit(
+            event,
+            {
+                "say": say,
+                "bot_user_id": context.get("bot_user_id"),
+                "client": client,
+                "origin": "app_mention",
+            },
+            body=body,
         )
 
     @app.event("reaction_added")
@@ -2739,6 +2759,8 @@ def register_handlers(
         text = event.get("text") or ""
         if not text.strip() and subtype != "file_share":
             return
+        if ingest.is_duplicate(event, body=body):
+            return
         user_id = event.get("user") or ""
         if user_id:
             await _ensure_user_invited(client, user_id=user_id)
@@ -2771,12 +2793,15 @@ def register_handlers(
                     channel_id,
                 )
                 return
-        await _route_slack_event_with_guard(
-            event=event,
-            say=say,
-            bot_user_id=context.get("bot_user_id"),
-            client=client,
-            origin="message",
+        await ingest.submit(
+            event,
+            {
+                "say": say,
+                "bot_user_id": context.get("bot_user_id"),
+                "client": client,
+                "origin": "message",
+            },
+            body=body,
         )
 
 
@@ -0,0 +1,280 @@
+"""Deduplicated, per-thread ingestion of Slack message events.
+
+Slack redelivers events it considers unacknowledged (same ``event_id``) and
+users double-send, so routing every Socket Mode event straight into
+``route_slack_event`` duplicates agent work: a "thinking" placeholder, a
+constraint query and a full agent turn per copy.
+
+``SlackIngestQueue`` sits in front of routing:
+
+- events are deduplicated by ``event_id`` / ``client_msg_id`` / channel+ts
+  in a TTL cache;
+- work is serialized per thread key (one turn at a time per thread);
+- consecutive messages from the same user that queue up behind a running
+  turn — or arrive within ``coalesce_window_s`` — are merged into one turn;
+- independent threads run concurrently under a global concurrency cap.
+
+``submit`` resolves once the turn that handled the event has finished, so
+callers keep their await-until-routed semantics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from cachetools import TTLCache
+
+from fateforger.core.logging_config import (
+    observe_slack_ingest_wait,
+    record_slack_ingest_event,
+    set_slack_ingest_queue_depth,
+)
+
+from .focus import FocusManager
+
+logger = logging.getLogger(__name__)
+
+TurnHandler = Callable[[dict, Any], Awaitable[None]]
+
+
+def event_thread_key(event: dict) -> str:
+    """Return the conversation key ``route_slack_event`` routes ``event`` under.
+
+    DMs outside a thread share one ``<channel>:dm`` key so multi-turn DM
+    conversations work without threads.
+    """
+    channel = str(event.get("channel") or "")
+    thread_ts = event.get("thread_ts")
+    is_dm = event.get("channel_type") == "im" or channel.startswith("D")
+    if is_dm and not thread_ts:
+        return f"{channel}:dm"
+    return FocusManager.thread_key(channel, thread_ts, str(event.get("ts") or ""))
+
+
+def event_dedupe_keys(event: dict, *, body: dict | None = None) -> tuple[str, ...]:
+    """Return every idempotency key identifying ``event``."""
+    keys: list[str] = []
+    event_id = (body or {}).get("event_id")
+    if event_id:
+        keys.append(f"event:{event_id}")
+    client_msg_id = event.get("client_msg_id")
+    if client_msg_id:
+        keys.append(f"msg:{client_msg_id}")
+    channel = event.get("channel")
+    ts = event.get("ts")
+    if channel and ts:
+        keys.append(f"ts:{channel}:{ts}")
+    return tuple(keys)
+
+
+def coalesce_events(events: list[dict]) -> dict:
+    """Merge a burst of message events into one, based on the latest.
+
+    Texts are joined in arrival order; files are concatenated.  The merged
+    event keeps the latest ``ts`` and lists every source in ``coalesced_ts``.
+    """
+    if len(events) == 1:
+        return events[0]
+    merged = dict(events[-1])
+    merged["text"] = "\n".join(
+        text for event in events if (text := (event.get("text") or "").strip())
+    )
+    files = [file for event in events for file in (event.get("files") or [])]
+    if files:
+        merged["files"] = files
+    merged["coalesced_ts"] = [event.get("ts") for event in events]
+    return merged
+
+
+@dataclass(slots=True)
+class _QueuedEvent:
+    event: dict
+    payload: Any
+    enqueued_at: float
+    done: asyncio.Future[None]
+
+
+class SlackIngestQueue:
+    """Dedupe, serialize per thread, and coalesce Slack message events."""
+
+    def __init__(
+        self,
+        handler: TurnHandler,
+        *,
+        max_concurrency: int = 16,
+        max_pending_per_thread: int = 20,
+        coalesce_window_s: float = 0.0,
+        dedupe_ttl_s: float = 600.0,
+        dedupe_max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create the queue.
+
+        Args:
+            handler: Runs one turn as ``handler(event, payload)``; ``payload``
+                is the latest submitter's payload.
+            max_concurrency: Turns running at once across all threads.
+            max_pending_per_thread: Events a thread may queue; later ones are
+                dropped.
+            coalesce_window_s: Settle time before a thread's turn starts, so
+                rapid double-sends land in the same turn.
+            dedupe_ttl_s: How long an event's idempotency keys are remembered.
+            dedupe_max_entries: Bound on remembered idempotency keys.
+            clock: Monotonic clock (wait-time metrics and dedupe TTL).
+        """
+        self._handler = handler
+        self._semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+        self._max_pending = max(1, int(max_pending_per_thread))
+        self._coalesce_window_s = max(0.0, float(coalesce_window_s))
+        self._clock = clock
+        self._seen: TTLCache = TTLCache(
+            maxsize=max(1, int(dedupe_max_entries)),
+            ttl=max(0.001, float(dedupe_ttl_s)),
+            timer=clock,
+        )
+        self._pending: dict[str, deque[_QueuedEvent]] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+        self._depth = 0
+
+    @property
+    def depth(self) -> int:
+        """Events waiting for a turn across all threads."""
+        return self._depth
+
+    def is_duplicate(self, event: dict, *, body: dict | None = None) -> bool:
+        """Whether ``event`` was already submitted; counts it when so.
+
+        Does not mark ``event`` as seen — only ``submit`` does, so a caller
+        may still filter the event out after this check.
+        """
+        if any(key in self._seen for key in event_dedupe_keys(event, body=body)):
+            record_slack_ingest_event(outcome="duplicate")
+            return True
+        return False
+
+    async def submit(
+        self,
+        event: dict,
+        payload: Any = None,
+        *,
+        body: dict | None = None,
+        thread_key: str | None = None,
+    ) -> bool:
+        """Queue ``event`` and wait until the turn handling it has finished.
+
+        Returns:
+            ``False`` when the event was a duplicate or its thread queue was
+            full, ``True`` once it has been handled.
+        """
+        keys = event_dedupe_keys(event, body=body)
+        if any(key in self._seen for key in keys):
+            record_slack_ingest_event(outcome="duplicate")
+            logger.debug("Skipping duplicate Slack event keys=%s", keys)
+            return False
+        key = thread_key or event_thread_key(event)
+        queue = self._pending.setdefault(key, deque())
+        if len(queue) >= self._max_pending:
+            record_slack_ingest_event(outcome="dropped")
+            logger.warning(
+                "Slack ingest queue full thread=%s pending=%s; dropping ts=%s",
+                key,
+                len(queue),
+                event.get("ts"),
+            )
+            return False
+        for dedupe_key in keys:
+            self._seen[dedupe_key] = True
+        item = _QueuedEvent(
+            event=event,
+            payload=payload,
+            enqueued_at=self._clock(),
+            done=asyncio.get_running_loop().create_future(),
+        )
+        queue.append(item)
+        self._set_depth(self._depth + 1)
+        record_slack_ingest_event(outcome="accepted")
+        if key not in self._workers:
+            self._workers[key] = asyncio.create_task(
+                self._drain(key), name=f"slack-ingest:{key}"
+            )
+        await asyncio.shield(item.done)
+        return True
+
+    async def close(self) -> None:
+        """Cancel running turns and release every waiting submitter."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for queue in self._pending.values():
+            for item in queue:
+                if not item.done.done():
+                    item.done.cancel()
+        self._pending.clear()
+        self._set_depth(0)
+
+    async def _drain(self, key: str) -> None:
+        """Run turns for ``key`` until its queue is empty."""
+        queue = self._pending[key]
+        batch: list[_QueuedEvent] = []
+        try:
+            while queue:
+                if self._coalesce_window_s:
+                    await asyncio.sleep(self._coalesce_window_s)
+                async with self._semaphore:
+                    batch = self._take_batch(queue)
+                    await self._run_turn(key, batch)
+                    batch = []
+        finally:
+            # Only reached with a non-empty queue on cancellation.
+            for item in batch:
+                if not item.done.done():
+                    item.done.cancel()
+            self._workers.pop(key, None)
+            if not queue:
+                self._pending.pop(key, None)
+
+    def _take_batch(self, queue: deque[_QueuedEvent]) -> list[_QueuedEvent]:
+        """Pop the leading run of events from one user."""
+        user = queue[0].event.get("user")
+        batch = [queue.popleft()]
+        while queue and queue[0].event.get("user") == user:
+            batch.append(queue.popleft())
+        self._set_depth(self._depth - len(batch))
+        return batch
+
+    async def _run_turn(self, key: str, batch: list[_QueuedEvent]) -> None:
+        """Handle ``batch`` as one turn and release its submitters."""
+        started = self._clock()
+        for item in batch:
+            observe_slack_ingest_wait(wait_s=started - item.enqueued_at)
+        if len(batch) > 1:
+            record_slack_ingest_event(outcome="coalesced", amount=len(batch) - 1)
+            logger.debug("Coalesced %s Slack events thread=%s", len(batch), key)
+        try:
+            await self._handler(
+                coalesce_events([item.event for item in batch]), batch[-1].payload
+            )
+        except Exception:
+            logger.exception("Slack ingest turn failed thread=%s", key)
+        for item in batch:
+            if not item.done.done():
+                item.done.set_result(None)
+
+    def _set_depth(self, depth: int) -> None:
+        self._depth = max(0, depth)
+        set_slack_ingest_queue_depth(self._depth)
+
+
+__all__ = [
+    "SlackIngestQueue",
+    "coalesce_events",
+    "event_dedupe_keys",
+    "event_thread_key",
+]
@@ -6,7 +6,9 @@ Provides a standardized function for loading Google Calendar MCP tools for AutoG
 Environment variables should be loaded and managed externally.
 """
 
-from autogen_ext.tools.mcp import StreamableHttpServerParams, mcp_server_tools
+from autogen_ext.tools.mcp import StreamableHttpServerParams
+
+from fateforger.tools.mcp_pool import mcp_workbench_pool
 
 
 async def get_calendar_mcp_tools(server_url: str, timeout: float = 5.0):  # type: ignore
@@ -18,10 +20,10 @@ async def get_calendar_mcp_tools(server_url: str, timeout: float = 5.0):  # type
         timeout (float): Connection timeout in seconds.
 
     Returns:
-        list: MCP tools for Google Calendar.
+        list: MCP tools for Google Calendar (shared via the MCP workbench pool).
     """
     params = StreamableHttpServerParams(
         url=server_url,
         timeout=timeout,
     )
-    return await mcp_server_tools(params)
+    return await mcp_workbench_pool().discover_tools(params)
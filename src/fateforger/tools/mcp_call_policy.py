@@ -0,0 +1,304 @@
+"""Adaptive timeouts and circuit breaking for MCP tool calls.
+
+``McpWorkbenchPool.call_tool`` runs every MCP call through one shared
+``McpCallPolicy``.  Per ``(server, tool)`` it:
+
+* keeps a sliding window of successful call latencies and derives the call
+  timeout from their p99 (``p99_multiplier`` x p99, clamped to
+  ``[min_timeout_s, max_timeout_s]``; ``base_timeout_s`` until
+  ``min_samples`` calls were observed);
+* counts consecutive transport failures (exceptions and timeouts; errors
+  the MCP server *reports* are answers, not failures) and opens the
+  breaker after ``failure_threshold`` of them;
+* while open, rejects calls immediately with ``McpCircuitOpenError``
+  (callers fail fast or fall back to a cache); after ``open_cooldown_s``
+  one probe call is let through (half-open) and its outcome closes or
+  re-opens the breaker.
+
+Latencies and breaker state are exported via ``core/logging_config.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TypeVar
+
+from fateforger.core.logging_config import (
+    observe_mcp_call,
+    record_mcp_circuit_rejection,
+    record_mcp_circuit_state,
+)
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """Breaker state of one ``(server, tool)`` pair."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+class McpCircuitOpenError(RuntimeError):
+    """Raised instead of calling a tool whose breaker is open."""
+
+    def __init__(self, *, server: str, tool: str, retry_after_s: float) -> None:
+        super().__init__(
+            f"MCP circuit open for {server} {tool}; retry in {retry_after_s:.1f}s"
+        )
+        self.server = server
+        self.tool = tool
+        self.retry_after_s = retry_after_s
+
+
+@dataclass(frozen=True, slots=True)
+class McpCallPolicyConfig:
+    """Timeout and breaker settings shared by all MCP tools.
+
+    Attributes:
+        base_timeout_s: Timeout used until ``min_samples`` latencies exist.
+        min_timeout_s: Lower clamp of the adaptive timeout.
+        max_timeout_s: Upper clamp of the adaptive timeout.
+        p99_multiplier: Headroom applied to the observed p99 latency.
+        min_samples: Successful calls needed before adapting.
+        window: Latency samples kept per tool.
+        failure_threshold: Consecutive failures that open the breaker.
+        open_cooldown_s: Seconds the breaker stays open before a probe.
+    """
+
+    base_timeout_s: float = 15.0
+    min_timeout_s: float = 2.0
+    max_timeout_s: float = 30.0
+    p99_multiplier: float = 2.0
+    min_samples: int = 20
+    window: int = 200
+    failure_threshold: int = 5
+    open_cooldown_s: float = 30.0
+
+    def __post_init__(self) -> None:
+        """Validate settings."""
+        if not 0 < self.min_timeout_s <= self.max_timeout_s:
+            raise ValueError("require 0 < min_timeout_s <= max_timeout_s")
+        if self.failure_threshold < 1 or self.window < 1:
+            raise ValueError("failure_threshold and window must be >= 1")
+
+
+@dataclass(slots=True)
+class _ToolState:
+    latencies: deque[float]
+    state: CircuitState = CircuitState.CLOSED
+    failures: int = 0
+    opened_at: float = 0.0
+    probing: bool = False
+    timeout_s: float | None = field(default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class McpToolHealth:
+    """Snapshot of one tool's policy state."""
+
+    server: str
+    tool: str
+    state: CircuitState
+    consecutive_failures: int
+    timeout_s: float
+    samples: int
+
+
+class McpCallPolicy:
+    """Per-tool latency tracking, adaptive timeouts and circuit breakers."""
+
+    def __init__(
+        self,
+        config: McpCallPolicyConfig | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a policy with no history.
+
+        Args:
+            config: Timeout / breaker settings (defaults to ``McpCallPolicyConfig()``).
+            clock: Monotonic clock (injectable for tests).
+        """
+        self._config = config or McpCallPolicyConfig()
+        self._clock = clock
+        self._tools: dict[tuple[str, str], _ToolState] = {}
+
+    @property
+    def config(self) -> McpCallPolicyConfig:
+        """Return the active settings."""
+        return self._config
+
+    def _tool(self, server: str, tool: str) -> _ToolState:
+        state = self._tools.get((server, tool))
+        if state is None:
+            state = _ToolState(latencies=deque(maxlen=self._config.window))
+            self._tools[(server, tool)] = state
+        return state
+
+    def timeout_for(self, server: str, tool: str) -> float:
+        """Return the current adaptive timeout for ``tool`` on ``server``."""
+        state = self._tool(server, tool)
+        if state.timeout_s is None:
+            state.timeout_s = self._derive_timeout(state.latencies)
+        return state.timeout_s
+
+    def _derive_timeout(self, latencies: deque[float]) -> float:
+        cfg = self._config
+        if len(latencies) < cfg.min_samples:
+            return min(max(cfg.base_timeout_s, cfg.min_timeout_s), cfg.max_timeout_s)
+        ordered = sorted(latencies)
+        p99 = ordered[min(len(ordered) - 1, math.ceil(0.99 * len(ordered)) - 1)]
+        return min(max(p99 * cfg.p99_multiplier, cfg.min_timeout_s), cfg.max_timeout_s)
+
+    def state(self, server: str, tool: str) -> CircuitState:
+        """Return the breaker state (an elapsed cooldown reads as half-open)."""
+        state = self._tool(server, tool)
+        if (
+            state.state is CircuitState.OPEN
+            and self._clock() - state.opened_at >= self._config.open_cooldown_s
+        ):
+            return CircuitState.HALF_OPEN
+        return state.state
+
+    def health(self) -> list[McpToolHealth]:
+        """Return a snapshot of every tool seen so far."""
+        return [
+            McpToolHealth(
+                server=server,
+                tool=tool,
+                state=self.state(server, tool),
+                consecutive_failures=state.failures,
+                timeout_s=self.timeout_for(server, tool),
+                samples=len(state.latencies),
+            )
+            for (server, tool), state in self._tools.items()
+        ]
+
+    async def call(
+        self,
+        server: str,
+        tool: str,
+        invoke: Callable[[], Awaitable[T]],
+        *,
+        is_failure: Callable[[BaseException], bool] = lambda _exc: True,
+    ) -> T:
+        """Run ``invoke`` under the tool's breaker and adaptive timeout.
+
+        Args:
+            server: Server label (metrics / breaker key).
+            tool: Tool name.
+            invoke: Performs the call.
+            is_failure: Whether an exception counts against the breaker;
+                return ``False`` for errors the server reported itself.
+
+        Raises:
+            McpCircuitOpenError: The breaker is open (or a probe is running).
+            TimeoutError: The call exceeded the adaptive timeout.
+        """
+        state = self._tool(server, tool)
+        self._admit(server, tool, state)
+        started = self._clock()
+        try:
+            result = await asyncio.wait_for(
+                invoke(), timeout=self.timeout_for(server, tool)
+            )
+        except asyncio.CancelledError:
+            state.probing = False
+            raise
+        except BaseException as exc:
+            elapsed = self._clock() - started
+            if isinstance(exc, TimeoutError) or is_failure(exc):
+                observe_mcp_call(
+                    server=server,
+                    tool=tool,
+                    outcome="timeout" if isinstance(exc, TimeoutError) else "error",
+                    duration_s=elapsed,
+                )
+                self._on_failure(server, tool, state)
+            else:
+                observe_mcp_call(
+                    server=server, tool=tool, outcome="reported", duration_s=elapsed
+                )
+                self._on_success(server, tool, state, elapsed)
+            raise
+        elapsed = self._clock() - started
+        observe_mcp_call(server=server, tool=tool, outcome="ok", duration_s=elapsed)
+        self._on_success(server, tool, state, elapsed)
+        return result
+
+    def check(self, server: str, tool: str) -> None:
+        """Fail fast when ``call`` would reject; does not claim a probe.
+
+        Lets callers skip expensive setup (leasing / starting a session)
+        for a tool whose breaker is open.
+
+        Raises:
+            McpCircuitOpenError: The breaker is open (or a probe is running).
+        """
+        state = self._tool(server, tool)
+        if state.state is CircuitState.CLOSED:
+            return
+        remaining = state.opened_at + self._config.open_cooldown_s - self._clock()
+        if state.state is CircuitState.OPEN and remaining <= 0:
+            return
+        if state.state is CircuitState.HALF_OPEN and not state.probing:
+            return
+        record_mcp_circuit_rejection(server=server, tool=tool)
+        raise McpCircuitOpenError(
+            server=server, tool=tool, retry_after_s=max(remaining, 0.0)
+        )
+
+    def _admit(self, server: str, tool: str, state: _ToolState) -> None:
+        if state.state is CircuitState.CLOSED:
+            return
+        remaining = state.opened_at + self._config.open_cooldown_s - self._clock()
+        if state.state is CircuitState.OPEN and remaining <= 0:
+            self._transition(server, tool, state, CircuitState.HALF_OPEN)
+        if state.state is CircuitState.HALF_OPEN and not state.probing:
+            state.probing = True
+            return
+        record_mcp_circuit_rejection(server=server, tool=tool)
+        raise McpCircuitOpenError(
+            server=server, tool=tool, retry_after_s=max(remaining, 0.0)
+        )
+
+    def _on_success(
+        self, server: str, tool: str, state: _ToolState, elapsed: float
+    ) -> None:
+        state.latencies.append(elapsed)
+        state.timeout_s = None
+        state.failures = 0
+        state.probing = False
+        if state.state is not CircuitState.CLOSED:
+            self._transition(server, tool, state, CircuitState.CLOSED)
+
+    def _on_failure(self, server: str, tool: str, state: _ToolState) -> None:
+        state.failures += 1
+        probe_failed = state.state is CircuitState.HALF_OPEN
+        state.probing = False
+        if probe_failed or state.failures >= self._config.failure_threshold:
+            state.opened_at = self._clock()
+            self._transition(server, tool, state, CircuitState.OPEN)
+
+    def _transition(
+        self, server: str, tool: str, state: _ToolState, target: CircuitState
+    ) -> None:
+        state.state = target
+        record_mcp_circuit_state(server=server, tool=tool, state=target.value)
+
+
+__all__ = [
+    "CircuitState",
+    "McpCallPolicy",
+    "McpCallPolicyConfig",
+    "McpCircuitOpenError",
+    "McpToolHealth",
+]
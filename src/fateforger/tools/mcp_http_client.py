@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 
+from fateforger.tools.mcp_pool import mcp_workbench_pool
 from fateforger.tools.mcp_url_validation import McpEndpointResolver
 
 
@@ -44,13 +45,11 @@ class StreamableHttpMcpClient:
         return name if isinstance(name, str) and name.strip() else "MCP"
 
     async def get_tools(self) -> list:
-        """Load MCP tools from the configured endpoint."""
-        from autogen_ext.tools.mcp import mcp_server_tools
-
+        """Load MCP tools from the configured endpoint (cached by the pool)."""
         ok, reason = self.probe()
         if not ok:
             raise RuntimeError(reason or f"{self._endpoint_name()} endpoint is unavailable.")
-        tools = await mcp_server_tools(self._params)
+        tools = await mcp_workbench_pool().discover_tools(self._params)
         if not tools:
             raise RuntimeError(f"{self._endpoint_name()} server returned no tools")
         return tools
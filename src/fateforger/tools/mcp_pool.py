@@ -0,0 +1,535 @@
+"""Process-wide pool of warm MCP workbench sessions.
+
+Every MCP-facing client used to build and own a private ``McpWorkbench``,
+paying session setup and tool discovery separately and reconnecting
+independently after errors.  ``mcp_workbench_pool()`` instead keeps up to
+``size`` started sessions per server (keyed by URL + headers, or by the
+stdio command line) and leases them with bounded per-server concurrency.
+
+Clients keep their ``self._workbench`` attribute but hold a
+``PooledWorkbench`` proxy from ``McpWorkbenchPool.workbench(params)``:
+
+* ``call_tool`` leases the least-loaded session (MCP sessions multiplex
+  concurrent requests); a session that raises a transport error is discarded
+  and replaced on the next lease;
+* ``list_tools`` and ``discover_tools`` (the ``mcp_server_tools`` adapter
+  list) are cached per server for ``tools_ttl_s``;
+* ``reset`` drops every session for the server (used after "actor not
+  running"-style failures); sessions still serving other calls are stopped
+  once those calls finish; ``stop``/``close`` are no-ops because the pool
+  owns session lifetime (``McpWorkbenchPool.close`` at shutdown);
+* a background task health-checks idle sessions every
+  ``health_interval_s`` and replaces dead ones;
+* every ``call_tool`` runs under the pool's ``McpCallPolicy`` (adaptive
+  per-tool timeout and circuit breaker, see ``mcp_call_policy``).
+
+Sessions are bound to the event loop that created them, so the pool keeps
+one set of servers per running loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import weakref
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from fateforger.core.logging_config import record_mcp_pool_event
+from fateforger.tools.mcp_call_policy import McpCallPolicy, McpCallPolicyConfig
+
+logger = logging.getLogger(__name__)
+
+WorkbenchFactory = Callable[[Any], Any]
+ToolLoader = Callable[[Any], Any]
+
+
+@dataclass(frozen=True, slots=True)
+class McpPoolPolicy:
+    """Sizing and health-check settings for ``McpWorkbenchPool``.
+
+    Attributes:
+        size: Maximum warm sessions per server.
+        max_concurrency: Maximum in-flight calls per server (leases wait).
+        health_interval_s: Seconds between idle-session health checks;
+            ``0`` disables the background checker.
+        health_timeout_s: Timeout of one health-check ``list_tools`` call.
+        tools_ttl_s: How long cached tool lists stay valid.
+    """
+
+    size: int = 2
+    max_concurrency: int = 8
+    health_interval_s: float = 60.0
+    health_timeout_s: float = 5.0
+    tools_ttl_s: float = 300.0
+
+    def __post_init__(self) -> None:
+        """Validate limits."""
+        if self.size < 1:
+            raise ValueError("size must be >= 1")
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        if self.health_interval_s < 0 or self.tools_ttl_s < 0:
+            raise ValueError("intervals must be >= 0")
+
+
+@dataclass(slots=True)
+class _Slot:
+    workbench: Any
+    in_flight: int = 0
+    started: bool = False
+    retired: bool = False
+    start_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+@dataclass(slots=True)
+class _Cached:
+    value: Any
+    fetched_at: float
+
+
+@dataclass(slots=True)
+class _ServerPool:
+    """Sessions and caches for one server on one event loop."""
+
+    params: Any
+    label: str
+    semaphore: asyncio.Semaphore
+    slots: list[_Slot] = field(default_factory=list)
+    tool_schemas: _Cached | None = None
+    tool_adapters: _Cached | None = None
+    discovery: asyncio.Task[Any] | None = None
+    health_task: asyncio.Task[None] | None = None
+
+
+def server_key(params: Any) -> str:
+    """Return the pool key for MCP server params (URL/headers or stdio command)."""
+    url = getattr(params, "url", None)
+    if url:
+        headers = getattr(params, "headers", None) or {}
+        identity: list[Any] = ["http", str(url), sorted(dict(headers).items())]
+    elif getattr(params, "command", None):
+        identity = [
+            "stdio",
+            str(params.command),
+            list(getattr(params, "args", None) or []),
+            str(getattr(params, "cwd", None) or ""),
+        ]
+    else:
+        dump = getattr(params, "model_dump", None)
+        identity = [type(params).__name__, dump(mode="json") if dump else repr(params)]
+    raw = json.dumps(identity, sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _label(params: Any) -> str:
+    """Short server label for logs and metrics (host, or stdio script name)."""
+    url = getattr(params, "url", None)
+    if url:
+        return urlsplit(str(url)).netloc or str(url)
+    args = list(getattr(params, "args", None) or [])
+    command = str(args[-1] if args else getattr(params, "command", None) or "mcp")
+    return command.replace("\\", "/").rsplit("/", 1)[-1]
+
+
+def _default_factory(params: Any) -> Any:
+    from autogen_ext.tools.mcp import McpWorkbench  # noqa: PLC0415
+
+    return McpWorkbench(params)
+
+
+async def _default_loader(params: Any) -> Any:
+    from autogen_ext.tools.mcp import mcp_server_tools  # noqa: PLC0415
+
+    return await mcp_server_tools(params)
+
+
+def _is_protocol_error(exc: BaseException) -> bool:
+    """Return True for server-reported MCP errors (session still healthy)."""
+    try:
+        from mcp.shared.exceptions import McpError  # noqa: PLC0415
+    except Exception:  # pragma: no cover - optional dependency
+        return False
+    return isinstance(exc, McpError)
+
+
+class McpWorkbenchPool:
+    """Warm, shared ``McpWorkbench`` sessions leased per server."""
+
+    def __init__(
+        self,
+        policy: McpPoolPolicy | None = None,
+        *,
+        factory: WorkbenchFactory = _default_factory,
+        tool_loader: ToolLoader = _default_loader,
+        call_policy: McpCallPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create an empty pool.
+
+        Args:
+            policy: Sizing / health settings (defaults to ``McpPoolPolicy()``).
+            factory: Builds an unstarted workbench from server params.
+            tool_loader: Loads the AutoGen tool adapters for server params.
+            call_policy: Timeout / breaker policy applied to ``call_tool``.
+            clock: Monotonic clock for tool-cache expiry.
+        """
+        self._policy = policy or McpPoolPolicy()
+        self._call_policy = call_policy or McpCallPolicy()
+        self._factory = factory
+        self._tool_loader = tool_loader
+        self._clock = clock
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, _ServerPool]
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def policy(self) -> McpPoolPolicy:
+        """Return the active pool policy."""
+        return self._policy
+
+    @property
+    def call_policy(self) -> McpCallPolicy:
+        """Return the shared timeout / circuit-breaker policy."""
+        return self._call_policy
+
+    def workbench(self, params: Any) -> "PooledWorkbench":
+        """Return a workbench-compatible proxy bound to ``params``' server."""
+        return PooledWorkbench(self, params)
+
+    def _server(self, params: Any) -> _ServerPool:
+        loop = asyncio.get_running_loop()
+        servers = self._loops.setdefault(loop, {})
+        key = server_key(params)
+        server = servers.get(key)
+        if server is None:
+            server = _ServerPool(
+                params=params,
+                label=_label(params),
+                semaphore=asyncio.Semaphore(self._policy.max_concurrency),
+            )
+            servers[key] = server
+        return server
+
+    @asynccontextmanager
+    async def lease(self, params: Any) -> AsyncIterator[Any]:
+        """Lease a started session for ``params``' server.
+
+        Waits while ``max_concurrency`` calls are in flight for the server.
+        """
+        server = self._server(params)
+        async with server.semaphore:
+            slot = self._pick(server)
+            slot.in_flight += 1
+            try:
+                if not slot.started:
+                    await self._start(server, slot)
+                yield slot.workbench
+            finally:
+                slot.in_flight -= 1
+                if slot.retired and slot.in_flight == 0 and slot.started:
+                    asyncio.get_running_loop().create_task(
+                        _stop_quietly(slot.workbench)
+                    )
+
+    def _pick(self, server: _ServerPool) -> _Slot:
+        """Least-loaded slot; grow up to ``size`` before sharing a busy one."""
+        idle = [slot for slot in server.slots if slot.in_flight == 0]
+        if idle:
+            return idle[0]
+        if len(server.slots) < self._policy.size:
+            slot = _Slot(workbench=self._factory(server.params))
+            server.slots.append(slot)
+            return slot
+        return min(server.slots, key=lambda slot: slot.in_flight)
+
+    async def _start(self, server: _ServerPool, slot: _Slot) -> None:
+        async with slot.start_lock:
+            if slot.started:
+                return
+            start = getattr(slot.workbench, "start", None)
+            try:
+                if callable(start):
+                    await start()
+            except BaseException:
+                self._drop(server, slot)
+                raise
+            slot.started = True
+        record_mcp_pool_event("session_started")
+        if server.health_task is None and self._policy.health_interval_s > 0:
+            server.health_task = asyncio.get_running_loop().create_task(
+                self._health_loop(server)
+            )
+
+    async def call_tool(
+        self, params: Any, name: str, arguments: Mapping[str, Any] | None = None, **kwargs: Any
+    ) -> Any:
+        """Call ``name`` on a leased session under the call policy.
+
+        The lease wait and any session (re)start happen before the timed
+        region: only ``workbench.call_tool`` counts toward the tool's latency
+        window and adaptive timeout. Sessions that raise transport errors or
+        exceed the timeout are discarded (a hung session is not re-leased).
+
+        Raises:
+            McpCircuitOpenError: The tool's breaker is open.
+            TimeoutError: The call exceeded the tool's adaptive timeout.
+        """
+        server = self._server(params)
+        self._call_policy.check(server.label, name)
+        async with self.lease(params) as workbench:
+
+            async def _invoke() -> Any:
+                try:
+                    return await workbench.call_tool(
+                        name, arguments=arguments, **kwargs
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    if not _is_protocol_error(exc):
+                        self.discard(server, workbench)
+                    raise
+
+            try:
+                return await self._call_policy.call(
+                    server.label,
+                    name,
+                    _invoke,
+                    is_failure=lambda exc: not _is_protocol_error(exc),
+                )
+            except TimeoutError:
+                self.discard(server, workbench)
+                raise
+
+    async def list_tools(self, params: Any) -> list[Any]:
+        """Return the server's tool schemas (cached for ``tools_ttl_s``)."""
+        server = self._server(params)
+        if self._fresh(server.tool_schemas):
+            return list(server.tool_schemas.value)  # type: ignore[union-attr]
+        async with self.lease(params) as workbench:
+            try:
+                schemas = list(await workbench.list_tools())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.discard(server, workbench)
+                raise
+        server.tool_schemas = _Cached(value=schemas, fetched_at=self._clock())
+        return list(schemas)
+
+    async def discover_tools(self, params: Any) -> list[Any]:
+        """Return the AutoGen tool adapters for the server (cached, coalesced)."""
+        server = self._server(params)
+        if self._fresh(server.tool_adapters):
+            return list(server.tool_adapters.value)  # type: ignore[union-attr]
+        if server.discovery is None or server.discovery.done():
+            server.discovery = asyncio.ensure_future(self._tool_loader(params))
+        task = server.discovery
+        tools = list(await asyncio.shield(task) or [])
+        if tools and server.discovery is task:
+            server.tool_adapters = _Cached(value=tools, fetched_at=self._clock())
+        return tools
+
+    def _fresh(self, cached: _Cached | None) -> bool:
+        return (
+            cached is not None
+            and self._clock() - cached.fetched_at < self._policy.tools_ttl_s
+        )
+
+    async def warm(self, params: Any) -> int:
+        """Start up to ``size`` sessions for the server; return how many are live."""
+        server = self._server(params)
+        while len(server.slots) < self._policy.size:
+            server.slots.append(_Slot(workbench=self._factory(server.params)))
+        pending = [slot for slot in server.slots if not slot.started]
+        results = await asyncio.gather(
+            *(self._start(server, slot) for slot in pending), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning("MCP pool warm-up failed for %s: %s", server.label, result)
+        return sum(1 for slot in server.slots if slot.started)
+
+    def discard(self, server_or_params: Any, workbench: Any) -> None:
+        """Drop ``workbench`` from its server pool and stop it in the background."""
+        server = (
+            server_or_params
+            if isinstance(server_or_params, _ServerPool)
+            else self._server(server_or_params)
+        )
+        for slot in list(server.slots):
+            if slot.workbench is workbench:
+                self._drop(server, slot)
+
+    def _drop(self, server: _ServerPool, slot: _Slot) -> None:
+        """Unlist ``slot``; stop it now if idle, else when its last lease ends."""
+        if slot in server.slots:
+            server.slots.remove(slot)
+            record_mcp_pool_event("session_discarded")
+        server.tool_schemas = None
+        if slot.in_flight > 0:
+            slot.retired = True
+        elif slot.started:
+            asyncio.get_running_loop().create_task(_stop_quietly(slot.workbench))
+
+    async def reset(self, params: Any) -> None:
+        """Drop every session and cached tool list for the server.
+
+        Idle sessions are stopped before returning. Sessions leased by other
+        in-flight calls leave the pool at once (new calls get fresh sessions)
+        but are only stopped when those calls finish, so one caller's reset
+        does not abort everyone else's requests.
+        """
+        server = self._server(params)
+        slots, server.slots = list(server.slots), []
+        server.tool_schemas = None
+        server.tool_adapters = None
+        for slot in slots:
+            if slot.in_flight > 0:
+                slot.retired = True
+        await asyncio.gather(
+            *(
+                _stop_quietly(slot.workbench)
+                for slot in slots
+                if slot.started and not slot.retired
+            )
+        )
+
+    async def health_check(self, params: Any) -> int:
+        """Probe idle sessions once; return how many were replaced."""
+        return await self._check(self._server(params))
+
+    async def _check(self, server: _ServerPool) -> int:
+        dropped = 0
+        for slot in [s for s in server.slots if s.started and s.in_flight == 0]:
+            slot.in_flight += 1
+            try:
+                schemas = await asyncio.wait_for(
+                    slot.workbench.list_tools(), timeout=self._policy.health_timeout_s
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.info("MCP pool dropping unhealthy session for %s: %s", server.label, exc)
+                slot.in_flight -= 1
+                self._drop(server, slot)
+                dropped += 1
+                continue
+            slot.in_flight -= 1
+            server.tool_schemas = _Cached(value=list(schemas), fetched_at=self._clock())
+        return dropped
+
+    async def _health_loop(self, server: _ServerPool) -> None:
+        while True:
+            await asyncio.sleep(self._policy.health_interval_s)
+            try:
+                await self._check(server)
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # pragma: no cover - defensive
+                logger.debug("MCP pool health check failed", exc_info=True)
+
+    async def close(self) -> None:
+        """Stop all sessions and health checkers on the current loop."""
+        loop = asyncio.get_running_loop()
+        servers = self._loops.pop(loop, {})
+        for server in servers.values():
+            if server.health_task is not None:
+                server.health_task.cancel()
+        await asyncio.gather(
+            *(
+                _stop_quietly(slot.workbench)
+                for server in servers.values()
+                for slot in server.slots
+                if slot.started
+            )
+        )
+
+
+class PooledWorkbench:
+    """``McpWorkbench``-compatible proxy whose calls lease pooled sessions."""
+
+    def __init__(self, pool: McpWorkbenchPool, params: Any) -> None:
+        self._pool = pool
+        self._params = params
+
+    @property
+    def server_params(self) -> Any:
+        """Return the server params this proxy is bound to."""
+        return self._params
+
+    async def call_tool(
+        self, name: str, arguments: Mapping[str, Any] | None = None, **kwargs: Any
+    ) -> Any:
+        """Call an MCP tool on a pooled session."""
+        return await self._pool.call_tool(self._params, name, arguments, **kwargs)
+
+    async def list_tools(self) -> list[Any]:
+        """Return the server's (cached) tool schemas."""
+        return await self._pool.list_tools(self._params)
+
+    async def start(self) -> None:
+        """Warm the server's sessions."""
+        await self._pool.warm(self._params)
+
+    async def reset(self) -> None:
+        """Reconnect: drop the server's pooled sessions once they are idle."""
+        await self._pool.reset(self._params)
+
+    async def stop(self) -> None:
+        """No-op: the pool owns session lifetime."""
+
+    async def close(self) -> None:
+        """No-op: the pool owns session lifetime."""
+
+
+async def _stop_quietly(workbench: Any) -> None:
+    stop = getattr(workbench, "stop", None)
+    if not callable(stop):
+        return
+    try:
+        await stop()
+    except Exception:
+        logger.debug("MCP workbench stop failed", exc_info=True)
+
+
+_POOL: McpWorkbenchPool | None = None
+
+
+def mcp_workbench_pool() -> McpWorkbenchPool:
+    """Return the process-wide MCP workbench pool."""
+    global _POOL
+    if _POOL is None:
+        from fateforger.core.config import settings  # noqa: PLC0415
+
+        _POOL = McpWorkbenchPool(
+            McpPoolPolicy(
+                size=settings.mcp_pool_size,
+                max_concurrency=settings.mcp_pool_max_concurrency,
+                health_interval_s=settings.mcp_pool_health_interval_seconds,
+            ),
+            call_policy=McpCallPolicy(
+                McpCallPolicyConfig(
+                    max_timeout_s=settings.mcp_call_max_timeout_seconds,
+                    failure_threshold=settings.mcp_call_failure_threshold,
+                    open_cooldown_s=settings.mcp_call_open_cooldown_seconds,
+                )
+            ),
+        )
+    return _POOL
+
+
+__all__ = [
+    "McpPoolPolicy",
+    "McpWorkbenchPool",
+    "PooledWorkbench",
+    "mcp_workbench_pool",
+    "server_key",
+]
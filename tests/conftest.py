@@ -66,3 +66,12 @@ async def scheduler():
     sched.start()
     yield sched
     sched.shutdown(wait=False)
+
+
+@pytest.fixture(autouse=True)
+def _reset_calendar_read_cache():
+    from fateforger.adapters.calendar.read_cache import calendar_read_cache
+
+    calendar_read_cache().clear()
+    yield
+    calendar_read_cache().clear()
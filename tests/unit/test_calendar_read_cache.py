@@ -0,0 +1,304 @@
+"""Unit tests for the shared calendar read cache."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import date, datetime, timedelta
+from typing import Any
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from fateforger.adapters.calendar.read_cache import (
+    CalendarReadCache,
+    calendar_read_cache,
+)
+from fateforger.agents.timeboxing.sync_engine import (
+    SyncOp,
+    SyncOpType,
+    execute_sync,
+)
+
+TZ = ZoneInfo("Europe/Amsterdam")
+
+
+def _at(day: int, hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 2, day, hour, minute, tzinfo=TZ)
+
+
+def _event(event_id: str, start: datetime, end: datetime) -> dict[str, Any]:
+    return {
+        "id": event_id,
+        "summary": event_id,
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": end.isoformat()},
+    }
+
+
+class _Fetcher:
+    """Counts fetches and serves a fixed event list."""
+
+    def __init__(self, events: list[dict[str, Any]] | None, delay_s: float = 0.0):
+        self.events = events
+        self.delay_s = delay_s
+        self.calls = 0
+
+    async def __call__(self) -> list[dict[str, Any]] | None:
+        self.calls += 1
+        await asyncio.sleep(self.delay_s)
+        return None if self.events is None else [dict(e) for e in self.events]
+
+
+DAY_EVENTS = [
+    _event("standup", _at(14, 9), _at(14, 9, 15)),
+    _event("lunch", _at(14, 12), _at(14, 13)),
+    _event("review", _at(14, 16), _at(14, 17)),
+]
+
+
+@pytest.mark.asyncio
+async def test_exact_window_is_served_from_cache_until_ttl() -> None:
+    now = [0.0]
+    cache = CalendarReadCache(ttl_s=30.0, clock=lambda: now[0])
+    fetch = _Fetcher(DAY_EVENTS)
+
+    first = await cache.list_events(
+        calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=fetch
+    )
+    second = await cache.list_events(
+        calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=fetch
+    )
+    assert first == second == DAY_EVENTS
+    assert fetch.calls == 1
+    assert cache.stats.hits == 1 and cache.stats.misses == 1
+
+    second[0]["summary"] = "mutated"
+    again = await cache.list_events(
+        calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=fetch
+    )
+    assert again[0]["summary"] == "standup"
+
+    now[0] = 31.0
+    await cache.list_events(
+        calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=fetch
+    )
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_sub_window_is_sliced_from_superset() -> None:
+    cache = CalendarReadCache(ttl_s=30.0)
+    await cache.list_events(
+        calendar_id="primary",
+        start=_at(14, 0),
+        end=_at(16, 0),
+        fetch=_Fetcher(DAY_EVENTS),
+    )
+    fetch = _Fetcher([])
+
+    events = await cache.list_events(
+        calendar_id="primary", start=_at(14, 11), end=_at(14, 16), fetch=fetch
+    )
+
+    assert [e["id"] for e in events] == ["lunch"]
+    assert fetch.calls == 0
+    assert cache.stats.superset_hits == 1
+    other = await cache.list_events(
+        calendar_id="work", start=_at(14, 11), end=_at(14, 16), fetch=fetch
+    )
+    assert other == [] and fetch.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_fetch() -> None:
+    cache = CalendarReadCache(ttl_s=30.0)
+    fetch = _Fetcher(DAY_EVENTS, delay_s=0.01)
+
+    results = await asyncio.gather(
+        cache.list_events(
+            calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=fetch
+        ),
+        cache.list_events(
+            calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=fetch
+        ),
+        cache.list_events(
+            calendar_id="primary", start=_at(14, 8), end=_at(14, 10), fetch=fetch
+        ),
+    )
+
+    assert fetch.calls == 1
+    assert results[0] == results[1] == DAY_EVENTS
+    assert [e["id"] for e in results[2]] == ["standup"]
+    assert cache.stats.coalesced == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_reads_are_not_cached() -> None:
+    cache = CalendarReadCache(ttl_s=30.0)
+    failing = _Fetcher(None)
+    assert (
+        await cache.list_events(
+            calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=failing
+        )
+        is None
+    )
+    ok = _Fetcher(DAY_EVENTS)
+    assert await cache.list_events(
+        calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=ok
+    )
+    assert ok.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_drops_only_affected_windows() -> None:
+    cache = CalendarReadCache(ttl_s=30.0)
+    for day in (14, 15):
+        await cache.list_events(
+            calendar_id="primary",
+            start=_at(day, 0),
+            end=_at(day + 1, 0),
+            fetch=_Fetcher(DAY_EVENTS if day == 14 else []),
+        )
+
+    # Deleting an event only known on the 14th drops just that day.
+    assert (
+        cache.invalidate_for_payload(
+            {"calendarId": "primary", "eventId": "lunch"}, removes=True
+        )
+        == 1
+    )
+    fetch = _Fetcher([])
+    await cache.list_events(
+        calendar_id="primary", start=_at(15, 0), end=_at(16, 0), fetch=fetch
+    )
+    assert fetch.calls == 0
+
+    # A naive write payload is placed with its ``timeZone``.
+    assert (
+        cache.invalidate_for_payload(
+            {
+                "calendarId": "primary",
+                "eventId": "new",
+                "start": "2026-02-15T10:00:00",
+                "end": "2026-02-15T11:00:00",
+                "timeZone": "Europe/Amsterdam",
+            }
+        )
+        == 1
+    )
+    # A create without times cannot be placed: the calendar is dropped.
+    await cache.list_events(
+        calendar_id="primary", start=_at(15, 0), end=_at(16, 0), fetch=fetch
+    )
+    assert cache.invalidate_for_payload({"calendarId": "primary", "eventId": "x"}) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_during_read_keeps_stale_result_out_of_cache() -> None:
+    cache = CalendarReadCache(ttl_s=30.0)
+    fetch = _Fetcher(DAY_EVENTS, delay_s=0.01)
+
+    read = asyncio.create_task(
+        cache.list_events(
+            calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=fetch
+        )
+    )
+    await asyncio.sleep(0)
+    cache.invalidate(calendar_id="primary", start=_at(14, 9), end=_at(14, 10))
+    assert await read == DAY_EVENTS
+
+    await cache.list_events(
+        calendar_id="primary", start=_at(14, 0), end=_at(15, 0), fetch=fetch
+    )
+    assert fetch.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_bypasses_and_repopulates() -> None:
+    cache = CalendarReadCache(ttl_s=30.0)
+    await cache.list_events(
+        calendar_id="primary",
+        start=_at(14, 0),
+        end=_at(15, 0),
+        fetch=_Fetcher(DAY_EVENTS),
+    )
+    fresh = _Fetcher(DAY_EVENTS[:1])
+    events = await cache.list_events(
+        calendar_id="primary",
+        start=_at(14, 0),
+        end=_at(15, 0),
+        fetch=fresh,
+        refresh=True,
+    )
+    assert fresh.calls == 1 and len(events) == 1
+    cached = await cache.list_events(
+        calendar_id="primary",
+        start=_at(14, 0),
+        end=_at(15, 0),
+        fetch=_Fetcher([]),
+    )
+    assert len(cached) == 1
+
+
+class _CalendarWorkbench:
+    def __init__(self) -> None:
+        self.list_calls = 0
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        class _Result:
+            is_error = False
+
+            def __init__(self, text: str) -> None:
+                self._text = text
+                self.result = [type("Item", (), {"content": text})()]
+
+            def to_text(self) -> str:
+                return self._text
+
+        if name == "list-events":
+            self.list_calls += 1
+            return _Result(json.dumps({"events": DAY_EVENTS}))
+        return _Result("{}")
+
+
+@pytest.mark.asyncio
+async def test_timeboxing_snapshots_share_cache_and_sync_invalidates() -> None:
+    pytest.importorskip("autogen_ext.tools.mcp")
+    from fateforger.agents.timeboxing.mcp_clients import McpCalendarClient
+
+    workbench = _CalendarWorkbench()
+    client = McpCalendarClient.__new__(McpCalendarClient)
+    client._workbench = workbench
+
+    await client.list_range_snapshots(
+        calendar_id="primary",
+        start_day=date(2026, 2, 14),
+        end_day=date(2026, 2, 16),
+        tz=TZ,
+    )
+    diagnostics: dict[str, Any] = {}
+    snapshot = await client.list_day_snapshot(
+        calendar_id="primary", day=date(2026, 2, 14), tz=TZ, diagnostics=diagnostics
+    )
+    assert workbench.list_calls == 1
+    assert diagnostics["cache"] == "hit"
+    assert len(snapshot.immovables) == 3
+
+    start = _at(14, 18)
+    op = SyncOp(
+        op_type=SyncOpType.CREATE,
+        gcal_event_id="fftbnew",
+        after_payload={
+            "calendarId": "primary",
+            "eventId": "fftbnew",
+            "start": start.replace(tzinfo=None).isoformat(),
+            "end": (start + timedelta(hours=1)).replace(tzinfo=None).isoformat(),
+            "timeZone": "Europe/Amsterdam",
+        },
+    )
+    await execute_sync([op], workbench)
+    assert calendar_read_cache().stats.invalidations == 1
+
+    await client.list_day_snapshot(calendar_id="primary", day=date(2026, 2, 14), tz=TZ)
+    assert workbench.list_calls == 2
@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import random
 from datetime import date, time
 
+import pytest
+
 from fateforger.agents.timeboxing.calendar_reconciliation import (
+    _duration_minutes,
+    _minutes_between,
+    _normalize_summary,
+    _overlap_minutes,
+    build_desired_records,
+    build_remote_records,
     reconcile_calendar_ops,
 )
 from fateforger.agents.timeboxing.tb_models import FixedWindow, TBEvent, TBPlan
@@ -146,3 +155,184 @@ def test_remote_overlapping_snapshot_does_not_crash_reconciliation() -> None:
 
     assert len(plan.creates) == 0
     assert any(match.remote.event_id == "fftb-deep-1" for match in plan.updates + plan.noops)
+
+
+def _legacy_matches(
+    *,
+    remote: TBPlan,
+    desired: TBPlan,
+    event_id_map: dict[str, str],
+    remote_event_ids_by_index: list[str] | None,
+    fuzzy_start_tolerance_min: int = 20,
+    foreign_overlap_match_min_percent: int = 80,
+) -> list[tuple[int, int, str]]:
+    """Reference implementation of the original unindexed matching passes."""
+    remote_records = build_remote_records(
+        remote=remote,
+        event_id_map=event_id_map,
+        remote_event_ids_by_index=remote_event_ids_by_index,
+    )
+    desired_records = build_desired_records(desired=desired, event_id_map=event_id_map)
+    remaining_remote = {record.index for record in remote_records}
+    remaining_desired = {record.index for record in desired_records}
+    remote_by_index = {record.index: record for record in remote_records}
+    desired_by_index = {record.index: record for record in desired_records}
+    matches: list[tuple[int, int, str]] = []
+
+    def _take(desired_index: int, remote_index: int, kind: str) -> None:
+        matches.append((desired_index, remote_index, kind))
+        remaining_desired.discard(desired_index)
+        remaining_remote.discard(remote_index)
+
+    for record in desired_records:
+        if not record.hinted_event_id:
+            continue
+        candidates = [
+            r.index
+            for r in remote_records
+            if r.event_id == record.hinted_event_id and r.index in remaining_remote
+        ]
+        if candidates:
+            _take(record.index, min(candidates), "id")
+
+    for desired_index in sorted(remaining_desired):
+        record = desired_by_index[desired_index]
+        candidates = [
+            index
+            for index in sorted(remaining_remote)
+            if remote_by_index[index].canonical == record.canonical
+        ]
+        if candidates:
+            _take(desired_index, candidates[0], "canonical")
+
+    for desired_index in sorted(remaining_desired):
+        record = desired_by_index[desired_index]
+        best_score = None
+        best_index = None
+        for remote_index in sorted(remaining_remote):
+            other = remote_by_index[remote_index]
+            if _normalize_summary(other.summary) != _normalize_summary(record.summary):
+                continue
+            overlap = _overlap_minutes(
+                record.start_time, record.end_time, other.start_time, other.end_time
+            )
+            start_delta = _minutes_between(record.start_time, other.start_time)
+            if overlap <= 0 and start_delta > fuzzy_start_tolerance_min:
+                continue
+            duration_delta = abs(
+                _minutes_between(record.start_time, record.end_time)
+                - _minutes_between(other.start_time, other.end_time)
+            )
+            score = (overlap, -start_delta, -duration_delta)
+            if best_score is None or score > best_score:
+                best_score, best_index = score, remote_index
+        if best_index is not None:
+            _take(desired_index, best_index, "fuzzy")
+
+    for desired_index in sorted(remaining_desired):
+        record = desired_by_index[desired_index]
+        desired_duration = _duration_minutes(record.start_time, record.end_time)
+        if desired_duration <= 0:
+            continue
+        best_score = None
+        best_index = None
+        for remote_index in sorted(remaining_remote):
+            other = remote_by_index[remote_index]
+            if other.is_owned:
+                continue
+            remote_duration = _duration_minutes(other.start_time, other.end_time)
+            if remote_duration <= 0:
+                continue
+            overlap = _overlap_minutes(
+                record.start_time, record.end_time, other.start_time, other.end_time
+            )
+            if overlap <= 0:
+                continue
+            percent = int((overlap * 100) / min(desired_duration, remote_duration))
+            if percent < foreign_overlap_match_min_percent:
+                continue
+            score = (
+                percent,
+                overlap,
+                -_minutes_between(record.start_time, other.start_time),
+                -_minutes_between(record.end_time, other.end_time),
+            )
+            if best_score is None or score > best_score:
+                best_score, best_index = score, remote_index
+        if best_index is not None:
+            _take(desired_index, best_index, "fuzzy")
+    return matches
+
+
+_SUMMARIES = ["Focus", "focus ", "Lunch", "Lunch  Break", "Standup", "Gym", "Email"]
+
+
+def _random_plans(rng: random.Random) -> tuple[TBPlan, TBPlan, list[str]]:
+    remote_events: list[TBEvent] = []
+    remote_ids: list[str] = []
+    for index in range(rng.randint(0, 60)):
+        start = rng.randrange(6 * 60, 21 * 60, 5)
+        end = start + rng.choice([15, 30, 45, 60, 90, 120])
+        remote_events.append(
+            _fw(
+                rng.choice(_SUMMARIES),
+                time(start // 60, start % 60),
+                time(end // 60, end % 60),
+            )
+        )
+        remote_ids.append(rng.choice([f"fftb{index}", f"foreign{index}", ""]))
+    desired_events: list[TBEvent] = []
+    cursor = rng.randrange(6 * 60, 8 * 60, 5)
+    while cursor < 21 * 60 and len(desired_events) < 40:
+        end = cursor + rng.choice([15, 30, 45, 60, 90])
+        desired_events.append(
+            _fw(
+                rng.choice(_SUMMARIES),
+                time(cursor // 60, cursor % 60),
+                time(end // 60, end % 60),
+            )
+        )
+        cursor = end + rng.choice([0, 0, 5, 15, 30])
+    if remote_events and rng.random() < 0.5:
+        # Reuse remote windows so id/canonical passes get exercised too.
+        for event in rng.sample(remote_events, k=min(3, len(remote_events))):
+            if all(
+                event.p.et <= other.p.st or event.p.st >= other.p.et
+                for other in desired_events
+            ):
+                desired_events.append(event)
+        desired_events.sort(key=lambda event: event.p.st)
+    return (
+        TBPlan(events=remote_events, date=PLAN_DATE, tz=TZ),
+        TBPlan(events=desired_events, date=PLAN_DATE, tz=TZ),
+        remote_ids,
+    )
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_indexed_passes_match_legacy_algorithm(seed: int) -> None:
+    """Bucketed fuzzy and interval-indexed overlap passes keep legacy results."""
+    rng = random.Random(seed)
+    remote, desired, remote_ids = _random_plans(rng)
+    event_id_map: dict[str, str] = {}
+    for event, event_id in zip(remote.events, remote_ids):
+        if event_id and rng.random() < 0.3:
+            event_id_map[f"{event.n}|{event.p.st.isoformat()}"] = event_id
+
+    plan = reconcile_calendar_ops(
+        remote=remote,
+        desired=desired,
+        event_id_map=event_id_map,
+        remote_event_ids_by_index=remote_ids,
+    )
+    expected = _legacy_matches(
+        remote=remote,
+        desired=desired,
+        event_id_map=event_id_map,
+        remote_event_ids_by_index=remote_ids,
+    )
+
+    assert [
+        (match.desired.index, match.remote.index, match.match_kind)
+        for match in plan.matches
+    ] == expected
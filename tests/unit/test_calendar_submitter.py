@@ -29,7 +29,7 @@ def _plan() -> TBPlan:
 @pytest.mark.asyncio
 async def test_submit_plan_halts_on_first_sync_error(monkeypatch: pytest.MonkeyPatch) -> None:
     """Submitter should execute sync with halt_on_error enabled."""
-    captured: dict[str, bool] = {}
+    captured: dict[str, object] = {}
 
     def _fake_plan_sync(*args, **kwargs):
         _ = (args, kwargs)
@@ -42,10 +42,18 @@ async def test_submit_plan_halts_on_first_sync_error(monkeypatch: pytest.MonkeyP
         ]
 
     async def _fake_execute_sync(
-        ops, workbench, *, halt_on_error: bool = False
+        ops,
+        workbench,
+        *,
+        halt_on_error: bool = False,
+        policy=None,
+        batch: bool = False,
+        max_batch_size: int = 50,
     ) -> SyncTransaction:
-        _ = (ops, workbench)
+        _ = (ops, workbench, max_batch_size)
         captured["halt_on_error"] = halt_on_error
+        captured["policy"] = policy
+        captured["batch"] = batch
         return SyncTransaction(status="committed")
 
     monkeypatch.setattr(submitter_module, "plan_sync", _fake_plan_sync)
@@ -61,3 +69,5 @@ async def test_submit_plan_halts_on_first_sync_error(monkeypatch: pytest.MonkeyP
 
     assert tx.status == "committed"
     assert captured["halt_on_error"] is True
+    assert isinstance(captured["policy"], submitter_module.SyncExecutionPolicy)
+    assert captured["batch"] is True
@@ -0,0 +1,181 @@
+"""Unit tests for the session-scoped durable constraint read cache."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fateforger.agents.timeboxing.constraint_query_cache import (
+    CachedDurableConstraintStore,
+    ConstraintCacheEpoch,
+    ConstraintQueryKey,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Backend:
+    """Filters rows like the Mem0/Notion backends: stage must be in applies_stages."""
+
+    def __init__(self, rows: list[dict], *, delay: float = 0.0) -> None:
+        self.rows = rows
+        self.delay = delay
+        self.calls: list[dict] = []
+        self.writes: list[str] = []
+
+    async def query_constraints(self, *, filters, type_ids=None, tags=None, sort=None, limit=50):
+        self.calls.append({"filters": dict(filters), "limit": limit})
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        stage = filters.get("stage")
+        statuses = set(filters.get("statuses_any") or [])
+        out = [
+            dict(row)
+            for row in self.rows
+            if (not stage or stage in row.get("applies_stages", []))
+            and (not statuses or row["status"] in statuses)
+        ]
+        return out[:limit]
+
+    async def query_types(self, *, stage=None, event_types=None):
+        self.calls.append({"types": stage})
+        return [{"type_id": "t1", "count": 1}]
+
+    async def update_constraint(self, *, uid, patch, event=None):
+        self.writes.append(uid)
+        return {"uid": uid, "updated": True}
+
+    async def get_constraint(self, *, uid):
+        return {"uid": uid}
+
+
+def _rows() -> list[dict]:
+    return [
+        {"uid": "a", "status": "locked", "applies_stages": ["Skeleton", "Refine"]},
+        {"uid": "b", "status": "proposed", "applies_stages": ["Refine"]},
+        {"uid": "c", "status": "locked", "applies_stages": ["CollectConstraints"]},
+    ]
+
+
+def _filters(stage: str | None = None, **extra) -> dict:
+    return {
+        "as_of": "2026-03-01",
+        "statuses_any": ["locked", "proposed"],
+        "require_active": True,
+        "stage": stage,
+        **extra,
+    }
+
+
+def test_query_keys_ignore_list_order_and_empty_filters() -> None:
+    first = ConstraintQueryKey.build(
+        filters={"statuses_any": ["proposed", "locked"], "text_query": "", "stage": "Refine"},
+        type_ids=[],
+        tags=None,
+        sort=[["Status", "descending"]],
+    )
+    second = ConstraintQueryKey.build(
+        filters={"statuses_any": ["locked", "proposed"], "event_types_any": []},
+        type_ids=None,
+        tags=[],
+        sort=[["Status", "Descending"]],
+    )
+    assert first.without_stage() == second and first.stage == "Refine"
+
+
+@pytest.mark.asyncio
+async def test_hits_limits_copies_and_ttl() -> None:
+    backend = _Backend(_rows())
+    clock = _Clock()
+    cache = CachedDurableConstraintStore(backend, ttl_s=60, clock=clock)
+
+    first = await cache.query_constraints(filters=_filters(), limit=2)
+    first[0]["uid"] = "mutated"
+    assert [row["uid"] for row in await cache.query_constraints(filters=_filters(), limit=1)] == ["a"]
+    # A larger limit than the cached (truncated) result needs the backend.
+    assert len(await cache.query_constraints(filters=_filters(), limit=10)) == 3
+    assert len(await cache.query_constraints(filters=_filters(), limit=50)) == 3
+    assert len(backend.calls) == 2
+
+    clock.now = 61
+    await cache.query_constraints(filters=_filters(), limit=50)
+    assert len(backend.calls) == 3
+    assert cache.stats.hits == 2 and cache.stats.misses == 3
+    # Everything but reads and writes passes straight through.
+    assert cache.get_constraint == backend.get_constraint
+
+
+@pytest.mark.asyncio
+async def test_identical_in_flight_queries_share_one_backend_call() -> None:
+    backend = _Backend(_rows(), delay=0.01)
+    cache = CachedDurableConstraintStore(backend, ttl_s=60)
+    results = await asyncio.gather(
+        *(cache.query_constraints(filters=_filters("Refine"), limit=20) for _ in range(5))
+    )
+    assert len(backend.calls) == 1
+    assert all([row["uid"] for row in rows] == ["a", "b"] for rows in results)
+    assert cache.stats.coalesced == 4 and cache.stats.saved_rpcs == 4
+
+
+@pytest.mark.asyncio
+async def test_later_stages_are_answered_from_a_stage_less_superset() -> None:
+    backend = _Backend(_rows())
+    cache = CachedDurableConstraintStore(backend, ttl_s=60, superset_limit=100)
+
+    # The first read learns that rows carry ``applies_stages``.
+    assert [r["uid"] for r in await cache.query_constraints(filters=_filters("Skeleton"))] == ["a"]
+    assert [r["uid"] for r in await cache.query_constraints(filters=_filters("Refine"))] == ["a", "b"]
+    assert "stage" not in backend.calls[-1]["filters"]
+    collect = await cache.query_constraints(filters=_filters("CollectConstraints"))
+    assert [r["uid"] for r in collect] == ["c"]
+
+    assert len(backend.calls) == 2
+    assert cache.stats.superset_hits == 1
+    for stage in ("Skeleton", "Refine", "CollectConstraints"):
+        expected = await backend.query_constraints(filters=_filters(stage))
+        assert await cache.query_constraints(filters=_filters(stage)) == expected
+
+
+@pytest.mark.asyncio
+async def test_rows_without_stages_never_trigger_superset_fetches() -> None:
+    class _NotionLike(_Backend):
+        async def query_constraints(self, *, filters, **kwargs):
+            self.calls.append({"filters": dict(filters)})
+            return [dict(row) for row in self.rows]
+
+    backend = _NotionLike([{"uid": "a", "status": "locked"}])
+    cache = CachedDurableConstraintStore(backend, ttl_s=60)
+    await cache.query_constraints(filters=_filters("Skeleton"))
+    await cache.query_constraints(filters=_filters("Refine"))
+    assert [call["filters"]["stage"] for call in backend.calls] == ["Skeleton", "Refine"]
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_every_session_sharing_the_epoch() -> None:
+    backend = _Backend(_rows(), delay=0.01)
+    epoch = ConstraintCacheEpoch()
+    session_a = CachedDurableConstraintStore(backend, ttl_s=60, epoch=epoch)
+    session_b = CachedDurableConstraintStore(backend, ttl_s=60, epoch=epoch)
+
+    await session_a.query_constraints(filters=_filters())
+    await session_b.query_types(stage="Refine")
+    # A read racing a write must not repopulate the cache with pre-write rows.
+    racing = asyncio.create_task(session_b.query_constraints(filters=_filters()))
+    await asyncio.sleep(0)
+    await session_a.update_constraint(uid="a", patch={"status": "declined"})
+    await racing
+    calls = len(backend.calls)
+
+    await session_a.query_constraints(filters=_filters())
+    await session_b.query_constraints(filters=_filters())
+    await session_b.query_types(stage="Refine")
+    assert len(backend.calls) == calls + 3
+    assert backend.writes == ["a"]
+    assert session_a.stats.invalidations == 1 and session_b.stats.invalidations == 1
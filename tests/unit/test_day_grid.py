@@ -0,0 +1,98 @@
+"""Unit tests for the int-array day grid."""
+
+from __future__ import annotations
+
+from datetime import date, time
+
+import pytest
+
+from fateforger.agents.timeboxing.day_grid import DayGrid, GridConflict
+from fateforger.agents.timeboxing.tb_models import ET, FixedWindow, TBEvent, TBPlan
+
+
+def _t(minutes: int) -> time:
+    return time(minutes // 60, minutes % 60)
+
+
+def _grid(spans: list[tuple[int, int]], *, layer: str = "") -> DayGrid:
+    return DayGrid.from_times(
+        ((_t(start), _t(end)) for start, end in spans),
+        labels=[f"{layer}{index}" for index in range(len(spans))],
+        layer=layer,
+    )
+
+
+def test_sequence_checks_compare_seconds_in_input_order() -> None:
+    grid = DayGrid.from_times(
+        [
+            (time(9, 0), time(10, 0)),
+            (time(10, 0), time(11, 0)),  # touching is fine
+            (time(10, 59, 30), time(12, 0)),  # 30s overlap still counts
+            (time(8, 0), time(9, 0)),  # out of order
+        ]
+    )
+    assert grid.sequence_overlaps() == [1, 2]
+    assert grid.first_sequence_overlap() == 1
+    assert DayGrid.from_times([]).first_sequence_overlap() is None
+
+
+def test_capacity_stats_free_windows_and_conflicts() -> None:
+    grid = _grid([(540, 600), (570, 630), (720, 780), (1380, 0)])  # last crosses midnight
+    assert grid.busy_minutes() == 150
+    assert grid.utilization(540, 780) == pytest.approx(150 / 240)
+    assert grid.occupancy()[575] == 2 and grid.occupancy()[1400] == 0
+    assert grid.free_windows(480, 840, min_minutes=60) == [
+        (480, 540),
+        (630, 720),
+        (780, 840),
+    ]
+    assert grid.conflicts() == [GridConflict(first=0, second=1, start_min=570, end_min=600)]
+    assert list(grid.overlapping(590, 730)) == [0, 1, 2]
+
+
+def test_overlay_reports_only_cross_calendar_conflicts_when_asked() -> None:
+    plan = _grid([(540, 600), (590, 660)], layer="plan")
+    remote = _grid([(600, 630)], layer="remote")
+    merged = DayGrid.overlay([plan, remote])
+
+    assert len(merged) == 3 and merged.label(2) == "remote0"
+    assert [(c.first, c.second) for c in merged.conflicts()] == [(0, 1), (1, 2)]
+    cross = merged.conflicts(across_layers_only=True)
+    assert [(merged.layer(c.first), merged.layer(c.second)) for c in cross] == [
+        ("plan", "remote")
+    ]
+
+
+def test_tb_plan_day_grid_skips_background_by_default() -> None:
+    plan = TBPlan(
+        date=date(2026, 2, 16),
+        events=[
+            TBEvent(n="Focus", t=ET.DW, p=FixedWindow(st=time(9), et=time(11))),
+            TBEvent(n="Podcast", t=ET.BG, p=FixedWindow(st=time(9), et=time(10))),
+            TBEvent(n="Lunch", t=ET.R, p=FixedWindow(st=time(12), et=time(13))),
+        ],
+    )
+    grid = plan.day_grid()
+    assert [grid.label(i) for i in range(len(grid))] == ["Focus", "Lunch"]
+    assert grid.free_windows(540, 780) == [(660, 720)]
+    assert len(plan.day_grid(include_background=True).conflicts()) == 1
+
+
+def test_day_grid_checks_on_large_overlays() -> None:
+    """500-event plan overlaid with four 200-event calendars."""
+    plan = _grid([(i * 2, i * 2 + 2) for i in range(500)], layer="plan")
+    calendars = [
+        _grid([(i * 7 + offset, i * 7 + offset + 5) for i in range(200)], layer=f"c{k}")
+        for k, offset in enumerate((0, 1, 2, 3))
+    ]
+
+    merged = DayGrid.overlay([plan, *calendars])
+    assert merged.first_sequence_overlap() is not None
+    assert plan.first_sequence_overlap() is None
+    conflicts = merged.conflicts(across_layers_only=True)
+    assert conflicts and all(
+        merged.layer(conflict.first) != merged.layer(conflict.second)
+        for conflict in conflicts
+    )
+    assert merged.busy_minutes() == 1401
+    assert merged.free_windows(min_minutes=15) == [(1401, 1440)]
@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import random
+
 import jsonpatch
 
 from fateforger.agents.timeboxing.durable_constraint_store import (
     ClientBackedDurableConstraintStore,
+    build_durable_constraint_store,
+    durable_store_share_key,
+    _candidate_rank,
+    _semantic_identity,
+    _semantic_similarity_score,
+    _SemanticIdentityIndex,
 )
 
 
@@ -283,6 +292,233 @@ async def test_store_adapter_dedupe_archives_non_canonical_duplicates() -> None:
     assert client.updated, "canonical should be updated with supersedes list"
 
 
+class _DictClient:
+    """Dict-backed client recording backend reads and write concurrency."""
+
+    def __init__(self, records: dict[str, dict]) -> None:
+        self.records = records
+        self.versions = {uid: 1 for uid in records}
+        self.query_calls = 0
+        self.get_calls = 0
+        self.in_flight = 0
+        self.peak_writes = 0
+
+    def _metadata(self, uid: str) -> dict:
+        return {"uid": uid, "updated_at": f"v{self.versions.get(uid, 1)}"}
+
+    def put(self, uid: str, constraint: dict) -> None:
+        """Write directly to the backend, bypassing any adapter."""
+        self.records[uid] = constraint
+        self.versions[uid] = self.versions.get(uid, 0) + 1
+
+    async def query_constraints(self, *, filters, type_ids=None, tags=None, sort=None, limit=50):
+        _ = (filters, type_ids, tags, sort)
+        self.query_calls += 1
+        return [
+            {"uid": uid, "metadata": self._metadata(uid)}
+            for uid in list(self.records)[:limit]
+        ]
+
+    async def get_constraint(self, *, uid) -> dict | None:
+        self.get_calls += 1
+        record = self.records.get(uid)
+        if record is None:
+            return None
+        return {"uid": uid, "constraint_record": dict(record), "metadata": self._metadata(uid)}
+
+    async def upsert_constraint(self, *, record, event=None) -> dict:
+        _ = event
+        constraint = dict(record.get("constraint_record") or record)
+        uid = constraint["lifecycle"]["uid"]
+        self.put(uid, constraint)
+        return {"uid": uid}
+
+    async def _write(self) -> None:
+        self.in_flight += 1
+        self.peak_writes = max(self.peak_writes, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+
+    async def update_constraint(self, *, uid, patch, event=None) -> dict:
+        _ = (patch, event)
+        await self._write()
+        return {"uid": uid, "updated": uid in self.records}
+
+    async def archive_constraint(self, *, uid, reason=None) -> dict:
+        _ = reason
+        await self._write()
+        self.put(uid, {**self.records[uid], "status": "declined"})
+        return {"uid": uid, "updated": True}
+
+
+def _random_constraint(rng: random.Random, uid: str) -> dict:
+    return {
+        "name": rng.choice(["Gym", "Lunch", "No calls", "Deep work", ""]),
+        "scope": rng.choice(["profile", "session", ""]),
+        "status": rng.choice(["locked", "proposed", "declined"]),
+        "necessity": rng.choice(["must", "should"]),
+        "topics": rng.sample(["health", "meetings", "focus", "food"], rng.randint(0, 2)),
+        "applies_stages": rng.sample(["Skeleton", "Refine"], rng.randint(0, 1)),
+        "applies_event_types": rng.sample(["M", "DW"], rng.randint(0, 1)),
+        "applicability": {
+            "days_of_week": rng.sample(["MO", "TU", "WE"], rng.randint(0, 2)),
+            "timezone": rng.choice(["Europe/Amsterdam", ""]),
+            "recurrence": rng.choice(["weekly", ""]),
+        },
+        "payload": {
+            "rule_kind": rng.choice(["avoid_window", "fixed_window", ""]),
+            "windows": [
+                {"kind": "avoid", "start_time_local": f"{hour}:00", "end_time_local": "23:59"}
+                for hour in rng.sample([12, 17, 18], rng.randint(0, 1))
+            ],
+        },
+        "lifecycle": {"uid": uid},
+    }
+
+
+def _full_scan_match(entries: list[dict], constraint: dict) -> dict | None:
+    """The original all-candidates scan used before the identity index."""
+    _, identity = _semantic_identity(constraint)
+    exact, near = [], []
+    for entry in entries:
+        _, candidate = _semantic_identity(entry["constraint_record"])
+        if candidate == identity:
+            exact.append(entry)
+        elif (score := _semantic_similarity_score(identity, candidate)) >= 8:
+            near.append((score, entry))
+    if exact:
+        return min(exact, key=_candidate_rank)
+    if near:
+        return min(near, key=lambda item: (-item[0], *_candidate_rank(item[1])))[1]
+    return None
+
+
+def test_identity_index_bands_find_the_same_match_as_a_full_scan() -> None:
+    rng = random.Random(23)
+    entries = [
+        {"uid": f"u{i}", "constraint_record": _random_constraint(rng, f"u{i}"), "metadata": {}}
+        for i in range(400)
+    ]
+    index = _SemanticIdentityIndex()
+    for entry in entries:
+        index.put(entry)
+    for i in range(300):
+        constraint = _random_constraint(rng, f"q{i}")
+        key, identity = _semantic_identity(constraint)
+        assert index.match(key, identity) is _full_scan_match(entries, constraint)
+
+
+def _realistic_constraint(rng: random.Random, uid: str) -> dict:
+    hour, minute = rng.randrange(24), rng.choice([0, 15, 30, 45])
+    return {
+        "name": f"Rule {rng.randrange(2000)}",
+        "scope": rng.choice(["profile", "session", "datespan"]),
+        "status": rng.choice(["locked", "proposed"]),
+        "topics": rng.sample([f"topic-{n}" for n in range(40)], 2),
+        "applicability": {"timezone": rng.choice(["UTC", "Europe/Amsterdam", "US/Pacific"])},
+        "payload": {
+            "rule_kind": f"kind-{rng.randrange(8)}",
+            "windows": [
+                {"kind": "avoid", "start_time_local": f"{hour}:{minute:02d}", "end_time_local": "23:59"}
+            ],
+        },
+        "lifecycle": {"uid": uid},
+    }
+
+
+async def test_dedupe_is_incremental_and_batches_writes_under_the_cap() -> None:
+    rng = random.Random(5)
+    records = {f"u{i}": _realistic_constraint(rng, f"u{i}") for i in range(150)}
+    for i in range(50):
+        records[f"d{i}"] = {**records[f"u{i}"], "lifecycle": {"uid": f"d{i}"}}
+    client = _DictClient(records)
+    store = ClientBackedDurableConstraintStore(client=client)
+
+    first = await store.dedupe_constraints(limit=500)
+    assert first["scanned"] == 200 and first["duplicates_archived"] == 50
+    assert first["failed_archives"] == 0
+    assert 1 < client.peak_writes <= 4
+
+    again = await store.dedupe_constraints(limit=500)
+    assert again["scanned"] == 0 and again["duplicates_found"] == 0
+
+    copy = {**records["u60"], "lifecycle": {"uid": "copy"}}
+    await store.upsert_constraint(record={"constraint_record": copy})
+    match = await store.find_equivalent_constraint(record={"constraint_record": copy})
+    assert match is not None and match["uid"] in {"u60", "copy"}
+    latest = await store.dedupe_constraints(limit=500)
+    assert latest["scanned"] == 2 and latest["duplicates_archived"] == 1
+    # Each pass re-lists the backend but only re-reads rows whose version
+    # moved: hydrate, canonical refreshes, archived rows, then the copy.
+    assert client.query_calls == 3
+    assert client.get_calls == 200 + 50 + 50 + 1 + 1
+
+
+async def test_identity_index_picks_up_writes_that_bypass_the_adapter() -> None:
+    rng = random.Random(7)
+    records = {f"u{i}": _realistic_constraint(rng, f"u{i}") for i in range(20)}
+    client = _DictClient(records)
+    clock = [0.0]
+    store = ClientBackedDurableConstraintStore(
+        client=client, identity_index_ttl_s=60.0, clock=lambda: clock[0]
+    )
+    assert (await store.dedupe_constraints(limit=50))["duplicates_found"] == 0
+
+    # Another process (or a direct Notion edit) copies u3 and drops u4.
+    copy = {**records["u3"], "lifecycle": {"uid": "external"}}
+    client.put("external", copy)
+    del client.records["u4"]
+    removed = {"constraint_record": records.get("u5")}
+    probe = {"constraint_record": {**copy, "lifecycle": {"uid": "probe"}}}
+    assert (await store.find_equivalent_constraints(records=[probe]))["probe"]["uid"] == "u3"
+
+    clock[0] = 61.0
+    gets = client.get_calls
+    match = await store.find_equivalent_constraints(records=[probe, removed])
+    assert match["probe"]["uid"] in {"u3", "external"}
+    assert client.get_calls == gets + 1
+
+    result = await store.dedupe_constraints(limit=50)
+    assert result["duplicates_archived"] == 1 and result["indexed"] == 20
+
+
+async def test_equivalence_lookups_on_large_stores_reuse_the_index() -> None:
+    """500 batched equivalence lookups against 5000 stored constraints."""
+    rng = random.Random(11)
+    client = _DictClient({f"u{i}": _realistic_constraint(rng, f"u{i}") for i in range(5000)})
+    store = ClientBackedDurableConstraintStore(client=client, clock=lambda: 0.0)
+    incoming = [
+        {"constraint_record": _realistic_constraint(rng, f"q{i}")} for i in range(250)
+    ] + [{"constraint_record": client.records[f"u{i}"]} for i in range(250)]
+
+    await store.find_equivalent_constraints(records=incoming[:1])
+    assert client.query_calls == 1 and client.get_calls == 5000
+
+    matches = await store.find_equivalent_constraints(records=incoming)
+    assert all(f"u{i}" in matches for i in range(250))
+    # Lookups are answered from the identity index: no backend reads.
+    assert client.query_calls == 1 and client.get_calls == 5000
+
+
+async def test_callers_of_one_backend_share_an_identity_index() -> None:
+    key = durable_store_share_key("Graphiti", user_id="u1")
+    assert key == "graphiti:u1" and durable_store_share_key("constraint_mcp") == "constraint_mcp"
+    first_client, second_client = _DictClient({}), _DictClient({})
+    first = build_durable_constraint_store(first_client, share_key=key)
+    second = build_durable_constraint_store(second_client, share_key=key)
+    # Each caller keeps its own client; only the identity index is shared.
+    assert second is not first and second.client is second_client
+    assert first.client is first_client
+    assert second._identity_index is first._identity_index
+
+    def _index(client, share_key=None):
+        return build_durable_constraint_store(client, share_key=share_key)._identity_index
+
+    assert _index(_DictClient({}), "graphiti:u2") is not first._identity_index
+    assert _index(_ClientWithCoreMethods(), key) is not first._identity_index
+    assert _index(_DictClient({})) is not first._identity_index
+
+
 def test_build_constraint_json_patch_ops_uses_framework_patch() -> None:
     current = {
         "name": "No calls after 17:00",
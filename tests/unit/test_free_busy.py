@@ -0,0 +1,110 @@
+"""Unit tests for the calendar free/busy engine."""
+
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from fateforger.adapters.calendar.free_busy import (
+    BusyIndex,
+    find_slots,
+    working_windows,
+)
+
+TZ = ZoneInfo("Europe/Amsterdam")
+
+
+def _at(day: int, hour: int, minute: int = 0) -> datetime:
+    return datetime(2026, 2, day, hour, minute, tzinfo=TZ)
+
+
+def test_index_merges_overlaps_and_answers_point_queries() -> None:
+    index = BusyIndex(
+        [
+            (_at(16, 10), _at(16, 11)),
+            (_at(16, 10, 30), _at(16, 12)),
+            (_at(16, 12), _at(16, 12, 15)),
+            (_at(16, 14), _at(16, 14)),  # empty: ignored
+            (_at(16, 15), _at(16, 16)),
+        ]
+    )
+    assert index.intervals() == [
+        (_at(16, 10), _at(16, 12, 15)),
+        (_at(16, 15), _at(16, 16)),
+    ]
+    assert index.is_busy(_at(16, 11)) and not index.is_busy(_at(16, 12, 15))
+    assert list(index.free_gaps(_at(16, 11), _at(16, 17))) == [
+        (_at(16, 12, 15), _at(16, 15)),
+        (_at(16, 16), _at(16, 17)),
+    ]
+
+
+def test_find_slots_ranks_one_candidate_per_gap_across_the_horizon() -> None:
+    index = BusyIndex(
+        [
+            (_at(16, 9), _at(16, 17, 45)),  # day one fully booked but 15 min
+            (_at(17, 10), _at(17, 10, 20)),  # too-short gap before it
+            (_at(17, 11), _at(17, 13)),
+        ]
+    )
+    windows = working_windows(
+        not_before=_at(16, 8),
+        days=3,
+        tz=TZ,
+        work_start=time(9, 0),
+        work_end=time(18, 0),
+    )
+    assert len(windows) == 3 and windows[0] == (_at(16, 9), _at(16, 18))
+
+    slots = find_slots(index, windows=windows, duration=timedelta(minutes=30), limit=3)
+    assert [(slot.start, slot.end) for slot in slots] == [
+        (_at(17, 9), _at(17, 9, 30)),
+        (_at(17, 10, 20), _at(17, 10, 50)),
+        (_at(17, 13), _at(17, 13, 30)),
+    ]
+    assert slots[1].slack == timedelta(minutes=10)
+
+    # The first window is clipped to ``not_before``; past windows are dropped.
+    late = working_windows(
+        not_before=_at(16, 19), days=2, tz=TZ, work_start=time(9), work_end=time(18)
+    )
+    assert late == [(_at(17, 9), _at(17, 18))]
+
+
+class _CountingList(list):
+    """List that counts item reads (bisection probes and gap-walk steps)."""
+
+    def __init__(self, items) -> None:
+        super().__init__(items)
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        return super().__getitem__(key)
+
+
+def test_slot_queries_on_dense_calendars_touch_only_their_window() -> None:
+    """Queries on a 10k-event index read O(log n + k) entries, not all of them."""
+    base = _at(1, 0)
+    events = [
+        (base + timedelta(minutes=30 * i), base + timedelta(minutes=30 * i + 25))
+        for i in range(10_000)
+    ]
+    index = BusyIndex(events)
+    assert len(index) == 10_000
+    index._starts = _CountingList(index._starts)
+    index._ends = _CountingList(index._ends)
+    window = (events[-4][0], events[-1][1] + timedelta(hours=1))
+
+    slots = find_slots(
+        index, windows=[window], duration=timedelta(minutes=30), limit=1
+    )
+
+    assert [(slot.start, slot.gap_end) for slot in slots] == [
+        (events[-1][1], window[1])
+    ]
+    # ~14 bisection probes plus a few steps per interval in the window.
+    assert index._starts.reads + index._ends.reads < 64
+    assert list(index.free_gaps(*window)) == [
+        (events[i][1], events[i + 1][0]) for i in range(-4, -1)
+    ] + [(events[-1][1], window[1])]
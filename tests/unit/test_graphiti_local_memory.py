@@ -0,0 +1,125 @@
+"""Unit tests for the local Graphiti memory backend (JSONL log + index)."""
+
+from __future__ import annotations
+
+import json
+import random
+
+import pytest
+from autogen_core.memory import MemoryContent
+
+from fateforger.agents.timeboxing.graphiti_constraint_memory import (
+    GraphitiConstraintMemoryClient,
+    _GraphitiLocalMemoryBackend,
+)
+
+
+def _legacy_rank(rows: list[dict], user_id: str, query: str, limit: int) -> list[str]:
+    """The original full-scan ranking, returning memory ids."""
+    terms = [term for term in query.lower().split() if term]
+    scored = []
+    for row in rows:
+        metadata = dict(row.get("metadata") or {})
+        row_user = str(metadata.get("user_id") or "").strip()
+        if row_user and row_user != user_id:
+            continue
+        blob = (
+            str(row.get("content") or "")
+            + " "
+            + json.dumps(metadata, ensure_ascii=True, sort_keys=True)
+        ).lower()
+        score = sum(1 for term in terms if term in blob)
+        scored.append((score, str(metadata.get("updated_at") or ""), row))
+    scored.sort(key=lambda item: (-item[0], item[1]))
+    return [row["metadata"]["memory_id"] for _, _, row in scored[:limit]]
+
+
+def _row(index: int, rng: random.Random) -> dict:
+    words = ["sleep", "gym", "lunch", "deep", "work", "commute", "Focus", "walk"]
+    return {
+        "content": " ".join(rng.sample(words, 3)),
+        "mime_type": "text/plain",
+        "metadata": {
+            "memory_id": f"m{index}",
+            "uid": f"tb:{rng.choice(words).lower()}",
+            "updated_at": f"2026-01-{rng.randint(1, 9):02d}",
+            "user_id": rng.choice(["u1", "u1", "u2", ""]),
+        },
+        "created_at": "2026-01-01",
+    }
+
+
+@pytest.mark.asyncio
+async def test_indexed_query_matches_full_scan_ranking(tmp_path) -> None:
+    rng = random.Random(7)
+    rows = [_row(index, rng) for index in range(300)]
+    path = tmp_path / "graphiti_memory.json"
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+    backend = _GraphitiLocalMemoryBackend(path=str(path), user_id="u1", limit=50)
+
+    for query in ("", "sleep", "uid:tb:gym deep", "focus focus", "nothing", "m1"):
+        for limit in (1, 25, 400):
+            result = await backend.query(query, limit=limit)
+            got = [memory.metadata["memory_id"] for memory in result.results]
+            assert got == _legacy_rank(rows, "u1", query, limit), (query, limit)
+
+
+@pytest.mark.asyncio
+async def test_adds_append_and_legacy_or_torn_logs_are_compacted(tmp_path) -> None:
+    path = tmp_path / "graphiti_memory.json"
+    legacy = [{"content": "old sleep", "metadata": {"memory_id": "a", "user_id": "u1"}}]
+    path.write_text(json.dumps(legacy), encoding="utf-8")
+
+    backend = _GraphitiLocalMemoryBackend(path=str(path), user_id="u1", limit=10)
+    assert path.read_text(encoding="utf-8").startswith("{")
+    await backend.add(MemoryContent(content="new gym", mime_type="text/plain"))
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2 and json.loads(lines[1])["content"] == "new gym"
+
+    # A torn final write is dropped on reload and the log is rewritten.
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write('{"content": "torn')
+    reloaded = _GraphitiLocalMemoryBackend(path=str(path), user_id="u1", limit=10)
+    result = await reloaded.query("gym", limit=10)
+    assert [memory.content for memory in result.results] == ["new gym", "old sleep"]
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 2
+
+
+@pytest.mark.asyncio
+async def test_streamed_load_appends_and_indexed_query_at_10k_rows(tmp_path) -> None:
+    rng = random.Random(10_000)
+    path = tmp_path / "graphiti_memory.json"
+    with path.open("w", encoding="utf-8") as handle:
+        for index in range(10_000):
+            handle.write(json.dumps(_row(index, rng)) + "\n")
+
+    backend = _GraphitiLocalMemoryBackend(path=str(path), user_id="u1", limit=200)
+    for index in range(1_000):
+        await backend.add(
+            MemoryContent(content=f"note {index}", mime_type="text/plain")
+        )
+    result = await backend.query("tb:walk", limit=200)
+
+    logged = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    got = [memory.metadata["memory_id"] for memory in result.results]
+    assert len(logged) == 11_000
+    assert len(got) == 200
+    assert all("walk" in m.metadata["uid"] for m in result.results)
+    assert got == _legacy_rank(logged, "u1", "tb:walk", 200)
+
+
+@pytest.mark.asyncio
+async def test_constraint_index_hydrates_from_the_full_log(tmp_path) -> None:
+    path = str(tmp_path / "graphiti_memory.json")
+    writer = GraphitiConstraintMemoryClient(user_id="u1", local_config={"path": path})
+    for uid, status in (("tb:a", "locked"), ("tb:b", "proposed"), ("tb:a", "declined")):
+        await writer.upsert_constraint(
+            record={"name": uid, "status": status, "lifecycle": {"uid": uid}}
+        )
+
+    reader = GraphitiConstraintMemoryClient(user_id="u1", local_config={"path": path})
+    rows = await reader.query_constraints(
+        filters={"statuses_any": ["declined", "proposed"], "require_active": False}
+    )
+    assert sorted(row["uid"] for row in rows) == ["tb:a", "tb:b"]
+    assert len(reader._constraint_index) == 2
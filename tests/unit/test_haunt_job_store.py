@@ -0,0 +1,275 @@
+"""Unit tests for the durable haunt job store."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from fateforger.haunt.job_store import (
+    DurableJobScheduler,
+    JobSpec,
+    SqlAlchemyJobStore,
+    ensure_job_store_schema,
+)
+from fateforger.haunt.messages import FollowUpSpec
+from fateforger.haunt.planning_guardian import PlanningGuardian
+from fateforger.haunt.planning_store import PlanningAnchorPayload
+from fateforger.haunt.reconcile import PLANNING_REMINDER_JOB_KIND, PlanningReconciler
+from fateforger.haunt.service import HauntingService
+
+NOW = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+
+class _Scheduler:
+    """Records the APScheduler jobs added (only the window loader)."""
+
+    def __init__(self) -> None:
+        self.jobs: dict[str, dict] = {}
+
+    def add_job(self, func, trigger=None, id=None, **kwargs):
+        self.jobs[id] = {"func": func, "trigger": trigger, **kwargs}
+
+    def remove_job(self, job_id):
+        self.jobs.pop(job_id, None)
+
+    def get_jobs(self):
+        return []
+
+
+def _durable(store, *, now=NOW, **kwargs) -> DurableJobScheduler:
+    """Durable scheduler on a frozen timer clock (fired via ``fire_due``)."""
+    return DurableJobScheduler(
+        _Scheduler(), store, now=lambda: now, timer_clock=lambda: 0.0, **kwargs
+    )
+
+
+@pytest.fixture
+async def store():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    await ensure_job_store_schema(engine)
+    yield SqlAlchemyJobStore(async_sessionmaker(engine, expire_on_commit=False))
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_load_window_pages_clamps_and_drops_misfired(store) -> None:
+    for minutes in (-30, -1, 5, 10, 20, 50, 90):
+        await store.upsert(
+            JobSpec(
+                job_id=f"job{minutes}",
+                kind="k",
+                run_at=NOW + timedelta(minutes=minutes),
+                payload={"m": minutes},
+                misfire_grace_s=300,
+            )
+        )
+    durable = _durable(store, window=timedelta(hours=1), batch_size=2)
+
+    assert await durable.start() == 5
+    assert set(durable._scheduler.jobs) == {"durable_jobs:load_window"}
+    armed = [m for m in (-30, -1, 5, 10, 20, 50, 90) if durable.is_armed(f"job{m}")]
+    assert armed == [-1, 5, 10, 20, 50]
+    # Overdue within grace: due immediately on the (frozen) timer clock.
+    assert durable._timers.deadline("job-1") == 0.0
+    assert await store.get("job-30") is None
+    # Beyond the window: stored, not materialized until a later load.
+    await durable.schedule(
+        JobSpec(job_id="late", kind="k", run_at=NOW + timedelta(hours=3))
+    )
+    assert not durable.is_armed("late")
+    assert (await store.get("late")).run_at == NOW + timedelta(hours=3)
+
+
+@pytest.mark.asyncio
+async def test_followups_survive_restart_and_cancel_before_loading(store) -> None:
+    clock = {"now": NOW.replace(tzinfo=None)}
+    spec = FollowUpSpec(should_schedule=True, after=timedelta(minutes=10), max_attempts=3)
+
+    first = HauntingService(
+        _Scheduler(),
+        now=lambda: clock["now"],
+        job_scheduler=_durable(store),
+    )
+    for message_id, topic in (("m1", "T1"), ("m2", "T2")):
+        await first.schedule_followup(
+            message_id=message_id,
+            topic_id=topic,
+            task_id=None,
+            user_id="U1",
+            content="hello",
+            spec=spec,
+        )
+
+    # "Restart": fresh service and scheduler over the same store.
+    durable = _durable(store, now=NOW + timedelta(minutes=10))
+    second = HauntingService(
+        _Scheduler(), now=lambda: clock["now"], job_scheduler=durable
+    )
+    due = []
+
+    async def _dispatch(event):
+        due.append(event)
+
+    second.set_dispatcher(_dispatch)
+    assert (await second.get_followup("m2")).content == "hello"
+    assert await second.record_user_activity(topic_id="T2", task_id=None) == 1
+    assert await store.get("haunt-followup::m2") is None
+
+    assert await durable.start() == 1
+    clock["now"] = (NOW + timedelta(minutes=10)).replace(tzinfo=None)
+    assert await durable.fire_due() == 1
+
+    assert [(d.message_id, d.attempt) for d in due] == [("m1", 0)]
+    rescheduled = await store.get("haunt-followup::m1")
+    assert rescheduled.payload["attempt"] == 1
+    assert rescheduled.run_at == NOW + timedelta(minutes=30)
+
+
+class _Calendar:
+    async def list_events(self, **_):
+        return []
+
+    async def get_event(self, **_):
+        return None
+
+
+class _Anchors:
+    async def list_all(self):
+        return [
+            PlanningAnchorPayload(
+                user_id=user_id, channel_id="D", calendar_id="primary", event_id=""
+            )
+            for user_id in ("U1", "U2")
+        ]
+
+
+@pytest.mark.asyncio
+async def test_planning_nudges_persist_and_startup_skips_scheduled_users(store) -> None:
+    durable = _durable(store)
+    reconciler = PlanningReconciler(
+        _Scheduler(), calendar_client=_Calendar(), job_scheduler=durable
+    )
+    desired = await reconciler.reconcile_missing_planning(scope="U1", now=NOW)
+    stored = await store.find(kind=PLANNING_REMINDER_JOB_KIND, scope="U1")
+    assert {s.job_id for s in stored} == {job.key.as_id() for job in desired}
+    assert stored and stored[0].payload["scope"] == "U1"
+
+    guardian = PlanningGuardian(
+        _Scheduler(), anchor_store=_Anchors(), reconciler=reconciler, now=lambda: NOW
+    )
+    report = await guardian.reconcile_all(skip_scheduled=True)
+    assert report.skipped == 1 and report.users == 1
+
+
+@pytest.mark.asyncio
+async def test_window_load_during_a_running_job_does_not_rearm_it(store) -> None:
+    durable = _durable(store)
+    calls: list[str] = []
+
+    async def _handler(spec: JobSpec) -> None:
+        calls.append(spec.job_id)
+        # The periodic loader runs while the handler is still awaiting.
+        assert await durable.load_window() == 0
+        assert not durable.is_armed(spec.job_id)
+
+    durable.register("k", _handler)
+    await durable.start()
+    await durable.schedule(JobSpec(job_id="once", kind="k", run_at=NOW))
+
+    assert await durable.fire_due() == 1
+    assert await store.get("once") is None
+    await durable.load_window()
+    assert await durable.fire_due() == 0
+    assert calls == ["once"]
+    assert durable._in_flight == {}
+
+
+async def _settle() -> None:
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_reply_cancel_queued_ahead_of_a_popped_timer_wins(store) -> None:
+    durable = _durable(store)
+    service = HauntingService(
+        _Scheduler(), now=lambda: NOW.replace(tzinfo=None), job_scheduler=durable
+    )
+    due = []
+
+    async def _dispatch(event):
+        due.append(event)
+
+    service.set_dispatcher(_dispatch)
+    await durable.start()
+    await service.schedule_followup(
+        message_id="m1",
+        topic_id="T1",
+        task_id="t1",
+        content="hello",
+        spec=FollowUpSpec(
+            should_schedule=True, after=timedelta(minutes=10), max_attempts=3
+        ),
+    )
+    await service.load_stored_followups()
+    durable._timers.schedule("haunt-followup::m1", 0)
+
+    # The reply queues on the lock first, then the timer pops behind it.
+    async with service._lock:
+        cancel = asyncio.create_task(service.record_user_activity_bulk(task_ids=["t1"]))
+        await _settle()
+        fire = asyncio.create_task(durable.fire_due())
+        await _settle()
+
+    assert (await cancel).cancelled == 1
+    assert await fire == 1
+    assert due == []
+    assert await store.get("haunt-followup::m1") is None
+    assert await service.get_followup("m1") is None
+
+
+@pytest.mark.asyncio
+async def test_followup_store_writes_run_off_the_lock(store) -> None:
+    durable = _durable(store)
+    service = HauntingService(
+        _Scheduler(), now=lambda: NOW.replace(tzinfo=None), job_scheduler=durable
+    )
+    service.set_dispatcher(lambda event: asyncio.sleep(0))
+    await durable.start()
+    writes: list[tuple[str, bool]] = []
+    schedule, cancel = durable.schedule, durable.cancel
+
+    async def _schedule(spec):
+        writes.append(("schedule", service._lock.locked()))
+        return await schedule(spec)
+
+    async def _cancel(job_ids):
+        writes.append(("cancel", service._lock.locked()))
+        return await cancel(job_ids)
+
+    durable.schedule, durable.cancel = _schedule, _cancel
+    for message_id, max_attempts in (("m1", 2), ("m2", 1)):
+        await service.schedule_followup(
+            message_id=message_id,
+            topic_id=message_id,
+            task_id=None,
+            content="hello",
+            spec=FollowUpSpec(
+                should_schedule=True,
+                after=timedelta(minutes=10),
+                max_attempts=max_attempts,
+            ),
+        )
+    await service._dispatch_due(["m1", "m2"])
+
+    assert writes == [
+        ("schedule", False),
+        ("schedule", False),
+        ("cancel", False),
+        ("schedule", False),
+    ]
+    assert (await store.get("haunt-followup::m1")).payload["attempt"] == 1
+    assert await store.get("haunt-followup::m2") is None
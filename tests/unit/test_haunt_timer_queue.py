@@ -0,0 +1,133 @@
+"""Unit tests for the heap-based follow-up timer queue."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from fateforger.haunt import timer_queue as timer_queue_module
+from fateforger.haunt.messages import FollowUpSpec
+from fateforger.haunt.service import HauntingService
+from fateforger.haunt.timer_queue import TimerQueue
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def _noop(_keys: list[str]) -> None:
+    return None
+
+
+def test_reschedule_cancel_and_batched_pop_in_deadline_order() -> None:
+    clock = _Clock()
+    timers = TimerQueue(_noop, max_batch=2, clock=clock)
+    for key, delay in (("a", 30), ("b", 10), ("c", 20), ("d", 5)):
+        timers.schedule(key, delay)
+    timers.schedule("a", 1)  # supersedes the 30s entry
+    assert timers.cancel("d") and not timers.cancel("d")
+    assert len(timers) == 3 and timers.next_deadline() == 1
+
+    clock.now = 25
+    assert timers.pop_due() == ["a", "b"]
+    assert timers.pop_due() == ["c"]
+    clock.now = 100
+    assert timers.pop_due() == [] and len(timers) == 0
+
+
+def test_cancelled_entries_are_compacted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(timer_queue_module, "_COMPACT_MIN_STALE", 4)
+    timers = TimerQueue(_noop, clock=_Clock())
+    for index in range(10):
+        timers.schedule(f"k{index}", index)
+    assert timers.cancel_many(f"k{index}" for index in range(8)) == 8
+    assert len(timers._heap) == 2 and timers.next_deadline() == 8
+
+
+@pytest.mark.asyncio
+async def test_background_task_fires_due_keys_as_one_batch() -> None:
+    batches: list[list[str]] = []
+    fired = asyncio.Event()
+
+    async def _on_due(keys: list[str]) -> None:
+        batches.append(keys)
+        fired.set()
+
+    timers = TimerQueue(_on_due)
+    try:
+        timers.schedule("late", 60)
+        # An earlier deadline wakes the sleeping task.
+        for key in ("x", "y", "z"):
+            timers.schedule(key, 0.01)
+        await asyncio.wait_for(fired.wait(), timeout=1)
+        assert batches == [["x", "y", "z"]]
+        assert "late" in timers
+    finally:
+        await timers.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_batches_do_not_hold_back_later_deadlines() -> None:
+    release = asyncio.Event()
+    fired: list[list[str]] = []
+    second = asyncio.Event()
+
+    async def _on_due(keys: list[str]) -> None:
+        fired.append(keys)
+        if keys == ["slow"]:
+            await release.wait()
+        else:
+            second.set()
+
+    timers = TimerQueue(_on_due)
+    timers.schedule("slow", 0)
+    timers.schedule("next", 0.02)
+    await asyncio.wait_for(second.wait(), timeout=1)
+    assert fired == [["slow"], ["next"]]
+
+    closing = asyncio.create_task(timers.close())
+    await asyncio.sleep(0)
+    assert not closing.done()  # close() waits for the in-flight batch
+    release.set()
+    await asyncio.wait_for(closing, timeout=1)
+    assert not timers._dispatches
+
+
+@pytest.mark.asyncio
+async def test_haunting_service_schedules_and_cancels_followups_on_one_heap() -> None:
+    """Follow-ups share the timer heap instead of one scheduler job each."""
+    n, topics = 500, 50
+    base_now = datetime(2025, 1, 1, 9, 0)
+    service = HauntingService(scheduler=None, now=lambda: base_now)
+    spec = FollowUpSpec(
+        should_schedule=True,
+        after=timedelta(hours=1),
+        max_attempts=2,
+        cancel_on_user_reply=True,
+    )
+
+    for index in range(n):
+        await service.schedule_followup(
+            message_id=f"m{index}",
+            topic_id=f"topic-{index % topics}",
+            task_id=None,
+            content="ping",
+            spec=spec,
+        )
+    assert len(service._timers) == n
+
+    cancelled = 0
+    for topic in range(topics):
+        cancelled += await service.record_user_activity(
+            topic_id=f"topic-{topic}", task_id=None
+        )
+    await service.close()
+
+    assert cancelled == n and len(service._timers) == 0
+    assert service._timers.next_deadline() is None
@@ -0,0 +1,208 @@
+"""Unit tests for bulk follow-up cancellation on ``HauntingService``."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from fateforger.haunt.job_store import (
+    DurableJobScheduler,
+    SqlAlchemyJobStore,
+    ensure_job_store_schema,
+)
+from fateforger.haunt.messages import FollowUpSpec
+from fateforger.haunt.service import FollowUpCancelReport, HauntingService
+
+NOW = datetime(2025, 1, 1, 9, 0)
+
+
+def _spec(*, cancel_on_user_reply: bool = True) -> FollowUpSpec:
+    return FollowUpSpec(
+        should_schedule=True,
+        after=timedelta(minutes=30),
+        max_attempts=2,
+        cancel_on_user_reply=cancel_on_user_reply,
+    )
+
+
+async def _schedule(service: HauntingService, rows) -> None:
+    for message_id, topic_id, task_id, user_id, replies in rows:
+        await service.schedule_followup(
+            message_id=message_id,
+            topic_id=topic_id,
+            task_id=task_id,
+            user_id=user_id,
+            content="ping",
+            spec=_spec(cancel_on_user_reply=replies),
+        )
+
+
+class _CountingLock:
+    def __init__(self) -> None:
+        self.acquisitions = 0
+
+    async def __aenter__(self) -> None:
+        self.acquisitions += 1
+
+    async def __aexit__(self, *_exc) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_bulk_activity_cancels_in_one_pass_and_keeps_sticky_followups() -> None:
+    service = HauntingService(scheduler=None, now=lambda: NOW)
+    await _schedule(
+        service,
+        [
+            ("m1", "T1", None, "U1", True),
+            ("m2", "T2", None, "U1", True),
+            ("m3", "T3", "task-a", "U2", True),
+            ("m4", "T4", None, "U2", False),
+            ("m5", "T5", None, "U3", True),
+        ],
+    )
+    lock = _CountingLock()
+    service._lock = lock
+
+    report = await service.record_user_activity_bulk(
+        topic_ids=["T1", "T4", "missing"], task_ids=["task-a"], user_ids=["U1"]
+    )
+
+    assert report == FollowUpCancelReport(matched=4, cancelled=3, kept=1, stored=0)
+    assert lock.acquisitions == 1
+    assert set(service._pending) == {"m4", "m5"}
+    assert "U1" not in service._user_index and "task-a" not in service._task_index
+    assert len(service._timers) == 2
+
+    explicit = await service.cancel_followups_bulk(user_ids=["U2", "U3"])
+    assert explicit.cancelled == 2 and explicit.kept == 0
+    assert not service._pending and len(service._timers) == 0
+    await service.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_cancel_reaches_stored_followups_by_user() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        await ensure_job_store_schema(engine)
+        store = SqlAlchemyJobStore(async_sessionmaker(engine, expire_on_commit=False))
+
+        def _durable() -> DurableJobScheduler:
+            return DurableJobScheduler(
+                None,
+                store,
+                now=lambda: NOW.replace(tzinfo=timezone.utc),
+                timer_clock=lambda: 0.0,
+            )
+
+        before = HauntingService(None, now=lambda: NOW, job_scheduler=_durable())
+        await _schedule(
+            before,
+            [("m1", "T1", None, "U1", True), ("m2", "T2", None, "U1", False)],
+        )
+
+        after = HauntingService(None, now=lambda: NOW, job_scheduler=_durable())
+        activity = await after.record_user_activity_bulk(user_ids=["U1"])
+        assert activity == FollowUpCancelReport(matched=2, cancelled=1, kept=1, stored=1)
+
+        explicit = await after.cancel_followups_bulk(message_ids=["m2", "nope"])
+        assert explicit.cancelled == 1 and explicit.stored == 1
+        assert await store.find_any(kind="haunt.followup", user_ids=["U1"]) == []
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_activity_hot_path_stays_in_memory_and_off_the_lock() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        await ensure_job_store_schema(engine)
+        store = SqlAlchemyJobStore(async_sessionmaker(engine, expire_on_commit=False))
+        durable = DurableJobScheduler(
+            None, store, now=lambda: NOW.replace(tzinfo=timezone.utc), timer_clock=lambda: 0.0
+        )
+        before = HauntingService(None, now=lambda: NOW, job_scheduler=durable)
+        await _schedule(before, [("m1", "T1", None, "U1", True)])
+
+        after = HauntingService(None, now=lambda: NOW, job_scheduler=durable)
+        reads: list[str] = []
+        reads_under_lock: list[bool] = []
+        deletes_under_lock: list[bool] = []
+        find_pages, cancel = durable.find_pages, durable.cancel
+
+        async def _find_pages(**filters):
+            reads.append("find_pages")
+            async for page in find_pages(**filters):
+                reads_under_lock.append(after._lock.locked())
+                yield page
+
+        async def _find_any(**keys):
+            reads.append("find_any")
+            return []
+
+        async def _cancel(job_ids):
+            deletes_under_lock.append(after._lock.locked())
+            return await cancel(job_ids)
+
+        durable.find_pages, durable.find_any, durable.cancel = (
+            _find_pages,
+            _find_any,
+            _cancel,
+        )
+
+        for _ in range(3):
+            await after.record_user_activity_bulk(topic_ids=["T9"], user_ids=["U9"])
+        report = await after.record_user_activity_bulk(user_ids=["U1"])
+
+        assert report == FollowUpCancelReport(matched=1, cancelled=1, kept=0, stored=1)
+        assert reads == ["find_pages"]
+        assert reads_under_lock == [False]
+        assert deletes_under_lock == [False]
+        assert await store.find(kind="haunt.followup") == []
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_startup_load_pages_stored_followups_once() -> None:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        await ensure_job_store_schema(engine)
+        store = SqlAlchemyJobStore(async_sessionmaker(engine, expire_on_commit=False))
+        durable = DurableJobScheduler(
+            None,
+            store,
+            batch_size=2,
+            now=lambda: NOW.replace(tzinfo=timezone.utc),
+            timer_clock=lambda: 0.0,
+        )
+        before = HauntingService(None, now=lambda: NOW, job_scheduler=durable)
+        await _schedule(
+            before, [(f"m{i}", f"T{i}", None, "U1", True) for i in range(5)]
+        )
+
+        after = HauntingService(None, now=lambda: NOW, job_scheduler=durable)
+        pages: list[int] = []
+        by_kind = store.by_kind
+
+        async def _by_kind(kind, **kwargs):
+            page = await by_kind(kind, **kwargs)
+            pages.append(len(page))
+            return page
+
+        store.by_kind = _by_kind
+        loads = await asyncio.gather(
+            after.load_stored_followups(), after.load_stored_followups()
+        )
+
+        assert loads == [5, 5]
+        assert pages == [2, 2, 1]
+        assert await after.load_stored_followups() == 0
+        report = await after.record_user_activity_bulk(user_ids=["U1"])
+        assert report.cancelled == 5 and report.stored == 5
+        assert pages == [2, 2, 1]
+    finally:
+        await engine.dispose()
@@ -0,0 +1,227 @@
+"""Unit tests for MCP adaptive timeouts and circuit breaking."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from fateforger.adapters.calendar.read_cache import CalendarReadCache
+from fateforger.tools.mcp_call_policy import (
+    CircuitState,
+    McpCallPolicy,
+    McpCallPolicyConfig,
+    McpCircuitOpenError,
+)
+from fateforger.tools.mcp_pool import McpPoolPolicy, McpWorkbenchPool
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _policy(clock: _Clock, **overrides: float) -> McpCallPolicy:
+    config = {
+        "base_timeout_s": 10.0,
+        "min_timeout_s": 0.5,
+        "max_timeout_s": 20.0,
+        "min_samples": 5,
+        "failure_threshold": 2,
+        "open_cooldown_s": 30.0,
+        **overrides,
+    }
+    return McpCallPolicy(McpCallPolicyConfig(**config), clock=clock)
+
+
+async def _ok() -> str:
+    return "ok"
+
+
+async def _boom() -> str:
+    raise RuntimeError("connection refused")
+
+
+def test_timeout_adapts_to_p99_within_clamps() -> None:
+    clock = _Clock()
+    policy = _policy(clock)
+    assert policy.timeout_for("cal", "list-events") == 10.0
+
+    state = policy._tool("cal", "list-events")
+    for latency in (0.1, 0.2, 0.2, 0.3, 1.5):
+        policy._on_success("cal", "list-events", state, latency)
+    assert policy.timeout_for("cal", "list-events") == pytest.approx(3.0)
+
+    for _ in range(5):
+        policy._on_success("cal", "list-events", state, 0.01)
+    assert policy.timeout_for("cal", "list-events") == pytest.approx(3.0)
+    state.latencies.clear()
+    for _ in range(5):
+        policy._on_success("cal", "list-events", state, 0.01)
+    assert policy.timeout_for("cal", "list-events") == 0.5
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_fails_fast_and_recovers_through_probe() -> None:
+    clock = _Clock()
+    policy = _policy(clock)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            await policy.call("cal", "list-events", _boom)
+    assert policy.state("cal", "list-events") is CircuitState.OPEN
+
+    calls = 0
+
+    async def _counted() -> str:
+        nonlocal calls
+        calls += 1
+        return "ok"
+
+    with pytest.raises(McpCircuitOpenError) as excinfo:
+        await policy.call("cal", "list-events", _counted)
+    assert calls == 0 and excinfo.value.retry_after_s == pytest.approx(30.0)
+    # Other tools on the same server keep working.
+    assert await policy.call("cal", "get-event", _ok) == "ok"
+
+    clock.now = 31.0
+    assert policy.state("cal", "list-events") is CircuitState.HALF_OPEN
+    with pytest.raises(RuntimeError):
+        await policy.call("cal", "list-events", _boom)
+    assert policy.state("cal", "list-events") is CircuitState.OPEN
+
+    clock.now = 62.0
+    assert await policy.call("cal", "list-events", _counted) == "ok"
+    assert policy.state("cal", "list-events") is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_server_reported_errors_and_timeouts_are_classified() -> None:
+    clock = _Clock()
+    policy = _policy(clock, base_timeout_s=0.01, min_timeout_s=0.01)
+
+    class _Reported(Exception):
+        pass
+
+    async def _reported() -> str:
+        raise _Reported("bad arguments")
+
+    for _ in range(3):
+        with pytest.raises(_Reported):
+            await policy.call(
+                "cal",
+                "create-event",
+                _reported,
+                is_failure=lambda exc: not isinstance(exc, _Reported),
+            )
+    assert policy.state("cal", "create-event") is CircuitState.CLOSED
+
+    async def _slow() -> str:
+        await asyncio.sleep(1)
+        return "late"
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError):
+            await policy.call("cal", "list-events", _slow)
+    assert policy.state("cal", "list-events") is CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+async def test_pool_calls_run_under_the_call_policy() -> None:
+    class _DeadWorkbench:
+        async def start(self) -> None:
+            return None
+
+        async def stop(self) -> None:
+            return None
+
+        async def call_tool(self, name: str, arguments: object = None) -> str:
+            raise RuntimeError("Server disconnected")
+
+    clock = _Clock()
+    pool = McpWorkbenchPool(
+        McpPoolPolicy(health_interval_s=0.0),
+        factory=lambda _params: _DeadWorkbench(),
+        call_policy=_policy(clock),
+    )
+    proxy = pool.workbench(SimpleNamespace(url="http://calendar:3000/mcp"))
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="disconnected"):
+            await proxy.call_tool("list-events", arguments={})
+    with pytest.raises(McpCircuitOpenError, match="calendar:3000"):
+        await proxy.call_tool("list-events", arguments={})
+    assert [h.state for h in pool.call_policy.health()] == [CircuitState.OPEN]
+
+
+@pytest.mark.asyncio
+async def test_read_cache_serves_stale_window_while_circuit_is_open() -> None:
+    clock = _Clock()
+    cache = CalendarReadCache(ttl_s=60.0, stale_ttl_s=600.0, clock=clock)
+    tz = ZoneInfo("Europe/Amsterdam")
+    start, end = datetime(2026, 2, 14, tzinfo=tz), datetime(2026, 2, 15, tzinfo=tz)
+    event = {
+        "id": "standup",
+        "start": {"dateTime": "2026-02-14T09:00:00+01:00"},
+        "end": {"dateTime": "2026-02-14T09:15:00+01:00"},
+    }
+
+    async def _fetch() -> list[dict[str, object]]:
+        return [event]
+
+    async def _open() -> list[dict[str, object]]:
+        raise McpCircuitOpenError(server="cal", tool="list-events", retry_after_s=5)
+
+    await cache.list_events(calendar_id="primary", start=start, end=end, fetch=_fetch)
+    clock.now = 120.0
+    served = await cache.list_events(
+        calendar_id="primary", start=start, end=end, fetch=_open
+    )
+    assert served == [event] and cache.stats.stale_hits == 1
+
+    clock.now = 700.0
+    with pytest.raises(McpCircuitOpenError):
+        await cache.list_events(
+            calendar_id="primary", start=start, end=end, fetch=_open
+        )
+
+
+@pytest.mark.asyncio
+async def test_session_restart_is_not_timed_as_tool_latency() -> None:
+    class _SlowStartWorkbench:
+        async def start(self) -> None:
+            await asyncio.sleep(0.2)
+
+        async def stop(self) -> None:
+            return None
+
+        async def call_tool(self, name: str, arguments: object = None) -> str:
+            await asyncio.sleep(0.001)
+            return name
+
+    policy = McpCallPolicy(
+        McpCallPolicyConfig(
+            base_timeout_s=10.0, min_timeout_s=0.05, min_samples=5, failure_threshold=2
+        )
+    )
+    pool = McpWorkbenchPool(
+        McpPoolPolicy(size=1, health_interval_s=0.0),
+        factory=lambda _params: _SlowStartWorkbench(),
+        call_policy=policy,
+    )
+    params = SimpleNamespace(url="http://constraints/mcp")
+    for _ in range(10):
+        await pool.call_tool(params, "query")
+    assert policy.timeout_for("constraints", "query") == pytest.approx(0.05)
+
+    # The reconnect (0.2s) exceeds the adaptive timeout but is not timed.
+    await pool.reset(params)
+    for _ in range(3):
+        assert await pool.call_tool(params, "query") == "query"
+    assert policy.state("constraints", "query") is CircuitState.CLOSED
+    assert max(policy._tool("constraints", "query").latencies) < 0.05
@@ -0,0 +1,229 @@
+"""Unit tests for the shared MCP workbench pool."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from fateforger.tools.mcp_call_policy import McpCallPolicy, McpCallPolicyConfig
+from fateforger.tools.mcp_pool import McpPoolPolicy, McpWorkbenchPool, server_key
+
+
+class _FakeWorkbench:
+    """Records lifecycle calls; ``fail_next`` makes the next call raise."""
+
+    def __init__(self, registry: list["_FakeWorkbench"], delay_s: float = 0.0):
+        registry.append(self)
+        self.delay_s = delay_s
+        self.starts = 0
+        self.stops = 0
+        self.calls: list[str] = []
+        self.list_calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_next: Exception | None = None
+
+    async def start(self) -> None:
+        self.starts += 1
+
+    async def stop(self) -> None:
+        self.stops += 1
+
+    async def call_tool(self, name: str, arguments: Any = None) -> str:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_s)
+            if self.fail_next is not None:
+                exc, self.fail_next = self.fail_next, None
+                raise exc
+            self.calls.append(name)
+            return name
+        finally:
+            self.in_flight -= 1
+
+    async def list_tools(self) -> list[dict[str, str]]:
+        self.list_calls += 1
+        if self.fail_next is not None:
+            exc, self.fail_next = self.fail_next, None
+            raise exc
+        return [{"name": "list-events"}]
+
+
+def _params(url: str = "http://calendar/mcp", **headers: str) -> SimpleNamespace:
+    return SimpleNamespace(url=url, headers=headers or None)
+
+
+def _pool(
+    registry: list[_FakeWorkbench], *, delay_s: float = 0.0, **policy: Any
+) -> McpWorkbenchPool:
+    policy.setdefault("health_interval_s", 0.0)
+    return McpWorkbenchPool(
+        McpPoolPolicy(**policy),
+        factory=lambda _params: _FakeWorkbench(registry, delay_s=delay_s),
+    )
+
+
+def test_server_key_distinguishes_url_headers_and_stdio_command() -> None:
+    assert server_key(_params()) == server_key(_params())
+    assert server_key(_params()) != server_key(_params("http://other/mcp"))
+    assert server_key(_params(Authorization="a")) != server_key(
+        _params(Authorization="b")
+    )
+    stdio = SimpleNamespace(command="python", args=["server.py"], cwd="/repo")
+    assert server_key(stdio) != server_key(
+        SimpleNamespace(command="python", args=["other.py"], cwd="/repo")
+    )
+
+
+@pytest.mark.asyncio
+async def test_proxies_share_sessions_per_server() -> None:
+    registry: list[_FakeWorkbench] = []
+    pool = _pool(registry)
+
+    first = pool.workbench(_params())
+    second = pool.workbench(_params())
+    await first.call_tool("list-events", arguments={})
+    await second.call_tool("get-event", arguments={})
+    await pool.workbench(_params("http://ticktick/mcp")).call_tool("x")
+
+    assert len(registry) == 2
+    assert registry[0].calls == ["list-events", "get-event"]
+    assert registry[0].starts == 1
+
+    await first.stop()
+    assert registry[0].stops == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_spread_over_size_and_respect_concurrency() -> None:
+    registry: list[_FakeWorkbench] = []
+    pool = _pool(registry, delay_s=0.01, size=2, max_concurrency=3)
+    proxy = pool.workbench(_params())
+
+    await asyncio.gather(*(proxy.call_tool(f"t{i}") for i in range(9)))
+
+    assert len(registry) == 2
+    assert sum(len(wb.calls) for wb in registry) == 9
+    assert sum(wb.max_in_flight for wb in registry) <= 3
+
+
+@pytest.mark.asyncio
+async def test_transport_error_discards_session_and_next_call_reconnects() -> None:
+    registry: list[_FakeWorkbench] = []
+    pool = _pool(registry, size=1)
+    proxy = pool.workbench(_params())
+    await proxy.call_tool("warm")
+    registry[0].fail_next = RuntimeError("Server disconnected")
+
+    with pytest.raises(RuntimeError):
+        await proxy.call_tool("list-events")
+    await asyncio.sleep(0)
+    assert registry[0].stops == 1
+
+    assert await proxy.call_tool("list-events") == "list-events"
+    assert len(registry) == 2 and registry[1].starts == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_session_is_discarded_not_returned_to_the_pool() -> None:
+    registry: list[_FakeWorkbench] = []
+    pool = McpWorkbenchPool(
+        McpPoolPolicy(size=1, health_interval_s=0.0),
+        factory=lambda _params: _FakeWorkbench(registry),
+        call_policy=McpCallPolicy(
+            McpCallPolicyConfig(base_timeout_s=0.01, min_timeout_s=0.01)
+        ),
+    )
+    proxy = pool.workbench(_params())
+    await proxy.call_tool("warm")
+    registry[0].delay_s = 60.0
+
+    with pytest.raises(TimeoutError):
+        await proxy.call_tool("list-events")
+    await asyncio.sleep(0)
+    assert registry[0].stops == 1
+
+    assert await proxy.call_tool("list-events") == "list-events"
+    assert len(registry) == 2 and registry[1].calls == ["list-events"]
+
+
+@pytest.mark.asyncio
+async def test_tool_lists_are_cached_and_discovery_is_coalesced() -> None:
+    registry: list[_FakeWorkbench] = []
+    loads: list[object] = []
+
+    async def _loader(params: object) -> list[str]:
+        loads.append(params)
+        await asyncio.sleep(0.01)
+        return ["adapter"]
+
+    pool = McpWorkbenchPool(
+        McpPoolPolicy(health_interval_s=0.0),
+        factory=lambda _params: _FakeWorkbench(registry),
+        tool_loader=_loader,
+    )
+    proxy = pool.workbench(_params())
+    await proxy.list_tools()
+    await proxy.list_tools()
+    assert registry[0].list_calls == 1
+
+    results = await asyncio.gather(
+        pool.discover_tools(_params()), pool.discover_tools(_params())
+    )
+    assert results == [["adapter"], ["adapter"]]
+    await pool.discover_tools(_params())
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_warm_health_check_and_reset() -> None:
+    registry: list[_FakeWorkbench] = []
+    pool = _pool(registry, size=2)
+    proxy = pool.workbench(_params())
+
+    await proxy.start()
+    assert [wb.starts for wb in registry] == [1, 1]
+
+    registry[1].fail_next = RuntimeError("dead")
+    assert await pool.health_check(_params()) == 1
+    await asyncio.sleep(0)
+    assert registry[1].stops == 1
+
+    await proxy.reset()
+    assert registry[0].stops == 1
+    await proxy.call_tool("after-reset")
+    assert len(registry) == 3 and registry[2].calls == ["after-reset"]
+
+    await pool.close()
+    assert registry[2].stops == 1
+
+
+@pytest.mark.asyncio
+async def test_reset_stops_busy_sessions_only_after_their_calls_finish() -> None:
+    registry: list[_FakeWorkbench] = []
+    pool = _pool(registry, size=1)
+    proxy = pool.workbench(_params())
+    await proxy.call_tool("warm")
+    release = asyncio.Event()
+
+    async def _blocked(name: str, arguments: Any = None) -> str:
+        await release.wait()
+        return name
+
+    registry[0].call_tool = _blocked  # type: ignore[method-assign]
+    other = asyncio.create_task(proxy.call_tool("list-events"))
+    await asyncio.sleep(0)
+
+    await proxy.reset()
+    assert registry[0].stops == 0
+    assert await proxy.call_tool("after-reset") == "after-reset"
+    assert len(registry) == 2 and registry[1].calls == ["after-reset"]
+
+    release.set()
+    assert await other == "list-events"
+    await asyncio.sleep(0)
+    assert registry[0].stops == 1
@@ -318,3 +318,115 @@ async def test_mem0_direct_import_path_stays_on_current_thread() -> None:
     assert metadata["kind"] == "timeboxing_reflection"
     assert filters["user_id"] == "u1"
     assert infer is False
+
+
+class _CountingMemoryBackend(_FakeMemoryBackend):
+    def __init__(self) -> None:
+        super().__init__()
+        self.queries: list[str] = []
+
+    async def query(self, query_text: str, **kwargs) -> MemoryQueryResult:
+        self.queries.append(query_text)
+        return await super().query(query_text, **kwargs)
+
+
+class _EnumerableMemoryBackend(_CountingMemoryBackend):
+    def iter_memories(self):
+        return list(self.items)
+
+
+async def test_mem0_structured_queries_resolve_through_metadata_index() -> None:
+    backend = _EnumerableMemoryBackend()
+    client = Mem0ConstraintMemoryClient(
+        user_id="u1",
+        is_cloud=False,
+        local_config={"path": ":memory:"},
+        memory_backend=backend,
+    )
+    for index in range(40):
+        await client.upsert_constraint(
+            record=_record(
+                uid=f"tb_{index}",
+                name=f"Constraint {index}",
+                rule_kind="capacity" if index % 2 else "sequencing",
+                start_date="2026-01-01",
+                end_date="2026-12-31" if index % 3 else "2026-01-31",
+                stage="Skeleton" if index % 4 else "Frame",
+            )
+        )
+    await client.archive_constraint(uid="tb_1")
+
+    filters = {
+        "as_of": "2026-02-13",
+        "stage": "Skeleton",
+        "event_types_any": ["dw"],
+        "statuses_any": ["LOCKED"],
+    }
+    rows = await client.query_constraints(
+        filters=filters, type_ids=["capacity"], tags=["Focus"], limit=100
+    )
+    expected = {
+        f"tb_{index}"
+        for index in range(40)
+        if index % 2 and index % 3 and index % 4 and index != 1
+    }
+    assert {row["uid"] for row in rows} == expected
+    # Hydration enumerates the backend; structured queries never search.
+    assert backend.queries == []
+    assert await client.query_constraints(filters=filters, type_ids=[""]) == []
+
+    # The archived uid resolves to its latest version only.
+    declined = await client.query_constraints(
+        filters={"statuses_any": ["declined"], "require_active": False}
+    )
+    assert [row["uid"] for row in declined] == ["tb_1"]
+
+    # Only text queries search, and hits are checked against the index.
+    texts = await client.query_constraints(
+        filters={**filters, "text_query": "constraint 5"}, type_ids=["capacity"]
+    )
+    assert [row["uid"] for row in texts] == ["tb_5"]
+    assert len(backend.queries) == 1
+
+
+async def test_mem0_search_only_backends_see_rows_written_by_other_clients() -> None:
+    backend = _CountingMemoryBackend()
+    client = Mem0ConstraintMemoryClient(
+        user_id="u1",
+        is_cloud=False,
+        local_config={"path": ":memory:"},
+        memory_backend=backend,
+    )
+    other = Mem0ConstraintMemoryClient(
+        user_id="u1",
+        is_cloud=False,
+        local_config={"path": ":memory:"},
+        memory_backend=backend,
+    )
+    filters = {"as_of": "2026-02-13", "stage": "Skeleton"}
+    await client.upsert_constraint(
+        record=_record(
+            uid="tb_mine",
+            name="Mine",
+            rule_kind="capacity",
+            start_date="2026-01-01",
+            end_date=None,
+        )
+    )
+    assert [row["uid"] for row in await client.query_constraints(filters=filters)] == [
+        "tb_mine"
+    ]
+
+    await other.upsert_constraint(
+        record=_record(
+            uid="tb_theirs",
+            name="Theirs",
+            rule_kind="capacity",
+            start_date="2026-01-01",
+            end_date=None,
+        )
+    )
+    rows = await client.query_constraints(filters=filters)
+    assert {row["uid"] for row in rows} == {"tb_mine", "tb_theirs"}
+    assert (await client.get_constraint(uid="tb_theirs")) is not None
+    assert len(client._constraint_index) == 0
@@ -0,0 +1,194 @@
+"""Streaming queries, batched lookups and the async Notion constraint store."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import fateforger.adapters.notion.timeboxing_preferences as prefs_mod
+from fateforger.adapters.notion.timeboxing_preferences import (
+    AsyncNotionConstraintStore,
+    NotionConstraintStore,
+    clear_page_lookup_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_lookup_cache():
+    clear_page_lookup_cache()
+    yield
+    clear_page_lookup_cache()
+
+
+def _page(**props) -> SimpleNamespace:
+    return SimpleNamespace(props=SimpleNamespace(**props))
+
+
+class _ScriptedQuery:
+    def __init__(self, db: "_ScriptedDB") -> None:
+        self._db = db
+
+    def filter(self, _condition):
+        return self
+
+    def execute(self):
+        self._db.queries += 1
+        return list(self._db.responses.pop(0)) if self._db.responses else []
+
+
+class _ScriptedDB:
+    """Answers successive queries from ``responses``, counting round trips."""
+
+    def __init__(self, *responses, db_id: str = "db") -> None:
+        self.id = db_id
+        self.responses = list(responses)
+        self.queries = 0
+
+    @property
+    def query(self) -> _ScriptedQuery:
+        return _ScriptedQuery(self)
+
+
+def test_query_stream_stops_fetching_at_limit(monkeypatch) -> None:
+    fetched: list[int] = []
+
+    def _rows(page_size: int):
+        for index in range(1_000):
+            fetched.append(index)
+            yield index
+
+    raw = SimpleNamespace(
+        filter=lambda _obj: raw, sort=lambda _objs: raw, execute=_rows
+    )
+    session = SimpleNamespace(
+        api=SimpleNamespace(databases=SimpleNamespace(query=lambda _ref: raw)),
+        _cache_add=lambda page: page,
+    )
+    monkeypatch.setattr(prefs_mod, "get_active_session", lambda: session)
+    monkeypatch.setattr(prefs_mod.uno.Page, "wrap_obj_ref", staticmethod(lambda obj: obj))
+    query = SimpleNamespace(
+        database=SimpleNamespace(obj_ref=None),
+        _filter_obj_ref=lambda: object(),
+        _sorts_obj_ref=lambda: [],
+    )
+
+    assert list(prefs_mod._iter_query_pages(query, limit=3)) == [0, 1, 2]
+    assert fetched == [0, 1, 2]
+    assert list(prefs_mod._iter_query_pages(query, limit=0)) == []
+
+
+def test_topic_lookups_are_batched_and_cached_per_process(monkeypatch) -> None:
+    sleep, gym = _page(name="Sleep"), _page(name="Gym time")
+    store = NotionConstraintStore.__new__(NotionConstraintStore)
+    # One OR-ed exact query, then a contains fallback for "Gym".
+    store.topics_db = _ScriptedDB([sleep], [gym])
+    monkeypatch.setattr(
+        prefs_mod.TBTopic, "create", staticmethod(lambda **_: pytest.fail("created"))
+    )
+
+    out = store._resolve_topics_by_name(["Sleep", "Gym", "sleep", " "], create_missing=False)
+    assert out == [sleep, gym, sleep]
+    assert store.topics_db.queries == 2
+
+    other = NotionConstraintStore.__new__(NotionConstraintStore)
+    other.topics_db = store.topics_db
+    assert other._resolve_topics_by_name(["gym", "SLEEP"]) == [gym, sleep]
+    assert store.topics_db.queries == 2
+
+
+def test_type_lookups_share_one_query_and_attach_reads_fresh() -> None:
+    buffer = _page(type_id="buffer", name="Buffer", constraints=[])
+    legacy = _page(type_id="", name="min_sleep", constraints=[])
+    store = NotionConstraintStore.__new__(NotionConstraintStore)
+    store.types_db = _ScriptedDB([legacy, buffer], [buffer])
+
+    assert store._resolve_types_by_id(["min_sleep", "buffer", "missing"]) == [legacy, buffer]
+    assert store._resolve_types_by_id(["buffer"]) == [buffer]
+    assert store.types_db.queries == 1
+
+    updates: list[dict] = []
+    buffer.update_props = lambda **props: updates.append(props)
+    store._attach_constraint_type("constraint-page", "buffer")
+    assert store.types_db.queries == 2
+    assert updates == [{"constraints": ["constraint-page"]}]
+
+
+@pytest.mark.asyncio
+async def test_async_store_runs_notion_calls_off_the_event_loop() -> None:
+    # Every call must be inside its worker at once, and stays there until the
+    # event loop has kept ticking; a call on the loop thread would deadlock.
+    entered = threading.Event()
+    barrier = threading.Barrier(4, action=entered.set, timeout=5)
+    release = threading.Event()
+
+    class _BlockingStore:
+        def query_types(self, stage, event_types):
+            barrier.wait()
+            if not release.wait(timeout=5):
+                raise TimeoutError("event loop stopped ticking")
+            return [{"type_id": stage}]
+
+    store = AsyncNotionConstraintStore(_BlockingStore(), max_workers=4)
+    ticks = 0
+
+    async def _ticker() -> None:
+        nonlocal ticks
+        while not entered.is_set():
+            await asyncio.sleep(0.001)
+        for _ in range(5):
+            ticks += 1
+            await asyncio.sleep(0)
+        release.set()
+
+    ticker = asyncio.create_task(_ticker())
+    results = await asyncio.gather(
+        *(store.query_types(f"s{i}", None) for i in range(4))
+    )
+    await ticker
+    store.close()
+
+    assert [row[0]["type_id"] for row in results] == ["s0", "s1", "s2", "s3"]
+    assert ticks == 5
+
+
+@pytest.mark.asyncio
+async def test_async_store_serializes_writes_but_not_reads() -> None:
+    class _RacyStore:
+        """Check-then-create by uid, yielding between the check and the create."""
+
+        def __init__(self) -> None:
+            self.pages: dict[str, list[str]] = {}
+            self.active_reads = 0
+            self.peak_reads = 0
+
+        def upsert_constraint(self, record):
+            uid = record["uid"]
+            existing = self.pages.get(uid)
+            time.sleep(0.01)
+            if existing:
+                existing.append("update")
+                return existing
+            self.pages[uid] = ["create"]
+            return self.pages[uid]
+
+        def query_types(self, stage, event_types):
+            self.active_reads += 1
+            self.peak_reads = max(self.peak_reads, self.active_reads)
+            time.sleep(0.02)
+            self.active_reads -= 1
+            return []
+
+    racy = _RacyStore()
+    store = AsyncNotionConstraintStore(racy, max_workers=4)
+    await asyncio.gather(
+        *(store.upsert_constraint({"uid": "sleep"}) for _ in range(6)),
+        *(store.query_types(None, None) for _ in range(4)),
+    )
+    store.close()
+
+    assert racy.pages == {"sleep": ["create"] + ["update"] * 5}
+    assert racy.peak_reads > 1
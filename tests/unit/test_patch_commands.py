@@ -0,0 +1,202 @@
+"""Unit tests for ``fateforger.agents.timeboxing.patch_commands``.
+
+Covers:
+- Only explicit ``/edit`` commands are parsed; free-form text never is
+- Each command form (remove, move-to-time, move before/after, duration, rename)
+- Ambiguous / unknown event names and free-form text return ``None``
+- Multi-clause commands resolve against the partially patched plan
+- Hit rate over a sample of refine messages
+- Refine orchestration skips the tool-selection LLM for ``/edit`` commands
+"""
+
+from __future__ import annotations
+
+from datetime import date, time, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import fateforger.agents.timeboxing.agent as agent_module
+from fateforger.agents.timeboxing.agent import (
+    CalendarSyncOutcome,
+    TimeboxingFlowAgent,
+)
+from fateforger.agents.timeboxing.patch_commands import (
+    is_patch_command,
+    parse_patch_command,
+)
+from fateforger.agents.timeboxing.tb_models import (
+    ET,
+    AfterPrev,
+    FixedStart,
+    FixedWindow,
+    TBEvent,
+    TBPlan,
+)
+from fateforger.agents.timeboxing.tb_ops import apply_tb_ops
+
+
+@pytest.fixture()
+def plan() -> TBPlan:
+    return TBPlan(
+        date=date(2026, 2, 15),
+        events=[
+            TBEvent(n="Morning routine", t=ET.H, p=FixedStart(st="07:00", dur="PT30M")),
+            TBEvent(n="Deep work", t=ET.DW, p=AfterPrev(dur="PT2H")),
+            TBEvent(n="Standup", t=ET.M, p=FixedWindow(st="10:00", et="10:15")),
+            TBEvent(n="Lunch", t=ET.R, p=FixedStart(st="12:00", dur="PT1H")),
+            TBEvent(n="Gym", t=ET.H, p=AfterPrev(dur="PT45M")),
+        ],
+    )
+
+
+def _apply(plan: TBPlan, text: str) -> TBPlan:
+    patch = parse_patch_command(plan, f"/edit {text}")
+    assert patch is not None, text
+    return apply_tb_ops(plan, patch)
+
+
+class TestCommands:
+    """Each grammar rule maps onto the expected op."""
+
+    def test_remove(self, plan: TBPlan) -> None:
+        result = _apply(plan, "delete the gym block")
+        assert [e.n for e in result.events][-1] == "Lunch"
+
+    def test_move_fixed_start_keeps_duration(self, plan: TBPlan) -> None:
+        result = _apply(plan, "Move lunch to 13:00.")
+        assert result.events[3].p == FixedStart(st="13:00", dur="PT1H")
+
+    def test_move_after_prev_pins_start(self, plan: TBPlan) -> None:
+        result = _apply(plan, "move gym to 9:30")
+        assert result.events[4].p == FixedStart(st="09:30", dur="PT45M")
+
+    def test_move_fixed_window_keeps_length(self, plan: TBPlan) -> None:
+        result = _apply(plan, "reschedule standup to 11:00")
+        assert result.events[2].p == FixedWindow(st="11:00", et="11:15")
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("make deep work 90m", timedelta(minutes=90)),
+            ("set the deep work block to 1h30m", timedelta(minutes=90)),
+            ("make deep work 2.5h long", timedelta(hours=2, minutes=30)),
+            ("shorten deep work to PT1H", timedelta(hours=1)),
+        ],
+    )
+    def test_duration(self, plan: TBPlan, text: str, expected: timedelta) -> None:
+        result = _apply(plan, text)
+        assert result.events[1].p == AfterPrev(dur=expected)
+
+    def test_duration_on_fixed_window_moves_end(self, plan: TBPlan) -> None:
+        result = _apply(plan, "extend standup to 30m")
+        assert result.events[2].p == FixedWindow(st="10:00", et="10:30")
+
+    def test_move_after_and_before(self, plan: TBPlan) -> None:
+        after = _apply(plan, "move gym after morning routine")
+        assert [e.n for e in after.events][:2] == ["Morning routine", "Gym"]
+        before = _apply(plan, "move morning routine before lunch")
+        assert [e.n for e in before.events][2:4] == ["Morning routine", "Lunch"]
+
+    def test_rename(self, plan: TBPlan) -> None:
+        result = _apply(plan, 'rename gym to "Evening run"')
+        assert result.events[4].n == "Evening run"
+
+    def test_multi_clause(self, plan: TBPlan) -> None:
+        result = _apply(plan, "delete gym; move lunch to 12:30 and make deep work 1h")
+        assert [e.n for e in result.events] == [
+            "Morning routine",
+            "Deep work",
+            "Standup",
+            "Lunch",
+        ]
+        assert result.events[3].p.st == time(12, 30)
+        assert result.events[1].p.dur == timedelta(hours=1)
+
+
+class TestMisses:
+    """Anything outside the grammar must go to the LLM."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "",
+            "move lunch a bit later",
+            "make the afternoon lighter",
+            "move lunch to 1pm",
+            "delete meditation",
+            "move deep work to 25:00",
+            "make lunch 0m",
+            "move lunch to 23:30",
+            "delete gym and add a walk",
+        ],
+    )
+    def test_returns_none(self, plan: TBPlan, text: str) -> None:
+        assert parse_patch_command(plan, f"/edit {text}") is None
+
+    def test_ambiguous_name(self, plan: TBPlan) -> None:
+        plan.events.append(TBEvent(n="gym", t=ET.H, p=AfterPrev(dur="PT15M")))
+        assert parse_patch_command(plan, "/edit delete gym") is None
+
+    @pytest.mark.parametrize(
+        "text",
+        ["move lunch to 13:00", "please /edit move lunch to 13:00", "/editmove lunch to 13:00"],
+    )
+    def test_free_form_text_is_never_parsed(self, plan: TBPlan, text: str) -> None:
+        assert not is_patch_command(text)
+        assert parse_patch_command(plan, text) is None
+
+
+def test_hit_rate_on_sample_messages(plan: TBPlan) -> None:
+    """Grammar-conforming ``/edit`` commands hit; everything else misses."""
+    messages = [
+        "/edit move lunch to 13:00",
+        "/edit make deep work 2h",
+        "/edit delete the gym block",
+        "/edit rename standup to Team sync",
+        "/edit shift gym after lunch",
+        "/edit swap lunch and gym",
+        "move lunch to 13:00",
+        "can you give me more breaks in the afternoon?",
+    ]
+    hits = sum(parse_patch_command(plan, m) is not None for m in messages)
+    assert hits == 5
+
+
+@pytest.mark.asyncio
+async def test_refine_orchestration_skips_tool_selection_for_edit_commands(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    class _NoAssistant:
+        def __init__(self, **kwargs: object) -> None:
+            raise AssertionError("tool-selection LLM should not run")
+
+    monkeypatch.setattr(agent_module, "AssistantAgent", _NoAssistant)
+    agent = TimeboxingFlowAgent.__new__(TimeboxingFlowAgent)
+    agent._timebox_patcher = SimpleNamespace(local_commands_enabled=True)
+    patched: list[str] = []
+
+    async def _patch_and_sync(*, session, patch_message):
+        patched.append(patch_message)
+        return CalendarSyncOutcome(status="staged", changed=True)
+
+    agent._execute_refine_patch_and_sync = _patch_and_sync
+    reflection = SimpleNamespace(task=None)
+    agent._queue_reflection_memory_write = lambda **_kwargs: reflection.task
+
+    outcome = await agent._run_refine_tool_orchestration(
+        session=SimpleNamespace(),
+        patch_message="/edit move lunch to 13:00\n\nPlanning context:\n{}",
+        user_message="/edit move lunch to 13:00",
+    )
+    assert outcome.patch_selected and not outcome.memory_queued
+    assert patched == ["/edit move lunch to 13:00\n\nPlanning context:\n{}"]
+
+    # A queued reflection write is reported like the tool-selection path does.
+    reflection.task = object()
+    outcome = await agent._run_refine_tool_orchestration(
+        session=SimpleNamespace(),
+        patch_message="/edit move lunch to 13:00",
+        user_message="/edit move lunch to 13:00",
+    )
+    assert outcome.memory_queued
@@ -1,11 +1,13 @@
 """Unit tests for fateforger.agents.timeboxing.patching.
 
 Tests ``_extract_patch()`` (including fenced-JSON handling),
-``_build_context()``, and ``_patcher_system_prompt_with_schema()``.
+``_build_context()``, ``_patcher_system_prompt_with_schema()``, and hedged
+(concurrent candidate) patch generation.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 from datetime import date, time, timedelta
 from types import SimpleNamespace
@@ -23,6 +25,7 @@ from fateforger.agents.timeboxing.patching import (
     _build_context,
     _extract_patch,
     _patcher_system_prompt_with_schema,
+    PatchHedgingPolicy,
     TimeboxPatcher,
 )
 from fateforger.agents.timeboxing.tb_models import (
@@ -339,3 +342,287 @@ async def test_apply_patch_stops_on_non_retryable_provider_error(
             actions=[],
         )
     assert attempts["calls"] == 1
+
+
+# ── Hedged candidates ─────────────────────────────────────────────────────
+
+
+def _hedged_assistant(behaviours: list[tuple[float, str | BaseException]]) -> type:
+    """Fake AssistantAgent whose N-th instance sleeps then returns/raises."""
+
+    class _FakeAssistant:
+        created = 0
+        cancelled: list[int] = []
+
+        def __init__(self, **kwargs: object) -> None:
+            _ = kwargs
+            self.index = type(self).created
+            type(self).created += 1
+
+        async def on_messages(
+            self, messages: list[object], cancellation_token: object
+        ) -> object:
+            _ = messages
+            delay, outcome = behaviours[self.index]
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                assert cancellation_token.is_cancelled()  # type: ignore[attr-defined]
+                type(self).cancelled.append(self.index)
+                raise
+            if isinstance(outcome, BaseException):
+                raise outcome
+            return _make_response(outcome)
+
+    return _FakeAssistant
+
+
+async def _passthrough(label: str, awaitable: object, *, timeout_s: float) -> object:
+    _ = (label, timeout_s)
+    return await awaitable  # type: ignore[misc]
+
+
+def test_hedging_policy_validates() -> None:
+    with pytest.raises(ValueError, match="candidates"):
+        PatchHedgingPolicy(candidates=0)
+    with pytest.raises(ValueError, match="stagger_s"):
+        PatchHedgingPolicy(stagger_s=-1)
+
+
+@pytest.mark.asyncio
+async def test_hedged_patch_first_valid_candidate_wins(
+    simple_plan: TBPlan, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A fast valid candidate should win and the slow one should be cancelled."""
+    good = json.dumps({"ops": [{"op": "ue", "i": 1, "n": "Fast"}]})
+    slow = json.dumps({"ops": [{"op": "ue", "i": 1, "n": "Slow"}]})
+    fake = _hedged_assistant([(5.0, slow), (0.01, good)])
+    validated: list[str] = []
+    monkeypatch.setattr(patching_module, "AssistantAgent", fake)
+    monkeypatch.setattr(patching_module, "with_timeout", _passthrough)
+    patcher = TimeboxPatcher(
+        model_client=object(),
+        max_attempts=1,
+        hedging=PatchHedgingPolicy(candidates=2),
+    )
+
+    patched, _patch = await patcher.apply_patch(
+        stage="Refine",
+        current=simple_plan,
+        user_message="rename",
+        plan_validator=lambda plan: validated.append(plan.events[1].n),
+    )
+
+    assert patched.events[1].n == "Fast"
+    assert validated == ["Fast"]
+    assert fake.cancelled == [0]
+    report = patcher.last_report
+    assert report is not None
+    assert report.winner is not None and report.winner.candidate == 1
+    assert {(o.candidate, o.status) for o in report.outcomes} == {
+        (0, "cancelled"),
+        (1, "won"),
+    }
+    assert report.loser_runtime_s > 0
+    assert report.latency_s < 1.0
+
+
+@pytest.mark.asyncio
+async def test_hedged_patch_invalid_candidate_does_not_block_winner(
+    simple_plan: TBPlan, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A candidate failing apply_tb_ops should not stop a later valid one."""
+    bad = json.dumps({"ops": [{"op": "re", "i": 9}]})
+    good = json.dumps({"ops": [{"op": "ue", "i": 1, "n": "Fixed"}]})
+    fake = _hedged_assistant([(0.0, bad), (0.02, good)])
+    monkeypatch.setattr(patching_module, "AssistantAgent", fake)
+    monkeypatch.setattr(patching_module, "with_timeout", _passthrough)
+    patcher = TimeboxPatcher(
+        model_client=object(),
+        max_attempts=1,
+        hedging=PatchHedgingPolicy(candidates=2),
+    )
+
+    patched, _patch = await patcher.apply_patch(
+        stage="Refine", current=simple_plan, user_message="fix"
+    )
+
+    assert patched.events[1].n == "Fixed"
+    statuses = {o.candidate: o.status for o in patcher.last_report.outcomes}
+    assert statuses == {0: "failed", 1: "won"}
+
+
+@pytest.mark.asyncio
+async def test_hedged_patch_retries_with_first_candidate_error(
+    simple_plan: TBPlan, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """When every candidate fails, the next attempt gets candidate 0's feedback."""
+    contexts: list[str] = []
+    bad = json.dumps({"ops": [{"op": "re", "i": 9}]})
+
+    class _FakeAssistant:
+        def __init__(self, **kwargs: object) -> None:
+            _ = kwargs
+
+        async def on_messages(
+            self, messages: list[object], cancellation_token: object
+        ) -> object:
+            _ = cancellation_token
+            contexts.append(getattr(messages[0], "content", ""))
+            return _make_response(bad)
+
+    monkeypatch.setattr(patching_module, "AssistantAgent", _FakeAssistant)
+    monkeypatch.setattr(patching_module, "with_timeout", _passthrough)
+    patcher = TimeboxPatcher(
+        model_client=object(),
+        max_attempts=2,
+        hedging=PatchHedgingPolicy(candidates=3),
+    )
+
+    with pytest.raises(ValueError, match="failed after 2 attempts"):
+        await patcher.apply_patch(
+            stage="Refine", current=simple_plan, user_message="remove"
+        )
+
+    assert len(contexts) == 6
+    assert all("remove: index 9 out of range" in c for c in contexts[3:])
+    assert patcher.last_report.attempts == 2
+    assert patcher.last_report.winner is None
+
+
+@pytest.mark.asyncio
+async def test_hedged_stagger_skips_extra_candidates_after_fast_win(
+    simple_plan: TBPlan, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Staggered hedges never start when the primary candidate wins quickly."""
+    good = json.dumps({"ops": [{"op": "ue", "i": 1, "n": "Quick"}]})
+    fake = _hedged_assistant([(0.0, good), (0.0, good), (0.0, good)])
+    calls: list[int] = []
+    original = fake.on_messages
+
+    async def _counting(self: object, messages: list[object], token: object) -> object:
+        calls.append(self.index)  # type: ignore[attr-defined]
+        return await original(self, messages, token)
+
+    monkeypatch.setattr(fake, "on_messages", _counting)
+    monkeypatch.setattr(patching_module, "AssistantAgent", fake)
+    monkeypatch.setattr(patching_module, "with_timeout", _passthrough)
+    patcher = TimeboxPatcher(
+        model_client=object(),
+        max_attempts=1,
+        hedging=PatchHedgingPolicy(candidates=3, stagger_s=1.0),
+    )
+
+    await patcher.apply_patch(stage="Refine", current=simple_plan, user_message="x")
+
+    assert calls == [0]
+    assert [o.status for o in patcher.last_report.outcomes] == ["won"]
+
+
+@pytest.mark.asyncio
+async def test_hedged_candidate_cancelled_from_inside_loses_without_cancelling_call(
+    simple_plan: TBPlan, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A candidate ending in CancelledError is a loser, not a cancelled call."""
+    good = json.dumps({"ops": [{"op": "ue", "i": 1, "n": "Kept"}]})
+    fake = _hedged_assistant([(0.0, asyncio.CancelledError()), (0.02, good)])
+    monkeypatch.setattr(patching_module, "AssistantAgent", fake)
+    monkeypatch.setattr(patching_module, "with_timeout", _passthrough)
+    patcher = TimeboxPatcher(
+        model_client=object(),
+        max_attempts=1,
+        hedging=PatchHedgingPolicy(candidates=2),
+    )
+
+    patched, _patch = await patcher.apply_patch(
+        stage="Refine", current=simple_plan, user_message="rename"
+    )
+
+    assert patched.events[1].n == "Kept"
+    statuses = {o.candidate: o.status for o in patcher.last_report.outcomes}
+    assert statuses == {0: "cancelled", 1: "won"}
+
+
+@pytest.mark.asyncio
+async def test_hedged_patch_fails_cleanly_when_every_candidate_is_cancelled(
+    simple_plan: TBPlan, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fake = _hedged_assistant(
+        [(0.0, asyncio.CancelledError()), (0.0, asyncio.CancelledError())]
+    )
+    monkeypatch.setattr(patching_module, "AssistantAgent", fake)
+    monkeypatch.setattr(patching_module, "with_timeout", _passthrough)
+    patcher = TimeboxPatcher(
+        model_client=object(),
+        max_attempts=1,
+        hedging=PatchHedgingPolicy(candidates=2),
+    )
+
+    with pytest.raises(ValueError, match="all patch candidates were cancelled"):
+        await patcher.apply_patch(
+            stage="Refine", current=simple_plan, user_message="rename"
+        )
+
+
+# ── Local edit commands ───────────────────────────────────────────────────
+
+
+@pytest.mark.asyncio
+async def test_local_command_skips_llm(
+    simple_plan: TBPlan, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A structured command is applied without constructing an LLM agent."""
+
+    class _NoAssistant:
+        def __init__(self, **kwargs: object) -> None:
+            raise AssertionError("LLM agent should not be built")
+
+    monkeypatch.setattr(patching_module, "AssistantAgent", _NoAssistant)
+    patcher = TimeboxPatcher(model_client=object(), local_commands=True)
+
+    patched, patch = await patcher.apply_patch(
+        stage="Refine",
+        current=simple_plan,
+        user_message='/edit make deep work 90m\n\nPlanning context:\n```json\n{"stage": "Refine"}\n```',
+    )
+
+    assert patch.ops[0].op == "ue"
+    assert patched.events[1].p.dur == timedelta(minutes=90)
+    assert patcher.last_report.source == "local"
+    assert patcher.local_stats.hits == 1
+    assert patcher.local_stats.hit_rate == 1.0
+
+
+@pytest.mark.asyncio
+async def test_local_command_rejected_by_validator_falls_back(
+    simple_plan: TBPlan, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """If the validator rejects the local patch, the LLM path runs instead."""
+    raw_patch = json.dumps({"ops": [{"op": "ue", "i": 1, "n": "From LLM"}]})
+    fake = _hedged_assistant([(0.0, raw_patch)])
+    monkeypatch.setattr(patching_module, "AssistantAgent", fake)
+    monkeypatch.setattr(patching_module, "with_timeout", _passthrough)
+    patcher = TimeboxPatcher(model_client=object(), max_attempts=1, local_commands=True)
+
+    def _validator(plan: TBPlan) -> None:
+        if plan.events[1].p.dur != timedelta(hours=2):
+            raise ValueError("deep work must stay 2h")
+
+    patched, _patch = await patcher.apply_patch(
+        stage="Refine",
+        current=simple_plan,
+        user_message="/edit make deep work 30m",
+        plan_validator=_validator,
+    )
+
+    assert patched.events[1].n == "From LLM"
+    assert patcher.last_report.source == "llm"
+    assert patcher.local_stats.rejected == 1
+    assert patcher.local_stats.hit_rate == 0.0
+
+
+def test_local_commands_are_opt_in(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TIMEBOX_PATCHER_LOCAL_COMMANDS", raising=False)
+    assert TimeboxPatcher(model_client=object()).local_commands_enabled is False
+    monkeypatch.setenv("TIMEBOX_PATCHER_LOCAL_COMMANDS", "true")
+    assert TimeboxPatcher(model_client=object()).local_commands_enabled is True
@@ -281,6 +281,38 @@ async def test_suggest_next_slot_uses_mcp_datetime_shape_without_offset() -> Non
     assert "Z" not in args["timeMin"]
 
 
+@pytest.mark.asyncio
+async def test_suggest_next_slot_reads_horizon_once_and_ranks_candidates() -> None:
+    workbench = _FakeWorkbench(payload_text=json.dumps({"events": []}))
+    agent = PlannerAgent("planner_agent", haunt=_DummyHaunt())
+    agent._workbench = workbench
+    result = await agent.handle_suggest_next_slot(
+        SuggestNextSlot(
+            calendar_id="horizon-test",
+            duration_min=30,
+            time_zone="Europe/Amsterdam",
+            horizon_days=4,
+            work_start_hour=0,
+            work_end_hour=23,
+            max_candidates=3,
+        ),
+        None,
+    )
+    assert result.ok is True
+    assert len(workbench.calls) == 1
+    _, args = workbench.calls[0]
+    span = dt.datetime.fromisoformat(args["timeMax"]) - dt.datetime.fromisoformat(
+        args["timeMin"]
+    )
+    assert span > dt.timedelta(days=2)
+    starts = [candidate.start_utc for candidate in result.candidates]
+    assert len(starts) == 3 and starts == sorted(starts)
+    assert (result.start_utc, result.end_utc) == (
+        result.candidates[0].start_utc,
+        result.candidates[0].end_utc,
+    )
+
+
 @pytest.mark.asyncio
 async def test_suggest_next_slot_handles_plain_text_mcp_error_without_crashing() -> None:
     workbench = _FakeWorkbench(
@@ -0,0 +1,151 @@
+import asyncio
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from fateforger.haunt.planning_guardian import PlanningGuardian
+from fateforger.haunt.planning_session_store import (
+    SqlAlchemyPlanningSessionStore,
+    ensure_planning_session_schema,
+)
+from fateforger.haunt.planning_store import PlanningAnchorPayload
+from fateforger.haunt.reconcile import PlanningReconciler
+
+NOW = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+
+class _AnchorStore:
+    def __init__(self, user_ids):
+        self._anchors = [
+            PlanningAnchorPayload(
+                user_id=user_id,
+                channel_id=f"D-{user_id}",
+                calendar_id="primary",
+                event_id="",
+            )
+            for user_id in user_ids
+        ]
+
+    async def list_all(self):
+        return list(self._anchors)
+
+
+class _SlowCalendar:
+    """Counts concurrent list-events calls; ``broken`` users raise."""
+
+    def __init__(self, broken=()):
+        self.broken = set(broken)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.list_calls = 0
+        self.get_calls = []
+
+    async def list_events(self, *, calendar_id, time_min, time_max):
+        self.list_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return []
+        finally:
+            self.in_flight -= 1
+
+    async def get_event(self, *, calendar_id, event_id):
+        self.get_calls.append(event_id)
+        if event_id in self.broken:
+            raise RuntimeError("calendar down")
+        return {
+            "id": event_id,
+            "start": {"dateTime": "2025-01-01T10:00:00+00:00"},
+            "end": {"dateTime": "2025-01-01T10:30:00+00:00"},
+        }
+
+
+class _Scheduler:
+    def __init__(self):
+        self.jobs = {}
+
+    def get_jobs(self):
+        return [type("Job", (), {"id": job_id}) for job_id in self.jobs]
+
+    def add_job(self, func, trigger=None, id=None, **_):
+        self.jobs[id] = func
+
+    def remove_job(self, job_id):
+        self.jobs.pop(job_id, None)
+
+
+class _CountingStore(SqlAlchemyPlanningSessionStore):
+    def __init__(self, sessionmaker):
+        super().__init__(sessionmaker)
+        self.single_calls = 0
+        self.batch_calls = 0
+
+    async def list_for_user_between(self, **kwargs):
+        self.single_calls += 1
+        return await super().list_for_user_between(**kwargs)
+
+    async def list_for_users_between(self, **kwargs):
+        self.batch_calls += 1
+        return await super().list_for_users_between(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_reconcile_all_prefetches_once_and_bounds_concurrency():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    try:
+        await ensure_planning_session_schema(engine)
+        store = _CountingStore(async_sessionmaker(engine, expire_on_commit=False))
+        for user_id in ("U1", "U2"):
+            await store.upsert(
+                user_id=user_id,
+                planned_date=date(2025, 1, 1),
+                calendar_id="primary",
+                event_id=f"plan-{user_id}",
+                status="planned",
+            )
+        grouped = await store.list_for_users_between(
+            user_ids=["U1", "U3"], start_date=date(2025, 1, 1), end_date=date(2025, 1, 2)
+        )
+        assert [ref.event_id for ref in grouped["U1"]] == ["plan-U1"]
+        assert grouped["U3"] == []
+        store.batch_calls = 0
+
+        users = ["U1", "U2"] + [f"N{i}" for i in range(10)]
+        calendar = _SlowCalendar(broken={"plan-U2"})
+        scheduler = _Scheduler()
+        guardian = PlanningGuardian(
+            scheduler,
+            anchor_store=_AnchorStore(users),
+            reconciler=PlanningReconciler(
+                scheduler, calendar_client=calendar, planning_session_store=store
+            ),
+            now=lambda: NOW,
+            max_concurrency=3,
+        )
+
+        report = await guardian.reconcile_all()
+
+        assert store.batch_calls == 1 and store.single_calls == 0
+        assert report.users == 12 and report.failed == ["U2"]
+        assert report.succeeded == 11
+        assert set(report.durations_s) == set(users)
+        # U1 is satisfied by its stored ref; the ten users without one list events.
+        assert calendar.list_calls == 10
+        assert calendar.max_in_flight <= 3
+        assert any(job_id.startswith("rule:next_planning_session:N0:") for job_id in scheduler.jobs)
+        assert not any(":U1:" in job_id for job_id in scheduler.jobs)
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reconcile_all_without_anchors_returns_empty_report():
+    guardian = PlanningGuardian(
+        _Scheduler(),
+        anchor_store=_AnchorStore([]),
+        reconciler=PlanningReconciler(_Scheduler(), calendar_client=_SlowCalendar()),
+    )
+    report = await guardian.reconcile_all()
+    assert report.users == 0 and report.failed == []
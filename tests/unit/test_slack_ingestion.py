@@ -0,0 +1,101 @@
+"""Unit tests for deduplicated, per-thread Slack event ingestion."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from fateforger.slack_bot.ingestion import (
+    SlackIngestQueue,
+    coalesce_events,
+    event_thread_key,
+)
+
+
+def _event(ts: str, *, text: str = "hi", user: str = "U1", **extra) -> dict:
+    return {
+        "channel": "D1",
+        "channel_type": "im",
+        "user": user,
+        "text": text,
+        "ts": ts,
+        "client_msg_id": f"msg-{ts}",
+        **extra,
+    }
+
+
+def test_thread_keys_and_coalesced_event_shape() -> None:
+    assert event_thread_key(_event("1.0")) == "D1:dm"
+    assert event_thread_key(_event("2.0", thread_ts="1.0")) == "D1:1.0"
+    assert event_thread_key({"channel": "C1", "ts": "3.0"}) == "C1:3.0"
+
+    merged = coalesce_events(
+        [_event("1.0", text="plan my day"), _event("2.0", text=" ", files=[{"id": "F"}])]
+    )
+    assert merged["text"] == "plan my day" and merged["ts"] == "2.0"
+    assert merged["files"] == [{"id": "F"}]
+    assert merged["coalesced_ts"] == ["1.0", "2.0"]
+
+
+@pytest.mark.asyncio
+async def test_duplicates_are_skipped_and_bursts_coalesce_behind_a_turn() -> None:
+    turns: list[str] = []
+    release = asyncio.Event()
+
+    async def _handler(event: dict, payload) -> None:
+        turns.append(event["text"])
+        if len(turns) == 1:
+            await release.wait()
+
+    ingest = SlackIngestQueue(_handler)
+    first = asyncio.create_task(ingest.submit(_event("1.0", text="a"), body={"event_id": "Ev1"}))
+    await asyncio.sleep(0)
+    # Slack retry of the same envelope, and a resend of the same message.
+    assert ingest.is_duplicate(_event("9.9"), body={"event_id": "Ev1"})
+    assert not await ingest.submit(_event("1.0", text="a"), body={"event_id": "Ev2"})
+
+    burst = [
+        asyncio.create_task(ingest.submit(_event(ts, text=text)))
+        for ts, text in (("2.0", "b"), ("3.0", "c"))
+    ]
+    other_user = asyncio.create_task(ingest.submit(_event("4.0", text="d", user="U2")))
+    await asyncio.sleep(0)
+    assert ingest.depth == 3
+
+    release.set()
+    assert await asyncio.gather(first, *burst, other_user) == [True, True, True, True]
+    assert turns == ["a", "b\nc", "d"]
+    assert ingest.depth == 0 and not ingest._workers and not ingest._pending
+
+
+@pytest.mark.asyncio
+async def test_threads_run_concurrently_under_cap_and_full_queues_drop() -> None:
+    running = 0
+    peak = 0
+    gate = asyncio.Event()
+
+    async def _handler(event: dict, payload) -> None:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await gate.wait()
+        running -= 1
+
+    ingest = SlackIngestQueue(_handler, max_concurrency=2, max_pending_per_thread=1)
+    tasks = [
+        asyncio.create_task(ingest.submit(_event(f"{i}.0", thread_ts=f"T{i}")))
+        for i in range(4)
+    ]
+    await asyncio.sleep(0.01)
+    assert peak == 2
+
+    # Thread T0 is busy with one queued event allowed behind it.
+    queued = asyncio.create_task(ingest.submit(_event("5.0", thread_ts="T0")))
+    await asyncio.sleep(0)
+    assert not await ingest.submit(_event("6.0", thread_ts="T0"))
+
+    gate.set()
+    assert all(await asyncio.gather(*tasks, queued))
+    assert peak == 2
+    await ingest.close()
@@ -4,20 +4,28 @@ Covers:
 - ``base32hex_id`` determinism and GCal safety
 - ``is_owned_event`` prefix check
 - ``gcal_response_to_tb_plan`` conversion
-- ``plan_sync`` DeepDiff-based diffing (creates, updates, deletes, no-ops)
+- ``plan_sync`` field-level diffing (creates, updates, deletes, no-ops)
+- ``_canonical_diff_paths`` parity with DeepDiff, alone and inside ``plan_sync``
 - ``execute_sync`` with mocked MCP workbench
+- Concurrent ``execute_sync`` (``SyncExecutionPolicy``) ordering, limits and latency
+- Batched ``execute_sync`` / ``undo_sync`` via an advertised batch MCP tool
+- Multi-day ``plan_sync_range`` / ``execute_sync_range`` with per-day undo
 - ``undo_sync`` compensating ops
 - Foreign event protection (no mutations on non-fftb events)
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import re
+import time as time_module
 from datetime import date, time, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from deepdiff import DeepDiff
 
 from fateforger.adapters.calendar.models import (
     GCalEvent,
@@ -26,15 +34,22 @@ from fateforger.adapters.calendar.models import (
 )
 from fateforger.agents.timeboxing.sync_engine import (
     FFTB_PREFIX,
+    SyncExecutionPolicy,
     SyncOp,
     SyncOpType,
     SyncTransaction,
+    _canonical,
+    _canonical_diff_paths,
     base32hex_id,
     execute_sync,
+    execute_sync_range,
     gcal_response_to_tb_plan,
     gcal_response_to_tb_plan_with_identity,
     is_owned_event,
     plan_sync,
+    plan_sync_range,
+    resolve_batch_tool,
+    split_transaction_by_day,
     undo_sync,
 )
 from fateforger.agents.timeboxing.tb_models import (
@@ -255,7 +270,7 @@ class TestGcalResponseToTbPlan:
 
 
 class TestPlanSync:
-    """Test DeepDiff-based sync planning."""
+    """Test field-level sync planning."""
 
     def test_identical_plans_no_ops(self) -> None:
         """No changes → no sync ops."""
@@ -525,6 +540,100 @@ class TestPlanSync:
         assert ops == []
 
 
+# ── _canonical_diff_paths ────────────────────────────────────────────────
+
+
+def _deepdiff_reference_paths(
+    remote: dict[str, str], desired: dict[str, str]
+) -> tuple[str, ...]:
+    """Previous DeepDiff-based comparison, kept as the parity/benchmark baseline."""
+    diff = DeepDiff(remote, desired, ignore_order=True, verbose_level=2)
+    paths: set[str] = set()
+    for value in diff.to_dict().values():
+        paths.update(str(path) for path in value)
+    return tuple(sorted(paths))
+
+
+def _benchmark_plans(n: int) -> tuple[TBPlan, TBPlan, list[str]]:
+    """Build remote/desired plans of ``n`` owned events; every other one changed."""
+    slot = max(1, 1440 // n)
+    remote_events: list[TBEvent] = []
+    desired_events: list[TBEvent] = []
+    for index in range(n):
+        start_min = index * 1440 // n
+        end_min = min(start_min + slot, 1439)
+        window = FixedWindow(
+            st=time(start_min // 60, start_min % 60),
+            et=time(end_min // 60, end_min % 60),
+        )
+        remote_events.append(TBEvent(n=f"Block {index}", d="", t="DW", p=window))
+        desired_events.append(
+            TBEvent(
+                n=f"Block {index}",
+                d="changed" if index % 2 else "",
+                t="DW",
+                p=window,
+            )
+        )
+    remote = TBPlan(events=remote_events, date=PLAN_DATE, tz=TZ)
+    desired = TBPlan(events=desired_events, date=PLAN_DATE, tz=TZ)
+    return remote, desired, [f"fftb{index}" for index in range(n)]
+
+
+class TestCanonicalDiffPaths:
+    """Test the typed canonical comparator."""
+
+    def test_identical_is_empty(self) -> None:
+        resolved = {
+            "n": "A",
+            "d": "",
+            "t": "DW",
+            "start_time": time(9),
+            "end_time": time(10),
+        }
+        assert _canonical_diff_paths(_canonical(resolved), _canonical(resolved)) == ()
+
+    def test_matches_deepdiff_for_every_field_combination(self) -> None:
+        base = {
+            "summary": "A",
+            "start": "09:00:00",
+            "end": "10:00:00",
+            "description": "",
+            "colorId": "9",
+        }
+        fields = list(base)
+        for mask in range(1 << len(fields)):
+            other = dict(base)
+            for bit, name in enumerate(fields):
+                if mask & (1 << bit):
+                    other[name] = base[name] + "x"
+            assert _canonical_diff_paths(base, other) == _deepdiff_reference_paths(
+                base, other
+            )
+
+    @pytest.mark.parametrize("n", [10, 100, 1000])
+    def test_plan_sync_matches_deepdiff_baseline(self, n: int, monkeypatch) -> None:
+        """plan_sync yields the same ops with the typed comparator and DeepDiff."""
+        remote, desired, ids = _benchmark_plans(n)
+
+        ops = plan_sync(remote, desired, {}, remote_event_ids_by_index=ids)
+        assert len(ops) == n // 2
+
+        pairs = [
+            (_canonical(r), _canonical(d))
+            for r, d in zip(remote.resolve_times(), desired.resolve_times())
+        ]
+        after = [_canonical_diff_paths(r, d) for r, d in pairs]
+        before = [_deepdiff_reference_paths(r, d) for r, d in pairs]
+        assert after == before
+
+        monkeypatch.setattr(
+            "fateforger.agents.timeboxing.sync_engine._canonical_diff_paths",
+            _deepdiff_reference_paths,
+        )
+        assert plan_sync(remote, desired, {}, remote_event_ids_by_index=ids) == ops
+
+
 # ── execute_sync ─────────────────────────────────────────────────────────
 
 
@@ -636,6 +745,404 @@ class TestExecuteSync:
         assert mock_workbench.call_tool.call_count == 1
 
 
+# ── execute_sync (concurrent) ───────────────────────────────────────────
+
+
+class _DelayedWorkbench:
+    """Fake MCP workbench with injected per-call latency and call tracing."""
+
+    def __init__(self, *, delay_s: float = 0.0, fail_ids: set[str] | None = None):
+        self.delay_s = delay_s
+        self.fail_ids = fail_ids or set()
+        self.calls: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        event_id = str(arguments.get("eventId", ""))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay_s)
+        finally:
+            self.in_flight -= 1
+        self.calls.append((name, event_id))
+        result = MagicMock()
+        result.is_error = event_id in self.fail_ids
+        result.result = [MagicMock(text=f"{name}:{event_id}")]
+        return result
+
+
+def _create_op(event_id: str) -> SyncOp:
+    return SyncOp(
+        op_type=SyncOpType.CREATE,
+        gcal_event_id=event_id,
+        after_payload={"calendarId": "primary", "eventId": event_id},
+    )
+
+
+class TestExecuteSyncConcurrent:
+    """Test policy-driven concurrent execution."""
+
+    @pytest.mark.asyncio
+    async def test_results_align_with_ops(self) -> None:
+        wb = _DelayedWorkbench(delay_s=0.001)
+        ops = [_create_op(f"fftb{i}") for i in range(8)]
+        tx = await execute_sync(ops, wb, policy=SyncExecutionPolicy(max_concurrency=4))
+        assert tx.status == "committed"
+        assert [r["event_id"] for r in tx.results] == [op.gcal_event_id for op in ops]
+        assert all(r["ok"] for r in tx.results)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_respected(self) -> None:
+        wb = _DelayedWorkbench(delay_s=0.005)
+        ops = [_create_op(f"fftb{i}") for i in range(10)]
+        await execute_sync(ops, wb, policy=SyncExecutionPolicy(max_concurrency=3))
+        assert wb.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_same_event_ops_keep_order(self) -> None:
+        wb = _DelayedWorkbench(delay_s=0.001)
+        ops = [
+            _create_op("fftbsame"),
+            SyncOp(
+                op_type=SyncOpType.UPDATE,
+                gcal_event_id="fftbsame",
+                after_payload={"calendarId": "primary", "eventId": "fftbsame"},
+            ),
+            _create_op("fftbother"),
+            SyncOp(
+                op_type=SyncOpType.DELETE,
+                gcal_event_id="fftbsame",
+                after_payload={"calendarId": "primary", "eventId": "fftbsame"},
+            ),
+        ]
+        tx = await execute_sync(ops, wb, policy=SyncExecutionPolicy(max_concurrency=4))
+        same = [name for name, event_id in wb.calls if event_id == "fftbsame"]
+        assert same == ["create-event", "update-event", "delete-event"]
+        assert tx.status == "committed"
+
+    @pytest.mark.asyncio
+    async def test_failed_op_skips_dependent_ops(self) -> None:
+        wb = _DelayedWorkbench(fail_ids={"fftbbad"})
+        ops = [
+            _create_op("fftbbad"),
+            SyncOp(
+                op_type=SyncOpType.DELETE,
+                gcal_event_id="fftbbad",
+                after_payload={"calendarId": "primary", "eventId": "fftbbad"},
+            ),
+            _create_op("fftbgood"),
+        ]
+        tx = await execute_sync(ops, wb, policy=SyncExecutionPolicy(max_concurrency=2))
+        assert tx.status == "partial"
+        assert len(tx.results) == len(ops)
+        assert tx.results[0]["ok"] is False
+        assert tx.results[1]["skipped"] is True
+        assert tx.results[2]["ok"] is True
+
+    @pytest.mark.asyncio
+    async def test_halt_on_error_keeps_results_aligned_and_undoable(self) -> None:
+        wb = _DelayedWorkbench(fail_ids={"fftb0"})
+        ops = [_create_op(f"fftb{i}") for i in range(6)]
+        tx = await execute_sync(
+            ops,
+            wb,
+            halt_on_error=True,
+            policy=SyncExecutionPolicy(max_concurrency=1),
+        )
+        assert tx.status == "partial_halted"
+        assert len(tx.results) == len(ops)
+        assert all(r.get("skipped") for r in tx.results[1:])
+
+        undo_wb = _DelayedWorkbench()
+        undo_tx = await undo_sync(tx, undo_wb, policy=SyncExecutionPolicy())
+        assert undo_tx.status == "undone"
+        assert undo_wb.calls == []
+
+    @pytest.mark.asyncio
+    async def test_undo_with_policy_compensates_every_op(self) -> None:
+        wb = _DelayedWorkbench(delay_s=0.001)
+        ops = [_create_op(f"fftb{i}") for i in range(5)]
+        policy = SyncExecutionPolicy(max_concurrency=5)
+        tx = await execute_sync(ops, wb, policy=policy)
+        undo_wb = _DelayedWorkbench(delay_s=0.001)
+        undo_tx = await undo_sync(tx, undo_wb, policy=policy)
+        assert undo_tx.status == "undone"
+        assert sorted(event_id for _, event_id in undo_wb.calls) == sorted(
+            op.gcal_event_id for op in ops
+        )
+        assert {name for name, _ in undo_wb.calls} == {"delete-event"}
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_calls(self, monkeypatch) -> None:
+        clock = {"now": 0.0}
+        slept: list[float] = []
+        real_sleep = asyncio.sleep
+
+        async def _sleep(delay: float) -> None:
+            if delay > 0:
+                slept.append(delay)
+                clock["now"] += delay
+            await real_sleep(0)
+
+        monkeypatch.setattr(time_module, "monotonic", lambda: clock["now"])
+        monkeypatch.setattr(asyncio, "sleep", _sleep)
+        wb = _DelayedWorkbench()
+        ops = [_create_op(f"fftb{i}") for i in range(4)]
+        await execute_sync(
+            ops,
+            wb,
+            policy=SyncExecutionPolicy(max_concurrency=4, rate_per_s=64.0, burst=1),
+        )
+        # 1 burst token, then 3 refills of 1/64s each (exact in binary floats).
+        assert len(wb.calls) == 4
+        assert slept == [1 / 64] * 3
+
+    def test_policy_rejects_invalid_limits(self) -> None:
+        with pytest.raises(ValueError):
+            SyncExecutionPolicy(max_concurrency=0)
+        with pytest.raises(ValueError):
+            SyncExecutionPolicy(rate_per_s=0)
+
+    @pytest.mark.asyncio
+    async def test_policy_overlaps_calls_against_delayed_workbench(self) -> None:
+        """20 ops at 1ms per call: serial runs one at a time, the policy four."""
+        ops = [_create_op(f"fftb{i}") for i in range(20)]
+
+        serial_wb = _DelayedWorkbench(delay_s=0.001)
+        serial_tx = await execute_sync(ops, serial_wb)
+
+        concurrent_wb = _DelayedWorkbench(delay_s=0.001)
+        concurrent_tx = await execute_sync(
+            ops, concurrent_wb, policy=SyncExecutionPolicy(max_concurrency=4)
+        )
+
+        assert serial_tx.status == concurrent_tx.status == "committed"
+        assert len(serial_wb.calls) == len(concurrent_wb.calls) == len(ops)
+        assert serial_wb.max_in_flight == 1
+        assert concurrent_wb.max_in_flight == 4
+
+
+# ── execute_sync (batched) ──────────────────────────────────────────────
+
+
+class _BatchWorkbench:
+    """Fake MCP workbench advertising a batch tool."""
+
+    def __init__(
+        self,
+        *,
+        tools: tuple[str, ...] = ("list-events", "create-event", "batch-events"),
+        fail_ids: set[str] | None = None,
+        is_error: bool = False,
+    ) -> None:
+        self.tools = tools
+        self.fail_ids = fail_ids or set()
+        self.is_error = is_error
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return [{"name": name} for name in self.tools]
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        self.calls.append((name, arguments))
+        result = MagicMock()
+        result.is_error = self.is_error
+        if name == "batch-events":
+            entries = []
+            for index, operation in enumerate(arguments["operations"]):
+                event_id = operation["arguments"]["eventId"]
+                if event_id in self.fail_ids:
+                    entries.append({"index": index, "ok": False, "error": "boom"})
+                else:
+                    entries.append({"index": index, "ok": True, "id": event_id})
+            text = json.dumps({"results": entries})
+        else:
+            text = '{"ok": true}'
+        result.result = [MagicMock(text=text)]
+        return result
+
+
+class TestExecuteSyncBatched:
+    """Test the single-request batch mutation path."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_batch_tool(self) -> None:
+        assert await resolve_batch_tool(_BatchWorkbench()) == "batch-events"
+        assert await resolve_batch_tool(_BatchWorkbench(tools=("create-event",))) is None
+
+    @pytest.mark.asyncio
+    async def test_whole_transaction_sent_as_one_call(self) -> None:
+        wb = _BatchWorkbench()
+        ops = [_create_op(f"fftb{i}") for i in range(20)]
+        tx = await execute_sync(ops, wb, batch=True)
+        assert tx.status == "committed"
+        assert len(wb.calls) == 1
+        name, arguments = wb.calls[0]
+        assert name == "batch-events"
+        assert [o["tool"] for o in arguments["operations"]] == ["create-event"] * 20
+        assert [r["event_id"] for r in tx.results] == [op.gcal_event_id for op in ops]
+        assert all(r["ok"] for r in tx.results)
+
+    @pytest.mark.asyncio
+    async def test_chunks_by_max_batch_size(self) -> None:
+        wb = _BatchWorkbench()
+        ops = [_create_op(f"fftb{i}") for i in range(5)]
+        tx = await execute_sync(ops, wb, batch=True, max_batch_size=2)
+        assert len(wb.calls) == 3
+        assert len(tx.results) == 5
+
+    @pytest.mark.asyncio
+    async def test_per_op_failures_mapped_back(self) -> None:
+        wb = _BatchWorkbench(fail_ids={"fftb1"})
+        ops = [_create_op(f"fftb{i}") for i in range(3)]
+        tx = await execute_sync(ops, wb, batch=True)
+        assert tx.status == "partial"
+        assert [r["ok"] for r in tx.results] == [True, False, True]
+        assert tx.results[1]["error"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_halt_on_error_skips_remaining_chunks(self) -> None:
+        wb = _BatchWorkbench(fail_ids={"fftb0"})
+        ops = [_create_op(f"fftb{i}") for i in range(4)]
+        tx = await execute_sync(
+            ops, wb, batch=True, max_batch_size=2, halt_on_error=True
+        )
+        assert tx.status == "partial_halted"
+        assert len(wb.calls) == 1
+        assert wb.calls[0][1]["haltOnError"] is True
+        assert len(tx.results) == 4
+        assert tx.results[2]["skipped"] is True
+
+    @pytest.mark.asyncio
+    async def test_batch_error_fails_every_op(self) -> None:
+        wb = _BatchWorkbench(is_error=True)
+        ops = [_create_op(f"fftb{i}") for i in range(2)]
+        tx = await execute_sync(ops, wb, batch=True)
+        assert tx.status == "partial"
+        assert [r["ok"] for r in tx.results] == [False, False]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_per_op_without_batch_tool(self) -> None:
+        wb = _BatchWorkbench(tools=("create-event", "delete-event"))
+        ops = [_create_op(f"fftb{i}") for i in range(3)]
+        tx = await execute_sync(ops, wb, batch=True)
+        assert tx.status == "committed"
+        assert [name for name, _ in wb.calls] == ["create-event"] * 3
+
+    @pytest.mark.asyncio
+    async def test_undo_uses_batch_tool(self) -> None:
+        wb = _BatchWorkbench()
+        ops = [_create_op(f"fftb{i}") for i in range(3)]
+        tx = await execute_sync(ops, wb, batch=True)
+        undo_wb = _BatchWorkbench()
+        undo_tx = await undo_sync(tx, undo_wb, batch=True)
+        assert undo_tx.status == "undone"
+        assert len(undo_wb.calls) == 1
+        operations = undo_wb.calls[0][1]["operations"]
+        assert [o["tool"] for o in operations] == ["delete-event"] * 3
+        assert [o["arguments"]["eventId"] for o in operations] == [
+            "fftb2",
+            "fftb1",
+            "fftb0",
+        ]
+
+
+# ── plan_sync_range / execute_sync_range ─────────────────────────────────
+
+
+class TestSyncRange:
+    """Test multi-day planning and per-day undo."""
+
+    @staticmethod
+    def _day_plan(day: date, name: str) -> TBPlan:
+        return TBPlan(
+            events=[
+                TBEvent(
+                    n=name,
+                    d="",
+                    t="DW",
+                    p=FixedStart(st=time(9), dur=timedelta(hours=1)),
+                )
+            ],
+            date=day,
+            tz=TZ,
+        )
+
+    def test_plans_each_day_against_its_snapshot(self) -> None:
+        day1 = PLAN_DATE
+        day2 = PLAN_DATE + timedelta(days=1)
+        remote_by_day = {
+            day1: _make_gcal_response(
+                [
+                    (
+                        "fftbkeep",
+                        "Focus",
+                        "2025-06-15T09:00:00+02:00",
+                        "2025-06-15T10:00:00+02:00",
+                    ),
+                    (
+                        "fftbstale",
+                        "Old",
+                        "2025-06-15T14:00:00+02:00",
+                        "2025-06-15T15:00:00+02:00",
+                    ),
+                ]
+            ),
+        }
+        desired_by_day = {
+            day1: self._day_plan(day1, "Focus"),
+            day2: self._day_plan(day2, "Focus"),
+        }
+        ops = plan_sync_range(remote_by_day, desired_by_day)
+        # Remote colorless events map to a different type, so "Focus" updates.
+        assert [(op.op_type, op.plan_date) for op in ops] == [
+            (SyncOpType.CREATE, day2),
+            (SyncOpType.UPDATE, day1),
+            (SyncOpType.DELETE, day1),
+        ]
+        # The create gets a fresh owned id; the others keep their remote ids.
+        assert re.fullmatch(rf"{FFTB_PREFIX}[0-9a-v]{{32}}", ops[0].gcal_event_id)
+        assert [op.gcal_event_id for op in ops[1:]] == ["fftbkeep", "fftbstale"]
+
+    def test_rejects_mismatched_plan_date(self) -> None:
+        with pytest.raises(ValueError, match="has date"):
+            plan_sync_range({}, {PLAN_DATE: self._day_plan(PLAN_DATE + timedelta(1), "X")})
+
+    @pytest.mark.asyncio
+    async def test_execute_range_returns_per_day_undoable_transactions(self) -> None:
+        days = [PLAN_DATE + timedelta(days=offset) for offset in range(3)]
+        ops = plan_sync_range({}, {day: self._day_plan(day, "Focus") for day in days})
+        wb = _DelayedWorkbench()
+        tx, per_day = await execute_sync_range(
+            ops, wb, policy=SyncExecutionPolicy(max_concurrency=3)
+        )
+        assert tx.status == "committed"
+        assert sorted(per_day) == days
+        assert all(len(day_tx.ops) == 1 for day_tx in per_day.values())
+
+        undo_wb = _DelayedWorkbench()
+        undo_tx = await undo_sync(per_day[days[1]], undo_wb)
+        assert undo_tx.status == "undone"
+        assert undo_wb.calls == [("delete-event", per_day[days[1]].ops[0].gcal_event_id)]
+
+    @pytest.mark.asyncio
+    async def test_halted_range_keeps_results_aligned(self) -> None:
+        days = [PLAN_DATE + timedelta(days=offset) for offset in range(2)]
+        ops = plan_sync_range({}, {day: self._day_plan(day, "Focus") for day in days})
+        wb = _DelayedWorkbench(fail_ids={ops[0].gcal_event_id})
+        tx, per_day = await execute_sync_range(ops, wb, halt_on_error=True)
+        assert tx.status == "partial_halted"
+        assert len(tx.results) == len(ops)
+        assert set(per_day) == set(days)
+
+    def test_split_requires_complete_results(self) -> None:
+        tx = SyncTransaction(ops=[_create_op("fftba")])
+        with pytest.raises(ValueError, match="complete per-op execution results"):
+            split_transaction_by_day(tx)
+
+
 # ── undo_sync ────────────────────────────────────────────────────────────
 
 
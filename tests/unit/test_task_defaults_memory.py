@@ -208,8 +208,9 @@ def test_defaults_store_uses_graphiti_backend_selection(monkeypatch: pytest.Monk
         captured["user_id"] = user_id
         return sentinel_client
 
-    def _fake_build_store(client):
+    def _fake_build_store(client, *, share_key=None):
         assert client is sentinel_client
+        assert share_key == "graphiti:user-graphiti"
         return sentinel_store
 
     monkeypatch.setattr(
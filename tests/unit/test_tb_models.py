@@ -5,12 +5,14 @@ Covers:
 - TBEvent validation (BG must have fixed timing)
 - TBPlan validation (chain must have an anchor)
 - Time resolution: forward pass (ap, fs, fw), backward pass (bn), overlap detection
+- Resolution cache: reuse, dirty-suffix recomputation, parity with a fresh plan
 - ET_COLOR_MAP helpers
 - JSON schema round-trip (confirms LLM can produce valid payloads)
 """
 
 from __future__ import annotations
 
+import random
 from datetime import date, time, timedelta
 
 import pytest
@@ -344,6 +346,91 @@ class TestResolveTime:
         assert resolved[1]["index"] == 1
 
 
+# ── Resolution cache ─────────────────────────────────────────────────────
+
+
+def _chain_event(rng: random.Random, index: int) -> TBEvent:
+    kind = rng.choice(["ap", "ap", "bn", "fs"])
+    dur = timedelta(minutes=rng.choice([15, 30, 45]))
+    if kind == "fs":
+        return TBEvent(
+            n=f"E{index}", t="DW", p=FixedStart(st=time(6 + index, 0), dur=dur)
+        )
+    if kind == "bn":
+        return TBEvent(n=f"E{index}", t="SW", p=BeforeNext(dur=dur))
+    return TBEvent(n=f"E{index}", t="SW", p=AfterPrev(dur=dur))
+
+
+def _fresh_resolution(plan: TBPlan) -> list[dict]:
+    return TBPlan(events=list(plan.events), date=plan.date, tz=plan.tz).resolve_times(
+        validate_non_overlap=False
+    )
+
+
+class TestResolveTimesCache:
+    """Test cached / incremental ``resolve_times``."""
+
+    @pytest.fixture()
+    def plan(self) -> TBPlan:
+        return TBPlan(
+            events=[
+                TBEvent(n="Prep", t="SW", p=BeforeNext(dur="PT15M")),
+                TBEvent(n="Standup", t="M", p=FixedWindow(st="09:00", et="09:15")),
+                TBEvent(n="Focus", t="DW", p=AfterPrev(dur="PT2H")),
+                TBEvent(n="Lunch", t="R", p=FixedStart(st="12:00", dur="PT1H")),
+                TBEvent(n="Email", t="SW", p=AfterPrev(dur="PT30M")),
+            ],
+            date=date(2025, 6, 15),
+        )
+
+    def test_repeat_call_reuses_cache_and_returns_copies(self, plan: TBPlan) -> None:
+        first = plan.resolve_times()
+        first[0]["n"] = "mutated by caller"
+        second = plan.resolve_times()
+        assert second[0]["n"] == "Prep"
+        assert plan._resolved_cache is not None
+        assert plan._resolved_cache.records[0] is not first[0]
+
+    def test_list_mutation_invalidates_suffix(self, plan: TBPlan) -> None:
+        plan.resolve_times()
+        plan.events[1] = TBEvent(
+            n="Standup", t="M", p=FixedWindow(st="09:30", et="09:45")
+        )
+        resolved = plan.resolve_times()
+        assert resolved[0]["start_time"] == time(9, 15)  # bn run re-resolved
+        assert resolved[2]["start_time"] == time(9, 45)
+        assert resolved == _fresh_resolution(plan)
+
+    def test_date_change_recomputes(self, plan: TBPlan) -> None:
+        plan.resolve_times()
+        moved = plan.model_copy(update={"date": date(2025, 6, 16)})
+        assert moved.resolve_times() == _fresh_resolution(moved)
+
+    def test_overlap_still_validated_on_cache_hit(self, plan: TBPlan) -> None:
+        plan.events.append(
+            TBEvent(n="Clash", t="M", p=FixedWindow(st="12:10", et="12:20"))
+        )
+        plan.resolve_times(validate_non_overlap=False)
+        with pytest.raises(ValueError, match="Overlap"):
+            plan.resolve_times()
+
+    @pytest.mark.parametrize("seed", range(50))
+    def test_incremental_matches_fresh_resolution(self, seed: int) -> None:
+        rng = random.Random(seed)
+        events = [
+            TBEvent(n="Anchor", t="M", p=FixedWindow(st="05:00", et="05:15"))
+        ] + [_chain_event(rng, index) for index in range(1, 12)]
+        events.append(TBEvent(n="Tail", t="M", p=FixedStart(st="23:00", dur="PT15M")))
+        plan = TBPlan(events=events, date=date(2025, 6, 15))
+        plan.resolve_times(validate_non_overlap=False)
+        for _ in range(5):
+            index = rng.randrange(1, len(plan.events) - 1)
+            plan.events[index] = _chain_event(rng, index)
+            assert plan.resolve_times(validate_non_overlap=False) == _fresh_resolution(
+                plan
+            )
+
+
 # ── ET_COLOR_MAP helpers ─────────────────────────────────────────────────
 
 
@@ -6,15 +6,23 @@ Covers:
 - Discriminated union (de)serialization via ``TBOp`` / ``TBPatch``
 - ``apply_tb_ops`` correctly produces a new validated TBPlan
 - Multi-op patches (sequential application)
+- Structural-sharing fast path: parity with ``strict=True``
 """
 
 from __future__ import annotations
 
+import random
 from datetime import date
 
 import pytest
 
-from fateforger.agents.timeboxing.tb_models import ET, TBEvent, TBPlan
+from fateforger.agents.timeboxing.tb_models import (
+    ET,
+    AfterPrev,
+    FixedStart,
+    TBEvent,
+    TBPlan,
+)
 from fateforger.agents.timeboxing.tb_ops import (
     AddEvents,
     MoveEvent,
@@ -372,3 +380,97 @@ class TestImmutability:
         patch = TBPatch(ops=[RemoveEvent(i=0)])
         apply_tb_ops(plan, patch)
         assert [e.n for e in plan.events] == original_names
+
+
+# ── Fast path ────────────────────────────────────────────────────────────
+
+
+def _chain_plan(n: int = 40) -> TBPlan:
+    """An ``n``-event plan: one fixed anchor followed by an after_previous chain."""
+    events = [TBEvent(n="Anchor", t="PR", p={"a": "fs", "st": "06:00", "dur": "PT15M"})]
+    events += [
+        TBEvent(n=f"Block {i}", t="SW", p={"a": "ap", "dur": "PT15M"})
+        for i in range(1, n)
+    ]
+    return TBPlan(events=events, date=date(2025, 1, 15))
+
+
+def _random_op(rng: random.Random, size: int):
+    kind = rng.choice(["ae", "re", "ue", "ue", "ue", "me"])
+    index = rng.randrange(size)
+    if kind == "ae":
+        return AddEvents(
+            events=[TBEvent(n="New", t="BU", p={"a": "ap", "dur": "PT5M"})],
+            after=rng.choice([None, index]),
+        )
+    if kind == "re":
+        return RemoveEvent(i=index)
+    if kind == "me":
+        return MoveEvent(fr=index, to=rng.randrange(size))
+    timing = rng.choice(
+        [None, FixedStart(st="07:00", dur="PT10M"), AfterPrev(dur="PT20M")]
+    )
+    return UpdateEvent(
+        i=index,
+        n=rng.choice([None, f"Edit {index}"]),
+        t=rng.choice([None, ET.DW, ET.BG]),
+        p=timing,
+    )
+
+
+def _outcome(plan: TBPlan, patch: TBPatch, *, strict: bool):
+    try:
+        result = apply_tb_ops(plan, patch, strict=strict)
+    except (IndexError, ValueError) as exc:
+        return type(exc), str(exc)
+    return result.model_dump()
+
+
+class TestFastPath:
+    """The structural-sharing path must match the strict path exactly."""
+
+    def test_untouched_events_are_shared(self) -> None:
+        plan = _chain_plan()
+        result = apply_tb_ops(plan, TBPatch(ops=[UpdateEvent(i=5, n="Renamed")]))
+        assert result.events[4] is plan.events[4]
+        assert result.events[5] is not plan.events[5]
+        assert result.events[5].p is plan.events[5].p
+        assert plan.events[5].n == "Block 5"
+
+    def test_bg_rule_still_enforced(self) -> None:
+        plan = _chain_plan()
+        patch = TBPatch(ops=[UpdateEvent(i=3, t=ET.BG)])
+        with pytest.raises(ValueError, match="Background events"):
+            apply_tb_ops(plan, patch)
+
+    def test_losing_last_anchor_raises(self) -> None:
+        plan = _chain_plan()
+        patch = TBPatch(ops=[UpdateEvent(i=0, p=AfterPrev(dur="PT15M"))])
+        with pytest.raises(ValueError, match="anchor"):
+            apply_tb_ops(plan, patch)
+
+    @pytest.mark.parametrize("seed", range(100))
+    def test_matches_strict_path(self, seed: int) -> None:
+        rng = random.Random(seed)
+        plan = _chain_plan(12)
+        ops = [_random_op(rng, 10) for _ in range(rng.randint(1, 6))]
+        patch = TBPatch(ops=ops)
+        assert _outcome(plan, patch, strict=False) == _outcome(
+            plan, patch, strict=True
+        )
+
+    @pytest.mark.parametrize("n_ops", [1, 10, 50])
+    def test_update_batches_match_strict(self, n_ops: int) -> None:
+        """1/10/50-op update batches on a 40-event plan match the strict path."""
+        plan = _chain_plan(40)
+        patch = TBPatch(
+            ops=[
+                UpdateEvent(i=(i * 7) % 40, n=f"Edit {i}", d="moved")
+                for i in range(n_ops)
+            ]
+        )
+
+        fast = apply_tb_ops(plan, patch)
+        strict = apply_tb_ops(plan, patch, strict=True)
+
+        assert fast.model_dump() == strict.model_dump()
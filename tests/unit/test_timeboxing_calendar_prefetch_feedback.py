@@ -98,6 +98,7 @@ async def test_prefetch_calendar_force_refresh_bypasses_cached_snapshot() -> Non
     class _CalendarClient:
         def __init__(self) -> None:
             self.calls = 0
+            self.refresh_flags: list[bool] = []
 
         async def list_day_snapshot(
             self,
@@ -106,9 +107,11 @@ async def test_prefetch_calendar_force_refresh_bypasses_cached_snapshot() -> Non
             day: date,
             tz,
             diagnostics: dict | None = None,
+            refresh: bool = False,
         ) -> _Snapshot:
             _ = (calendar_id, day, tz, diagnostics)
             self.calls += 1
+            self.refresh_flags.append(refresh)
             return _Snapshot(suffix=f"R{self.calls}")
 
     agent = TimeboxingFlowAgent.__new__(TimeboxingFlowAgent)
@@ -134,6 +137,7 @@ async def test_prefetch_calendar_force_refresh_bypasses_cached_snapshot() -> Non
     )
 
     assert client.calls == 1
+    assert client.refresh_flags == [True]
     assert session.prefetched_immovables_by_date["2026-02-14"][0]["title"] == "Lunch R1"
 
 
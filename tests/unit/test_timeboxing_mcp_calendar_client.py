@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from datetime import date
+from datetime import date, timedelta
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -331,3 +331,46 @@ class TestParseEventDt:
         dt = self._call({"date": "2025-06-01"}, tz=self.EASTERN)
         assert dt is not None
         assert dt.tzinfo is not None
+
+
+@pytest.mark.asyncio
+async def test_list_range_snapshots_uses_single_window_and_buckets_by_day() -> None:
+    """Range snapshots should issue one list-events call and split by local day."""
+    workbench = _FakeWorkbench(
+        payload={
+            "events": [
+                {
+                    "id": "a",
+                    "summary": "Standup",
+                    "start": {"dateTime": "2026-02-14T09:00:00+01:00"},
+                    "end": {"dateTime": "2026-02-14T09:15:00+01:00"},
+                },
+                {
+                    "id": "b",
+                    "summary": "Review",
+                    "start": {"dateTime": "2026-02-16T14:00:00+01:00"},
+                    "end": {"dateTime": "2026-02-16T15:00:00+01:00"},
+                },
+            ],
+            "totalCount": 2,
+        }
+    )
+    client = McpCalendarClient.__new__(McpCalendarClient)
+    client._workbench = workbench
+
+    snapshots = await client.list_range_snapshots(
+        calendar_id="primary",
+        start_day=date(2026, 2, 14),
+        end_day=date(2026, 2, 16),
+        tz=ZoneInfo("Europe/Amsterdam"),
+    )
+
+    assert workbench.last_arguments is not None
+    assert workbench.last_arguments["timeMin"] == "2026-02-14T00:00:00"
+    assert workbench.last_arguments["timeMax"] == "2026-02-17T00:00:00"
+    assert sorted(snapshots) == [date(2026, 2, 14) + timedelta(days=i) for i in range(3)]
+    assert [e.id for e in snapshots[date(2026, 2, 14)].response.events] == ["a"]
+    assert snapshots[date(2026, 2, 15)].response.events == []
+    assert snapshots[date(2026, 2, 16)].immovables == [
+        {"title": "Review", "start": "14:00", "end": "15:00"}
+    ]
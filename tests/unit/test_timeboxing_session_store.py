@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from fateforger.agents.timeboxing.agent import Session, TimeboxingFlowAgent
+from fateforger.agents.timeboxing.session_store import (
+    SessionCache,
+    SessionCodec,
+    SqlAlchemyTimeboxingSessionStore,
+    ensure_timeboxing_session_schema,
+)
+from fateforger.agents.timeboxing.stage_gating import TimeboxingStage
+from fateforger.agents.timeboxing.sync_engine import SyncTransaction
+from fateforger.agents.timeboxing.tb_models import TBPlan
+
+
+def _plan() -> TBPlan:
+    return TBPlan.model_validate(
+        {
+            "date": "2026-02-14",
+            "tz": "Europe/Amsterdam",
+            "events": [
+                {"n": "Standup", "t": "M", "p": {"a": "fw", "st": "09:00", "et": "09:15"}},
+                {"n": "Deep work", "t": "DW", "p": {"a": "ap", "dur": "PT2H"}},
+            ],
+        }
+    )
+
+
+def _session(key: str = "c1:t1") -> Session:
+    session = Session(
+        thread_ts="t1",
+        channel_id="c1",
+        user_id="u1",
+        planned_date="2026-02-14",
+        tz_name="Europe/Amsterdam",
+        session_key=key,
+        committed=True,
+    )
+    session.stage = TimeboxingStage.REFINE
+    session.tb_plan = _plan()
+    session.base_snapshot = _plan()
+    session.event_id_map = {"Standup|09:00": "gcal-1"}
+    session.last_sync_transaction = SyncTransaction(status="committed")
+    session.durable_constraints_loaded_stages = {"Skeleton"}
+    return session
+
+
+async def _store() -> tuple[object, SqlAlchemyTimeboxingSessionStore[Session]]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    await ensure_timeboxing_session_schema(engine)
+    store = SqlAlchemyTimeboxingSessionStore(
+        async_sessionmaker(engine, expire_on_commit=False), SessionCodec(Session)
+    )
+    return engine, store
+
+
+def test_codec_round_trips_durable_fields_and_resets_transient_ones() -> None:
+    codec = SessionCodec(Session)
+    session = _session()
+    session.pending_calendar_prefetch = True
+    session.pending_durable_stages = {"Skeleton"}
+
+    restored = codec.decode(codec.encode(session))
+
+    assert restored.tb_plan == session.tb_plan
+    assert restored.base_snapshot == session.base_snapshot
+    assert restored.event_id_map == session.event_id_map
+    assert restored.last_sync_transaction.status == "committed"
+    assert restored.stage is TimeboxingStage.REFINE
+    assert restored.durable_constraints_loaded_stages == {"Skeleton"}
+    assert restored.pending_calendar_prefetch is False
+    assert restored.pending_durable_stages == set()
+    assert restored.graph_turn_lock is not session.graph_turn_lock
+
+
+def test_codec_ignores_unknown_keys() -> None:
+    import json
+    import zlib
+
+    blob = zlib.compress(
+        json.dumps(
+            {"thread_ts": "t", "channel_id": "c", "user_id": "u", "retired": 1}
+        ).encode()
+    )
+    restored = SessionCodec(Session).decode(blob)
+    assert restored.thread_ts == "t"
+    assert restored.tb_plan is None
+
+
+@pytest.mark.asyncio
+async def test_store_save_load_skips_unchanged_and_deletes() -> None:
+    engine, store = await _store()
+    try:
+        session = _session()
+        kwargs = {"user_id": "u1", "channel_id": "c1", "thread_ts": "t1"}
+        assert await store.save("c1:t1", session, **kwargs) is True
+        assert await store.save("c1:t1", session, **kwargs) is False
+
+        session.event_id_map["Deep work|09:15"] = "gcal-2"
+        assert await store.save("c1:t1", session, **kwargs) is True
+
+        loaded = await store.load("c1:t1")
+        assert loaded is not None
+        assert loaded.event_id_map == session.event_id_map
+        assert loaded.tb_plan.events[1].p.dur == session.tb_plan.events[1].p.dur
+        assert await store.keys_for_user("u1") == ["c1:t1"]
+
+        await store.delete("c1:t1")
+        assert await store.load("c1:t1") is None
+    finally:
+        await engine.dispose()
+
+
+def test_cache_proposes_idle_and_overflow_entries_but_not_pinned() -> None:
+    now = [0.0]
+    cache: SessionCache[str] = SessionCache(
+        max_entries=2, idle_ttl_s=10.0, clock=lambda: now[0]
+    )
+    cache["a"] = "a"
+    now[0] = 1.0
+    cache["b"] = "b"
+    now[0] = 2.0
+    cache["c"] = "c"
+    assert cache.take_touched() and not cache.take_touched()
+
+    assert cache.eviction_candidates(pinned=lambda _: False) == ["a"]
+    # A pinned LRU entry is skipped; the next-oldest one makes room instead.
+    assert cache.eviction_candidates(pinned=lambda v: v == "a") == ["b"]
+
+    cache.get("a")  # refresh LRU position
+    assert cache.eviction_candidates(pinned=lambda _: False) == ["b"]
+
+    now[0] = 20.0
+    assert cache.eviction_candidates(pinned=lambda _: False) == ["b", "c", "a"]
+
+
+@pytest.mark.asyncio
+async def test_turn_keeps_its_own_keys_after_a_concurrent_take() -> None:
+    cache: SessionCache[str] = SessionCache(max_entries=8, idle_ttl_s=3600.0)
+    cache["a"] = "a"
+    cache["b"] = "b"
+    cache.take_touched()
+    mid_turn = asyncio.Event()
+    other_done = asyncio.Event()
+
+    async def _turn(key: str) -> list[str]:
+        with cache.turn():
+            cache.get(key)
+            if key == "a":
+                mid_turn.set()
+                await other_done.wait()
+                return cache.take_touched()
+            await mid_turn.wait()
+            taken = cache.take_touched()
+            other_done.set()
+            return taken
+
+    first, second = await asyncio.gather(_turn("a"), _turn("b"))
+    assert sorted(second) == ["a", "b"]
+    assert first == ["a"]
+    assert cache.take_touched() == []
+
+
+@pytest.mark.asyncio
+async def test_agent_rehydrates_session_after_eviction() -> None:
+    engine, store = await _store()
+    try:
+        agent = TimeboxingFlowAgent.__new__(TimeboxingFlowAgent)
+        agent._session_debug_loggers = {}
+        agent._sessions = SessionCache(max_entries=1, idle_ttl_s=3600.0)
+        agent._session_store = store
+
+        agent._sessions["c1:t1"] = _session("c1:t1")
+        await agent._flush_sessions()
+        agent._sessions["c2:t2"] = _session("c2:t2")
+        await agent._flush_sessions()
+        assert "c1:t1" not in agent._sessions
+
+        restored = await agent._load_session("c1:t1")
+        assert restored is not None
+        assert restored.session_key == "c1:t1"
+        assert restored.tb_plan == _plan()
+        assert restored.tb_plan.date == date(2026, 2, 14)
+        assert await agent._load_session("missing") is None
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_agent_keeps_busy_sessions_in_memory() -> None:
+    engine, store = await _store()
+    try:
+        agent = TimeboxingFlowAgent.__new__(TimeboxingFlowAgent)
+        agent._session_debug_loggers = {}
+        agent._sessions = SessionCache(max_entries=1, idle_ttl_s=3600.0)
+        agent._session_store = store
+
+        busy = _session("c1:t1")
+        agent._sessions["c1:t1"] = busy
+        async with busy.graph_turn_lock:
+            agent._sessions["c2:t2"] = _session("c2:t2")
+            await agent._flush_sessions()
+            assert agent._sessions.peek("c1:t1") is busy
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_agent_pins_sessions_with_pending_background_work() -> None:
+    engine, store = await _store()
+    try:
+        agent = TimeboxingFlowAgent.__new__(TimeboxingFlowAgent)
+        agent._session_debug_loggers = {}
+        agent._sessions = SessionCache(max_entries=1, idle_ttl_s=3600.0)
+        agent._session_store = store
+        gate = asyncio.Event()
+        agent._constraint_extraction_tasks = {
+            "extract:1": asyncio.create_task(gate.wait())
+        }
+
+        extracting = _session("c1:t1")
+        extracting.pending_constraint_extractions.add("extract:1")
+        prefetching = _session("c2:t2")
+        prefetching.pending_calendar_prefetch = True
+        agent._sessions["c1:t1"] = extracting
+        agent._sessions["c2:t2"] = prefetching
+        agent._sessions["c3:t3"] = _session("c3:t3")
+        await agent._flush_sessions()
+        assert agent._sessions.peek("c1:t1") is extracting
+        assert agent._sessions.peek("c2:t2") is prefetching
+
+        gate.set()
+        await agent._constraint_extraction_tasks["extract:1"]
+        prefetching.pending_calendar_prefetch = False
+        await agent._flush_sessions()
+        assert len(agent._sessions) == 1
+    finally:
+        await engine.dispose()